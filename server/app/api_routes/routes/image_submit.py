@@ -30,9 +30,11 @@ from app.core.database import SessionLocal
 from app.models.job import Job, JobStatus
 from app.plugin_loader import PluginRegistry
 from app.services.plugin_management_service import PluginManagementService
-from app.services.storage.factory import get_storage_service
+from app.services.queue.factory import enqueue_submitted_job
+from app.services.storage.factory import get_shared_storage_service
 from app.services.tool_router import resolve_tools
 from app.settings import settings
+from app.workers.job_notifier import job_notifier
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -43,8 +45,11 @@ def get_storage():
 
     This avoids import-time S3 connection attempts and allows
     dependency injection for testing. See issue #243.
+
+    v0.16.0: Returns the process-wide instance instead of building a new
+    client per request.
     """
-    return get_storage_service(settings)
+    return get_shared_storage_service(settings)
 
 
 def get_plugin_manager():
@@ -113,6 +118,12 @@ async def submit_image(
         None,
         description="Logical tool ID(s) (capability strings). Repeatable for multi-tool.",
     ),
+    priority: int = Query(
+        0,
+        ge=-10,
+        le=10,
+        description="Scheduling priority, -10..10 (higher runs first)",
+    ),
     plugin_manager=Depends(get_plugin_manager),
     plugin_service=Depends(get_plugin_service),
     storage=Depends(get_storage),
@@ -126,6 +137,7 @@ async def submit_image(
         plugin_id (str): Plugin identifier (from /v1/plugins).
         tool (List[str] | None): Explicit plugin tool ID(s); repeatable for multi-tool requests. Optional when `logical_tool_id` is provided.
         logical_tool_id (List[str] | None): Logical capability strings to resolve into concrete tool ID(s); repeatable for multi-tool requests.
+        priority (int): Scheduling priority from -10 to 10 (default 0); higher-priority jobs are dispatched first.
 
     Returns:
         dict: Canonical JSON describing the queued job:
@@ -296,6 +308,7 @@ async def submit_image(
             plugin_id=plugin_id,
             input_path=input_path,
             job_type=job_type,
+            priority=priority,
         )
         db.add(job)
         db.flush()  # Flush to ensure job exists before adding tools
@@ -312,6 +325,10 @@ async def submit_image(
     finally:
         db.close()
 
+    # v0.16.0: Queue the job for dispatch, then wake the worker
+    enqueue_submitted_job(settings, str(job_id), plugin_id, job_type, priority=priority)
+    job_notifier.notify()
+
     # v0.9.8: Canonical JSON response
     # Handle case where created_at might be None (e.g., in mocked tests)
     if job.created_at:
@@ -7,27 +7,61 @@ for both image and video jobs, replacing the separate /v1/video/status and
 v0.9.3: Added GET /v1/jobs list endpoint for job listing with pagination.
 v0.10.0: Added GET /v1/jobs/{job_id}/video endpoint for video file serving.
 Issue #350: Added GET /v1/jobs/{job_id}/result endpoint for lazy loading.
+v0.16.0: Added DELETE /v1/jobs/{job_id} for cooperative job cancellation.
+v0.16.0: /video and /result stream from the storage backend with Range
+support (or redirect to a presigned URL) instead of copying the whole file
+to local disk before the first byte is sent.
+v0.16.0: Results are stored gzip-compressed; /result serves them with
+Content-Encoding when the client accepts it.
+v0.16.0: Result URLs are signed without existence probes and cached, so
+GET /v1/jobs makes no storage calls per job.
 """
 
 import json
 import logging
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import RedirectResponse, Response, StreamingResponse
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.models.job import Job, JobStatus
-from app.schemas.job import JobListItem, JobListResponse, JobResultsResponse
-from app.services.storage.factory import get_storage_service
+from app.schemas.job import (
+    JobCancelResponse,
+    JobListItem,
+    JobListResponse,
+    JobResultsResponse,
+)
+from app.services.storage.factory import get_shared_storage_service
+from app.services.storage.http_range import (
+    RangeNotSatisfiableError,
+    accepts_encoding,
+    parse_range_header,
+)
+from app.services.storage.result_codec import (
+    iter_decoded,
+    load_result,
+    result_content_encoding,
+)
+from app.services.storage.signed_url_cache import SignedUrlCache
 from app.services.video_summary_service import derive_video_summary
 from app.settings import settings
+from app.workers.job_cancellation import job_cancellations
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
-storage = get_storage_service(settings)
+storage = get_shared_storage_service(settings)
+
+# v0.16.0: Result URLs are valid for an hour and reused until 5 minutes
+# before they expire
+RESULT_URL_EXPIRES_SECONDS = 3600
+RESULT_URL_REFRESH_MARGIN_SECONDS = 300
+result_urls = SignedUrlCache(
+    ttl_seconds=RESULT_URL_EXPIRES_SECONDS - RESULT_URL_REFRESH_MARGIN_SECONDS
+)
 
 
 def _calculate_progress(status: JobStatus) -> int:
@@ -37,17 +71,143 @@ def _calculate_progress(status: JobStatus) -> int:
         status: Job status enum
 
     Returns:
-        Progress int (0-100): pending=0, running=50, completed/failed=100
+        Progress int (0-100): pending=0, running=50,
+        completed/failed/cancelled=100
         Issue #296: Changed from float to int to match DB model.
     """
     if status == JobStatus.pending:
         return 0
     elif status == JobStatus.running:
         return 50
-    else:  # completed or failed
+    else:  # completed, failed or cancelled
         return 100
 
 
+def _result_url(job: Job) -> str:
+    """Return the download URL of a completed job's result artifact.
+
+    v0.16.0: A completed job's output_path is only set after the artifact
+    was saved, so no existence probe is made. Backends that presign URLs
+    (S3) return a direct URL; others are served by /v1/jobs/{id}/result.
+    URLs are cached per job until shortly before they expire.
+
+    Args:
+        job: Completed job with an output_path
+
+    Returns:
+        Download URL of the result
+    """
+
+    def sign() -> str:
+        url = storage.get_redirect_url(
+            job.output_path, expires_in=RESULT_URL_EXPIRES_SECONDS
+        )
+        return url or f"/v1/jobs/{job.job_id}/result?mode=stream"
+
+    return result_urls.get(job.output_path, sign)
+
+
+def _storage_file_response(
+    request: Request,
+    path: str,
+    media_type: str,
+    filename: str,
+    content_encoding: Optional[str] = None,
+) -> Response:
+    """Serve a stored file, honouring a single-range Range header.
+
+    v0.16.0: The file is streamed from the backend (ranged S3 GETs for
+    S3), so the first byte is sent before the file is read to the end.
+    With FORGESYTE_STORAGE_REDIRECT_DOWNLOADS, backends that can presign
+    URLs redirect the client to the object instead.
+
+    Args:
+        request: Incoming request (for the Range header)
+        path: Path relative to storage root
+        media_type: Content-Type of the response
+        filename: Download filename (Content-Disposition)
+        content_encoding: Content-Encoding of the stored bytes, if any
+            (ranges then apply to the encoded bytes)
+
+    Returns:
+        200 or 206 streaming response, 416 response, or 307 redirect
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    if settings.storage_redirect_downloads:
+        url = storage.get_redirect_url(path)
+        if url:
+            return RedirectResponse(url, status_code=307)
+
+    size = storage.get_size(path)
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'attachment; filename="{filename}"',
+    }
+    if content_encoding:
+        headers["Content-Encoding"] = content_encoding
+        headers["Vary"] = "Accept-Encoding"
+    try:
+        byte_range = parse_range_header(request.headers.get("range"), size)
+    except RangeNotSatisfiableError as err:
+        return Response(
+            status_code=416, headers={"Content-Range": f"bytes */{err.size}"}
+        )
+
+    if byte_range is None:
+        headers["Content-Length"] = str(size)
+        return StreamingResponse(
+            storage.iter_bytes(path), media_type=media_type, headers=headers
+        )
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        storage.iter_bytes(path, start, end - start + 1),
+        status_code=206,
+        media_type=media_type,
+        headers=headers,
+    )
+
+
+def _result_file_response(request: Request, path: str, filename: str) -> Response:
+    """Serve a stored result artifact, compressed or not.
+
+    v0.16.0: Compressed results (see result_codec) go through
+    _storage_file_response() with their Content-Encoding when the client
+    accepts it; other clients get the JSON decompressed while streaming.
+
+    Args:
+        request: Incoming request (for the Range and Accept-Encoding headers)
+        path: Path relative to storage root
+        filename: Download filename (Content-Disposition)
+
+    Returns:
+        Streaming response, 416 response, or 307 redirect
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    encoding = result_content_encoding(path)
+    if encoding is None or accepts_encoding(
+        request.headers.get("accept-encoding"), encoding
+    ):
+        return _storage_file_response(
+            request, path, "application/json", filename, encoding
+        )
+
+    return StreamingResponse(
+        iter_decoded(storage.iter_bytes(path)),
+        media_type="application/json",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Vary": "Accept-Encoding",
+        },
+    )
+
+
 @router.get("/v1/jobs", response_model=JobListResponse)
 async def list_jobs(
     limit: int = Query(
@@ -105,11 +265,8 @@ async def list_jobs(
                 except json.JSONDecodeError:
                     summary = None
 
-            # Get signed URL for artifact download
-            try:
-                result_url = storage.get_signed_url(job.output_path)
-            except FileNotFoundError:
-                result_url = None
+            # v0.16.0: Signed without an existence probe, cached per job
+            result_url = _result_url(job)
 
         # Build job item
         job_items.append(
@@ -120,7 +277,8 @@ async def list_jobs(
                 created_at=job.created_at,
                 completed_at=(
                     job.updated_at
-                    if job.status in (JobStatus.completed, JobStatus.failed)
+                    if job.status
+                    in (JobStatus.completed, JobStatus.failed, JobStatus.cancelled)
                     else None
                 ),
                 result_url=result_url,  # Issue #350
@@ -234,17 +392,14 @@ async def get_job(job_id: UUID, db: Session = Depends(get_db)) -> JobResultsResp
 
     # Load results from storage to derive summary
     try:
-        results_path = job.output_path
-        file_path = storage.load_file(results_path)
-        with open(file_path, "r") as f:
-            results = json.load(f)
+        results = load_result(storage, job.output_path)
     except FileNotFoundError as err:
         raise HTTPException(status_code=404, detail="Results file not found") from err
-    except json.JSONDecodeError as err:
+    except ValueError as err:
         raise HTTPException(status_code=500, detail="Invalid results file") from err
 
     # Return result_url and summary for all completed jobs
-    result_url = storage.get_signed_url(job.output_path)
+    result_url = _result_url(job)
     summary = derive_video_summary(results)
     return JobResultsResponse(
         job_id=job.job_id,
@@ -265,20 +420,92 @@ async def get_job(job_id: UUID, db: Session = Depends(get_db)) -> JobResultsResp
     )
 
 
+@router.delete("/v1/jobs/{job_id}", response_model=JobCancelResponse)
+async def cancel_job(job_id: UUID, db: Session = Depends(get_db)) -> JobCancelResponse:
+    """Cancel a pending or running job.
+
+    v0.16.0: Pending jobs are never claimed once cancelled. Running jobs
+    are stopped by the worker at the next progress checkpoint (one frame
+    for video jobs), which frees the execution slot. Cancelling an already
+    cancelled job is a no-op.
+
+    Args:
+        job_id: UUID of the job
+        db: Database session
+
+    Returns:
+        JobCancelResponse with job_id and status "cancelled"
+
+    Raises:
+        HTTPException: 404 if job not found, 409 if the job already
+            finished (completed/failed) or is being updated concurrently
+    """
+    job = db.query(Job).filter(Job.job_id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    if job.status == JobStatus.cancelled:
+        return JobCancelResponse(job_id=job.job_id, status=job.status.value)
+
+    if job.status in (JobStatus.completed, JobStatus.failed):
+        raise HTTPException(status_code=409, detail=f"Job already {job.status.value}")
+
+    was_running = job.status == JobStatus.running
+    try:
+        # Only cancel if the worker has not finished the job meanwhile
+        updated = (
+            db.query(Job)
+            .filter(Job.job_id == job_id)
+            .filter(Job.status.in_([JobStatus.pending, JobStatus.running]))
+            .update(
+                {
+                    "status": JobStatus.cancelled,
+                    "error_message": "Cancelled by user",
+                    "ray_future_id": None,
+                },
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+    except DBAPIError as err:
+        # The worker wrote to this job at the same moment
+        db.rollback()
+        raise HTTPException(
+            status_code=409, detail="Job is being updated, retry cancellation"
+        ) from err
+
+    if not updated:
+        raise HTTPException(
+            status_code=409, detail="Job finished before it could be cancelled"
+        )
+
+    if was_running:
+        job_cancellations.cancel(str(job_id))
+
+    logger.info("Job %s cancelled (was %s)", job_id, job.status.value)
+    return JobCancelResponse(job_id=job_id, status=JobStatus.cancelled.value)
+
+
 @router.get("/v1/jobs/{job_id}/video")
-async def get_job_video(job_id: UUID, db: Session = Depends(get_db)) -> FileResponse:
+async def get_job_video(
+    job_id: UUID, request: Request, db: Session = Depends(get_db)
+) -> Response:
     """Get the uploaded video file for playback in VideoResultsViewer.
 
     Serves the original uploaded video file stored at video/input/{job_id}.mp4.
     This is used by the frontend VideoResultsViewer component for video playback
     with overlay rendering.
 
+    v0.16.0: Supports Range requests, so seeking fetches only the bytes
+    the player needs.
+
     Args:
         job_id: UUID of the job
+        request: Incoming request (for the Range header)
         db: Database session
 
     Returns:
-        FileResponse with video/mp4 content type
+        Streaming video/mp4 response (206 for Range requests)
 
     Raises:
         HTTPException: 404 if job not found or video file not found
@@ -292,30 +519,33 @@ async def get_job_video(job_id: UUID, db: Session = Depends(get_db)) -> FileResp
         raise HTTPException(status_code=404, detail="Video file not found")
 
     try:
-        video_path = storage.load_file(job.input_path)
+        return _storage_file_response(
+            request, job.input_path, "video/mp4", f"{job_id}.mp4"
+        )
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Video file not found") from None
 
-    return FileResponse(
-        path=video_path,
-        media_type="video/mp4",
-        filename=f"{job_id}.mp4",
-    )
-
 
 @router.get("/v1/jobs/{job_id}/result")
-async def get_job_result(job_id: UUID, db: Session = Depends(get_db)) -> FileResponse:
+async def get_job_result(
+    job_id: UUID, request: Request, db: Session = Depends(get_db)
+) -> Response:
     """Get the JSON result file for download.
 
     Issue #350: Artifact Pattern - lazy loading video results.
     Serves the JSON output file for a completed job.
 
+    v0.16.0: Streamed from storage with Range support. Compressed results
+    are sent as stored with Content-Encoding: gzip when the client accepts
+    it, and decompressed on the fly (without Range support) otherwise.
+
     Args:
         job_id: UUID of the job
+        request: Incoming request (for the Range header)
         db: Database session
 
     Returns:
-        FileResponse with application/json content type
+        Streaming application/json response (206 for Range requests)
 
     Raises:
         HTTPException: 404 if job not found or result file not found
@@ -332,16 +562,11 @@ async def get_job_result(job_id: UUID, db: Session = Depends(get_db)) -> FileRes
         raise HTTPException(status_code=404, detail="Result not found")
 
     try:
-        result_path = storage.load_file(job.output_path)
-        logger.debug("[JOB RESULT] job_id=%s result_path=%s", job_id, result_path)
+        response = _result_file_response(request, job.output_path, f"{job_id}.json")
+        logger.debug("[JOB RESULT] job_id=%s serving %s", job_id, job.output_path)
+        return response
     except FileNotFoundError:
         logger.debug(
             "[JOB RESULT] job_id=%s file not found: %s", job_id, job.output_path
         )
         raise HTTPException(status_code=404, detail="Result file not found") from None
-
-    return FileResponse(
-        path=result_path,
-        media_type="application/json",
-        filename=f"{job_id}.json",
-    )
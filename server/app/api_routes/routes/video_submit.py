@@ -10,14 +10,18 @@ check (tool vs logical_tool_id), and canonical JSON response.
 v0.10.1: Split video upload and job submission for deterministic tool-locking.
 - POST /v1/video/upload: Upload-only, returns {video_path}
 - POST /v1/video/submit: Accepts JSON body {plugin_id, video_path, lockedTools}
+
+v0.16.0: Uploads are no longer read into memory. The MP4 header is
+validated from the first bytes, then the spooled upload is streamed to
+storage in chunks (multipart upload on S3), so memory per upload stays
+constant whatever the video size.
 """
 
 import asyncio
 import logging
 import traceback
 from datetime import timezone
-from io import BytesIO
-from typing import List
+from typing import BinaryIO, List
 from uuid import uuid4
 
 from botocore.exceptions import ClientError
@@ -34,10 +38,12 @@ from app.models.job import Job, JobStatus
 from app.plugin_loader import PluginRegistry
 from app.schemas.job import VideoSubmitRequest
 from app.services.plugin_management_service import PluginManagementService
+from app.services.queue.factory import enqueue_submitted_job
 from app.services.storage.base import StorageService
-from app.services.storage.factory import get_storage_service
+from app.services.storage.factory import get_shared_storage_service
 from app.services.tool_router import resolve_tools
 from app.settings import settings
+from app.workers.job_notifier import job_notifier
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -48,8 +54,11 @@ def get_storage() -> StorageService:
 
     This avoids import-time S3 connection attempts and allows
     dependency injection for testing.
+
+    v0.16.0: Returns the process-wide instance instead of building a new
+    client per request.
     """
-    return get_storage_service(settings)
+    return get_shared_storage_service(settings)
 
 
 def is_transient_s3_error(exception: BaseException) -> bool:
@@ -91,7 +100,7 @@ def is_transient_s3_error(exception: BaseException) -> bool:
 
 async def save_file_async(
     storage: StorageService,
-    src: BytesIO,
+    src: BinaryIO,
     dest_path: str,
 ) -> str:
     """Save file to storage with async retry logic.
@@ -103,7 +112,7 @@ async def save_file_async(
 
     Args:
         storage: StorageService instance
-        src: File-like object (BytesIO) to save
+        src: Seekable file-like object to save (e.g. UploadFile.file)
         dest_path: Destination path relative to storage root
 
     Returns:
@@ -146,6 +155,10 @@ def get_plugin_service(plugin_manager=Depends(get_plugin_manager)):
     return PluginManagementService(plugin_manager)
 
 
+# v0.16.0: Bytes read to validate an MP4 upload (the ftyp box is at the start)
+MP4_HEADER_BYTES = 64
+
+
 def validate_mp4_magic_bytes(data: bytes) -> None:
     """Validate that data contains MP4 magic bytes.
 
@@ -159,6 +172,22 @@ def validate_mp4_magic_bytes(data: bytes) -> None:
         raise HTTPException(status_code=400, detail="Invalid MP4 file")
 
 
+async def validate_mp4_upload(file: UploadFile) -> None:
+    """Validate an uploaded MP4 from its first bytes only.
+
+    v0.16.0: Replaces reading the whole upload before validation. The
+    upload is rewound so it can be streamed to storage afterwards.
+
+    Args:
+        file: Uploaded video
+
+    Raises:
+        HTTPException: If file is not a valid MP4
+    """
+    validate_mp4_magic_bytes(await file.read(MP4_HEADER_BYTES))
+    await file.seek(0)
+
+
 @router.post("/v1/video/upload")
 async def upload_video(
     file: UploadFile,
@@ -189,9 +218,8 @@ async def upload_video(
             detail=f"Plugin '{plugin_id}' not found",
         )
 
-    # Read and validate file
-    contents = await file.read()
-    validate_mp4_magic_bytes(contents)
+    # v0.16.0: Validate the header only; the body is streamed to storage
+    await validate_mp4_upload(file)
 
     # Generate video path (no job created yet)
     video_id = uuid4()
@@ -201,7 +229,7 @@ async def upload_video(
     storage = get_storage()
 
     try:
-        await save_file_async(storage, BytesIO(contents), video_path)
+        await save_file_async(storage, file.file, video_path)
         logger.info(f"Video uploaded to {video_path}")
     except (ConnectionError, TimeoutError, OSError, ClientError) as e:
         logger.error(
@@ -224,7 +252,8 @@ async def submit_video_job(
     Used after /v1/video/upload when user clicks "Run Job".
 
     Args:
-        request: JSON body with plugin_id, video_path, and lockedTools
+        request: JSON body with plugin_id, video_path, lockedTools and
+            optional priority
         plugin_manager: PluginRegistry from app state (DI)
         plugin_service: PluginManagementService instance (DI)
 
@@ -318,6 +347,7 @@ async def submit_video_job(
             plugin_id=plugin_id,
             input_path=video_path,
             job_type=job_type,
+            priority=request.priority,
         )
         db.add(job)
         db.flush()  # Flush to ensure job exists before adding tools
@@ -330,6 +360,12 @@ async def submit_video_job(
     finally:
         db.close()
 
+    # v0.16.0: Queue the job for dispatch, then wake the worker
+    enqueue_submitted_job(
+        settings, str(job_id), plugin_id, job_type, priority=request.priority
+    )
+    job_notifier.notify()
+
     return {"job_id": str(job_id)}
 
 
@@ -345,6 +381,12 @@ async def submit_video(
         None,
         description="Logical tool ID(s) (capability strings). Repeatable for multi-tool.",
     ),
+    priority: int = Query(
+        0,
+        ge=-10,
+        le=10,
+        description="Scheduling priority, -10..10 (higher runs first)",
+    ),
     plugin_manager=Depends(get_plugin_manager),
     plugin_service=Depends(get_plugin_service),
 ):
@@ -358,6 +400,7 @@ async def submit_video(
         plugin_id (str): Plugin identifier.
         tool (List[str] | None): Concrete tool ID(s) from the plugin manifest. Repeatable for multi-tool; optional if `logical_tool_id` is provided.
         logical_tool_id (List[str] | None): Logical capability strings used to resolve concrete tool ID(s). Repeatable for multi-tool.
+        priority (int): Scheduling priority from -10 to 10 (default 0); higher-priority jobs are dispatched first.
 
     Returns:
         dict: Canonical JSON describing the queued job.
@@ -458,9 +501,8 @@ async def submit_video(
                 detail=f"Tool '{resolved_tool}' does not support video input (input_types: {input_types})",
             )
 
-    # Read and validate file
-    contents = await file.read()
-    validate_mp4_magic_bytes(contents)
+    # v0.16.0: Validate the header only; the body is streamed to storage
+    await validate_mp4_upload(file)
 
     # Determine job type based on number of tools
     is_multi_tool = len(resolved_tools) > 1
@@ -474,7 +516,7 @@ async def submit_video(
     storage = get_storage()
 
     try:
-        await save_file_async(storage, BytesIO(contents), input_path)
+        await save_file_async(storage, file.file, input_path)
         logger.info(f"Video saved to {input_path}")
     except (ConnectionError, TimeoutError, OSError, ClientError) as e:
         logger.error(
@@ -493,6 +535,7 @@ async def submit_video(
             plugin_id=plugin_id,
             input_path=input_path,
             job_type=job_type,
+            priority=priority,
         )
         db.add(job)
         db.flush()  # Flush to ensure job exists before adding tools
@@ -505,6 +548,10 @@ async def submit_video(
     finally:
         db.close()
 
+    # v0.16.0: Queue the job for dispatch, then wake the worker
+    enqueue_submitted_job(settings, str(job_id), plugin_id, job_type, priority=priority)
+    job_notifier.notify()
+
     # v0.9.8: Canonical JSON response
     # Handle case where created_at might be None (e.g., in mocked tests)
     if job.created_at:
@@ -291,12 +291,30 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error("Startup audit failed", extra={"error": str(e)})
 
+    # v0.16.0: Warm the plugin process pool so workers load models at startup
+    try:
+        from .plugins.sandbox import get_plugin_process_pool
+
+        plugin_pool = get_plugin_process_pool()
+        if plugin_pool is not None:
+            plugin_pool.start()
+    except Exception as e:
+        logger.error("Plugin process pool startup failed", extra={"error": str(e)})
+
     # Services (v0.9.2: TaskProcessor removed, using JobWorker instead)
     # v0.9.3: Legacy AnalysisService and JobManagementService removed
     try:
         app.state.plugin_service = PluginManagementService(plugin_manager)
+        # v0.16.0: Streaming actors are pooled across WebSocket clients and
+        # frames of the same tool are micro-batched
+        from .services.streaming_actor_pool import create_streaming_actor_pool
+
         app.state.analysis_service = VisionAnalysisService(
-            app.state.plugin_service, ws_manager
+            app.state.plugin_service,
+            ws_manager,
+            actor_pool=create_streaming_actor_pool(settings),
+            batch_window_ms=settings.streaming_batch_window_ms,
+            batch_max_size=settings.streaming_batch_max_size,
         )
 
         # Phase 14: Pipeline Services
@@ -416,6 +434,12 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down ForgeSyte...")
+    from .plugins.sandbox import shutdown_plugin_process_pool
+
+    shutdown_plugin_process_pool()
+    analysis_service = getattr(app.state, "analysis_service", None)
+    if analysis_service is not None:
+        analysis_service.actor_pool.shutdown()
     for name in plugin_manager.list().keys():
         try:
             plugin = plugin_manager.get(name)
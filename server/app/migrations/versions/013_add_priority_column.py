@@ -0,0 +1,46 @@
+"""Add priority column for job scheduling.
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-16
+
+v0.16.0: Jobs carry an integer priority (higher runs first). Existing
+rows default to 0, which keeps their FIFO order relative to each other.
+
+The column is nullable because DuckDB cannot ADD COLUMN with a NOT NULL
+constraint; the server default fills it for every insert.
+
+No index is created: DuckDB rewrites indexed columns on UPDATE, and the
+pending set scanned by the worker is small.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "013"
+down_revision = "012"
+branch_labels = None
+depends_on = None
+
+
+def _column_exists(table_name: str, column_name: str) -> bool:
+    """Check if a column exists in a table using DuckDB's PRAGMA."""
+    conn = op.get_bind()
+    result = conn.execute(sa.text(f"PRAGMA table_info('{table_name}')"))
+    columns = [row[1] for row in result.fetchall()]
+    return column_name in columns
+
+
+def upgrade() -> None:
+    """Add priority column to jobs table."""
+    if not _column_exists("jobs", "priority"):
+        op.add_column(
+            "jobs",
+            sa.Column("priority", sa.Integer(), nullable=True, server_default="0"),
+        )
+
+
+def downgrade() -> None:
+    """Remove priority column from jobs table."""
+    if _column_exists("jobs", "priority"):
+        op.drop_column("jobs", "priority")
@@ -0,0 +1,72 @@
+"""Add 'cancelled' to the job status enum.
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-16
+
+v0.16.0: Jobs can be cancelled via DELETE /v1/jobs/{job_id}.
+
+DuckDB stores jobs.status as an ENUM, so the column type is widened with
+ALTER COLUMN ... TYPE. DuckDB refuses to alter a table that has indexes,
+so ix_jobs_progress (migration 006) is dropped and recreated around it.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "014"
+down_revision = "013"
+branch_labels = None
+depends_on = None
+
+OLD_STATUSES = ("pending", "running", "completed", "failed")
+NEW_STATUSES = OLD_STATUSES + ("cancelled",)
+
+
+def _status_type() -> str:
+    """Return the DuckDB data type of jobs.status."""
+    conn = op.get_bind()
+    return conn.execute(
+        sa.text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_name = 'jobs' AND column_name = 'status'"
+        )
+    ).scalar_one()
+
+
+def _index_exists(index_name: str) -> bool:
+    """Check if an index exists using DuckDB's catalog."""
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text("SELECT 1 FROM duckdb_indexes() WHERE index_name = :name"),
+        {"name": index_name},
+    )
+    return result.first() is not None
+
+
+def _set_status_values(values: tuple) -> None:
+    """Change jobs.status to an ENUM of the given values."""
+    enum_values = ", ".join(f"'{value}'" for value in values)
+    had_index = _index_exists("ix_jobs_progress")
+    if had_index:
+        op.drop_index("ix_jobs_progress", table_name="jobs")
+    op.execute(f"ALTER TABLE jobs ALTER COLUMN status TYPE ENUM({enum_values})")
+    if had_index:
+        op.create_index("ix_jobs_progress", "jobs", ["progress"])
+
+
+def upgrade() -> None:
+    """Allow 'cancelled' as a job status."""
+    if "'cancelled'" not in _status_type():
+        _set_status_values(NEW_STATUSES)
+
+
+def downgrade() -> None:
+    """Remove 'cancelled'; cancelled jobs become failed."""
+    if "'cancelled'" in _status_type():
+        op.execute(
+            "UPDATE jobs SET status = 'failed', "
+            "error_message = COALESCE(error_message, 'Cancelled by user') "
+            "WHERE status = 'cancelled'"
+        )
+        _set_status_values(OLD_STATUSES)
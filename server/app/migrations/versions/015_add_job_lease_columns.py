@@ -0,0 +1,56 @@
+"""Add lease columns for running-job heartbeats.
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-16
+
+v0.16.0: A worker holds a lease on every job it runs and renews it
+periodically. lease_owner identifies the worker, lease_expires_at is the
+renewal deadline, and attempts counts how often the job was claimed.
+RUNNING jobs whose lease expired are requeued until attempts reaches
+FORGESYTE_JOB_MAX_ATTEMPTS.
+
+Like priority (013), attempts is nullable with a server default because
+DuckDB cannot ADD COLUMN ... NOT NULL.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "015"
+down_revision = "014"
+branch_labels = None
+depends_on = None
+
+LEASE_COLUMNS = (
+    ("lease_owner", sa.String(), None),
+    ("lease_expires_at", sa.DateTime(), None),
+    ("attempts", sa.Integer(), "0"),
+)
+
+
+def _column_exists(table_name: str, column_name: str) -> bool:
+    """Check if a column exists in a table using DuckDB's PRAGMA."""
+    conn = op.get_bind()
+    result = conn.execute(sa.text(f"PRAGMA table_info('{table_name}')"))
+    columns = [row[1] for row in result.fetchall()]
+    return column_name in columns
+
+
+def upgrade() -> None:
+    """Add lease_owner, lease_expires_at and attempts to jobs table."""
+    for name, column_type, server_default in LEASE_COLUMNS:
+        if not _column_exists("jobs", name):
+            op.add_column(
+                "jobs",
+                sa.Column(
+                    name, column_type, nullable=True, server_default=server_default
+                ),
+            )
+
+
+def downgrade() -> None:
+    """Remove lease columns from jobs table."""
+    for name, _, _ in reversed(LEASE_COLUMNS):
+        if _column_exists("jobs", name):
+            op.drop_column("jobs", name)
@@ -17,6 +17,8 @@ class JobStatus(str, enum.Enum):
     running = "running"
     completed = "completed"
     failed = "failed"
+    # v0.16.0: Cancelled via DELETE /v1/jobs/{job_id}
+    cancelled = "cancelled"
 
 
 class Job(Base):
@@ -87,3 +89,36 @@ class Job(Base):
         nullable=True,
         default=None,
     )
+
+    # v0.16.0: Scheduling priority (higher runs first, default 0)
+    # Within a priority level the worker applies weighted fair share
+    # across (plugin_id, job_type) flows. See app/workers/fair_share.py.
+    # Nullable only because DuckDB cannot ADD COLUMN ... NOT NULL.
+    priority = Column(
+        Integer,
+        nullable=True,
+        default=0,
+        server_default="0",
+    )
+
+    # v0.16.0: Lease held by the worker running the job. The worker renews
+    # lease_expires_at while it runs; RUNNING jobs whose lease expired are
+    # requeued (see JobLeaseService). attempts counts claims of the job.
+    lease_owner = Column(
+        String,
+        nullable=True,
+        default=None,
+    )
+
+    lease_expires_at = Column(
+        DateTime,
+        nullable=True,
+        default=None,
+    )
+
+    attempts = Column(
+        Integer,
+        nullable=True,
+        default=0,
+        server_default="0",
+    )
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 logger = logging.getLogger(__name__)
 
@@ -188,6 +188,25 @@ class BasePlugin(ABC):
         """
         raise NotImplementedError
 
+    # ----------------------------------------------------------------------
+    # Optional batch API
+    # ----------------------------------------------------------------------
+
+    def run_tool_batch(
+        self, tool_name: str, args_list: List[Dict[str, Any]]
+    ) -> List[Any]:
+        """
+        Execute a tool on several inputs at once.
+
+        v0.16.0: StreamingToolActor.process_frames() calls this with frames
+        collected from all clients streaming the tool. Plugins override it
+        to run model inference at batch size > 1. The default runs each
+        input through run_tool().
+
+        Must return one result per input, in input order.
+        """
+        return [self.run_tool(tool_name, args) for args in args_list]
+
     # ----------------------------------------------------------------------
     # Optional lifecycle hook
     # ----------------------------------------------------------------------
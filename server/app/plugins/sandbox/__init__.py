@@ -1,6 +1,7 @@
 """Sandbox module for Phase 11 plugin crash protection.
 
 Provides exception isolation for plugin execution with timeout and memory guards.
+v0.16.0: PluginProcessPool adds process isolation with warm worker processes.
 """
 
 from .memory_guard import (
@@ -10,6 +11,11 @@ from .memory_guard import (
     get_memory_usage_bytes,
     run_with_memory_guard,
 )
+from .process_pool import (
+    PluginProcessPool,
+    get_plugin_process_pool,
+    shutdown_plugin_process_pool,
+)
 from .sandbox_runner import run_plugin_sandboxed
 from .timeout import run_sandboxed_with_timeout, run_with_timeout
 
@@ -22,4 +28,7 @@ __all__ = [
     "check_memory_limit",
     "format_memory_bytes",
     "DEFAULT_MEMORY_LIMIT_BYTES",
+    "PluginProcessPool",
+    "get_plugin_process_pool",
+    "shutdown_plugin_process_pool",
 ]
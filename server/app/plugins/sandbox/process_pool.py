@@ -0,0 +1,495 @@
+"""Warm process-pool backend for sandboxed plugin execution.
+
+v0.16.0: run_plugin_sandboxed() only isolates plugin *exceptions*; it runs in
+the calling thread, so a segfault or a leak takes down the server process
+and GIL-bound plugins never use more than one core.
+
+PluginProcessPool keeps N long-lived worker processes with every plugin
+preloaded (model load cost is paid once per worker, not per call). Each
+call is shipped over a multiprocessing Pipe as a single pickled message
+and executed in the worker via run_plugin_sandboxed(), so error mapping is
+identical to in-process execution.
+
+- Progress callbacks are relayed back over the same pipe. If a callback
+  raises (e.g. JobCancelledError), the call is aborted and its worker
+  replaced.
+- A worker is recycled after `max_calls_per_worker` calls or when its RSS
+  exceeds `max_rss_bytes`.
+- A call that exceeds its timeout kills the worker process (a real hard
+  timeout, unlike the thread-based run_with_timeout) and a fresh worker
+  takes its place. A worker that dies mid-call is replaced the same way.
+
+Usage:
+    pool = PluginProcessPool(size=2)
+    pool.start()
+    result = pool.run("yolo", "player_detector", {"frame": frame_b64})
+    pool.shutdown()
+"""
+
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import signal
+import threading
+import time
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .sandbox_runner import PluginSandboxResult, run_plugin_sandboxed
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CALLS_PER_WORKER = 500
+DEFAULT_MAX_RSS_BYTES = 4 * 1024 * 1024 * 1024
+DEFAULT_CALL_TIMEOUT_SECONDS = 3600.0
+DEFAULT_STARTUP_TIMEOUT_SECONDS = 300.0
+
+# Pipe message kinds (worker -> parent)
+_READY = "ready"
+_PROGRESS = "progress"
+_RESULT = "result"
+
+PluginLoader = Callable[[], Dict[str, Any]]
+
+
+def load_entrypoint_plugins() -> Dict[str, Any]:
+    """Load all entry-point plugins (default loader for pool workers).
+
+    Returns:
+        Dict mapping plugin name -> plugin instance
+    """
+    from ...plugin_loader import PluginRegistry
+
+    registry = PluginRegistry()
+    load_result = registry.load_plugins()
+    if load_result.get("errors"):
+        logger.error(f"Pool worker plugin load errors: {load_result['errors']}")
+    return {name: registry.get(name) for name in registry.list()}
+
+
+def _send(conn: Connection, message: Any) -> None:
+    conn.send_bytes(pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _recv(conn: Connection) -> Any:
+    return pickle.loads(conn.recv_bytes())
+
+
+def _current_rss_bytes() -> int:
+    """Return this process's resident set size in bytes (0 if unknown)."""
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _run_call(
+    conn: Connection,
+    plugins: Dict[str, Any],
+    plugin_id: str,
+    tool_name: str,
+    args: Dict[str, Any],
+    relay_progress: bool,
+) -> PluginSandboxResult:
+    """Execute one tool call inside a worker process."""
+    plugin = plugins.get(plugin_id)
+    if plugin is None:
+        return PluginSandboxResult(
+            ok=False,
+            error=f"Plugin '{plugin_id}' is not loaded in pool worker",
+            error_type="ValueError",
+        )
+
+    def tool_func(**kw: Any) -> Any:
+        if relay_progress:
+            kw["progress_callback"] = lambda *a, **k: _send(conn, (_PROGRESS, a, k))
+        return plugin.run_tool(tool_name, kw)
+
+    return run_plugin_sandboxed(tool_func, **args)
+
+
+def _worker_main(
+    conn: Connection,
+    plugin_loader: PluginLoader,
+    max_calls: int,
+    max_rss_bytes: int,
+) -> None:
+    """Worker process loop: preload plugins, then serve calls until retired."""
+    # Ctrl-C is handled by the parent, which shuts the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    try:
+        plugins = plugin_loader()
+    except Exception as e:
+        logger.exception(f"Pool worker failed to load plugins: {e}")
+        plugins = {}
+    _send(conn, (_READY, os.getpid()))
+
+    calls = 0
+    while True:
+        try:
+            message = _recv(conn)
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+
+        result = _run_call(conn, plugins, *message)
+        calls += 1
+        retire = calls >= max_calls or (
+            max_rss_bytes > 0 and _current_rss_bytes() > max_rss_bytes
+        )
+        try:
+            _send(conn, (_RESULT, result, retire))
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            _send(
+                conn,
+                (
+                    _RESULT,
+                    PluginSandboxResult(
+                        ok=False,
+                        error=f"Plugin result is not serializable: {e}",
+                        error_type=type(e).__name__,
+                        execution_time_ms=result.execution_time_ms,
+                    ),
+                    retire,
+                ),
+            )
+        if retire:
+            break
+
+    conn.close()
+
+
+class _PoolWorker:
+    """Parent-side handle for one worker process."""
+
+    def __init__(
+        self,
+        ctx: Any,
+        plugin_loader: PluginLoader,
+        max_calls: int,
+        max_rss_bytes: int,
+    ) -> None:
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, plugin_loader, max_calls, max_rss_bytes),
+            name="plugin-pool-worker",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid
+
+    def wait_ready(self, timeout: float) -> bool:
+        """Block until the worker has loaded its plugins."""
+        if self.ready:
+            return True
+        try:
+            if self.conn.poll(timeout) and _recv(self.conn)[0] == _READY:
+                self.ready = True
+        except (EOFError, OSError):
+            pass
+        return self.ready
+
+    def call(
+        self,
+        plugin_id: str,
+        tool_name: str,
+        args: Dict[str, Any],
+        progress_callback: Optional[Callable[..., Any]],
+        timeout_seconds: float,
+    ) -> Tuple[PluginSandboxResult, bool]:
+        """Run one call on this worker.
+
+        Returns:
+            (result, reusable) - reusable is False if the worker timed out,
+            died, retired, or was aborted by progress_callback and must be
+            replaced
+        """
+        payload = pickle.dumps(
+            (plugin_id, tool_name, args, progress_callback is not None),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        deadline = time.monotonic() + timeout_seconds
+        try:
+            self.conn.send_bytes(payload)
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.conn.poll(remaining):
+                    return (
+                        PluginSandboxResult(
+                            ok=False,
+                            error=(
+                                f"Plugin execution timed out after "
+                                f"{timeout_seconds}s (worker killed)"
+                            ),
+                            error_type="TimeoutError",
+                        ),
+                        False,
+                    )
+                kind, *rest = _recv(self.conn)
+                if kind == _PROGRESS:
+                    progress_args, progress_kwargs = rest
+                    try:
+                        progress_callback(*progress_args, **progress_kwargs)  # type: ignore[misc]
+                    except Exception as e:
+                        # Same as in-process: a raising callback (e.g. job
+                        # cancellation) aborts the tool. The worker is
+                        # mid-call, so it is killed rather than reused.
+                        return (
+                            PluginSandboxResult(
+                                ok=False,
+                                error=f"Plugin execution aborted: {e}",
+                                error_type=type(e).__name__,
+                            ),
+                            False,
+                        )
+                    continue
+                result, retire = rest
+                return result, not retire
+        except (EOFError, OSError):
+            self.process.join(timeout=1.0)
+            return (
+                PluginSandboxResult(
+                    ok=False,
+                    error=(
+                        f"Plugin worker process died "
+                        f"(exit code {self.process.exitcode})"
+                    ),
+                    error_type="WorkerCrashed",
+                ),
+                False,
+            )
+
+    def stop(self, graceful: bool = True) -> None:
+        """Stop the worker, killing it if it does not exit promptly."""
+        if graceful and self.process.is_alive():
+            try:
+                _send(self.conn, None)
+            except (OSError, ValueError):
+                pass
+            self.process.join(timeout=2.0)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout=2.0)
+        self.conn.close()
+
+
+class PluginProcessPool:
+    """Pool of warm, plugin-preloaded worker processes.
+
+    Thread-safe: each caller borrows one idle worker for the duration of a
+    call, so at most `size` calls run at once and further callers block.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        *,
+        plugin_loader: PluginLoader = load_entrypoint_plugins,
+        max_calls_per_worker: int = DEFAULT_MAX_CALLS_PER_WORKER,
+        max_rss_bytes: int = DEFAULT_MAX_RSS_BYTES,
+        call_timeout_seconds: float = DEFAULT_CALL_TIMEOUT_SECONDS,
+        startup_timeout_seconds: float = DEFAULT_STARTUP_TIMEOUT_SECONDS,
+        mp_context: str = "spawn",
+    ) -> None:
+        """Initialize pool (no processes are started until start()/run()).
+
+        Args:
+            size: Number of worker processes
+            plugin_loader: Picklable top-level function returning
+                           {plugin_id: plugin}; called once per worker
+            max_calls_per_worker: Recycle a worker after this many calls
+            max_rss_bytes: Recycle a worker whose RSS exceeds this (0 = off)
+            call_timeout_seconds: Default hard timeout per call
+            startup_timeout_seconds: Max time for a worker to load plugins
+            mp_context: multiprocessing start method ("spawn" avoids
+                        inheriting CUDA/DB state from the server process)
+
+        Raises:
+            ValueError: If size or max_calls_per_worker < 1
+        """
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        if max_calls_per_worker < 1:
+            raise ValueError("max_calls_per_worker must be >= 1")
+        self.size = size
+        self.max_calls_per_worker = max_calls_per_worker
+        self.max_rss_bytes = max_rss_bytes
+        self.call_timeout_seconds = call_timeout_seconds
+        self.startup_timeout_seconds = startup_timeout_seconds
+        self._plugin_loader = plugin_loader
+        self._ctx = multiprocessing.get_context(mp_context)
+        self._idle: "queue.Queue[Optional[_PoolWorker]]" = queue.Queue()
+        self._workers: Dict[int, _PoolWorker] = {}
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+        self.recycled = 0
+
+    def _spawn(self) -> _PoolWorker:
+        worker = _PoolWorker(
+            self._ctx,
+            self._plugin_loader,
+            self.max_calls_per_worker,
+            self.max_rss_bytes,
+        )
+        with self._lock:
+            self._workers[id(worker)] = worker
+        return worker
+
+    def _discard(self, worker: _PoolWorker, graceful: bool) -> None:
+        with self._lock:
+            self._workers.pop(id(worker), None)
+        worker.stop(graceful=graceful)
+
+    def start(self) -> None:
+        """Start all worker processes so plugins load before the first call."""
+        with self._lock:
+            if self._started:
+                return
+            if self._closed:
+                raise RuntimeError("PluginProcessPool is shut down")
+            self._started = True
+        for _ in range(self.size):
+            self._idle.put(self._spawn())
+        logger.info(f"Plugin process pool started with {self.size} workers")
+
+    def run(
+        self,
+        plugin_id: str,
+        tool_name: str,
+        args: Dict[str, Any],
+        progress_callback: Optional[Callable[..., Any]] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> PluginSandboxResult:
+        """Execute a plugin tool in a pool worker.
+
+        Never raises for plugin failures; like run_plugin_sandboxed(), all
+        errors come back as a PluginSandboxResult with ok=False.
+
+        Args:
+            plugin_id: Plugin ID (must be loaded by plugin_loader)
+            tool_name: Tool name passed to plugin.run_tool()
+            args: Picklable tool arguments
+            progress_callback: Optional callback, invoked in the calling
+                               thread with the plugin's progress arguments
+            timeout_seconds: Hard timeout (default: call_timeout_seconds)
+
+        Returns:
+            PluginSandboxResult
+
+        Raises:
+            RuntimeError: If the pool has been shut down
+        """
+        self.start()
+        timeout = timeout_seconds or self.call_timeout_seconds
+
+        worker = self._idle.get()
+        if worker is None or self._closed:
+            self._idle.put(None)
+            raise RuntimeError("PluginProcessPool is shut down")
+
+        reusable = False
+        try:
+            if not worker.wait_ready(self.startup_timeout_seconds):
+                return PluginSandboxResult(
+                    ok=False,
+                    error="Plugin worker process failed to start",
+                    error_type="WorkerCrashed",
+                )
+            try:
+                result, reusable = worker.call(
+                    plugin_id, tool_name, args, progress_callback, timeout
+                )
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                # Arguments could not be serialized; nothing reached the worker
+                reusable = True
+                return PluginSandboxResult(
+                    ok=False,
+                    error=f"Plugin arguments are not serializable: {e}",
+                    error_type=type(e).__name__,
+                )
+            if result.error_type in ("TimeoutError", "WorkerCrashed"):
+                logger.error(
+                    f"Pool worker {worker.pid} failed running "
+                    f"{plugin_id}.{tool_name}: {result.error}"
+                )
+            return result
+        finally:
+            if reusable and not self._closed:
+                self._idle.put(worker)
+            else:
+                self._discard(worker, graceful=False)
+                if not self._closed:
+                    self.recycled += 1
+                    self._idle.put(self._spawn())
+
+    def worker_pids(self) -> List[Optional[int]]:
+        """Return PIDs of live worker processes (for monitoring/tests)."""
+        with self._lock:
+            return [w.pid for w in self._workers.values() if w.process.is_alive()]
+
+    def shutdown(self) -> None:
+        """Stop all workers. Calls in flight are killed."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            workers = list(self._workers.values())
+        # Wake any callers blocked waiting for a worker
+        self._idle.put(None)
+        for worker in workers:
+            self._discard(worker, graceful=True)
+        logger.info("Plugin process pool shut down")
+
+
+_pool: Optional[PluginProcessPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_plugin_process_pool() -> Optional[PluginProcessPool]:
+    """Return the shared pool, or None if FORGESYTE_PLUGIN_PROCESS_WORKERS=0.
+
+    Returns:
+        Process-wide PluginProcessPool configured from settings, or None
+        when plugins run in-process
+    """
+    global _pool
+    from ...settings import settings
+
+    if settings.plugin_process_workers <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = PluginProcessPool(
+                size=settings.plugin_process_workers,
+                max_calls_per_worker=settings.plugin_process_max_calls,
+                max_rss_bytes=settings.plugin_process_max_rss_mb * 1024 * 1024,
+                call_timeout_seconds=settings.plugin_process_timeout_seconds,
+            )
+        return _pool
+
+
+def shutdown_plugin_process_pool() -> None:
+    """Shut down the shared pool if it was created."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
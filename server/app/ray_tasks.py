@@ -24,17 +24,24 @@ Usage:
 """
 
 import base64
+import contextlib
+import hashlib
 import logging
 import tempfile
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Dict, Iterator, List, Optional, Protocol, Tuple
 
 import ray
 
+from .services.storage.base import StorageService
 from .services.tool_router import iter_manifest_tools
 
 logger = logging.getLogger(__name__)
 
+# v0.16.0: (start, end) frames of a chunked video task; end None = to the end
+FrameRange = Tuple[int, Optional[int]]
+
 
 class StorageServiceProtocol(Protocol):
     """Protocol for storage service (for type hints)."""
@@ -66,8 +73,17 @@ class PluginServiceProtocol(Protocol):
         ...
 
 
-def _get_plugin_service() -> PluginServiceProtocol:
-    """Get plugin service instance (lazy import to avoid circular deps)."""
+# v0.16.0: Ray reuses worker processes across tasks. Building the plugin
+# registry imports every entry point and loads every plugin's models, which
+# took seconds per task, so the plugin and storage services are built once
+# per worker process and shared by all tasks it runs.
+_services_lock = threading.Lock()
+_plugin_service: Optional[PluginServiceProtocol] = None
+_storage_service: Optional[StorageServiceProtocol] = None
+
+
+def _build_plugin_service() -> PluginServiceProtocol:
+    """Create a plugin service with all plugins loaded (lazy imports)."""
     from .plugin_loader import PluginRegistry
     from .services.plugin_management_service import PluginManagementService
 
@@ -81,12 +97,60 @@ def _get_plugin_service() -> PluginServiceProtocol:
     return PluginManagementService(registry)
 
 
+def _get_plugin_service() -> PluginServiceProtocol:
+    """Get this worker process's plugin service, loading plugins on first use."""
+    global _plugin_service
+    if _plugin_service is None:
+        with _services_lock:
+            if _plugin_service is None:
+                _plugin_service = _build_plugin_service()
+    return _plugin_service
+
+
 def _get_storage_service() -> StorageServiceProtocol:
-    """Get storage service instance (lazy import)."""
-    from .services.storage.factory import get_storage_service
-    from .settings import settings
+    """Get this worker process's storage service (lazy import)."""
+    global _storage_service
+    if _storage_service is None:
+        with _services_lock:
+            if _storage_service is None:
+                from .services.storage.factory import get_storage_service
+                from .settings import settings
+
+                _storage_service = get_storage_service(settings)
+    return _storage_service
+
 
-    return get_storage_service(settings)
+def _reset_worker_services() -> None:
+    """Drop the memoized plugin and storage services (for tests)."""
+    global _plugin_service, _storage_service
+    with _services_lock:
+        _plugin_service = None
+        _storage_service = None
+
+
+@contextlib.contextmanager
+def _local_input(storage: StorageServiceProtocol, input_path: str) -> Iterator[Path]:
+    """Yield a local path of an input file for the duration of a task.
+
+    v0.16.0: StorageService backends serve inputs through open_local(),
+    which for S3 pins the copy in the host's storage cache (shared by all
+    Ray workers of the node). Other storages are loaded directly and temp
+    copies deleted afterwards.
+
+    Args:
+        storage: Storage service
+        input_path: Path of the input in storage
+    """
+    if isinstance(storage, StorageService):
+        with storage.open_local(input_path) as local_file_path:
+            yield local_file_path
+        return
+
+    local_file_path = storage.load_file(input_path)
+    try:
+        yield local_file_path
+    finally:
+        _cleanup_local_file(local_file_path)
 
 
 @ray.remote(num_gpus=0)
@@ -95,6 +159,11 @@ def execute_pipeline_remote(
     tools_to_run: List[str],
     input_path: str,
     job_type: str,
+    job_id: Optional[str] = None,
+    progress_actor: Any = None,
+    frame_range: Optional[FrameRange] = None,
+    overlap_frames: int = 0,
+    part: int = 0,
 ) -> Dict[str, Any]:
     """Execute a plugin pipeline on a Ray worker.
 
@@ -108,6 +177,14 @@ def execute_pipeline_remote(
         tools_to_run: List of tool names to execute sequentially
         input_path: Path to input file in storage (S3/MinIO or local)
         job_type: Type of job ("image", "image_multi", "video", "video_multi")
+        job_id: v0.16.0: Job UUID string (for progress reports)
+        progress_actor: v0.16.0: ProgressActor handle receiving video
+                        progress (None disables progress reporting)
+        frame_range: v0.16.0: (start, end) frames of a chunked video job
+                     (end None = to the end of the video)
+        overlap_frames: v0.16.0: Frames processed before start to warm up
+                        stateful tools (dropped from the output)
+        part: v0.16.0: Chunk index (for progress reports)
 
     Returns:
         Dict mapping tool_name -> result for each tool executed
@@ -115,6 +192,12 @@ def execute_pipeline_remote(
     Raises:
         RuntimeError: If plugin or tool execution fails
     """
+    progress_reporter = None
+    if progress_actor is not None and job_id:
+        from .workers.ray_progress import RayProgressReporter
+
+        progress_reporter = RayProgressReporter(progress_actor, job_id, part=part)
+
     return _execute_pipeline_impl(
         plugin_id,
         tools_to_run,
@@ -122,6 +205,9 @@ def execute_pipeline_remote(
         job_type,
         _get_plugin_service,
         _get_storage_service,
+        progress_reporter=progress_reporter,
+        frame_range=frame_range,
+        overlap_frames=overlap_frames,
     )
 
 
@@ -132,6 +218,9 @@ def _execute_pipeline_impl(
     job_type: str,
     get_plugin_service_fn=None,
     get_storage_service_fn=None,
+    progress_reporter=None,
+    frame_range: Optional[FrameRange] = None,
+    overlap_frames: int = 0,
 ) -> Dict[str, Any]:
     """Implementation of pipeline execution (separated for testing).
 
@@ -145,6 +234,10 @@ def _execute_pipeline_impl(
         job_type: Type of job ("image", "image_multi", "video", "video_multi")
         get_plugin_service_fn: Optional override for dependency injection
         get_storage_service_fn: Optional override for dependency injection
+        progress_reporter: v0.16.0: Optional RayProgressReporter for
+                           video progress
+        frame_range: v0.16.0: Only process these frames of the video
+        overlap_frames: v0.16.0: Warm-up frames processed before the range
     """
     # Use injected dependencies or defaults
     if get_plugin_service_fn is None:
@@ -160,7 +253,9 @@ def _execute_pipeline_impl(
         raise ValueError("tools_to_run cannot be empty")
 
     # Download from remote S3 directly to the GPU Worker's temp disk
-    local_file_path = storage.load_file(input_path)
+    # v0.16.0: Through the host's storage cache
+    inputs = contextlib.ExitStack()
+    local_file_path = inputs.enter_context(_local_input(storage, input_path))
 
     try:
         args: Dict[str, Any] = {}
@@ -217,15 +312,42 @@ def _execute_pipeline_impl(
             # Video job: pass the local file path
             args = {"video_path": str(local_file_path)}
 
+        # v0.16.0: Chunked video job - process [start - overlap, end) only
+        first_frame = 0
+        if frame_range is not None:
+            start, end = frame_range
+            first_frame = max(0, start - max(overlap_frames, 0))
+            args["start_frame"] = first_frame
+            if end is not None:
+                args["end_frame"] = end
+
+        # v0.16.0: Report video progress to the JobWorker's ProgressActor
+        total_frames = 0
+        if progress_reporter is not None and "video_path" in args:
+            if frame_range is not None and frame_range[1] is not None:
+                total_frames = frame_range[1] - first_frame
+            else:
+                from .workers.worker import JobWorker
+
+                total_frames = (
+                    JobWorker._get_total_frames(args["video_path"]) - first_frame
+                )
+
         # Execute tools sequentially
         results: Dict[str, Any] = {}
-        for tool_name in tools_to_run:
+        for tool_index, tool_name in enumerate(tools_to_run):
             logger.info(f"Ray Worker executing {plugin_id}.{tool_name}")
 
-            # Note: progress_callback is disabled for Ray tasks in Phase B
-            # Progress tracking happens at the JobWorker level
+            progress_callback = None
+            if total_frames:
+                progress_callback = progress_reporter.callback(
+                    tool_index,
+                    len(tools_to_run),
+                    total_frames,
+                    frame_offset=first_frame if frame_range is not None else None,
+                )
             result = plugin_service.run_plugin_tool(
-                plugin_id, tool_name, args, progress_callback=None
+                plugin_id, tool_name, args, progress_callback=progress_callback
             )
 
             # Handle Pydantic models
@@ -234,21 +356,276 @@ def _execute_pipeline_impl(
             elif hasattr(result, "dict"):
                 result = result.dict()
 
+            if frame_range is not None:
+                # Drop warm-up frames and anything a tool ran past the range
+                result = _clip_frames(result, frame_range, first_frame)
+
             results[tool_name] = result
 
         return results
 
     finally:
-        # Clean up the worker's local temp file (only if it's actually a temp file)
-        # S3StorageService.load_file() returns a tempfile.NamedTemporaryFile path
-        # LocalStorageService.load_file() returns the actual stored file path
-        # Only delete files that are in the system temp directory
-        if local_file_path.exists():
-            temp_dir = Path(tempfile.gettempdir()).resolve()
+        inputs.close()
+
+
+def _cleanup_local_file(local_file_path: Path) -> None:
+    """Delete a storage download if it is a temp file."""
+    # Clean up the worker's local temp file (only if it's actually a temp file)
+    # S3StorageService.load_file() returns a tempfile.NamedTemporaryFile path
+    # LocalStorageService.load_file() returns the actual stored file path
+    # Only delete files that are in the system temp directory
+    if local_file_path.exists():
+        temp_dir = Path(tempfile.gettempdir()).resolve()
+        try:
+            # Check if file is in temp directory
+            local_file_path.resolve().relative_to(temp_dir)
+            local_file_path.unlink()
+        except ValueError:
+            # File is not in temp directory (e.g., local storage) - don't delete
+            pass
+
+
+# ---------------------------------------------------------------------------
+# v0.16.0: Frame-range parallel video execution
+# ---------------------------------------------------------------------------
+#
+# A video job used to run as one task on one Ray worker. When every tool of
+# a job accepts "start_frame" and "end_frame" (manifest input_types), the
+# JobWorker dispatches execute_video_chunked_remote instead. It reads the
+# frame count from the container metadata, splits the video into
+# FORGESYTE_RAY_VIDEO_CHUNK_FRAMES ranges and runs each range as a separate
+# execute_pipeline_remote task. Each task also processes
+# FORGESYTE_RAY_VIDEO_CHUNK_OVERLAP frames before its range, so trackers
+# warm up, and drops them from its output. The per-range frames are then
+# concatenated by frame_idx. The last range runs to the end of the video,
+# so an inexact frame count in the metadata cannot lose frames.
+
+
+def split_frame_ranges(total_frames: int, chunk_frames: int) -> List[FrameRange]:
+    """Split a video into consecutive frame ranges.
+
+    Args:
+        total_frames: Frame count from the container metadata
+        chunk_frames: Frames per range
+
+    Returns:
+        [(start, end), ...] covering the video; the last end is None
+    """
+    if chunk_frames <= 0 or total_frames <= chunk_frames:
+        return [(0, None)]
+    starts = list(range(0, total_frames, chunk_frames))
+    # Fold a short tail into the previous range
+    if len(starts) > 1 and total_frames - starts[-1] < chunk_frames // 2:
+        starts.pop()
+    ends: List[Optional[int]] = [*starts[1:], None]
+    return list(zip(starts, ends, strict=True))
+
+
+def tools_support_frame_ranges(manifest: Any, tools_to_run: List[str]) -> bool:
+    """Return True if every tool accepts start_frame and end_frame."""
+    if not isinstance(manifest, dict):
+        return False
+    tool_defs = {t.get("id"): t for t in iter_manifest_tools(manifest)}
+    for tool_name in tools_to_run:
+        input_types = (tool_defs.get(tool_name) or {}).get("input_types")
+        if not isinstance(input_types, list) or not {
+            "start_frame",
+            "end_frame",
+        }.issubset(input_types):
+            return False
+    return True
+
+
+def _probe_frame_count(video_path: str) -> int:
+    """Read the frame count from the container metadata (0 if unknown)."""
+    try:
+        import cv2
+
+        cap = cv2.VideoCapture(video_path)
+        try:
+            return max(int(cap.get(cv2.CAP_PROP_FRAME_COUNT)), 0)
+        finally:
+            cap.release()
+    except Exception as e:
+        logger.warning(f"Could not read frame count of {video_path}: {e}")
+        return 0
+
+
+def _clip_frames(result: Any, frame_range: FrameRange, first_frame: int) -> Any:
+    """Keep only the frames of a tool output inside frame_range.
+
+    Frames without a frame_idx are numbered by position from first_frame.
+    """
+    start, end = frame_range
+
+    def inside(frames: List[Any]) -> List[Any]:
+        kept = []
+        for position, frame in enumerate(frames):
+            idx = first_frame + position
+            if isinstance(frame, dict) and isinstance(frame.get("frame_idx"), int):
+                idx = frame["frame_idx"]
+            if idx >= start and (end is None or idx < end):
+                kept.append(frame)
+        return kept
+
+    if isinstance(result, dict) and isinstance(result.get("frames"), list):
+        return {**result, "frames": inside(result["frames"])}
+    if isinstance(result, list):
+        return inside(result)
+    return result
+
+
+def _merge_chunk_outputs(outputs: List[Any], total_frames: int) -> Any:
+    """Concatenate one tool's per-range outputs (in range order).
+
+    Dict outputs keep the non-frame keys of the first range, and the
+    largest reported total_frames (at least the probed count).
+    """
+    if all(isinstance(output, list) for output in outputs):
+        return [frame for output in outputs for frame in output]
+    dicts = [output for output in outputs if isinstance(output, dict)]
+    if not dicts:
+        return outputs[0] if outputs else None
+    merged = dict(dicts[0])
+    merged["frames"] = [frame for d in dicts for frame in d.get("frames", [])]
+    reported = [d.get("total_frames") for d in dicts]
+    merged["total_frames"] = max(
+        [total_frames, *[t for t in reported if isinstance(t, int)]]
+    )
+    return merged
+
+
+def _soft_node_affinity(node_id: str) -> Any:
+    """Prefer a node; spill to others when it is busy or lacks resources."""
+    from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
+
+    return NodeAffinitySchedulingStrategy(
+        node_id=node_id, soft=True, _spill_on_unavailable=True
+    )
+
+
+def _local_node_strategy() -> Any:
+    """Return a soft affinity to the current node, or None outside Ray."""
+    if not ray.is_initialized():
+        return None
+    try:
+        node_id = ray.get_runtime_context().get_node_id()
+        if not node_id:
+            return None
+        return _soft_node_affinity(node_id)
+    except Exception as e:
+        logger.debug(f"No node affinity available: {e}")
+        return None
+
+
+def input_node_strategy(input_path: str) -> Any:
+    """Return a soft affinity to the node preferred for an input, or None.
+
+    v0.16.0: Tasks launched from the JobWorker have no coordinator whose
+    node already holds the input. Every task of one input (jobs submitted
+    for the same upload, retries, requeues) therefore prefers the same
+    node, picked by rendezvous hashing of the path over the alive nodes,
+    so the input lands in one node's storage cache and is reused there.
+    Adding or removing a node only moves the inputs that hashed to it.
+
+    Args:
+        input_path: Path of the input in storage
+
+    Returns:
+        NodeAffinitySchedulingStrategy, or None outside Ray or with a
+        single node
+    """
+    if not ray.is_initialized():
+        return None
+    try:
+        node_ids = [node["NodeID"] for node in ray.nodes() if node.get("Alive")]
+        if len(node_ids) < 2:
+            return None
+        node_id = max(
+            node_ids,
+            key=lambda n: hashlib.sha256(f"{n}/{input_path}".encode()).digest(),
+        )
+        return _soft_node_affinity(node_id)
+    except Exception as e:
+        logger.debug(f"No node affinity available: {e}")
+        return None
+
+
+@ray.remote(num_cpus=0)
+def execute_video_chunked_remote(
+    plugin_id: str,
+    tools_to_run: List[str],
+    input_path: str,
+    job_type: str,
+    chunk_frames: int,
+    overlap_frames: int = 0,
+    job_id: Optional[str] = None,
+    progress_actor: Any = None,
+    task_options: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Run a video job as parallel frame-range tasks and merge the results.
+
+    The coordinator reserves no CPU; it only waits on its range tasks.
+    Cancelling it cancels the range tasks as well.
+
+    Args:
+        plugin_id: Plugin identifier
+        tools_to_run: Tool names (all must accept start_frame/end_frame)
+        input_path: Path to the video in storage
+        job_type: "video" or "video_multi"
+        chunk_frames: Frames per range task
+        overlap_frames: Warm-up frames before each range
+        job_id: Job UUID string (for progress reports)
+        progress_actor: ProgressActor handle (None disables progress)
+        task_options: Ray options of each range task (plugin resources)
+
+    Returns:
+        Dict mapping tool_name -> merged result, as execute_pipeline_remote
+    """
+    storage = _get_storage_service()
+    with _local_input(storage, input_path) as local_file_path:
+        total_frames = _probe_frame_count(str(local_file_path))
+
+    ranges = split_frame_ranges(total_frames, chunk_frames)
+    logger.info(
+        f"Ray video job {job_id}: {total_frames} frames in {len(ranges)} range(s)"
+    )
+    # v0.16.0: The probe put the input in this node's cache; prefer this
+    # node for the range tasks and spill to others once it is busy
+    options = dict(task_options or {})
+    strategy = _local_node_strategy()
+    if strategy is not None and len(ranges) > 1:
+        options["scheduling_strategy"] = strategy
+    remote_fn = execute_pipeline_remote
+    if options:
+        remote_fn = remote_fn.options(**options)
+    refs = [
+        remote_fn.remote(
+            plugin_id=plugin_id,
+            tools_to_run=tools_to_run,
+            input_path=input_path,
+            job_type=job_type,
+            job_id=job_id,
+            progress_actor=progress_actor,
+            frame_range=frame_range if len(ranges) > 1 else None,
+            overlap_frames=overlap_frames,
+            part=part,
+        )
+        for part, frame_range in enumerate(ranges)
+    ]
+    try:
+        chunk_results = ray.get(refs)
+    except Exception:
+        for ref in refs:
             try:
-                # Check if file is in temp directory
-                local_file_path.resolve().relative_to(temp_dir)
-                local_file_path.unlink()
-            except ValueError:
-                # File is not in temp directory (e.g., local storage) - don't delete
+                ray.cancel(ref, force=True)
+            except Exception:
                 pass
+        raise
+
+    return {
+        tool_name: _merge_chunk_outputs(
+            [chunk.get(tool_name) for chunk in chunk_results], total_frames
+        )
+        for tool_name in tools_to_run
+    }
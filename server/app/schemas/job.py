@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import List, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class JobStatusResponse(BaseModel):
@@ -15,7 +15,7 @@ class JobStatusResponse(BaseModel):
     """
 
     job_id: UUID
-    status: Literal["pending", "running", "completed", "failed"]
+    status: Literal["pending", "running", "completed", "failed", "cancelled"]
     progress: Optional[int]  # v0.9.6: None for pre-v0.9.6 jobs, 0-100 for video jobs
     created_at: datetime
     updated_at: datetime
@@ -40,7 +40,7 @@ class JobResultsResponse(BaseModel):
     """
 
     job_id: UUID
-    status: str  # "pending", "running", "completed", "failed"
+    status: str  # "pending", "running", "completed", "failed", "cancelled"
     plugin_id: str  # Issue #296: Was missing, DB has NOT NULL
     # Clean Break: No inline results - use result_url for lazy loading
     result_url: Optional[str] = None  # Issue #350: URL for lazy loading video results
@@ -74,7 +74,7 @@ class JobListItem(BaseModel):
     """
 
     job_id: str
-    status: str  # "pending", "running", "completed", "failed" (Issue #212 aligned)
+    status: str  # "pending", "running", "completed", "failed", "cancelled" (Issue #212)
     plugin: str  # plugin_id
     created_at: datetime
     completed_at: Optional[datetime] = None
@@ -92,13 +92,22 @@ class JobListResponse(BaseModel):
     count: int
 
 
+class JobCancelResponse(BaseModel):
+    """Response for DELETE /v1/jobs/{job_id} (v0.16.0)."""
+
+    job_id: UUID
+    status: str  # Always "cancelled"
+
+
 class VideoSubmitRequest(BaseModel):
     """Request body for POST /v1/video/submit (v0.10.1).
 
     v0.10.1: Deterministic tool-locking flow.
     After video upload, tools are locked and passed here.
+    v0.16.0: Added optional scheduling priority (higher runs first).
     """
 
     plugin_id: str
     video_path: str
     lockedTools: List[str]
+    priority: int = Field(default=0, ge=-10, le=10)
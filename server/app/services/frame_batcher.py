@@ -0,0 +1,118 @@
+"""Cross-client micro-batching of streaming frames.
+
+v0.16.0: Every streamed frame used to be one process_frame() call on a
+StreamingToolActor, so inference ran at batch size 1 however many clients
+streamed the same tool. FrameBatcher collects frames per (plugin, tool)
+for a short window (FORGESYTE_STREAMING_BATCH_WINDOW_MS, a few ms) or
+until FORGESYTE_STREAMING_BATCH_MAX_SIZE frames are waiting, runs them as
+one batch, and resolves each caller's future with its own result. Each
+caller still answers its own client and frame_id.
+
+The batcher runs on the event loop of the WebSocket handlers; it needs no
+locks.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+BatchKey = Tuple[str, str]  # (plugin_id, tool_name)
+BatchDispatch = Callable[[BatchKey, List[Dict[str, Any]]], Awaitable[List[Any]]]
+
+DEFAULT_BATCH_WINDOW_MS = 5.0
+DEFAULT_BATCH_MAX_SIZE = 8
+
+
+class FrameBatcher:
+    """Groups concurrent frames of the same tool into batches."""
+
+    def __init__(
+        self,
+        dispatch: BatchDispatch,
+        window_ms: float = DEFAULT_BATCH_WINDOW_MS,
+        max_batch_size: int = DEFAULT_BATCH_MAX_SIZE,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            dispatch: Coroutine running one batch; returns one result per
+                      frame in order (an Exception entry fails that frame)
+            window_ms: Maximum wait for more frames after the first
+            max_batch_size: Frames that trigger an immediate flush
+        """
+        self._dispatch = dispatch
+        self.window_seconds = max(window_ms, 0.0) / 1000.0
+        self.max_batch_size = max(1, max_batch_size)
+        self._pending: Dict[BatchKey, List[Tuple[Dict[str, Any], asyncio.Future]]] = {}
+        self._timers: Dict[BatchKey, asyncio.TimerHandle] = {}
+        # The event loop only keeps weak references to tasks, so running
+        # batches are held here until done
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, plugin_id: str, tool_name: str, args: Dict[str, Any]) -> Any:
+        """Queue one frame and wait for its result.
+
+        Args:
+            plugin_id: Plugin identifier
+            tool_name: Tool name within the plugin
+            args: Tool arguments for the frame
+
+        Returns:
+            The tool result for this frame
+
+        Raises:
+            Exception: The error of this frame or of its whole batch
+        """
+        loop = asyncio.get_running_loop()
+        key = (plugin_id, tool_name)
+        future: asyncio.Future = loop.create_future()
+        batch = self._pending.setdefault(key, [])
+        batch.append((args, future))
+
+        if len(batch) >= self.max_batch_size:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.window_seconds, self._flush, key)
+        return await future
+
+    def _flush(self, key: BatchKey) -> None:
+        """Start dispatching the pending frames of a key."""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, None)
+        if batch:
+            task = asyncio.ensure_future(self._run_batch(key, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(
+        self, key: BatchKey, batch: List[Tuple[Dict[str, Any], asyncio.Future]]
+    ) -> None:
+        """Dispatch one batch and scatter the results to their futures."""
+        results: Optional[List[Any]] = None
+        error: Optional[BaseException] = None
+        try:
+            results = await self._dispatch(key, [args for args, _ in batch])
+            if not isinstance(results, list) or len(results) != len(batch):
+                raise RuntimeError(
+                    f"Batch for {key[0]}.{key[1]} returned "
+                    f"{len(results) if isinstance(results, list) else 'no'} "
+                    f"results for {len(batch)} frames"
+                )
+        except Exception as e:
+            error = e
+
+        if len(batch) > 1:
+            logger.debug(f"Processed batch of {len(batch)} frames for {key}")
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue  # Caller went away (e.g. client disconnected)
+            if error is not None:
+                future.set_exception(error)
+            elif isinstance(results[index], Exception):  # type: ignore[index]
+                future.set_exception(results[index])  # type: ignore[index]
+            else:
+                future.set_result(results[index])  # type: ignore[index]
@@ -0,0 +1,460 @@
+"""JobClaimService - atomic batch claim of pending jobs.
+
+v0.16.0: Replaces the select / conditional update / commit / refresh
+sequence the worker ran per job. A single UPDATE ... RETURNING flips up to
+K pending jobs to RUNNING and returns their rows; the tools for every
+claimed job are then fetched with one batched job_tools query inside the
+same transaction.
+
+DuckDB does not allow an UPDATE inside a CTE, so the job_tools lookup
+cannot be folded into the claim statement itself.
+
+v0.16.0: Jobs are ordered by priority (highest first), then created_at.
+When a FairShareScheduler is passed, a lightweight candidate query runs
+first and the scheduler picks which jobs to claim.
+
+v0.16.0: Passing a JobLease records the claiming worker and a lease
+deadline on each claimed job and increments its attempts (see
+JobLeaseService).
+
+v0.16.0: claim_from_queue() takes candidates from a LeaseQueueService
+instead of scanning the jobs table; the jobs table is only touched by
+primary key to claim the leased jobs.
+
+Usage:
+    from app.services.job_claim_service import JobClaimService
+
+    for claimed in JobClaimService.claim_pending_jobs(db, limit=4):
+        run(claimed.job, claimed.tools)
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from ..models.job import Job, JobStatus
+from .job_tools_service import JobToolsService
+
+if TYPE_CHECKING:
+    from ..workers.fair_share import FairShareScheduler, JobCandidate
+    from .job_lease_service import JobLease
+    from .queue.base import LeaseQueueService
+
+# Delay before a job whose claim conflicted is delivered again
+QUEUE_RETRY_DELAY_SECONDS = 1.0
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ClaimedJob:
+    """A job claimed for execution together with its ordered tools.
+
+    Attributes:
+        job: Job row, already marked RUNNING
+        tools: Tool IDs from job_tools in execution order
+    """
+
+    job: Job
+    tools: List[str] = field(default_factory=list)
+
+
+class JobClaimService:
+    """Service for claiming pending jobs with one DB round trip."""
+
+    @staticmethod
+    def claim_pending_jobs(
+        db: Session,
+        limit: int,
+        type_limits: Optional[Dict[str, int]] = None,
+        scheduler: Optional["FairShareScheduler"] = None,
+        lease: Optional["JobLease"] = None,
+    ) -> List[ClaimedJob]:
+        """Atomically claim up to `limit` pending jobs.
+
+        Without a scheduler, jobs are taken by highest priority, then oldest
+        first, in a single UPDATE ... RETURNING. With a scheduler, pending
+        candidates are read first and the scheduler decides which to claim
+        (see FairShareScheduler); the scheduler is charged for the claimed
+        jobs.
+
+        Only rows that are still pending when the UPDATE runs are claimed,
+        so concurrent workers never claim the same job twice. A write
+        conflict with another worker is treated as "nothing claimed".
+
+        Args:
+            db: Database session (committed on success)
+            limit: Maximum number of jobs to claim
+            type_limits: Optional max jobs to claim per job_type in this
+                         batch (0 excludes the type). Types not listed are
+                         bounded only by `limit`.
+            scheduler: Optional fair-share scheduler choosing the jobs
+            lease: Optional lease taken on the claimed jobs
+
+        Returns:
+            Claimed jobs in dispatch order (empty if none)
+        """
+        if limit <= 0:
+            return []
+
+        if scheduler is not None:
+            candidates = JobClaimService.fetch_candidates(db, per_flow_limit=limit)
+            chosen = scheduler.select(candidates, limit, type_limits)
+            if not chosen:
+                return []
+            claimed = JobClaimService.claim_jobs(
+                db, [c.job_id for c in chosen], lease=lease
+            )
+            claimed_ids = {str(c.job.job_id) for c in claimed}
+            scheduler.record_dispatch([c for c in chosen if c.job_id in claimed_ids])
+            return claimed
+
+        if type_limits:
+            ranked = (
+                select(
+                    Job.job_id,
+                    Job.job_type,
+                    Job.created_at,
+                    Job.priority,
+                    func.row_number()
+                    .over(
+                        partition_by=Job.job_type,
+                        order_by=(Job.priority.desc(), Job.created_at.asc()),
+                    )
+                    .label("type_rank"),
+                )
+                .where(Job.status == JobStatus.pending)
+                .subquery()
+            )
+            conditions = [
+                and_(ranked.c.job_type == job_type, ranked.c.type_rank <= max_jobs)
+                for job_type, max_jobs in type_limits.items()
+                if max_jobs > 0
+            ]
+            conditions.append(ranked.c.job_type.notin_(list(type_limits)))
+            to_claim = (
+                select(ranked.c.job_id)
+                .where(or_(*conditions))
+                .order_by(ranked.c.priority.desc(), ranked.c.created_at.asc())
+                .limit(limit)
+            )
+        else:
+            to_claim = (
+                select(Job.job_id)
+                .where(Job.status == JobStatus.pending)
+                .order_by(Job.priority.desc(), Job.created_at.asc())
+                .limit(limit)
+            )
+
+        return JobClaimService._claim_where(db, Job.job_id.in_(to_claim), lease)
+
+    @staticmethod
+    def claim_from_queue(
+        db: Session,
+        queue: "LeaseQueueService",
+        limit: int,
+        type_limits: Optional[Dict[str, int]] = None,
+        scheduler: Optional["FairShareScheduler"] = None,
+        owner: str = "worker",
+        lease: Optional["JobLease"] = None,
+    ) -> List[ClaimedJob]:
+        """Claim up to `limit` jobs delivered by a lease queue.
+
+        Visible queue entries are ranked like claim_pending_jobs() ranks
+        pending rows (scheduler, or priority then age), leased, and claimed
+        by job_id. Claimed entries are acked: from then on the jobs row owns
+        the job. Entries whose job is no longer pending (cancelled, deleted,
+        claimed elsewhere) are acked and dropped; entries whose claim
+        conflicted are nacked, and a job whose entry is dead-lettered is
+        marked failed.
+
+        Args:
+            db: Database session (committed on success)
+            queue: Lease queue holding pending job_ids
+            limit: Maximum number of jobs to claim
+            type_limits: Optional max jobs to claim per job_type (0 excludes)
+            scheduler: Optional fair-share scheduler choosing the jobs
+            owner: Lease owner recorded on the queue entries
+            lease: Optional lease taken on the claimed jobs
+
+        Returns:
+            Claimed jobs in dispatch order (empty if none)
+        """
+        from ..workers.fair_share import JobCandidate
+
+        if limit <= 0:
+            return []
+
+        candidates = [
+            JobCandidate(
+                job_id=entry.job_id,
+                plugin_id=entry.plugin_id,
+                job_type=entry.job_type,
+                priority=entry.priority,
+                created_at=datetime.fromtimestamp(entry.enqueued_at),
+            )
+            for entry in queue.peek_ready(per_flow_limit=limit)
+        ]
+        if scheduler is not None:
+            chosen = scheduler.select(candidates, limit, type_limits)
+        else:
+            chosen = JobClaimService._select_in_order(candidates, limit, type_limits)
+        if not chosen:
+            return []
+
+        leased = {
+            entry.job_id for entry in queue.lease([c.job_id for c in chosen], owner)
+        }
+        chosen = [c for c in chosen if c.job_id in leased]
+        if not chosen:
+            return []
+
+        claimed = JobClaimService.claim_jobs(
+            db, [c.job_id for c in chosen], lease=lease
+        )
+        claimed_ids = {str(c.job.job_id) for c in claimed}
+        queue.ack(list(claimed_ids))
+
+        unclaimed = [c.job_id for c in chosen if c.job_id not in claimed_ids]
+        if unclaimed:
+            JobClaimService._settle_unclaimed(db, queue, unclaimed)
+
+        if scheduler is not None:
+            scheduler.record_dispatch([c for c in chosen if c.job_id in claimed_ids])
+        return claimed
+
+    @staticmethod
+    def _select_in_order(
+        candidates: List["JobCandidate"],
+        limit: int,
+        type_limits: Optional[Dict[str, int]],
+    ) -> List["JobCandidate"]:
+        """Pick candidates by priority, then age, honouring type_limits."""
+        remaining = dict(type_limits or {})
+        chosen: List["JobCandidate"] = []
+        for candidate in sorted(candidates, key=lambda c: (-c.priority, c.created_at)):
+            if len(chosen) >= limit:
+                break
+            if remaining.get(candidate.job_type, 1) <= 0:
+                continue
+            chosen.append(candidate)
+            if candidate.job_type in remaining:
+                remaining[candidate.job_type] -= 1
+        return chosen
+
+    @staticmethod
+    def _settle_unclaimed(
+        db: Session, queue: "LeaseQueueService", job_ids: List[str]
+    ) -> None:
+        """Ack, retry, or dead-letter leased entries whose claim failed.
+
+        Args:
+            db: Database session
+            queue: Queue the entries were leased from
+            job_ids: Leased job_ids that were not claimed
+        """
+        statuses = {
+            str(job_id): status
+            for job_id, status in db.query(Job.job_id, Job.status)
+            .filter(Job.job_id.in_(job_ids))
+            .all()
+        }
+        db.rollback()
+
+        for job_id in job_ids:
+            if statuses.get(job_id) != JobStatus.pending:
+                # Cancelled, deleted or already running: nothing to deliver
+                queue.ack([job_id])
+                continue
+
+            if queue.nack(
+                job_id, "Job claim conflicted", delay=QUEUE_RETRY_DELAY_SECONDS
+            ):
+                logger.error(f"Job {job_id} dead-lettered: claim kept failing")
+                db.query(Job).filter(Job.job_id == job_id).filter(
+                    Job.status == JobStatus.pending
+                ).update(
+                    {
+                        "status": JobStatus.failed,
+                        "error_message": "Dead-lettered: job could not be claimed",
+                    },
+                    synchronize_session=False,
+                )
+                db.commit()
+
+    @staticmethod
+    def claim_jobs(
+        db: Session, job_ids: List[str], lease: Optional["JobLease"] = None
+    ) -> List[ClaimedJob]:
+        """Atomically claim specific jobs if they are still pending.
+
+        Args:
+            db: Database session (committed on success)
+            job_ids: Job UUID strings to claim
+            lease: Optional lease taken on the claimed jobs
+
+        Returns:
+            Claimed jobs in the order of job_ids (jobs already taken by
+            another worker are omitted)
+        """
+        if not job_ids:
+            return []
+        claimed = JobClaimService._claim_where(db, Job.job_id.in_(job_ids), lease)
+        position = {job_id: idx for idx, job_id in enumerate(job_ids)}
+        claimed.sort(key=lambda c: position.get(str(c.job.job_id), len(position)))
+        return claimed
+
+    @staticmethod
+    def fetch_candidates(db: Session, per_flow_limit: int) -> List["JobCandidate"]:
+        """Read the head of every (plugin_id, job_type) flow of pending jobs.
+
+        Only the top `per_flow_limit` jobs of each flow (by priority, then
+        age) are returned, so a large backlog in one flow cannot hide the
+        jobs of other flows.
+
+        Args:
+            db: Database session
+            per_flow_limit: Maximum candidates per flow
+
+        Returns:
+            Lightweight JobCandidate rows (no ORM objects)
+        """
+        from ..workers.fair_share import JobCandidate
+
+        ranked = (
+            select(
+                Job.job_id,
+                Job.plugin_id,
+                Job.job_type,
+                Job.priority,
+                Job.created_at,
+                func.row_number()
+                .over(
+                    partition_by=(Job.plugin_id, Job.job_type),
+                    order_by=(Job.priority.desc(), Job.created_at.asc()),
+                )
+                .label("flow_rank"),
+            )
+            .where(Job.status == JobStatus.pending)
+            .subquery()
+        )
+        rows = db.execute(
+            select(
+                ranked.c.job_id,
+                ranked.c.plugin_id,
+                ranked.c.job_type,
+                ranked.c.priority,
+                ranked.c.created_at,
+            ).where(ranked.c.flow_rank <= per_flow_limit)
+        ).all()
+        return [
+            JobCandidate(
+                job_id=str(row.job_id),
+                plugin_id=row.plugin_id,
+                job_type=row.job_type,
+                priority=row.priority or 0,
+                created_at=row.created_at,
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def enqueue_pending(db: Session, queue: "LeaseQueueService") -> int:
+        """Enqueue every pending job (entries already queued are kept).
+
+        Run once when a worker starts on a queue, so jobs committed before a
+        crash (or before the queue backend was enabled) are not stranded.
+
+        Args:
+            db: Database session
+            queue: Queue to fill
+
+        Returns:
+            Number of pending jobs found
+        """
+        from .queue.base import QueueEntry
+
+        rows = db.execute(
+            select(
+                Job.job_id, Job.plugin_id, Job.job_type, Job.priority, Job.created_at
+            ).where(Job.status == JobStatus.pending)
+        ).all()
+        queue.enqueue_many(
+            QueueEntry(
+                job_id=str(row.job_id),
+                plugin_id=row.plugin_id,
+                job_type=row.job_type,
+                priority=row.priority or 0,
+                enqueued_at=row.created_at.timestamp() if row.created_at else 0.0,
+            )
+            for row in rows
+        )
+        return len(rows)
+
+    @staticmethod
+    def _claim_where(
+        db: Session, condition, lease: Optional["JobLease"] = None
+    ) -> List[ClaimedJob]:
+        """Flip matching pending jobs to RUNNING and load their tools.
+
+        Args:
+            db: Database session (committed on success)
+            condition: Extra WHERE clause selecting the jobs to claim
+            lease: Optional lease taken on the claimed jobs
+
+        Returns:
+            Claimed jobs in priority, then created_at order
+        """
+        values = {
+            "status": JobStatus.running,
+            "attempts": func.coalesce(Job.attempts, 0) + 1,
+        }
+        if lease is not None:
+            values["lease_owner"] = lease.owner
+            values["lease_expires_at"] = lease.expires_at()
+        stmt = (
+            update(Job)
+            .where(condition)
+            .where(Job.status == JobStatus.pending)
+            .values(**values)
+            .returning(Job)
+        )
+
+        try:
+            jobs = list(
+                db.execute(
+                    stmt, execution_options={"synchronize_session": False}
+                ).scalars()
+            )
+            tools_by_job = JobToolsService.get_tools_for_jobs(
+                db, [job.job_id for job in jobs]
+            )
+            # RETURNING already gave us the committed state; keep it loaded
+            # instead of paying a refresh SELECT per job after commit
+            expire_on_commit = db.expire_on_commit
+            db.expire_on_commit = False
+            try:
+                db.commit()
+            finally:
+                db.expire_on_commit = expire_on_commit
+        except DBAPIError as e:
+            # Another worker updated the same rows first
+            db.rollback()
+            logger.debug(f"Job claim conflicted with another worker: {e}")
+            return []
+
+        jobs.sort(key=lambda job: (-(job.priority or 0), job.created_at))
+        claimed = [
+            ClaimedJob(job=job, tools=tools_by_job.get(str(job.job_id), []))
+            for job in jobs
+        ]
+        if claimed:
+            logger.debug(
+                f"Claimed {len(claimed)} jobs: {[str(c.job.job_id) for c in claimed]}"
+            )
+        return claimed
@@ -0,0 +1,262 @@
+"""JobLeaseService - heartbeat leases on running jobs.
+
+v0.16.0: Claiming a job records the claiming worker in lease_owner and a
+deadline in lease_expires_at, and increments attempts. While the job runs,
+the worker renews the deadline (see app/workers/job_leases.py). A worker
+that crashes or is redeployed stops renewing, so its jobs' leases expire
+and reap_expired() puts them back to PENDING for another worker, instead
+of the whole job being lost. Jobs that already used max_attempts claims
+are failed so a job that kills its worker cannot loop forever.
+
+Usage:
+    from app.services.job_lease_service import JobLease, JobLeaseService
+
+    lease = JobLease(owner="host:1234", seconds=60.0)
+    JobClaimService.claim_pending_jobs(db, limit=1, lease=lease)
+    JobLeaseService.renew(db, [job_id], lease)
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import and_, func, or_, update
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from ..models.job import Job, JobStatus
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_SECONDS = 60.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+@dataclass(frozen=True)
+class JobLease:
+    """Lease terms a worker applies to the jobs it claims.
+
+    Attributes:
+        owner: Worker identifier stored in jobs.lease_owner
+        seconds: Lease duration; the worker must renew before it elapses
+    """
+
+    owner: str
+    seconds: float = DEFAULT_LEASE_SECONDS
+
+    def expires_at(self, now: Optional[datetime] = None) -> datetime:
+        """Return the lease deadline for a lease taken or renewed now."""
+        return (now or datetime.utcnow()) + timedelta(seconds=self.seconds)
+
+
+@dataclass
+class ReapedJobs:
+    """Outcome of a reap_expired() pass.
+
+    Attributes:
+        requeued: Job IDs put back to PENDING
+        failed: Job IDs failed after exhausting their attempts
+    """
+
+    requeued: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+
+
+class JobLeaseService:
+    """Service for renewing and reaping running-job leases."""
+
+    @staticmethod
+    def renew(db: Session, job_ids: List[str], lease: JobLease) -> List[str]:
+        """Extend the lease of running jobs still owned by lease.owner.
+
+        Args:
+            db: Database session (committed on success)
+            job_ids: Job UUID strings the worker is running
+            lease: Lease of the renewing worker
+
+        Returns:
+            Job IDs whose lease was renewed. Jobs missing from the result
+            were reaped, cancelled or finished and must not be completed
+            by this worker.
+        """
+        if not job_ids:
+            return []
+        stmt = (
+            update(Job)
+            .where(Job.job_id.in_(job_ids))
+            .where(Job.status == JobStatus.running)
+            .where(Job.lease_owner == lease.owner)
+            .values(lease_expires_at=lease.expires_at())
+            .returning(Job.job_id)
+        )
+        try:
+            renewed = [
+                str(job_id)
+                for job_id in db.execute(
+                    stmt, execution_options={"synchronize_session": False}
+                ).scalars()
+            ]
+            db.commit()
+        except DBAPIError as e:
+            # Row is being updated elsewhere (completion, cancel); retry later
+            db.rollback()
+            logger.debug(f"Lease renewal conflicted: {e}")
+            return list(job_ids)
+        return renewed
+
+    @staticmethod
+    def reap_expired(
+        db: Session,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        include_unleased: bool = False,
+        now: Optional[datetime] = None,
+    ) -> ReapedJobs:
+        """Requeue RUNNING jobs whose lease expired.
+
+        Jobs with fewer than max_attempts claims go back to PENDING with
+        the lease cleared; the others are marked FAILED.
+
+        Args:
+            db: Database session (committed on success)
+            max_attempts: Claims after which an expired job is failed
+            include_unleased: Also reap RUNNING jobs without a lease (claimed
+                              before leases existed). Only safe at startup.
+            now: Reference time (defaults to utcnow)
+
+        Returns:
+            ReapedJobs with requeued and failed job IDs
+        """
+        now = now or datetime.utcnow()
+        expired = and_(Job.lease_expires_at.isnot(None), Job.lease_expires_at < now)
+        if include_unleased:
+            expired = or_(expired, Job.lease_expires_at.is_(None))
+        exhausted = func.coalesce(Job.attempts, 0) >= max_attempts
+        cleared = {"lease_owner": None, "lease_expires_at": None, "ray_future_id": None}
+
+        result = ReapedJobs()
+        try:
+            result.failed = JobLeaseService._reap(
+                db,
+                and_(expired, exhausted),
+                status=JobStatus.failed,
+                error_message=func.concat(
+                    "Lease expired after ",
+                    func.coalesce(Job.attempts, 0),
+                    " attempt(s)",
+                ),
+                **cleared,
+            )
+            result.requeued = JobLeaseService._reap(
+                db, and_(expired, ~exhausted), status=JobStatus.pending, **cleared
+            )
+            db.commit()
+        except DBAPIError as e:
+            db.rollback()
+            logger.debug(f"Lease reaping conflicted: {e}")
+            return ReapedJobs()
+
+        if result.requeued or result.failed:
+            logger.warning(
+                f"Reaped expired leases: requeued={result.requeued} "
+                f"failed={result.failed}"
+            )
+        return result
+
+    @staticmethod
+    def adopt_expired(
+        db: Session,
+        lease: JobLease,
+        ray_future_prefix: str,
+        include_unleased: bool = False,
+        now: Optional[datetime] = None,
+    ) -> List[Tuple[str, str]]:
+        """Take over expired RUNNING jobs whose execution outlives workers.
+
+        v0.16.0: Jobs whose ray_future_id starts with ray_future_prefix run
+        in detached Ray actors (see app/workers/ray_executions.py). Instead
+        of being requeued, they are leased to the adopting worker, which
+        reattaches to the running execution. attempts is not incremented.
+
+        Args:
+            db: Database session (committed on success)
+            lease: Lease of the adopting worker
+            ray_future_prefix: ray_future_id prefix of adoptable jobs
+            include_unleased: Also adopt RUNNING jobs without a lease
+            now: Reference time (defaults to utcnow)
+
+        Returns:
+            (job_id, ray_future_id) of the adopted jobs
+        """
+        now = now or datetime.utcnow()
+        expired = and_(Job.lease_expires_at.isnot(None), Job.lease_expires_at < now)
+        if include_unleased:
+            expired = or_(expired, Job.lease_expires_at.is_(None))
+        stmt = (
+            update(Job)
+            .where(Job.status == JobStatus.running)
+            .where(expired)
+            .where(Job.ray_future_id.startswith(ray_future_prefix))
+            .values(lease_owner=lease.owner, lease_expires_at=lease.expires_at(now))
+            .returning(Job.job_id, Job.ray_future_id)
+        )
+        try:
+            adopted = [
+                (str(job_id), ray_future_id)
+                for job_id, ray_future_id in db.execute(
+                    stmt, execution_options={"synchronize_session": False}
+                )
+            ]
+            db.commit()
+        except DBAPIError as e:
+            db.rollback()
+            logger.debug(f"Lease adoption conflicted: {e}")
+            return []
+        return adopted
+
+    @staticmethod
+    def release(db: Session, job_ids: List[str], lease: JobLease) -> None:
+        """Expire the lease of adopted jobs whose execution is gone.
+
+        v0.16.0: Clears ray_future_id, so the next reap_expired() requeues
+        the jobs like any other orphaned job.
+
+        Args:
+            db: Database session (committed on success)
+            job_ids: Job UUID strings to release
+            lease: Lease of the releasing worker
+        """
+        if not job_ids:
+            return
+        stmt = (
+            update(Job)
+            .where(Job.job_id.in_(job_ids))
+            .where(Job.lease_owner == lease.owner)
+            .values(
+                lease_expires_at=datetime.utcnow() - timedelta(seconds=1),
+                ray_future_id=None,
+            )
+        )
+        try:
+            db.execute(stmt, execution_options={"synchronize_session": False})
+            db.commit()
+        except DBAPIError as e:
+            db.rollback()
+            logger.debug(f"Lease release conflicted: {e}")
+
+    @staticmethod
+    def _reap(db: Session, condition, **values) -> List[str]:
+        """Update expired RUNNING jobs matching condition; return their IDs."""
+        stmt = (
+            update(Job)
+            .where(Job.status == JobStatus.running)
+            .where(condition)
+            .values(**values)
+            .returning(Job.job_id)
+        )
+        return [
+            str(job_id)
+            for job_id in db.execute(
+                stmt, execution_options={"synchronize_session": False}
+            ).scalars()
+        ]
@@ -15,13 +15,16 @@ Usage:
     # Get tools for a job
     tools = JobToolsService.get_tools_for_job(db, job_id)
 
+    # Get tools for several jobs in one query
+    tools_by_job = JobToolsService.get_tools_for_jobs(db, [job_id_1, job_id_2])
+
     # Delete tools when job is deleted
     JobToolsService.delete_tools_for_job(db, job_id)
 """
 
 import logging
 import uuid
-from typing import List
+from typing import Dict, List
 
 from sqlalchemy.orm import Session
 
@@ -101,6 +104,43 @@ class JobToolsService:
         logger.debug(f"Retrieved {len(tools)} tools for job {job_id}: {tools}")
         return tools
 
+    @staticmethod
+    def get_tools_for_jobs(
+        db: Session, job_ids: List[uuid.UUID]
+    ) -> Dict[str, List[str]]:
+        """Get ordered tool lists for several jobs with a single query.
+
+        v0.16.0: Used by JobClaimService so a claimed batch costs one
+        job_tools round trip instead of one per job.
+
+        Args:
+            db: Database session
+            job_ids: UUIDs of the jobs
+
+        Returns:
+            Dict mapping str(job_id) -> tool IDs in execution order.
+            Jobs without tools are absent.
+
+        Example:
+            >>> JobToolsService.get_tools_for_jobs(db, [job_a, job_b])
+            {"<job_a>": ["ocr"], "<job_b>": ["detect", "track"]}
+        """
+        if not job_ids:
+            return {}
+
+        job_tools = (
+            db.query(JobTool)
+            .filter(JobTool.job_id.in_(job_ids))
+            .order_by(JobTool.job_id, JobTool.tool_order)
+            .all()
+        )
+
+        tools_by_job: Dict[str, List[str]] = {}
+        for jt in job_tools:
+            tools_by_job.setdefault(str(jt.job_id), []).append(jt.tool_id)
+        logger.debug(f"Retrieved tools for {len(tools_by_job)} jobs")
+        return tools_by_job
+
     @staticmethod
     def delete_tools_for_job(db: Session, job_id: uuid.UUID) -> int:
         """Delete all tools for a job (CASCADE replacement).
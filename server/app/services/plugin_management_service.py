@@ -27,7 +27,7 @@ from typing import Any, Dict, List, Optional
 from pydantic import ValidationError
 
 from ..plugins.loader.plugin_registry import get_registry
-from ..plugins.sandbox import run_plugin_sandboxed
+from ..plugins.sandbox import get_plugin_process_pool, run_plugin_sandboxed
 from ..protocols import PluginRegistry
 
 logger = logging.getLogger(__name__)
@@ -343,6 +343,8 @@ class PluginManagementService:
         and async tool functions with state tracking.
 
         v0.9.6: Added progress_callback for video progress tracking.
+        v0.16.0: Runs in a PluginProcessPool worker when
+        FORGESYTE_PLUGIN_PROCESS_WORKERS > 0.
 
         Args:
             plugin_id: Plugin ID
@@ -402,12 +404,23 @@ class PluginManagementService:
         registry.mark_running(plugin_id)
 
         # 5. Execute tool in sandbox
+        # v0.16.0: Use the warm process pool when enabled so a crashing or
+        # leaking plugin cannot take down this process
+        pool = get_plugin_process_pool()
         try:
-            # Use sandbox for crash-proof execution
-            sandbox_result = run_plugin_sandboxed(
-                tool_func,
-                **args,
-            )
+            if pool is not None:
+                sandbox_result = pool.run(
+                    plugin_id,
+                    tool_name,
+                    args,
+                    progress_callback=progress_callback,
+                )
+            else:
+                # Use sandbox for crash-proof execution
+                sandbox_result = run_plugin_sandboxed(
+                    tool_func,
+                    **args,
+                )
 
             if sandbox_result.ok:
                 # Success: record and return result
@@ -1,6 +1,13 @@
 """Queue services for Phase 16."""
 
-from .base import QueueService
+from .base import LeaseQueueService, QueueEntry, QueueService
 from .memory_queue import InMemoryQueueService
+from .sqlite_queue import SqliteQueueService
 
-__all__ = ["QueueService", "InMemoryQueueService"]
+__all__ = [
+    "QueueService",
+    "InMemoryQueueService",
+    "LeaseQueueService",
+    "QueueEntry",
+    "SqliteQueueService",
+]
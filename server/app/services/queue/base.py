@@ -1,7 +1,11 @@
-"""Abstract queue service interface."""
+"""Abstract queue service interface.
+
+v0.16.0: Added LeaseQueueService for durable, lease-based dispatch.
+"""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
 
 
 class QueueService(ABC):
@@ -39,3 +43,137 @@ class QueueService(ABC):
             Queue size
         """
         raise NotImplementedError
+
+
+@dataclass
+class QueueEntry:
+    """A queued job_id with the scheduling metadata stored alongside it.
+
+    v0.16.0: Lets the worker pick jobs (priority, fair share, slot quotas)
+    from the queue alone, without reading the jobs table.
+
+    Attributes:
+        job_id: UUID string identifying the job
+        plugin_id: Plugin the job runs on
+        job_type: Job type ("image", "video", ...)
+        priority: Scheduling priority (higher first)
+        enqueued_at: Unix timestamp of the first enqueue
+        deliveries: Number of times the entry has been leased
+        last_error: Reason of the last nack (dead letters keep it)
+    """
+
+    job_id: str
+    plugin_id: str = ""
+    job_type: str = ""
+    priority: int = 0
+    enqueued_at: float = 0.0
+    deliveries: int = 0
+    last_error: Optional[str] = None
+
+
+class LeaseQueueService(QueueService):
+    """Durable queue with at-least-once delivery through leases.
+
+    v0.16.0: A leased entry is invisible to other consumers until its
+    visibility timeout expires. The consumer must ack() it once the job is
+    owned elsewhere (or nack() it to retry); an entry whose lease expires
+    is delivered again. Entries nacked too often are dead-lettered.
+    """
+
+    @abstractmethod
+    def enqueue(
+        self,
+        job_id: str,
+        plugin_id: str = "",
+        job_type: str = "",
+        priority: int = 0,
+    ) -> None:
+        """Add a job_id with its scheduling metadata to the queue.
+
+        Args:
+            job_id: UUID string identifying the job
+            plugin_id: Plugin the job runs on (used for fair share)
+            job_type: Job type (used for slot quotas and weights)
+            priority: Scheduling priority (higher first)
+
+        Raises:
+            ValueError: If job_id is not a valid UUID string
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def peek_ready(self, per_flow_limit: int) -> List[QueueEntry]:
+        """Return visible entries, at most per_flow_limit per flow.
+
+        A flow is a (plugin_id, job_type) pair; entries are taken by
+        priority, then enqueue order.
+
+        Args:
+            per_flow_limit: Maximum entries returned per flow
+
+        Returns:
+            Visible (not leased, not dead) entries
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def enqueue_many(self, entries: Iterable[QueueEntry]) -> None:
+        """Add several entries at once (entries already queued are kept).
+
+        Args:
+            entries: Entries to add; enqueued_at is set to now when 0
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def lease(
+        self,
+        job_ids: List[str],
+        owner: str,
+        visibility_timeout: Optional[float] = None,
+    ) -> List[QueueEntry]:
+        """Lease the given entries if they are still visible.
+
+        Args:
+            job_ids: Entries to lease
+            owner: Identifier of the consumer taking the lease
+            visibility_timeout: Seconds before the entry is redelivered
+                                (default: the queue's own timeout)
+
+        Returns:
+            Entries actually leased (others were taken meanwhile)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def ack(self, job_ids: List[str]) -> None:
+        """Remove delivered entries from the queue.
+
+        Args:
+            job_ids: Entries to remove
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def nack(self, job_id: str, error: str, delay: float = 0.0) -> bool:
+        """Return a leased entry to the queue, or dead-letter it.
+
+        Args:
+            job_id: Entry to return
+            error: Reason, kept on the entry
+            delay: Seconds before the entry becomes visible again
+
+        Returns:
+            True if the entry exceeded its delivery limit and was
+            dead-lettered instead of requeued
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def dead_letters(self) -> List[QueueEntry]:
+        """Return all dead-lettered entries.
+
+        Returns:
+            Dead-lettered entries, oldest first
+        """
+        raise NotImplementedError
@@ -0,0 +1,113 @@
+"""Queue service factory for dependency injection.
+
+v0.16.0: FORGESYTE_QUEUE_BACKEND selects how the worker finds jobs:
+- "sqlite" (default): submit routes enqueue job_ids into a durable
+  SqliteQueueService and the worker dispatches from it.
+- "database": the worker scans the jobs table for pending jobs.
+
+A relative FORGESYTE_QUEUE_PATH is resolved against the server directory,
+like the local storage root (server/data/jobs), so every process opens
+the same file whatever its working directory.
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional
+
+from app.services.queue.base import LeaseQueueService
+from app.services.queue.sqlite_queue import SqliteQueueService
+
+if TYPE_CHECKING:
+    from app.settings import AppSettings
+
+logger = logging.getLogger(__name__)
+
+# Allowed queue backends
+ALLOWED_BACKENDS = {"database", "sqlite"}
+
+# Base directory of relative queue paths
+SERVER_DIR = Path(__file__).resolve().parent.parent.parent.parent
+
+# One queue instance per file, shared by submit routes and the worker
+_queues: Dict[str, SqliteQueueService] = {}
+_queues_lock = threading.Lock()
+
+
+def reset_queue_factory_state() -> None:
+    """Drop cached queue instances (for test isolation)."""
+    with _queues_lock:
+        for queue in _queues.values():
+            queue.close()
+        _queues.clear()
+
+
+def resolve_queue_path(queue_path: str) -> str:
+    """Return queue_path, made absolute against SERVER_DIR if relative."""
+    path = Path(queue_path).expanduser()
+    if not path.is_absolute():
+        path = SERVER_DIR / path
+    return str(path)
+
+
+def get_queue_service(settings: "AppSettings") -> Optional[LeaseQueueService]:
+    """Returns the configured dispatch queue, or None for table scanning.
+
+    Args:
+        settings: AppSettings instance with queue configuration
+
+    Returns:
+        Shared LeaseQueueService, or None when queue_backend is "database"
+
+    Raises:
+        ValueError: If queue_backend is not a valid backend name
+    """
+    backend = settings.queue_backend.strip().lower()
+    if backend not in ALLOWED_BACKENDS:
+        raise ValueError(
+            f"Unsupported queue backend '{settings.queue_backend}'. "
+            f"Expected one of: {sorted(ALLOWED_BACKENDS)}"
+        )
+    if backend == "database":
+        return None
+
+    queue_path = resolve_queue_path(settings.queue_path)
+    with _queues_lock:
+        queue = _queues.get(queue_path)
+        if queue is None:
+            queue = SqliteQueueService(
+                queue_path,
+                visibility_timeout=settings.queue_visibility_timeout_seconds,
+                max_deliveries=settings.queue_max_deliveries,
+            )
+            _queues[queue_path] = queue
+            logger.info(f"Queue Backend: SQLite at {queue_path}")
+        return queue
+
+
+def enqueue_submitted_job(
+    settings: "AppSettings",
+    job_id: str,
+    plugin_id: str,
+    job_type: str,
+    priority: int = 0,
+) -> None:
+    """Hand a committed job to the dispatch queue, if one is configured.
+
+    Failures are logged, not raised: the job row is already committed and
+    the worker backfills pending jobs into the queue every lease period.
+
+    Args:
+        settings: AppSettings instance with queue configuration
+        job_id: UUID string of the committed job
+        plugin_id: Plugin the job runs on
+        job_type: Job type ("image", "video", ...)
+        priority: Scheduling priority
+    """
+    queue = get_queue_service(settings)
+    if queue is None:
+        return
+    try:
+        queue.enqueue(job_id, plugin_id=plugin_id, job_type=job_type, priority=priority)
+    except Exception as e:
+        logger.error(f"Failed to enqueue job {job_id}: {e}")
@@ -0,0 +1,352 @@
+"""Durable SQLite-backed queue with leases and dead-lettering.
+
+v0.16.0: The worker used to find work by scanning the jobs table, so every
+poll competed with API reads and grew with job history. This queue keeps
+only undelivered job_ids in a separate embedded SQLite file (stdlib, no
+server). Entries are removed once the worker has claimed the job, so the
+queue stays as small as the backlog and dispatch cost does not depend on
+how many jobs were ever run.
+
+Delivery is at-least-once:
+- lease() hides entries for a visibility timeout. If the consumer crashes
+  before ack(), the entry becomes visible again and is redelivered.
+- nack() returns an entry with an optional delay. After `max_deliveries`
+  deliveries it is dead-lettered instead and kept for inspection.
+
+The jobs table stays the source of truth: a duplicate delivery cannot run a
+job twice because claiming a job is a conditional pending -> running UPDATE.
+"""
+
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from app.services.queue.base import LeaseQueueService, QueueEntry
+
+DEFAULT_VISIBILITY_TIMEOUT_SECONDS = 30.0
+DEFAULT_MAX_DELIVERIES = 5
+
+_ENTRY_COLUMNS = (
+    "job_id, plugin_id, job_type, priority, enqueued_at, deliveries, last_error"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS queue_items (
+    job_id TEXT PRIMARY KEY,
+    plugin_id TEXT NOT NULL DEFAULT '',
+    job_type TEXT NOT NULL DEFAULT '',
+    priority INTEGER NOT NULL DEFAULT 0,
+    enqueued_at REAL NOT NULL,
+    visible_at REAL NOT NULL,
+    deliveries INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    dead INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_queue_items_ready
+    ON queue_items (dead, visible_at);
+CREATE INDEX IF NOT EXISTS ix_queue_items_flow
+    ON queue_items (plugin_id, job_type, priority DESC, enqueued_at);
+"""
+
+
+def _entry(row: tuple) -> QueueEntry:
+    return QueueEntry(
+        job_id=row[0],
+        plugin_id=row[1],
+        job_type=row[2],
+        priority=row[3],
+        enqueued_at=row[4],
+        deliveries=row[5],
+        last_error=row[6],
+    )
+
+
+def _placeholders(values: List[str]) -> str:
+    return ", ".join("?" for _ in values)
+
+
+class SqliteQueueService(LeaseQueueService):
+    """Lease-based job queue persisted in a local SQLite file.
+
+    Thread-safe: each thread uses its own connection. Several processes may
+    share the same file (SQLite WAL mode serialises writers).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT_SECONDS,
+        max_deliveries: int = DEFAULT_MAX_DELIVERIES,
+    ) -> None:
+        """Open (and create if needed) the queue database.
+
+        Args:
+            path: SQLite file path (":memory:" is not supported because
+                  each thread opens its own connection)
+            visibility_timeout: Default lease duration in seconds
+            max_deliveries: Deliveries after which a nacked entry is
+                            dead-lettered
+
+        Raises:
+            ValueError: If max_deliveries < 1
+        """
+        if max_deliveries < 1:
+            raise ValueError("max_deliveries must be >= 1")
+        self.path = path
+        self.visibility_timeout = visibility_timeout
+        self.max_deliveries = max_deliveries
+        self._local = threading.local()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn().executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # isolation_level=None: autocommit, explicit BEGIN where needed
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def enqueue(
+        self,
+        job_id: str,
+        plugin_id: str = "",
+        job_type: str = "",
+        priority: int = 0,
+    ) -> None:
+        """Add a job_id to the queue (no-op if it is already queued).
+
+        Args:
+            job_id: UUID string identifying the job
+            plugin_id: Plugin the job runs on (used for fair share)
+            job_type: Job type (used for slot quotas and weights)
+            priority: Scheduling priority (higher first)
+
+        Raises:
+            ValueError: If job_id is not a valid UUID string
+        """
+        self.enqueue_many(
+            [
+                QueueEntry(
+                    job_id=job_id,
+                    plugin_id=plugin_id,
+                    job_type=job_type,
+                    priority=priority,
+                )
+            ]
+        )
+
+    def enqueue_many(self, entries: Iterable[QueueEntry]) -> None:
+        """Add several entries in one transaction (already queued are kept).
+
+        Args:
+            entries: Entries to add; enqueued_at is set to now when 0
+
+        Raises:
+            ValueError: If a job_id is not a valid UUID string
+        """
+        now = time.time()
+        rows = []
+        for entry in entries:
+            job_id = str(uuid.UUID(str(entry.job_id)))
+            rows.append(
+                (
+                    job_id,
+                    entry.plugin_id or "",
+                    entry.job_type or "",
+                    entry.priority or 0,
+                    entry.enqueued_at or now,
+                    now,
+                )
+            )
+        if not rows:
+            return
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT OR IGNORE INTO queue_items "
+                "(job_id, plugin_id, job_type, priority, enqueued_at, visible_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def dequeue(self) -> Optional[str]:
+        """Lease and return the next job_id, or None if nothing is visible.
+
+        The entry stays leased for the default visibility timeout and must
+        be ack()ed, like entries returned by lease().
+
+        Returns:
+            Job ID string, or None if queue is empty
+        """
+        ready = self.peek_ready(per_flow_limit=1)
+        ready.sort(key=lambda e: (-e.priority, e.enqueued_at))
+        for entry in ready:
+            if self.lease([entry.job_id], "dequeue", self.visibility_timeout):
+                return entry.job_id
+        return None
+
+    def size(self) -> int:
+        """Return the number of queued entries (leased included, dead excluded).
+
+        Returns:
+            Queue size
+        """
+        row = (
+            self._conn()
+            .execute("SELECT COUNT(*) FROM queue_items WHERE dead = 0")
+            .fetchone()
+        )
+        return int(row[0])
+
+    def peek_ready(self, per_flow_limit: int) -> List[QueueEntry]:
+        """Return visible entries, at most per_flow_limit per flow.
+
+        Args:
+            per_flow_limit: Maximum entries returned per (plugin_id, job_type)
+
+        Returns:
+            Visible (not leased, not dead) entries
+        """
+        if per_flow_limit <= 0:
+            return []
+        rows = (
+            self._conn()
+            .execute(
+                f"SELECT {_ENTRY_COLUMNS} FROM ("
+                f"  SELECT {_ENTRY_COLUMNS}, ROW_NUMBER() OVER ("
+                "    PARTITION BY plugin_id, job_type"
+                "    ORDER BY priority DESC, enqueued_at"
+                "  ) AS flow_rank"
+                "  FROM queue_items WHERE dead = 0 AND visible_at <= ?"
+                ") WHERE flow_rank <= ?",
+                (time.time(), per_flow_limit),
+            )
+            .fetchall()
+        )
+        return [_entry(row) for row in rows]
+
+    def lease(
+        self,
+        job_ids: List[str],
+        owner: str,
+        visibility_timeout: Optional[float] = None,
+    ) -> List[QueueEntry]:
+        """Lease the given entries if they are still visible.
+
+        Args:
+            job_ids: Entries to lease
+            owner: Identifier of the consumer taking the lease
+            visibility_timeout: Lease duration (default: queue default)
+
+        Returns:
+            Entries actually leased (others were taken meanwhile)
+        """
+        if not job_ids:
+            return []
+        now = time.time()
+        timeout = (
+            self.visibility_timeout
+            if visibility_timeout is None
+            else visibility_timeout
+        )
+        rows = (
+            self._conn()
+            .execute(
+                "UPDATE queue_items "
+                "SET visible_at = ?, lease_owner = ?, deliveries = deliveries + 1 "
+                f"WHERE job_id IN ({_placeholders(job_ids)}) "
+                "AND dead = 0 AND visible_at <= ? "
+                f"RETURNING {_ENTRY_COLUMNS}",
+                (now + timeout, owner, *job_ids, now),
+            )
+            .fetchall()
+        )
+        return [_entry(row) for row in rows]
+
+    def ack(self, job_ids: List[str]) -> None:
+        """Remove delivered entries from the queue.
+
+        Args:
+            job_ids: Entries to remove
+        """
+        if not job_ids:
+            return
+        self._conn().execute(
+            f"DELETE FROM queue_items WHERE job_id IN ({_placeholders(job_ids)})",
+            tuple(job_ids),
+        )
+
+    def nack(self, job_id: str, error: str, delay: float = 0.0) -> bool:
+        """Return a leased entry to the queue, or dead-letter it.
+
+        Args:
+            job_id: Entry to return
+            error: Reason, kept on the entry
+            delay: Seconds before the entry becomes visible again
+
+        Returns:
+            True if the entry reached max_deliveries and was dead-lettered
+        """
+        row = (
+            self._conn()
+            .execute(
+                "UPDATE queue_items "
+                "SET dead = CASE WHEN deliveries >= ? THEN 1 ELSE 0 END, "
+                "visible_at = ?, lease_owner = NULL, last_error = ? "
+                "WHERE job_id = ? RETURNING dead",
+                (self.max_deliveries, time.time() + delay, error, job_id),
+            )
+            .fetchone()
+        )
+        return bool(row and row[0])
+
+    def dead_letters(self) -> List[QueueEntry]:
+        """Return all dead-lettered entries.
+
+        Returns:
+            Dead-lettered entries, oldest first
+        """
+        rows = (
+            self._conn()
+            .execute(
+                f"SELECT {_ENTRY_COLUMNS} FROM queue_items "
+                "WHERE dead = 1 ORDER BY enqueued_at"
+            )
+            .fetchall()
+        )
+        return [_entry(row) for row in rows]
+
+    def requeue_dead_letter(self, job_id: str) -> bool:
+        """Move a dead-lettered entry back into the queue.
+
+        Args:
+            job_id: Dead-lettered entry
+
+        Returns:
+            True if the entry was requeued
+        """
+        cursor = self._conn().execute(
+            "UPDATE queue_items SET dead = 0, deliveries = 0, visible_at = ?, "
+            "lease_owner = NULL WHERE job_id = ? AND dead = 1",
+            (time.time(), job_id),
+        )
+        return cursor.rowcount > 0
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -1,8 +1,28 @@
 """Abstract storage service interface."""
 
+import contextlib
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
-from typing import BinaryIO
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+# v0.16.0: Chunk size when streaming stored files to HTTP clients
+STREAM_CHUNK_BYTES = 256 * 1024
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    """A file listed by StorageService.list_files() (v0.16.0).
+
+    Attributes:
+        path: Path relative to storage root
+        size: File size in bytes
+        modified: Last modification time (Unix timestamp)
+    """
+
+    path: str
+    size: int
+    modified: float
 
 
 class StorageService(ABC):
@@ -36,6 +56,85 @@ class StorageService(ABC):
         """
         raise NotImplementedError
 
+    @contextlib.contextmanager
+    def open_local(self, path: str) -> Iterator[Path]:
+        """Yield a local path to the stored file, valid until the context exits.
+
+        v0.16.0: Backends that download copies override this to pin a
+        cached copy (or delete a temp copy) for the duration of the use.
+
+        Args:
+            path: Path relative to storage root
+
+        Yields:
+            Local filesystem Path object (must not be modified or deleted)
+
+        Raises:
+            FileNotFoundError: If file does not exist
+        """
+        yield self.load_file(path)
+
+    def get_size(self, path: str) -> int:
+        """Return the size of a stored file in bytes.
+
+        v0.16.0: Backends override this with a metadata lookup so no copy
+        of the file is made.
+
+        Args:
+            path: Path relative to storage root
+
+        Returns:
+            File size in bytes
+
+        Raises:
+            FileNotFoundError: If file does not exist
+        """
+        return self.load_file(path).stat().st_size
+
+    def iter_bytes(
+        self,
+        path: str,
+        start: int = 0,
+        length: Optional[int] = None,
+        chunk_size: int = STREAM_CHUNK_BYTES,
+    ) -> Iterator[bytes]:
+        """Return an iterator over a byte range of a stored file.
+
+        v0.16.0: Used to stream files (and HTTP Range requests) without
+        copying them to local disk first. The file is opened before this
+        returns, so a missing file raises here rather than mid-stream.
+
+        Args:
+            path: Path relative to storage root
+            start: First byte to read
+            length: Number of bytes to read (None = to the end of the file)
+            chunk_size: Maximum size of each yielded chunk
+
+        Returns:
+            Iterator of byte chunks
+
+        Raises:
+            FileNotFoundError: If file does not exist
+        """
+        f = open(self.load_file(path), "rb")
+        f.seek(start)
+        return _iter_file(f, length, chunk_size)
+
+    def get_redirect_url(self, path: str, expires_in: int = 3600) -> Optional[str]:
+        """Return a URL clients can download the file from directly.
+
+        v0.16.0: Unlike get_signed_url(), existence is not checked (the
+        backend answers a missing file itself), so this makes no request.
+
+        Args:
+            path: Path relative to storage root
+            expires_in: URL expiration time in seconds (default 1 hour)
+
+        Returns:
+            Direct URL, or None if the backend must serve the file itself
+        """
+        return None
+
     @abstractmethod
     def delete_file(self, path: str) -> None:
         """Delete a stored file, if it exists.
@@ -45,6 +144,30 @@ class StorageService(ABC):
         """
         raise NotImplementedError
 
+    def list_files(self, prefix: str = "") -> Iterator[StoredFile]:
+        """List stored files under a path prefix.
+
+        v0.16.0: Used by the storage retention service.
+
+        Args:
+            prefix: Path prefix relative to storage root ("" for all files)
+
+        Returns:
+            Iterator of StoredFile entries, in no particular order
+        """
+        raise NotImplementedError(f"{type(self).__name__} cannot list files")
+
+    def delete_files(self, paths: Iterable[str]) -> None:
+        """Delete several stored files; missing files are ignored.
+
+        v0.16.0: Backends override this with a batched delete.
+
+        Args:
+            paths: Paths relative to storage root
+        """
+        for path in paths:
+            self.delete_file(path)
+
     @abstractmethod
     def file_exists(self, path: str) -> bool:
         """Check if a file exists in storage.
@@ -74,3 +197,19 @@ class StorageService(ABC):
             FileNotFoundError: If file does not exist
         """
         raise NotImplementedError
+
+
+def _iter_file(f: BinaryIO, length: Optional[int], chunk_size: int) -> Iterator[bytes]:
+    """Yield up to length bytes of an open file, then close it."""
+    remaining = length
+    try:
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            chunk = f.read(size)
+            if not chunk:
+                break
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+    finally:
+        f.close()
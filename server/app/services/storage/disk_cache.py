@@ -0,0 +1,173 @@
+"""Size-bounded local disk cache for files fetched from remote storage.
+
+v0.16.0: Remote storage backends download an object to a fresh temp file
+on every load_file() call, and callers delete it when done, so every task
+re-downloads inputs that an earlier task on the same host already fetched.
+DiskCache keeps downloaded files in one directory shared by all processes
+of a host (e.g. the Ray workers of a node):
+
+- Single flight: a per-entry flock makes concurrent processes wait for
+  one download instead of each fetching the object.
+- Atomic fills: content is written to a temp file in the cache directory
+  and renamed into place, so a crashed fill never leaves a partial entry.
+- Pinning: an entry is share-locked while a caller uses it; eviction
+  skips locked entries.
+- LRU budget: hits refresh the entry's mtime; after each fill the least
+  recently used unpinned entries are deleted until the cache fits in
+  max_bytes.
+
+Usage:
+    cache = DiskCache(Path("/tmp/forgesyte-inputs"), max_bytes=10 * 1024**3)
+    with cache.open("video/input/abc.mp4", fill=download_to) as local_path:
+        process(local_path)
+"""
+
+import contextlib
+import fcntl
+import hashlib
+import logging
+import os
+import uuid
+from pathlib import Path
+from typing import Callable, Iterator, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+_LOCK_SUFFIX = ".lock"
+_PART_SUFFIX = ".part"
+
+
+class DiskCache:
+    """Read-through cache of remote files on the local disk."""
+
+    def __init__(self, root: Path, max_bytes: int) -> None:
+        """Initialize the cache, creating its directory if needed.
+
+        Args:
+            root: Cache directory (shared by all processes using the cache)
+            max_bytes: Size budget of the cached files
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, key: str, suffix: str = "") -> Path:
+        """Return the cache path of a key.
+
+        Args:
+            key: Cache key (e.g. storage path)
+            suffix: File suffix kept for tools that sniff it (e.g. ".mp4")
+        """
+        digest = hashlib.sha256(key.encode()).hexdigest()[:40]
+        return self.root / f"{digest}{suffix}"
+
+    @contextlib.contextmanager
+    def open(
+        self, key: str, fill: Callable[[Path], None], suffix: str = ""
+    ) -> Iterator[Path]:
+        """Yield a local file holding key's content, filling it on a miss.
+
+        The entry is pinned until the context exits.
+
+        Args:
+            key: Cache key (e.g. storage path)
+            fill: Writes the content to the given path (called on a miss)
+            suffix: File suffix of the cached file
+
+        Yields:
+            Path of the cached file (must not be modified or deleted)
+        """
+        path = self.path_for(key, suffix)
+        lock_fd = os.open(f"{path}{_LOCK_SUFFIX}", os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_SH)
+            filled = False
+            if not path.exists():
+                # Exclusive while filling; other processes wait for the file
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+                if not path.exists():
+                    self._fill(path, fill)
+                    filled = True
+                fcntl.flock(lock_fd, fcntl.LOCK_SH)
+            if filled:
+                self.evict()
+            else:
+                self._touch(path)
+            yield path
+        finally:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            os.close(lock_fd)
+
+    def evict(self) -> int:
+        """Delete least recently used unpinned entries over the budget.
+
+        Returns:
+            Number of entries deleted
+        """
+        entries = self._entries()
+        used = sum(size for _, size, _ in entries)
+        deleted = 0
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if used <= self.max_bytes:
+                break
+            if self._delete_unpinned(path):
+                used -= size
+                deleted += 1
+        return deleted
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the cached files."""
+        return sum(size for _, size, _ in self._entries())
+
+    def _fill(self, path: Path, fill: Callable[[Path], None]) -> None:
+        part = path.with_name(f"{path.name}.{uuid.uuid4().hex}{_PART_SUFFIX}")
+        try:
+            fill(part)
+            os.replace(part, path)
+        except BaseException:
+            part.unlink(missing_ok=True)
+            raise
+        logger.debug(f"Cached {path.name} ({path.stat().st_size} bytes)")
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _entries(self) -> List[Tuple[Path, int, float]]:
+        """Return (path, size, mtime) of every cached file."""
+        entries = []
+        for path in self.root.iterdir():
+            if path.name.endswith((_LOCK_SUFFIX, _PART_SUFFIX)):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    @staticmethod
+    def _delete_unpinned(path: Path) -> bool:
+        """Delete an entry unless another caller holds its lock."""
+        try:
+            lock_fd = os.open(f"{path}{_LOCK_SUFFIX}", os.O_CREAT | os.O_RDWR, 0o644)
+        except OSError:
+            return False
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(lock_fd)
+            return False
+        try:
+            # The lock file stays: removing it would let two processes lock
+            # different inodes for the same entry
+            path.unlink(missing_ok=True)
+            logger.debug(f"Evicted {path.name} from disk cache")
+            return True
+        finally:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            os.close(lock_fd)
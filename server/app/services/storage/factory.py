@@ -1,9 +1,22 @@
-"""Storage service factory for dependency injection."""
+"""Storage service factory for dependency injection.
+
+v0.16.0: get_storage_service() builds a new service (and S3 client) per
+call. Request handlers and workers use get_shared_storage_service(), which
+returns one thread-safe instance per storage configuration for the life of
+the process, so requests reuse the client's connection pool and verified
+bucket instead of paying client construction and TLS setup each time.
+"""
 
 import logging
-from typing import TYPE_CHECKING
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from boto3.s3.transfer import TransferConfig
 
 from app.services.storage.base import StorageService
+from app.services.storage.disk_cache import DiskCache
 from app.services.storage.local_storage import LocalStorageService
 from app.services.storage.s3_storage import S3StorageService
 
@@ -18,6 +31,10 @@ _logged_backends: set[str] = set()
 # Allowed storage backends
 ALLOWED_BACKENDS = {"local", "s3"}
 
+# v0.16.0: Process-wide services by storage configuration
+_shared_services: Dict[Tuple, StorageService] = {}
+_shared_lock = threading.Lock()
+
 
 def reset_storage_factory_state() -> None:
     """Reset module-level cache for test isolation.
@@ -26,8 +43,35 @@ def reset_storage_factory_state() -> None:
     deterministic logging behavior across tests.
 
     Issue #245: _logged_backends creates order-dependent test behavior.
+    v0.16.0: Also drops the shared storage services.
     """
     _logged_backends.clear()
+    with _shared_lock:
+        _shared_services.clear()
+
+
+def get_storage_cache(settings: "AppSettings") -> Optional[DiskCache]:
+    """Build the local disk cache of remote storage objects.
+
+    v0.16.0: Configured by FORGESYTE_STORAGE_CACHE_DIR/_MB. All processes
+    on a host using the same directory share the cached files.
+
+    Args:
+        settings: AppSettings instance with storage configuration
+
+    Returns:
+        DiskCache, or None if disabled or the directory is unusable
+    """
+    if settings.storage_cache_mb <= 0:
+        return None
+    root = settings.storage_cache_dir or str(
+        Path(tempfile.gettempdir()) / "forgesyte-storage-cache"
+    )
+    try:
+        return DiskCache(Path(root), settings.storage_cache_mb * 1024 * 1024)
+    except OSError as e:
+        logger.warning(f"Storage cache disabled ({root}): {e}")
+        return None
 
 
 def get_storage_service(settings: "AppSettings") -> StorageService:
@@ -73,6 +117,67 @@ def get_storage_service(settings: "AppSettings") -> StorageService:
             endpoint_url=endpoint,
             access_key=settings.s3_access_key,
             secret_key=settings.s3_secret_key,
+            cache=get_storage_cache(settings),
+            max_pool_connections=settings.s3_max_pool_connections,
+            transfer_config=get_transfer_config(settings),
         )
 
     return LocalStorageService()
+
+
+def get_transfer_config(settings: "AppSettings") -> TransferConfig:
+    """Build the multipart transfer configuration of the S3 client.
+
+    v0.16.0: Configured by FORGESYTE_S3_TRANSFER_CONCURRENCY and
+    FORGESYTE_S3_MULTIPART_CHUNK_MB.
+
+    Args:
+        settings: AppSettings instance with storage configuration
+
+    Returns:
+        TransferConfig for upload_fileobj/download_fileobj
+    """
+    chunk_bytes = max(settings.s3_multipart_chunk_mb, 5) * 1024 * 1024
+    return TransferConfig(
+        multipart_threshold=chunk_bytes,
+        multipart_chunksize=chunk_bytes,
+        max_concurrency=max(settings.s3_transfer_concurrency, 1),
+    )
+
+
+def get_shared_storage_service(settings: "AppSettings") -> StorageService:
+    """Return the process-wide storage service for the settings.
+
+    v0.16.0: Built on first use and reused afterwards. A different storage
+    configuration (e.g. settings changed in tests) gets its own instance.
+
+    Args:
+        settings: AppSettings instance with storage configuration
+
+    Returns:
+        Shared StorageService instance (S3 or Local)
+
+    Raises:
+        ValueError: If storage_backend is not a valid backend name
+    """
+    key = (
+        settings.storage_backend.strip().lower(),
+        settings.s3_endpoint_url,
+        settings.s3_bucket_name,
+        settings.s3_access_key,
+        settings.s3_secret_key,
+        settings.storage_cache_dir,
+        settings.storage_cache_mb,
+        settings.s3_max_pool_connections,
+        settings.s3_transfer_concurrency,
+        settings.s3_multipart_chunk_mb,
+    )
+    service = _shared_services.get(key)
+    if service is None:
+        # boto3 client creation is not thread-safe; build under the lock
+        with _shared_lock:
+            service = _shared_services.get(key)
+            if service is None:
+                service = get_storage_service(settings)
+                _shared_services[key] = service
+    return service
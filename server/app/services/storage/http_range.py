@@ -0,0 +1,98 @@
+"""HTTP Range header parsing for files streamed from storage.
+
+v0.16.0: Job videos and results are streamed from the storage backend
+instead of being copied to a local file first, so the endpoints answer
+Range requests (video seeking, resumed downloads) themselves.
+
+Only single ranges are honoured; multi-range and malformed headers are
+ignored and the whole file is served, as RFC 9110 allows.
+
+v0.16.0: accepts_encoding() checks Accept-Encoding before serving a
+compressed result artifact as stored.
+"""
+
+from typing import Optional, Tuple
+
+
+class RangeNotSatisfiableError(Exception):
+    """Raised when a Range header lies outside the file (HTTP 416)."""
+
+    def __init__(self, size: int) -> None:
+        """Initialize with the size of the file.
+
+        Args:
+            size: File size in bytes (sent as Content-Range: bytes */size)
+        """
+        super().__init__(f"Range not satisfiable for {size} bytes")
+        self.size = size
+
+
+def parse_range_header(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single-range "bytes=" header against a file size.
+
+    Args:
+        header: Value of the Range header (None if absent)
+        size: File size in bytes
+
+    Returns:
+        (start, end) byte positions, end inclusive, or None to serve the
+        whole file
+
+    Raises:
+        RangeNotSatisfiableError: If the range starts past the end of the
+            file or is an empty suffix range
+    """
+    if not header:
+        return None
+    unit, _, spec = header.strip().partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    first, last = first.strip(), last.strip()
+    if not sep or not (first.isdigit() or (not first and last.isdigit())):
+        return None
+    if last and not last.isdigit():
+        return None
+
+    if not first:
+        # Suffix range: the last N bytes
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise RangeNotSatisfiableError(size)
+        return max(size - suffix, 0), size - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiableError(size)
+    end = min(int(last), size - 1) if last else size - 1
+    return start, end
+
+
+def accepts_encoding(header: Optional[str], encoding: str) -> bool:
+    """Return whether an Accept-Encoding header allows a content coding.
+
+    v0.16.0: Used to serve compressed result artifacts as stored.
+
+    Args:
+        header: Value of the Accept-Encoding header (None if absent)
+        encoding: Content coding, e.g. "gzip"
+
+    Returns:
+        True if the coding (or "*") is listed with a non-zero q value
+    """
+    if not header:
+        return False
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        if name.strip().lower() not in (encoding, "*"):
+            continue
+        param, _, value = params.strip().partition("=")
+        if param.strip().lower() == "q":
+            try:
+                return float(value) > 0
+            except ValueError:
+                return False
+        return True
+    return False
@@ -1,15 +1,21 @@
 """Local filesystem storage implementation."""
 
+import os
 import re
+import shutil
+import uuid
 from pathlib import Path
-from typing import BinaryIO
+from typing import BinaryIO, Iterator
 
-from app.services.storage.base import StorageService
+from app.services.storage.base import StorageService, StoredFile
 
 # Absolute path to data/jobs directory (v0.9.2 unified storage)
 # __file__ is .../server/app/services/storage/local_storage.py
 BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent / "data" / "jobs"
 
+# v0.16.0: Files are copied in chunks of this size instead of read whole
+COPY_CHUNK_BYTES = 1024 * 1024
+
 
 class LocalStorageService(StorageService):
     """Local filesystem storage for Phase 16 job processing."""
@@ -31,8 +37,16 @@ class LocalStorageService(StorageService):
         full_path = BASE_DIR / dest_path
         full_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(full_path, "wb") as f:
-            f.write(src.read())
+        # v0.16.0: Stream in chunks to a temp file, then rename, so large
+        # uploads use constant memory and readers never see a partial file
+        part_path = full_path.with_name(f".{full_path.name}.{uuid.uuid4().hex}.part")
+        try:
+            with open(part_path, "wb") as f:
+                shutil.copyfileobj(src, f, COPY_CHUNK_BYTES)
+            os.replace(part_path, full_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
 
         # Return relative path only (not full path)
         return dest_path
@@ -64,6 +78,37 @@ class LocalStorageService(StorageService):
         if full_path.exists():
             full_path.unlink()
 
+    def list_files(self, prefix: str = "") -> Iterator[StoredFile]:
+        """List stored files under a path prefix.
+
+        In-progress uploads (hidden ".part" files) are skipped.
+
+        Args:
+            prefix: Path prefix relative to storage root ("" for all files)
+
+        Returns:
+            Iterator of StoredFile entries
+        """
+        return self._iter_files(prefix)
+
+    @staticmethod
+    def _iter_files(prefix: str) -> Iterator[StoredFile]:
+        # Walk the directory containing the prefix, then filter by prefix
+        start = BASE_DIR / prefix.rpartition("/")[0]
+        for root, _dirs, names in os.walk(start):
+            for name in names:
+                if name.startswith("."):
+                    continue
+                full_path = Path(root) / name
+                path = full_path.relative_to(BASE_DIR).as_posix()
+                if not path.startswith(prefix):
+                    continue
+                try:
+                    stat = full_path.stat()
+                except FileNotFoundError:
+                    continue  # Deleted while listing
+                yield StoredFile(path=path, size=stat.st_size, modified=stat.st_mtime)
+
     def file_exists(self, path: str) -> bool:
         """Check if a file exists in storage.
 
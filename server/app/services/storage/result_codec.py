@@ -0,0 +1,121 @@
+"""Encoding of job result artifacts in storage.
+
+v0.16.0: Results are written as compact JSON (no indentation) compressed
+with gzip, under a ".json.gz" path. The ".gz" suffix is the content-encoding
+marker: readers decode by path, so results written before v0.16.0 (plain
+".json") still load, and S3 stores the object with Content-Encoding: gzip
+so presigned downloads are decoded by the client. gzip rather than zstd
+because it is in the standard library and every HTTP client accepts it.
+"""
+
+import gzip
+import json
+import zlib
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
+
+if TYPE_CHECKING:
+    from app.services.storage.base import StorageService
+
+# Content-Encoding of compressed results (matches the ".gz" suffix)
+RESULT_CONTENT_ENCODING = "gzip"
+
+# Level 6 (the zlib default) is within a few percent of level 9 on JSON
+# at a fraction of the CPU time
+RESULT_COMPRESS_LEVEL = 6
+
+
+def result_path(job_type: str, job_id: str) -> str:
+    """Return the storage path of a job's result artifact.
+
+    Args:
+        job_type: Job type (storage subdirectory, e.g. "video")
+        job_id: Job UUID
+
+    Returns:
+        Path relative to storage root
+    """
+    return f"{job_type}/output/{job_id}.json.gz"
+
+
+def result_content_encoding(path: str) -> Optional[str]:
+    """Return the Content-Encoding of a stored result, from its path.
+
+    Args:
+        path: Path relative to storage root
+
+    Returns:
+        "gzip" for compressed results, None for plain JSON
+    """
+    return RESULT_CONTENT_ENCODING if path.endswith(".gz") else None
+
+
+def encode_result(data: Any) -> bytes:
+    """Serialize a result as compact, gzip-compressed JSON.
+
+    Args:
+        data: JSON-serializable result
+
+    Returns:
+        Compressed bytes to store under result_path()
+    """
+    raw = json.dumps(data, separators=(",", ":")).encode()
+    # mtime=0 keeps the output identical for identical results
+    return gzip.compress(raw, compresslevel=RESULT_COMPRESS_LEVEL, mtime=0)
+
+
+def decode_result(raw: bytes, path: str) -> Any:
+    """Parse a stored result, decompressing it if its path says so.
+
+    Args:
+        raw: Stored bytes
+        path: Path the bytes were stored under
+
+    Returns:
+        Parsed JSON result
+
+    Raises:
+        ValueError: If the bytes are not a valid (compressed) JSON document
+    """
+    if result_content_encoding(path):
+        try:
+            raw = gzip.decompress(raw)
+        except (OSError, EOFError) as err:
+            raise ValueError(f"Invalid compressed result: {path}") from err
+    return json.loads(raw)
+
+
+def load_result(storage: "StorageService", path: str) -> Any:
+    """Load and parse a result artifact from storage.
+
+    Args:
+        storage: Storage service holding the result
+        path: Path relative to storage root
+
+    Returns:
+        Parsed JSON result
+
+    Raises:
+        FileNotFoundError: If the result does not exist
+        ValueError: If the result is not valid (compressed) JSON
+    """
+    with storage.open_local(path) as local_path:
+        return decode_result(local_path.read_bytes(), path)
+
+
+def iter_decoded(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Decompress a stream of gzip chunks, for clients without gzip support.
+
+    Args:
+        chunks: Compressed byte chunks
+
+    Yields:
+        Decompressed byte chunks
+    """
+    decoder = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = decoder.decompress(chunk)
+        if data:
+            yield data
+    tail = decoder.flush()
+    if tail:
+        yield tail
@@ -1,14 +1,46 @@
-"""S3/MinIO storage implementation for Phase 11 (v0.11.0)."""
+"""S3/MinIO storage implementation for Phase 11 (v0.11.0).
 
+v0.16.0: With a DiskCache, open_local() keeps downloaded objects on the
+host, so the Ray workers of a node fetch each job input once instead of
+once per task. load_file() used to download the whole object to a new temp
+file on every call, so the result and video endpoints and the workers
+fetched the same keys again and again; it now reads through the same
+cache. Entries are keyed by bucket, key and ETag: each read costs one HEAD
+request to validate the cached copy, a changed object gets a new entry,
+and downloads are made conditional on that ETag so an entry never holds
+another version.
+
+v0.16.0: get_size()/iter_bytes() stream objects (or byte ranges of them)
+straight from S3 for HTTP responses, and get_redirect_url() presigns a
+URL without an existence probe.
+
+v0.16.0: Instances are meant to be shared by a whole process (see
+factory.get_shared_storage_service): the boto3 client is thread-safe and
+keeps a connection pool of max_pool_connections, multipart transfers use
+a TransferConfig, and the bucket is verified once per instance.
+"""
+
+import contextlib
+import mimetypes
+import shutil
 import tempfile
+import threading
 from pathlib import Path
-from typing import BinaryIO
+from typing import Any, BinaryIO, Iterable, Iterator, Optional
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import ClientError
 
-from app.services.storage.base import StorageService
+from app.services.storage.base import STREAM_CHUNK_BYTES, StorageService, StoredFile
+from app.services.storage.disk_cache import DiskCache
+
+# v0.16.0: Read size when streaming an object into the disk cache
+_CACHE_FILL_CHUNK_BYTES = 1024 * 1024
+
+# v0.16.0: Maximum keys per delete_objects request (S3 limit)
+_DELETE_BATCH_SIZE = 1000
 
 
 class S3StorageService(StorageService):
@@ -21,13 +53,26 @@ class S3StorageService(StorageService):
         access_key: str,
         secret_key: str,
         region_name: str = "us-east-1",
+        cache: Optional[DiskCache] = None,
+        max_pool_connections: int = 10,
+        transfer_config: Optional[TransferConfig] = None,
     ) -> None:
         self.bucket = bucket_name
+        self.cache = cache  # v0.16.0: Local read-through cache (None = off)
+        # v0.16.0: Multipart settings of upload_fileobj/download_fileobj
+        self.transfer_config = transfer_config or TransferConfig()
         self._bucket_verified = False  # Track bucket verification state (Issue #247)
+        self._bucket_lock = threading.Lock()  # v0.16.0: Shared across threads
 
         # FIX: Force Path Style addressing for IP-based MinIO URLs (Tailscale)
         # FIX: Force s3v4 signature for modern MinIO compatibility
-        s3_config = Config(s3={"addressing_style": "path"}, signature_version="s3v4")
+        # v0.16.0: Pool sized for concurrent requests and multipart threads
+        s3_config = Config(
+            s3={"addressing_style": "path"},
+            signature_version="s3v4",
+            max_pool_connections=max_pool_connections,
+            tcp_keepalive=True,
+        )
 
         # Build client arguments
         client_kwargs = {
@@ -48,29 +93,109 @@ class S3StorageService(StorageService):
         if self._bucket_verified:
             return
 
-        try:
-            self.client.head_bucket(Bucket=self.bucket)
-        except ClientError as e:
-            # Check for 404 (Not Found)
-            error_code = str(e.response.get("Error", {}).get("Code", ""))
-            if error_code == "404":
-                self.client.create_bucket(Bucket=self.bucket)
-            else:
-                raise
+        with self._bucket_lock:
+            if self._bucket_verified:
+                return
+            try:
+                self.client.head_bucket(Bucket=self.bucket)
+            except ClientError as e:
+                # Check for 404 (Not Found)
+                error_code = str(e.response.get("Error", {}).get("Code", ""))
+                if error_code == "404":
+                    self.client.create_bucket(Bucket=self.bucket)
+                else:
+                    raise
 
-        self._bucket_verified = True
+            self._bucket_verified = True
 
     def save_file(self, src: BinaryIO, dest_path: str) -> str:
-        """Upload file-like object to S3."""
+        """Upload file-like object to S3.
+
+        v0.16.0: upload_fileobj reads src in parts and uses a multipart
+        upload for large files, so src may be a spooled upload of any size.
+
+        v0.16.0: Content-Type and Content-Encoding are stored from the path
+        (e.g. "x.json.gz" -> application/json, gzip), so presigned
+        downloads of compressed results are decoded by the client.
+        """
         self._ensure_bucket()  # Lazy bucket verification (Issue #247)
         src.seek(0)
-        self.client.upload_fileobj(src, self.bucket, dest_path)
+        extra_args = {}
+        content_type, content_encoding = mimetypes.guess_type(dest_path)
+        if content_type:
+            extra_args["ContentType"] = content_type
+        if content_encoding:
+            extra_args["ContentEncoding"] = content_encoding
+        self.client.upload_fileobj(
+            src,
+            self.bucket,
+            dest_path,
+            ExtraArgs=extra_args or None,
+            Config=self.transfer_config,
+        )
         return dest_path
 
     def load_file(self, path: str) -> Path:
         """Download file from S3 to a local temp file.
         Preserves suffix so OpenCV knows it is an .mp4.
+
+        v0.16.0: With a cache, the object is read through it and the temp
+        file is a local copy of the cached file, owned by the caller as
+        before (eviction cannot remove it). Prefer open_local(), which
+        pins the cached file instead of copying it.
         """
+        if self.cache is None:
+            return self._download_temp(path)
+        with self.open_local(path) as cached_path:
+            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=cached_path.suffix)
+            tmp_path = Path(tmp.name)
+            try:
+                with tmp, open(cached_path, "rb") as src:
+                    shutil.copyfileobj(src, tmp, _CACHE_FILL_CHUNK_BYTES)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            return tmp_path
+
+    @contextlib.contextmanager
+    def open_local(self, path: str) -> Iterator[Path]:
+        """Yield a local copy of an S3 object for the duration of the context.
+
+        v0.16.0: The cached copy is pinned (never evicted) until the
+        context exits. Without a cache, a temp copy is deleted on exit.
+        """
+        if self.cache is None:
+            tmp_path = self._download_temp(path)
+            try:
+                yield tmp_path
+            finally:
+                tmp_path.unlink(missing_ok=True)
+            return
+
+        self._ensure_bucket()  # Lazy bucket verification (Issue #247)
+        try:
+            etag = self.client.head_object(Bucket=self.bucket, Key=path)["ETag"]
+        except ClientError as e:
+            self._raise_not_found(e, path)
+            raise
+
+        def fill(dest: Path) -> None:
+            try:
+                response = self.client.get_object(
+                    Bucket=self.bucket, Key=path, IfMatch=etag
+                )
+                with open(dest, "wb") as f:
+                    shutil.copyfileobj(response["Body"], f, _CACHE_FILL_CHUNK_BYTES)
+            except ClientError as e:
+                self._raise_not_found(e, path)
+                raise
+
+        key = f"{self.bucket}/{path}#{etag}"
+        with self.cache.open(key, fill, suffix=Path(path).suffix) as local_path:
+            yield local_path
+
+    def _download_temp(self, path: str) -> Path:
+        """Download an object to a new temp file (caller deletes it)."""
         self._ensure_bucket()  # Lazy bucket verification (Issue #247)
 
         suffix = Path(path).suffix
@@ -78,7 +203,9 @@ class S3StorageService(StorageService):
         tmp_path = Path(tmp.name)
 
         try:
-            self.client.download_fileobj(self.bucket, path, tmp)
+            self.client.download_fileobj(
+                self.bucket, path, tmp, Config=self.transfer_config
+            )
             tmp.close()
             return tmp_path
         except ClientError as e:
@@ -86,11 +213,7 @@ class S3StorageService(StorageService):
             tmp.close()
             if tmp_path.exists():
                 tmp_path.unlink()
-
-            error_code = str(e.response.get("Error", {}).get("Code", ""))
-            # S3 returns '404' for HeadObject, 'NoSuchKey' for GetObject
-            if error_code in ("404", "NoSuchKey"):
-                raise FileNotFoundError(f"File not found in S3: {path}") from e
+            self._raise_not_found(e, path)
             raise
         except Exception:
             # Clean up on any other exception (Issue #246)
@@ -99,11 +222,106 @@ class S3StorageService(StorageService):
                 tmp_path.unlink()
             raise
 
+    @staticmethod
+    def _raise_not_found(error: ClientError, path: str) -> None:
+        """Raise FileNotFoundError if a ClientError means a missing key."""
+        error_code = str(error.response.get("Error", {}).get("Code", ""))
+        # S3 returns '404' for HeadObject, 'NoSuchKey' for GetObject
+        if error_code in ("404", "NoSuchKey"):
+            raise FileNotFoundError(f"File not found in S3: {path}") from error
+
+    def get_size(self, path: str) -> int:
+        """Return the size of an S3 object from its metadata (one HEAD)."""
+        self._ensure_bucket()  # Lazy bucket verification (Issue #247)
+        try:
+            return int(
+                self.client.head_object(Bucket=self.bucket, Key=path)["ContentLength"]
+            )
+        except ClientError as e:
+            self._raise_not_found(e, path)
+            raise
+
+    def iter_bytes(
+        self,
+        path: str,
+        start: int = 0,
+        length: Optional[int] = None,
+        chunk_size: int = STREAM_CHUNK_BYTES,
+    ) -> Iterator[bytes]:
+        """Stream a byte range of an S3 object with a ranged GET.
+
+        v0.16.0: The first chunk is available as soon as S3 sends it, so
+        time-to-first-byte does not depend on the object size.
+        """
+        self._ensure_bucket()  # Lazy bucket verification (Issue #247)
+        params = {"Bucket": self.bucket, "Key": path}
+        if start or length is not None:
+            end = "" if length is None else str(start + length - 1)
+            params["Range"] = f"bytes={start}-{end}"
+        try:
+            body = self.client.get_object(**params)["Body"]
+        except ClientError as e:
+            self._raise_not_found(e, path)
+            raise
+        return self._iter_body(body, chunk_size)
+
+    @staticmethod
+    def _iter_body(body: Any, chunk_size: int) -> Iterator[bytes]:
+        """Yield the chunks of a get_object body, then close it."""
+        try:
+            yield from body.iter_chunks(chunk_size)
+        finally:
+            body.close()
+
+    def get_redirect_url(self, path: str, expires_in: int = 3600) -> Optional[str]:
+        """Presign a GET URL of an object (no request is made)."""
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": path},
+            ExpiresIn=expires_in,
+        )
+
     def delete_file(self, path: str) -> None:
         """Delete a stored file, if it exists."""
         self._ensure_bucket()  # Lazy bucket verification (Issue #247)
         self.client.delete_object(Bucket=self.bucket, Key=path)
 
+    def list_files(self, prefix: str = "") -> Iterator[StoredFile]:
+        """List objects under a key prefix (paginated list_objects_v2)."""
+        self._ensure_bucket()  # Lazy bucket verification (Issue #247)
+        return self._iter_objects(prefix)
+
+    def _iter_objects(self, prefix: str) -> Iterator[StoredFile]:
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                yield StoredFile(
+                    path=obj["Key"],
+                    size=obj["Size"],
+                    modified=obj["LastModified"].timestamp(),
+                )
+
+    def delete_files(self, paths: Iterable[str]) -> None:
+        """Delete objects with delete_objects, _DELETE_BATCH_SIZE per request.
+
+        Raises:
+            OSError: If S3 reports per-object delete errors
+        """
+        self._ensure_bucket()  # Lazy bucket verification (Issue #247)
+        keys = list(paths)
+        for i in range(0, len(keys), _DELETE_BATCH_SIZE):
+            batch = keys[i : i + _DELETE_BATCH_SIZE]
+            response = self.client.delete_objects(
+                Bucket=self.bucket,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+            errors = response.get("Errors", [])
+            if errors:
+                raise OSError(
+                    f"Failed to delete {len(errors)} objects, first: "
+                    f"{errors[0].get('Key')} ({errors[0].get('Code')})"
+                )
+
     def file_exists(self, path: str) -> bool:
         """Check if a file exists in storage.
 
@@ -0,0 +1,81 @@
+"""In-process cache of signed download URLs.
+
+v0.16.0: GET /v1/jobs returned a freshly signed result URL for every
+completed job on the page, and S3StorageService.get_signed_url() probes the
+object with head_object first, so a 100-job page made 100 sequential S3
+round trips. The jobs routes now treat a completed job's output_path as the
+record that the artifact exists (it is set only after the upload succeeded),
+sign URLs without a probe, and keep each URL here until shortly before it
+expires, so repeated list requests sign nothing at all.
+
+Usage:
+    urls = SignedUrlCache(ttl_seconds=3600 - 300)
+    url = urls.get(path, lambda: storage.get_redirect_url(path, 3600))
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Tuple
+
+
+class SignedUrlCache:
+    """Thread-safe, size-bounded TTL cache of URLs by storage path."""
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int = 4096,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl_seconds: How long a URL is reused (keep below its expiry)
+            max_entries: Least recently used URLs beyond this are dropped
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: str, sign: Callable[[], str]) -> str:
+        """Return the cached URL of a path, signing a new one when stale.
+
+        Args:
+            path: Storage path the URL points to
+            sign: Builds a URL for the path (called outside the lock)
+
+        Returns:
+            Download URL
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(path)
+                return entry[0]
+
+        url = sign()
+        with self._lock:
+            self._entries[path] = (url, now + self.ttl_seconds)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return url
+
+    def invalidate(self, path: str) -> None:
+        """Forget the URL of a path (e.g. after the file was deleted).
+
+        Args:
+            path: Storage path the URL points to
+        """
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def clear(self) -> None:
+        """Forget all URLs."""
+        with self._lock:
+            self._entries.clear()
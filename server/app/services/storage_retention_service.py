@@ -0,0 +1,308 @@
+"""StorageRetentionService - deletes stored files nothing needs anymore.
+
+v0.16.0: Nothing used to delete job inputs, outputs or checkpoints, and
+uploads from /v1/video/upload that never got a job stayed forever. A
+retention pass lists the storage backend, matches every file against the
+jobs table, and deletes in batches:
+
+- Expired: files of finished jobs older than the TTL of the longest
+  matching prefix in RetentionPolicy.ttl_seconds.
+- Orphaned: files no job references, once older than the orphan grace
+  (so an upload can still be submitted, and a running job's output can be
+  written, before it is recorded).
+- Evicted: if the remaining files exceed max_total_bytes, the oldest files
+  of finished jobs, until the total fits.
+
+Files of pending and running jobs are never deleted. When a job's result
+is deleted its output_path is cleared, so the jobs API stops offering it.
+A dry run computes the same report without deleting anything.
+
+Usage:
+    from app.services.storage_retention_service import (
+        RetentionPolicy, StorageRetentionService,
+    )
+
+    policy = RetentionPolicy(ttl_seconds={"video/input/": 7 * 86400})
+    service = StorageRetentionService(storage, SessionLocal, policy)
+    report = service.run_once(dry_run=True)
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import update
+from sqlalchemy.exc import DBAPIError
+
+from ..models.job import Job, JobStatus
+from .storage.base import StorageService, StoredFile
+from .video_checkpoint_service import CHECKPOINT_ROOT
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ORPHAN_GRACE_SECONDS = 24 * 3600.0
+DEFAULT_DELETE_BATCH_SIZE = 1000
+
+# Jobs whose files must be kept regardless of age or budget
+ACTIVE_STATUSES = (JobStatus.pending, JobStatus.running)
+
+
+def parse_retention_ttls(raw: str) -> Dict[str, float]:
+    """Parse a TTL spec like "video/input=168,image/output=720" (hours).
+
+    Args:
+        raw: Comma-separated prefix=hours pairs (empty string for none)
+
+    Returns:
+        Dict mapping path prefix (with a trailing "/") -> TTL in seconds
+
+    Raises:
+        ValueError: If an entry is malformed or a TTL is negative
+    """
+    ttls: Dict[str, float] = {}
+    for entry in raw.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        prefix, sep, hours = entry.partition("=")
+        prefix = prefix.strip().strip("/")
+        if not sep or not prefix:
+            raise ValueError(f"Invalid retention TTL entry: '{entry}'")
+        value = float(hours)
+        if value < 0:
+            raise ValueError(f"Retention TTL for '{prefix}' must be >= 0")
+        ttls[f"{prefix}/"] = value * 3600.0
+    return ttls
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """What a retention pass may delete.
+
+    Attributes:
+        ttl_seconds: Path prefix -> age after which files of finished jobs
+                     are deleted (prefixes without a TTL are kept)
+        max_total_bytes: Size budget of all stored files (0 = no budget)
+        orphan_grace_seconds: Age after which unreferenced files are deleted
+        batch_size: Paths per StorageService.delete_files() call
+    """
+
+    ttl_seconds: Dict[str, float] = field(default_factory=dict)
+    max_total_bytes: int = 0
+    orphan_grace_seconds: float = DEFAULT_ORPHAN_GRACE_SECONDS
+    batch_size: int = DEFAULT_DELETE_BATCH_SIZE
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """Return the TTL of the longest prefix matching path, if any."""
+        matches = [prefix for prefix in self.ttl_seconds if path.startswith(prefix)]
+        if not matches:
+            return None
+        return self.ttl_seconds[max(matches, key=len)]
+
+
+@dataclass
+class RetentionReport:
+    """Outcome of a retention pass.
+
+    Attributes:
+        dry_run: True if nothing was deleted
+        scanned_files: Number of stored files listed
+        scanned_bytes: Total size of the listed files
+        expired: Paths past their prefix TTL
+        orphaned: Paths no job references
+        evicted: Paths removed to fit the size budget
+        freed_bytes: Total size of the deleted (or deletable) paths
+        cleared_outputs: Job IDs whose output_path was cleared
+    """
+
+    dry_run: bool
+    scanned_files: int = 0
+    scanned_bytes: int = 0
+    expired: List[str] = field(default_factory=list)
+    orphaned: List[str] = field(default_factory=list)
+    evicted: List[str] = field(default_factory=list)
+    freed_bytes: int = 0
+    cleared_outputs: List[str] = field(default_factory=list)
+
+    @property
+    def deleted(self) -> List[str]:
+        """All paths the pass deleted (or would delete, in a dry run)."""
+        return self.expired + self.orphaned + self.evicted
+
+    def summary(self) -> str:
+        """One-line description for logs."""
+        return (
+            f"{'[dry run] ' if self.dry_run else ''}scanned "
+            f"{self.scanned_files} files ({self.scanned_bytes} bytes): "
+            f"{len(self.expired)} expired, {len(self.orphaned)} orphaned, "
+            f"{len(self.evicted)} evicted, {self.freed_bytes} bytes freed"
+        )
+
+
+@dataclass
+class _JobRefs:
+    """Storage paths referenced by the jobs table."""
+
+    active_paths: Set[str] = field(default_factory=set)
+    active_jobs: Set[str] = field(default_factory=set)
+    finished_paths: Set[str] = field(default_factory=set)
+    finished_outputs: Dict[str, str] = field(default_factory=dict)
+    finished_jobs: Set[str] = field(default_factory=set)
+
+
+class StorageRetentionService:
+    """Applies a RetentionPolicy to a storage backend."""
+
+    def __init__(
+        self,
+        storage: StorageService,
+        session_factory,
+        policy: RetentionPolicy,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            storage: Storage backend to clean up (must support list_files())
+            session_factory: Factory returning database sessions
+            policy: What may be deleted
+        """
+        self.storage = storage
+        self.policy = policy
+        self._session_factory = session_factory
+
+    def run_once(
+        self, dry_run: bool = False, now: Optional[float] = None
+    ) -> RetentionReport:
+        """Run one retention pass.
+
+        Args:
+            dry_run: Only report what would be deleted
+            now: Current Unix time (injectable for tests)
+
+        Returns:
+            RetentionReport of the pass
+        """
+        now = time.time() if now is None else now
+        report = RetentionReport(dry_run=dry_run)
+
+        # List before reading the jobs table: a job created after the
+        # snapshot can only reference files younger than the orphan grace
+        files = list(self.storage.list_files())
+        refs = self._load_refs()
+
+        evictable: List[StoredFile] = []
+        sizes: Dict[str, int] = {}
+        for stored in files:
+            report.scanned_files += 1
+            report.scanned_bytes += stored.size
+            sizes[stored.path] = stored.size
+            owner = self._owner(stored.path, refs)
+            age = now - stored.modified
+            if owner == "active":
+                continue
+            if owner is None:
+                if age >= self.policy.orphan_grace_seconds:
+                    report.orphaned.append(stored.path)
+                continue
+            ttl = self.policy.ttl_for(stored.path)
+            if ttl is not None and age >= ttl:
+                report.expired.append(stored.path)
+            else:
+                evictable.append(stored)
+
+        remaining = report.scanned_bytes - sum(
+            sizes[path] for path in report.expired + report.orphaned
+        )
+        if self.policy.max_total_bytes > 0:
+            for stored in sorted(evictable, key=lambda f: f.modified):
+                if remaining <= self.policy.max_total_bytes:
+                    break
+                report.evicted.append(stored.path)
+                remaining -= stored.size
+
+        report.freed_bytes = report.scanned_bytes - remaining
+        deleted_outputs = [
+            (refs.finished_outputs[path], path)
+            for path in report.expired + report.evicted
+            if path in refs.finished_outputs
+        ]
+        report.cleared_outputs = [job_id for job_id, _ in deleted_outputs]
+
+        if not dry_run and report.deleted:
+            self._delete(report.deleted)
+            self._clear_outputs(deleted_outputs)
+
+        logger.info(f"Storage retention: {report.summary()}")
+        return report
+
+    def _load_refs(self) -> _JobRefs:
+        """Read the paths each job references, by job state."""
+        refs = _JobRefs()
+        db = self._session_factory()
+        try:
+            rows = db.query(
+                Job.job_id, Job.status, Job.input_path, Job.output_path
+            ).all()
+        finally:
+            db.close()
+
+        for job_id, status, input_path, output_path in rows:
+            job_id = str(job_id)
+            paths = [path for path in (input_path, output_path) if path]
+            if status in ACTIVE_STATUSES:
+                refs.active_jobs.add(job_id)
+                refs.active_paths.update(paths)
+            else:
+                refs.finished_jobs.add(job_id)
+                refs.finished_paths.update(paths)
+                if output_path:
+                    refs.finished_outputs[output_path] = job_id
+        # A file shared by an active and a finished job stays
+        refs.finished_paths -= refs.active_paths
+        return refs
+
+    @staticmethod
+    def _owner(path: str, refs: _JobRefs) -> Optional[str]:
+        """Return "active", "finished" or None (orphan) for a stored path."""
+        if path in refs.active_paths:
+            return "active"
+        if path in refs.finished_paths:
+            return "finished"
+        if path.startswith(f"{CHECKPOINT_ROOT}/"):
+            # video/checkpoints/{job_id}/{tool}/...
+            job_id = path[len(CHECKPOINT_ROOT) + 1 :].split("/", 1)[0]
+            if job_id in refs.active_jobs:
+                return "active"
+            if job_id in refs.finished_jobs:
+                return "finished"
+        return None
+
+    def _delete(self, paths: List[str]) -> None:
+        """Delete paths in batches of policy.batch_size."""
+        batch_size = max(self.policy.batch_size, 1)
+        for i in range(0, len(paths), batch_size):
+            self.storage.delete_files(paths[i : i + batch_size])
+
+    def _clear_outputs(self, deleted_outputs: List[Tuple[str, str]]) -> None:
+        """Clear output_path of finished jobs whose result was deleted."""
+        if not deleted_outputs:
+            return
+        db = self._session_factory()
+        try:
+            for job_id, path in deleted_outputs:
+                db.execute(
+                    update(Job)
+                    .where(Job.job_id == job_id)
+                    .where(Job.output_path == path)
+                    .where(Job.status.notin_(ACTIVE_STATUSES))
+                    .values(output_path=None),
+                    execution_options={"synchronize_session": False},
+                )
+            db.commit()
+        except DBAPIError as e:
+            # Rows are rechecked on the next pass
+            db.rollback()
+            logger.warning(f"Failed to clear deleted job outputs: {e}")
+        finally:
+            db.close()
@@ -0,0 +1,310 @@
+"""Shared pool of StreamingToolActor replicas for WebSocket streaming.
+
+v0.16.0: VisionAnalysisService used to spawn one StreamingToolActor per
+(client, plugin, tool), so every connection reloaded the model and 50
+viewers of one tool held 50 copies of it. Actors are now shared by all
+clients and keyed by (plugin, tool):
+
+- Least-loaded routing: a frame goes to the replica with the fewest frames
+  in flight. A new replica is spawned only when all replicas of the tool
+  are busy and the tool has fewer than max_replicas.
+- Bounded size: at most max_actors replicas exist in total. At the limit,
+  the least recently used idle replica of another tool is evicted.
+- Idle eviction: replicas unused for idle_seconds are killed, except the
+  pre-warmed replica of each configured tool. A sweeper thread, started
+  with the first replica, checks every idle_seconds / 2, so replicas are
+  freed even when no more frames arrive.
+- Pre-warming: tools listed in FORGESYTE_STREAMING_PREWARM get a replica
+  as soon as Ray is available, so the first connect does not wait for
+  model loading.
+
+Memory is therefore bounded by the number of tools in use, not clients.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import ray
+
+logger = logging.getLogger(__name__)
+
+ActorKey = Tuple[str, str]  # (plugin_id, tool_name)
+
+DEFAULT_MAX_ACTORS = 8
+DEFAULT_MAX_REPLICAS = 2
+DEFAULT_IDLE_SECONDS = 300.0
+
+
+def parse_prewarm_tools(spec: str) -> List[ActorKey]:
+    """Parse a pre-warm spec like "yolo:player_detection,ocr:analyze".
+
+    Args:
+        spec: Comma-separated plugin:tool pairs
+
+    Returns:
+        List of (plugin_id, tool_name) keys
+
+    Raises:
+        ValueError: If an entry is not a plugin:tool pair
+    """
+    keys: List[ActorKey] = []
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        plugin_id, sep, tool_name = entry.partition(":")
+        if not sep or not plugin_id.strip() or not tool_name.strip():
+            raise ValueError(f"Invalid pre-warm entry {entry!r}, expected plugin:tool")
+        keys.append((plugin_id.strip(), tool_name.strip()))
+    return keys
+
+
+@dataclass(eq=False)
+class ActorReplica:
+    """One pooled StreamingToolActor.
+
+    Attributes:
+        key: (plugin_id, tool_name) the actor serves
+        handle: Ray actor handle
+        in_flight: Frames currently being processed
+        last_used: Clock time of the last release
+        pinned: Pre-warmed replica, exempt from idle eviction
+    """
+
+    key: ActorKey
+    handle: Any
+    in_flight: int = 0
+    last_used: float = 0.0
+    pinned: bool = field(default=False)
+
+
+class StreamingActorPool:
+    """Routes frames to shared StreamingToolActor replicas."""
+
+    def __init__(
+        self,
+        max_actors: int = DEFAULT_MAX_ACTORS,
+        max_replicas: int = DEFAULT_MAX_REPLICAS,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+        prewarm: Iterable[ActorKey] = (),
+        clock: Callable[[], float] = time.monotonic,
+        sweep_seconds: Optional[float] = None,
+    ) -> None:
+        """Initialize an empty pool (actors are spawned on demand).
+
+        Args:
+            max_actors: Maximum replicas across all tools
+            max_replicas: Maximum replicas of one (plugin, tool)
+            idle_seconds: Idle time after which a replica is killed
+            prewarm: (plugin, tool) keys that keep one warm replica
+            clock: Monotonic time source (injectable for tests)
+            sweep_seconds: Interval of the idle sweep
+                           (default idle_seconds / 2, at least 1s)
+        """
+        self.max_actors = max(1, max_actors)
+        self.max_replicas = max(1, max_replicas)
+        self.idle_seconds = idle_seconds
+        self.prewarm_keys = list(prewarm)
+        self._clock = clock
+        if sweep_seconds is None:
+            sweep_seconds = max(1.0, idle_seconds / 2)
+        self.sweep_seconds = sweep_seconds
+        self._replicas: Dict[ActorKey, List[ActorReplica]] = {}
+        self._prewarmed = False
+        self._lock = threading.Lock()
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop_sweeper = threading.Event()
+
+    @property
+    def size(self) -> int:
+        """Number of live replicas across all tools."""
+        return sum(len(replicas) for replicas in self._replicas.values())
+
+    def replicas(self, plugin_id: str, tool_name: str) -> List[ActorReplica]:
+        """Return the live replicas of a tool."""
+        return list(self._replicas.get((plugin_id, tool_name), []))
+
+    def acquire(self, plugin_id: str, tool_name: str) -> ActorReplica:
+        """Pick the replica that will process one frame.
+
+        Must be paired with release() once the frame is done.
+
+        Args:
+            plugin_id: Plugin identifier
+            tool_name: Tool name within the plugin
+
+        Returns:
+            Least-loaded replica of the tool (spawned if needed)
+
+        Raises:
+            RuntimeError: If the tool has no replica and the pool is full
+                          of busy replicas
+        """
+        key = (plugin_id, tool_name)
+        with self._lock:
+            self._evict_idle_locked()
+            replicas = self._replicas.setdefault(key, [])
+            best = min(replicas, key=lambda r: r.in_flight, default=None)
+            if best is None or (
+                best.in_flight > 0 and len(replicas) < self.max_replicas
+            ):
+                if self.size < self.max_actors or self._evict_lru_locked(key):
+                    best = self._spawn_locked(key)
+                elif best is None:
+                    raise RuntimeError(
+                        f"Streaming actor pool is full ({self.max_actors} busy "
+                        f"actors); cannot serve {plugin_id}.{tool_name}"
+                    )
+            best.in_flight += 1
+            return best
+
+    def release(self, replica: ActorReplica) -> None:
+        """Mark one frame of a replica as done."""
+        with self._lock:
+            replica.in_flight = max(0, replica.in_flight - 1)
+            replica.last_used = self._clock()
+
+    def discard(self, replica: ActorReplica) -> None:
+        """Drop a dead replica (e.g. after RayActorError) from the pool."""
+        with self._lock:
+            replicas = self._replicas.get(replica.key, [])
+            if replica in replicas:
+                replicas.remove(replica)
+                logger.warning(
+                    f"Evicted dead actor for {replica.key[0]}.{replica.key[1]}"
+                )
+
+    def ensure_prewarmed(self) -> None:
+        """Spawn one pinned replica per pre-warm tool (once)."""
+        with self._lock:
+            if self._prewarmed:
+                return
+            self._prewarmed = True
+            for key in self.prewarm_keys:
+                if self._replicas.get(key) or self.size >= self.max_actors:
+                    continue
+                try:
+                    self._spawn_locked(key).pinned = True
+                except Exception as e:
+                    logger.error(f"Failed to pre-warm actor {key[0]}.{key[1]}: {e}")
+
+    def evict_idle(self) -> int:
+        """Kill replicas idle for longer than idle_seconds.
+
+        Returns:
+            Number of replicas killed
+        """
+        with self._lock:
+            return self._evict_idle_locked()
+
+    def start_sweeper(self) -> None:
+        """Run evict_idle() every sweep_seconds from a daemon thread (once).
+
+        Called when the first replica is spawned.
+        """
+        if self._sweeper is not None:
+            return
+        self._stop_sweeper.clear()
+        self._sweeper = threading.Thread(
+            target=self._sweep_forever,
+            name="streaming-actor-sweeper",
+            daemon=True,
+        )
+        self._sweeper.start()
+
+    def shutdown(self) -> None:
+        """Stop the sweeper and kill every replica."""
+        self._stop_sweeper.set()
+        if self._sweeper is not None:
+            self._sweeper.join()
+            self._sweeper = None
+        with self._lock:
+            for replicas in self._replicas.values():
+                for replica in replicas:
+                    self._kill(replica)
+            self._replicas.clear()
+            self._prewarmed = False
+
+    def _sweep_forever(self) -> None:
+        while not self._stop_sweeper.wait(self.sweep_seconds):
+            try:
+                killed = self.evict_idle()
+            except Exception as e:
+                logger.error(f"Streaming actor idle sweep failed: {e}")
+                continue
+            if killed:
+                logger.info(f"Evicted {killed} idle streaming actor(s)")
+
+    def _spawn_locked(self, key: ActorKey) -> ActorReplica:
+        from ..workers.ray_actors import StreamingToolActor
+
+        logger.info(f"Spawning pooled Ray Actor for {key[0]}.{key[1]}")
+        # StreamingToolActor.remote is dynamically created by @ray.remote
+        handle = StreamingToolActor.remote(*key)  # type: ignore[attr-defined]
+        replica = ActorReplica(key=key, handle=handle, last_used=self._clock())
+        self._replicas.setdefault(key, []).append(replica)
+        self.start_sweeper()
+        return replica
+
+    def _evict_idle_locked(self) -> int:
+        deadline = self._clock() - self.idle_seconds
+        killed = 0
+        for key, replicas in list(self._replicas.items()):
+            for replica in list(replicas):
+                if replica.pinned or replica.in_flight or replica.last_used > deadline:
+                    continue
+                replicas.remove(replica)
+                self._kill(replica)
+                killed += 1
+            if not replicas:
+                del self._replicas[key]
+        return killed
+
+    def _evict_lru_locked(self, keep: ActorKey) -> bool:
+        """Kill the least recently used idle replica of another tool."""
+        idle = [
+            replica
+            for key, replicas in self._replicas.items()
+            if key != keep
+            for replica in replicas
+            if not replica.in_flight
+        ]
+        if not idle:
+            return False
+        victim = min(idle, key=lambda r: r.last_used)
+        self._replicas[victim.key].remove(victim)
+        if not self._replicas[victim.key]:
+            del self._replicas[victim.key]
+        self._kill(victim)
+        return True
+
+    @staticmethod
+    def _kill(replica: ActorReplica) -> None:
+        logger.info(f"Killing pooled Ray Actor for {replica.key[0]}.{replica.key[1]}")
+        try:
+            if ray.is_initialized():
+                ray.kill(replica.handle)
+        except Exception as e:
+            logger.warning(f"Failed to kill actor {replica.key}: {e}")
+
+
+def create_streaming_actor_pool(settings: Optional[Any] = None) -> StreamingActorPool:
+    """Create a pool configured from settings (FORGESYTE_STREAMING_*).
+
+    Args:
+        settings: Settings object (defaults to app.settings.settings)
+    """
+    if settings is None:
+        from ..settings import settings as app_settings
+
+        settings = app_settings
+
+    return StreamingActorPool(
+        max_actors=settings.streaming_actor_pool_size,
+        max_replicas=settings.streaming_actor_max_replicas,
+        idle_seconds=settings.streaming_actor_idle_seconds,
+        prewarm=parse_prewarm_tools(settings.streaming_prewarm_tools),
+    )
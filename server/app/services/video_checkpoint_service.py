@@ -0,0 +1,238 @@
+"""Checkpoints for long-running video tools.
+
+v0.16.0: A video tool used to run start-to-finish inside one
+run_plugin_tool() call, so a failure (or a lease expiry and requeue) at
+frame 40,000 threw away every frame before it. VideoCheckpoint persists a
+tool's progress to storage so a re-run of the job only redoes the tail:
+
+- Frame segments: tools that list "start_frame" in their manifest
+  input_types may pass the results of the frames they just processed to
+  the progress callback, ``progress_callback(current, total,
+  frame_results=[...])``. The results are buffered and written as one
+  storage object per `segment_frames` frames, keyed by frame range. On
+  re-run the tool receives ``start_frame`` and returns the frames from
+  there on; the persisted frames are merged in front of its output.
+- Tool results: in multi-tool jobs, each finished tool's output is saved,
+  so tools that already completed are not run again.
+
+Each tool keeps a small index.json holding its segments' frame ranges in
+order and its saved result. It is rewritten after each segment is
+stored, so a resume reads one object instead of listing and sorting
+segments, and a segment only counts once the index names it. Everything
+lives under
+``video/checkpoints/{job_id}/{tool_name}/`` and is deleted once the job
+completes, fails for good or is cancelled (clear_job_checkpoints()). Runs
+stopped because the job was requeued keep their checkpoints.
+"""
+
+import json
+import logging
+from io import BytesIO
+from typing import Any, Dict, List, Optional
+
+from .storage.base import StorageService
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_ROOT = "video/checkpoints"
+
+# Frames per persisted segment (one storage write per segment)
+DEFAULT_SEGMENT_FRAMES = 500
+
+
+class VideoCheckpoint:
+    """Persisted progress of one video tool within one job."""
+
+    def __init__(
+        self,
+        storage: StorageService,
+        job_id: str,
+        tool_name: str,
+        segment_frames: int = DEFAULT_SEGMENT_FRAMES,
+    ) -> None:
+        """Initialize a checkpoint (call load() to read persisted state).
+
+        Args:
+            storage: StorageService holding the checkpoint objects
+            job_id: Job UUID string
+            tool_name: Tool the checkpoint belongs to
+            segment_frames: Frames per persisted segment
+        """
+        self.storage = storage
+        self.job_id = str(job_id)
+        self.tool_name = tool_name
+        self.segment_frames = max(1, segment_frames)
+        self.prefix = f"{CHECKPOINT_ROOT}/{self.job_id}/{tool_name}"
+        self._segments: List[Dict[str, Any]] = []
+        self._result_path: Optional[str] = None
+        self._buffer: List[Any] = []
+        self._buffer_start = 0
+        self._buffer_end = 0
+        self._loaded_resume_frame = 0
+
+    @property
+    def index_path(self) -> str:
+        """Storage path of this tool's checkpoint index."""
+        return f"{self.prefix}/index.json"
+
+    @property
+    def resume_frame(self) -> int:
+        """First frame not covered by a persisted segment."""
+        return self._segments[-1]["end"] if self._segments else 0
+
+    def load(self) -> None:
+        """Read the persisted index. A missing or corrupt index means no
+        checkpoint (the tool starts from frame 0)."""
+        self._segments = []
+        self._result_path = None
+        try:
+            if not self.storage.file_exists(self.index_path):
+                return
+            index = self._read_json(self.index_path)
+            self._segments = list(index.get("segments", []))
+            self._result_path = index.get("result")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable checkpoint {self.index_path}: {e}")
+            self._segments = []
+            self._result_path = None
+        self._buffer = []
+        self._buffer_start = self._buffer_end = self.resume_frame
+        self._loaded_resume_frame = self.resume_frame
+
+    def completed_result(self) -> Optional[Any]:
+        """Return the saved output of a tool that already finished, if any."""
+        if self._result_path is None:
+            return None
+        try:
+            return self._read_json(self._result_path)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable checkpoint result: {e}")
+            return None
+
+    def record(self, current_frame: int, frame_results: Optional[List[Any]]) -> None:
+        """Buffer results of frames processed up to current_frame.
+
+        Writes a segment once the buffer spans `segment_frames` frames.
+
+        Args:
+            current_frame: Frames processed so far (absolute, 1-based count)
+            frame_results: Results produced since the previous call
+        """
+        if frame_results:
+            self._buffer.extend(frame_results)
+        self._buffer_end = max(self._buffer_end, int(current_frame))
+        if self._buffer_end - self._buffer_start >= self.segment_frames:
+            self.flush()
+
+    def flush(self) -> None:
+        """Persist buffered frames as a segment covering the frames seen."""
+        if self._buffer_end <= self._buffer_start:
+            return
+        start, end = self._buffer_start, self._buffer_end
+        path = f"{self.prefix}/frames_{start:08d}_{end:08d}.json"
+        self._write_json(path, self._buffer)
+        self._segments.append({"start": start, "end": end, "path": path})
+        self._write_index()
+        self._buffer = []
+        self._buffer_start = end
+
+    def persisted_frames(self, before: Optional[int] = None) -> List[Any]:
+        """Return the frame results of persisted segments in order.
+
+        Args:
+            before: Only segments ending at or before this frame (default all)
+        """
+        frames: List[Any] = []
+        for segment in self._segments:
+            if before is None or segment["end"] <= before:
+                frames.extend(self._read_json(segment["path"]))
+        return frames
+
+    def merge(self, result: Any) -> Any:
+        """Put frames persisted by earlier runs in front of a resumed
+        tool's output.
+
+        Output frames before the resume point are dropped in favour of the
+        persisted ones, so a tool that ignored start_frame is not counted
+        twice.
+
+        Args:
+            result: Tool output ({"frames": [...], ...} or a frame list)
+
+        Returns:
+            Output covering the whole video
+        """
+        resume = self._loaded_resume_frame
+        if not resume:
+            return result
+        persisted = self.persisted_frames(before=resume)
+        if isinstance(result, dict):
+            tail = [
+                f for f in result.get("frames", []) if _frame_idx(f, resume) >= resume
+            ]
+            return {**result, "frames": persisted + tail}
+        if isinstance(result, list):
+            return persisted + [f for f in result if _frame_idx(f, resume) >= resume]
+        return result
+
+    def save_result(self, result: Any) -> None:
+        """Record the tool's final output so a re-run can skip the tool."""
+        self._result_path = f"{self.prefix}/result.json"
+        self._write_json(self._result_path, result)
+        self._write_index()
+
+    def clear(self) -> None:
+        """Delete every object of this checkpoint."""
+        paths = [segment["path"] for segment in self._segments]
+        if self._result_path:
+            paths.append(self._result_path)
+        paths.append(self.index_path)
+        for path in paths:
+            try:
+                self.storage.delete_file(path)
+            except Exception as e:
+                logger.warning(f"Failed to delete checkpoint object {path}: {e}")
+        self._segments = []
+        self._result_path = None
+
+    def _write_index(self) -> None:
+        self._write_json(
+            self.index_path, {"segments": self._segments, "result": self._result_path}
+        )
+
+    def _write_json(self, path: str, data: Any) -> None:
+        self.storage.save_file(BytesIO(json.dumps(data).encode()), path)
+
+    def _read_json(self, path: str) -> Any:
+        with self.storage.open_local(path) as local_path:
+            return json.loads(local_path.read_bytes())
+
+
+def clear_job_checkpoints(storage: StorageService, job_id: str) -> int:
+    """Delete every checkpoint object of a job, for all of its tools.
+
+    Args:
+        storage: StorageService holding the checkpoint objects
+        job_id: Job UUID string
+
+    Returns:
+        Number of objects deleted (0 if the storage cannot list files)
+    """
+    prefix = f"{CHECKPOINT_ROOT}/{job_id}/"
+    try:
+        paths = [stored.path for stored in storage.list_files(prefix)]
+        if paths:
+            storage.delete_files(paths)
+    except NotImplementedError:
+        return 0
+    except Exception as e:
+        logger.warning(f"Failed to delete checkpoints of job {job_id}: {e}")
+        return 0
+    return len(paths)
+
+
+def _frame_idx(frame: Any, default: int) -> int:
+    """Return a frame result's frame_idx (default when it has none)."""
+    if isinstance(frame, dict) and isinstance(frame.get("frame_idx"), int):
+        return frame["frame_idx"]
+    return default
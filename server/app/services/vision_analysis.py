@@ -5,6 +5,9 @@ This service is used ONLY for the /v1/stream WebSocket endpoint.
 It performs real-time per-frame analysis using long-lived Ray Actors
 that hold plugin models in GPU memory across frames.
 
+v0.16.0 — Actors are shared by all clients through StreamingActorPool
+(keyed by plugin and tool) instead of spawned per client.
+
 Architecture:
     WebSocket Frame → VisionAnalysisService → StreamingToolActor (GPU)
                                                           ↓
@@ -28,12 +31,14 @@ import base64
 import logging
 import time
 import uuid
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 import ray
 
 from ..protocols import WebSocketProvider
+from .frame_batcher import DEFAULT_BATCH_MAX_SIZE, FrameBatcher
 from .plugin_management_service import PluginManagementService
+from .streaming_actor_pool import StreamingActorPool
 
 logger = logging.getLogger(__name__)
 
@@ -54,89 +59,133 @@ class VisionAnalysisService:
     Attributes:
         plugin_service: Plugin management service for executing tools
         ws_manager: WebSocket manager for client communication
-        active_actors: Dict mapping client_id -> {tool_name: actor_handle}
+        actor_pool: v0.16.0: Shared pool of StreamingToolActor replicas
+        frame_batcher: v0.16.0: Cross-client micro-batcher (None = per frame)
+        active_actors: Dict mapping client_id -> {(plugin, tool): actor_handle}
+                       of the replica that served the client's last frame
+                       (None for batched frames)
     """
 
     def __init__(
-        self, plugin_service: PluginManagementService, ws_manager: WebSocketProvider
+        self,
+        plugin_service: PluginManagementService,
+        ws_manager: WebSocketProvider,
+        actor_pool: Optional[StreamingActorPool] = None,
+        batch_window_ms: float = 0.0,
+        batch_max_size: int = DEFAULT_BATCH_MAX_SIZE,
     ) -> None:
         """Initialize vision analysis service with dependencies.
 
         Args:
             plugin_service: Plugin management service for executing tools
             ws_manager: WebSocket manager (implements WebSocketProvider protocol)
+            actor_pool: v0.16.0: Shared actor pool (defaults to an unconfigured
+                        StreamingActorPool)
+            batch_window_ms: v0.16.0: Window for micro-batching frames of the
+                             same tool across clients (0 disables batching)
+            batch_max_size: v0.16.0: Frames that flush a batch immediately
 
         Raises:
             TypeError: If plugin_service or ws_manager don't have required methods
         """
         self.plugin_service = plugin_service
         self.ws_manager = ws_manager
-        # Track active Ray actors: client_id -> {(plugin_name, tool_name): actor_handle}
+        self.actor_pool = actor_pool or StreamingActorPool()
+        self.frame_batcher: Optional[FrameBatcher] = None
+        if batch_window_ms > 0:
+            self.frame_batcher = FrameBatcher(
+                self._process_batch, batch_window_ms, batch_max_size
+            )
+        # Track the tools each client streams: client_id -> {(plugin_name, tool_name): actor_handle}
         # Using tuple key prevents cross-plugin reuse when clients switch plugins
         self.active_actors: Dict[str, Dict[tuple, Any]] = {}
 
         logger.debug("VisionAnalysisService initialized")
 
-    def _get_or_create_actor(
-        self, client_id: str, plugin_name: str, tool_name: str
+    async def _process_with_actor(
+        self, client_id: str, plugin_name: str, tool_name: str, args: Dict[str, Any]
     ) -> Any:
-        """Get or create a Ray Actor for a specific client/plugin/tool combination.
+        """Process one frame on a pooled Ray Actor.
 
-        This method implements lazy initialization with caching:
-        - First call creates a new actor
-        - Subsequent calls return the cached actor
-
-        v0.13.1: Key now includes plugin_name to prevent cross-plugin reuse
-        when clients switch plugins mid-connection.
+        v0.16.0: The frame goes to the least-loaded shared replica of
+        (plugin_name, tool_name); the pool spawns one only if needed. With
+        micro-batching enabled, the frame joins a batch of concurrent
+        frames of the same tool instead.
 
         Args:
             client_id: Unique client identifier
             plugin_name: Plugin identifier
             tool_name: Tool name within the plugin
+            args: Tool arguments
 
         Returns:
-            Ray Actor handle for the StreamingToolActor
-        """
-        from ..workers.ray_actors import StreamingToolActor
+            Raw tool result
 
-        if client_id not in self.active_actors:
-            self.active_actors[client_id] = {}
-
-        # Use (plugin_name, tool_name) tuple as key to prevent cross-plugin reuse
-        actor_key = (plugin_name, tool_name)
+        Raises:
+            RuntimeError: If the actor died or the pool is exhausted
+        """
+        client_actors = self.active_actors.setdefault(client_id, {})
+        if self.frame_batcher is not None:
+            client_actors.setdefault((plugin_name, tool_name), None)
+            return await self.frame_batcher.submit(plugin_name, tool_name, args)
+
+        handle, result = await self._call_actor(
+            plugin_name, tool_name, "process_frame", args
+        )
+        client_actors[(plugin_name, tool_name)] = handle
+        return result
+
+    async def _process_batch(
+        self, key: Tuple[str, str], args_list: List[Dict[str, Any]]
+    ) -> List[Any]:
+        """Run a micro-batch of frames on one pooled Ray Actor (v0.16.0)."""
+        plugin_name, tool_name = key
+        _, results = await self._call_actor(
+            plugin_name, tool_name, "process_frames", args_list
+        )
+        return results
+
+    async def _call_actor(
+        self, plugin_name: str, tool_name: str, method: str, payload: Any
+    ) -> Tuple[Any, Any]:
+        """Call a method on the least-loaded replica of a tool.
 
-        if actor_key not in self.active_actors[client_id]:
-            logger.info(
-                f"Spawning Ray Actor for client {client_id}, "
-                f"plugin {plugin_name}, tool {tool_name}"
-            )
-            # StreamingToolActor.remote is dynamically created by @ray.remote
-            actor = StreamingToolActor.remote(plugin_name, tool_name)  # type: ignore[attr-defined]
-            self.active_actors[client_id][actor_key] = actor
+        Returns:
+            (actor handle, result)
 
-        return self.active_actors[client_id][actor_key]
+        Raises:
+            RuntimeError: If the actor died or the pool is exhausted
+        """
+        self.actor_pool.ensure_prewarmed()
+        replica = self.actor_pool.acquire(plugin_name, tool_name)
+        try:
+            # v0.13.1: Await ObjectRef directly instead of blocking ray.get()
+            # This yields to the event loop, allowing concurrent WebSocket handling
+            result = await getattr(replica.handle, method).remote(payload)  # type: ignore[misc]
+            return replica.handle, result
+        except ray.exceptions.RayActorError as e:
+            # v0.13.3: Evict poisoned handle - actor failed during init
+            # This prevents reusing dead actors indefinitely
+            self.actor_pool.discard(replica)
+            raise RuntimeError(
+                f"Ray Actor for {plugin_name}.{tool_name} failed: {e}"
+            ) from e
+        finally:
+            self.actor_pool.release(replica)
 
     async def cleanup_client(self, client_id: str) -> None:
-        """Kill all Ray actors associated with a disconnected client.
-
-        This method MUST be called when a WebSocket disconnects to
-        free GPU VRAM. Otherwise, actors will leak and exhaust GPU memory.
+        """Forget a disconnected client.
 
-        v0.13.1: Updated to use (plugin_name, tool_name) tuple keys.
+        v0.16.0: Actors are shared, so they are no longer killed with the
+        client. Replicas left idle are evicted by the pool's sweeper after
+        its idle timeout, which also bounds GPU memory.
 
         Args:
             client_id: Unique client identifier
         """
-        if client_id in self.active_actors:
-            if ray.is_initialized():
-                for actor_key, actor in self.active_actors[client_id].items():
-                    plugin_name, tool_name = actor_key
-                    logger.info(
-                        f"Killing Ray Actor for client {client_id}, "
-                        f"plugin {plugin_name}, tool {tool_name}"
-                    )
-                    ray.kill(actor)
-            del self.active_actors[client_id]
+        self.active_actors.pop(client_id, None)
+        if ray.is_initialized():
+            self.actor_pool.evict_idle()
 
     async def handle_frame(
         self, client_id: str, plugin_name: str, data: Dict[str, Any]
@@ -203,29 +252,10 @@ class VisionAnalysisService:
                 }
 
                 if use_ray:
-                    # Use cached Ray Actor for GPU-accelerated processing
-                    actor = self._get_or_create_actor(client_id, plugin_name, tool_name)
-                    try:
-                        future = actor.process_frame.remote(args)
-                        # v0.13.1: Await ObjectRef directly instead of blocking ray.get()
-                        # This yields to the event loop, allowing concurrent WebSocket handling
-                        tool_result = await future  # type: ignore[misc]
-                    except ray.exceptions.RayActorError as e:
-                        # v0.13.3: Evict poisoned handle - actor failed during init
-                        # This prevents reusing dead actors indefinitely
-                        actor_key = (plugin_name, tool_name)
-                        if (
-                            client_id in self.active_actors
-                            and actor_key in self.active_actors[client_id]
-                        ):
-                            del self.active_actors[client_id][actor_key]
-                            logger.warning(
-                                f"Evicted dead actor for {plugin_name}.{tool_name}",
-                                extra={"client_id": client_id},
-                            )
-                        raise RuntimeError(
-                            f"Ray Actor for {plugin_name}.{tool_name} failed: {e}"
-                        ) from e
+                    # v0.16.0: Use a shared pooled Ray Actor
+                    tool_result = await self._process_with_actor(
+                        client_id, plugin_name, tool_name, args
+                    )
                 else:
                     # Fallback to local synchronous execution
                     tool_result = self.plugin_service.run_plugin_tool(
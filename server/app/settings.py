@@ -32,6 +32,144 @@ class AppSettings(BaseSettings):
     s3_secret_key: str = Field(default="", alias="S3_SECRET_KEY")
     s3_bucket_name: str = Field(default="forgesyte-jobs", alias="S3_BUCKET_NAME")
 
+    # S3 client tuning (v0.16.0): each process shares one pooled client
+    # (get_shared_storage_service). Uploads/downloads split into parts of
+    # FORGESYTE_S3_MULTIPART_CHUNK_MB transferred by up to
+    # FORGESYTE_S3_TRANSFER_CONCURRENCY threads, so the pool should hold
+    # several transfers' worth of connections.
+    s3_max_pool_connections: int = Field(
+        default=50, alias="FORGESYTE_S3_MAX_POOL_CONNECTIONS"
+    )
+    s3_transfer_concurrency: int = Field(
+        default=8, alias="FORGESYTE_S3_TRANSFER_CONCURRENCY"
+    )
+    s3_multipart_chunk_mb: int = Field(
+        default=16, alias="FORGESYTE_S3_MULTIPART_CHUNK_MB"
+    )
+
+    # Local disk cache of S3 objects (v0.16.0): read-through, validated by
+    # ETag, shared by all processes of a host (API, JobWorker, Ray workers)
+    # and bounded to this many MB (0 disables). Empty dir =
+    # <tmp>/forgesyte-storage-cache
+    storage_cache_dir: str = Field(default="", alias="FORGESYTE_STORAGE_CACHE_DIR")
+    storage_cache_mb: int = Field(default=10240, alias="FORGESYTE_STORAGE_CACHE_MB")
+
+    # Job video/result downloads (v0.16.0): redirect clients to a presigned
+    # S3 URL instead of streaming through the API. Only enable when clients
+    # can reach S3_ENDPOINT_URL.
+    storage_redirect_downloads: bool = Field(
+        default=False, alias="FORGESYTE_STORAGE_REDIRECT_DOWNLOADS"
+    )
+
+    # Storage retention (v0.16.0): every interval (0 disables) the JobWorker
+    # process deletes files of finished jobs older than their prefix TTL
+    # ("video/input=168,image/output=720", in hours), files no job
+    # references once older than the orphan grace, and then the oldest
+    # finished-job files beyond max_mb (0 = no budget). Dry run only logs.
+    storage_retention_interval_seconds: float = Field(
+        default=0.0, alias="FORGESYTE_STORAGE_RETENTION_INTERVAL_SECONDS"
+    )
+    storage_retention_ttls: str = Field(
+        default="", alias="FORGESYTE_STORAGE_RETENTION_TTLS"
+    )
+    storage_retention_orphan_grace_hours: float = Field(
+        default=24.0, alias="FORGESYTE_STORAGE_RETENTION_ORPHAN_GRACE_HOURS"
+    )
+    storage_retention_max_mb: int = Field(
+        default=0, alias="FORGESYTE_STORAGE_RETENTION_MAX_MB"
+    )
+    storage_retention_dry_run: bool = Field(
+        default=False, alias="FORGESYTE_STORAGE_RETENTION_DRY_RUN"
+    )
+
+    # Job worker concurrency (v0.16.0)
+    # FORGESYTE_WORKER_SLOT_QUOTAS caps concurrent jobs per job_type,
+    # e.g. "video=1,video_multi=1" keeps slots free for image jobs
+    worker_slots: int = Field(default=1, alias="FORGESYTE_WORKER_SLOTS")
+    worker_slot_quotas: str = Field(default="", alias="FORGESYTE_WORKER_SLOT_QUOTAS")
+
+    # Fair-share scheduler weights per job_type, e.g. "image=4,video=1"
+    # (merged over app.workers.fair_share.DEFAULT_JOB_TYPE_WEIGHTS)
+    scheduler_weights: str = Field(default="", alias="FORGESYTE_SCHEDULER_WEIGHTS")
+
+    # Job dispatch queue (v0.16.0): "sqlite" dispatches from a durable lease
+    # queue at queue_path (relative to the server directory), "database"
+    # scans the jobs table
+    queue_backend: str = Field(default="sqlite", alias="FORGESYTE_QUEUE_BACKEND")
+    queue_path: str = Field(default="data/queue.sqlite3", alias="FORGESYTE_QUEUE_PATH")
+    queue_visibility_timeout_seconds: float = Field(
+        default=30.0, alias="FORGESYTE_QUEUE_VISIBILITY_TIMEOUT_SECONDS"
+    )
+    queue_max_deliveries: int = Field(default=5, alias="FORGESYTE_QUEUE_MAX_DELIVERIES")
+
+    # Running-job leases (v0.16.0): workers renew the lease of each running
+    # job; jobs whose lease expires are requeued until max_attempts claims
+    job_lease_seconds: float = Field(default=60.0, alias="FORGESYTE_JOB_LEASE_SECONDS")
+    job_max_attempts: int = Field(default=3, alias="FORGESYTE_JOB_MAX_ATTEMPTS")
+
+    # Video job checkpoints (v0.16.0): frames per persisted result segment
+    # for resumable video tools; 0 disables checkpoints
+    video_checkpoint_frames: int = Field(
+        default=500, alias="FORGESYTE_VIDEO_CHECKPOINT_FRAMES"
+    )
+
+    # Ray batch dispatch (v0.16.0): concurrency follows the cluster's free
+    # resources; this optionally caps concurrent Ray jobs (0 = no cap).
+    # The FORGESYTE_RAY_* settings only apply to a JobWorker built with
+    # use_ray=True; the bundled worker entrypoints run without Ray.
+    ray_max_jobs: int = Field(default=0, alias="FORGESYTE_RAY_MAX_JOBS")
+
+    # Frame-range parallel Ray video jobs (v0.16.0): frames per range task
+    # (0 = one task per job) and warm-up frames before each range. Only
+    # jobs whose tools accept start_frame/end_frame are split.
+    ray_video_chunk_frames: int = Field(
+        default=3000, alias="FORGESYTE_RAY_VIDEO_CHUNK_FRAMES"
+    )
+    ray_video_chunk_overlap: int = Field(
+        default=30, alias="FORGESYTE_RAY_VIDEO_CHUNK_OVERLAP"
+    )
+
+    # Shared StreamingToolActor pool for /v1/stream (v0.16.0): total and
+    # per-tool replica limits, idle eviction, and "plugin:tool,..." entries
+    # that keep one pre-warmed replica
+    streaming_actor_pool_size: int = Field(
+        default=8, alias="FORGESYTE_STREAMING_ACTOR_POOL_SIZE"
+    )
+    streaming_actor_max_replicas: int = Field(
+        default=2, alias="FORGESYTE_STREAMING_ACTOR_MAX_REPLICAS"
+    )
+    streaming_actor_idle_seconds: float = Field(
+        default=300.0, alias="FORGESYTE_STREAMING_ACTOR_IDLE_SECONDS"
+    )
+    streaming_prewarm_tools: str = Field(
+        default="", alias="FORGESYTE_STREAMING_PREWARM"
+    )
+
+    # Cross-client micro-batching of streamed frames (v0.16.0): frames of
+    # one tool arriving within the window run as one batch (0 disables)
+    streaming_batch_window_ms: float = Field(
+        default=5.0, alias="FORGESYTE_STREAMING_BATCH_WINDOW_MS"
+    )
+    streaming_batch_max_size: int = Field(
+        default=8, alias="FORGESYTE_STREAMING_BATCH_MAX_SIZE"
+    )
+
+    # Warm plugin process pool (v0.16.0). 0 runs plugins in-process.
+    # Workers are recycled after max_calls or above max_rss_mb, and a call
+    # exceeding timeout_seconds kills its worker process.
+    plugin_process_workers: int = Field(
+        default=0, alias="FORGESYTE_PLUGIN_PROCESS_WORKERS"
+    )
+    plugin_process_max_calls: int = Field(
+        default=500, alias="FORGESYTE_PLUGIN_PROCESS_MAX_CALLS"
+    )
+    plugin_process_max_rss_mb: int = Field(
+        default=4096, alias="FORGESYTE_PLUGIN_PROCESS_MAX_RSS_MB"
+    )
+    plugin_process_timeout_seconds: float = Field(
+        default=3600.0, alias="FORGESYTE_PLUGIN_PROCESS_TIMEOUT_SECONDS"
+    )
+
     # CORS configuration - empty by default for security (Issue #253)
     # Set explicit origins via environment variable:
     # CORS_ORIGINS=["http://localhost:5173", "http://localhost:3000"]
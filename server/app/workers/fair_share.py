@@ -0,0 +1,159 @@
+"""Priority and weighted fair-share job selection.
+
+v0.16.0: Jobs are no longer dispatched strictly FIFO. Pending jobs are
+grouped into flows keyed by (plugin_id, job_type) and served with
+start-time fair queueing:
+
+- Higher Job.priority always wins over lower priority.
+- Within a priority level, the flow with the smallest virtual start tag
+  goes next. Each dispatched job advances its flow's tag by 1 / weight,
+  so a flow with weight 4 gets four jobs for every one of a weight-1 flow.
+- A flow that was idle restarts at the current virtual clock, so it can
+  not bank credit while idle and then monopolise the worker.
+
+A burst of video uploads therefore cannot starve interactive image jobs:
+an image job waits for at most one video dispatch per image weight.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Short image jobs get 4x the dispatch share of long video jobs by default
+DEFAULT_JOB_TYPE_WEIGHTS: Dict[str, float] = {
+    "image": 4.0,
+    "image_multi": 4.0,
+    "video": 1.0,
+    "video_multi": 1.0,
+}
+
+FlowKey = Tuple[str, str]
+
+
+def parse_job_type_weights(raw: str) -> Dict[str, float]:
+    """Parse a weight spec like "image=4,video=1" into a dict.
+
+    Args:
+        raw: Comma-separated job_type=weight pairs (empty string for none)
+
+    Returns:
+        Dict mapping job_type -> weight
+
+    Raises:
+        ValueError: If an entry is malformed or a weight is not positive
+    """
+    weights: Dict[str, float] = {}
+    for entry in raw.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        job_type, sep, value = entry.partition("=")
+        if not sep or not job_type.strip():
+            raise ValueError(f"Invalid scheduler weight entry: '{entry}'")
+        weight = float(value)
+        if weight <= 0:
+            raise ValueError(f"Scheduler weight for '{job_type}' must be > 0")
+        weights[job_type.strip()] = weight
+    return weights
+
+
+@dataclass
+class JobCandidate:
+    """Lightweight view of a pending job used for scheduling decisions."""
+
+    job_id: str
+    plugin_id: str
+    job_type: str
+    priority: int
+    created_at: datetime
+
+    @property
+    def flow(self) -> FlowKey:
+        """Fair-share flow this job belongs to."""
+        return (self.plugin_id, self.job_type)
+
+
+class FairShareScheduler:
+    """Start-time fair queueing across (plugin_id, job_type) flows.
+
+    Not thread-safe: owned by the single dispatcher thread of a JobWorker.
+    """
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None) -> None:
+        """Initialize scheduler.
+
+        Args:
+            weights: Per-job_type weights, merged over
+                     DEFAULT_JOB_TYPE_WEIGHTS. Unknown types weigh 1.0.
+        """
+        self.weights: Dict[str, float] = {**DEFAULT_JOB_TYPE_WEIGHTS, **(weights or {})}
+        self._clock = 0.0
+        self._finish: Dict[FlowKey, float] = {}
+
+    def _cost(self, job_type: str) -> float:
+        return 1.0 / self.weights.get(job_type, 1.0)
+
+    def select(
+        self,
+        candidates: Sequence[JobCandidate],
+        limit: int,
+        type_limits: Optional[Dict[str, int]] = None,
+    ) -> List[JobCandidate]:
+        """Pick up to `limit` jobs in dispatch order without changing state.
+
+        Args:
+            candidates: Pending jobs (any order)
+            limit: Maximum number of jobs to pick
+            type_limits: Optional max picks per job_type (0 excludes it)
+
+        Returns:
+            Chosen candidates in the order they should be dispatched
+        """
+        queues: Dict[FlowKey, List[JobCandidate]] = {}
+        for candidate in sorted(
+            candidates, key=lambda c: (-c.priority, c.created_at), reverse=True
+        ):
+            queues.setdefault(candidate.flow, []).append(candidate)
+
+        remaining = dict(type_limits or {})
+        clock = self._clock
+        finish = dict(self._finish)
+        chosen: List[JobCandidate] = []
+
+        while len(chosen) < limit:
+            best: Optional[Tuple[Tuple[int, float, datetime], FlowKey, float]] = None
+            for flow, queue in queues.items():
+                if not queue or remaining.get(flow[1], 1) <= 0:
+                    continue
+                head = queue[-1]
+                start = max(clock, finish.get(flow, 0.0))
+                rank = (-head.priority, start, head.created_at)
+                if best is None or rank < best[0]:
+                    best = (rank, flow, start)
+            if best is None:
+                break
+
+            _, flow, start = best
+            job = queues[flow].pop()
+            chosen.append(job)
+            clock = start
+            finish[flow] = start + self._cost(job.job_type)
+            if job.job_type in remaining:
+                remaining[job.job_type] -= 1
+
+        return chosen
+
+    def record_dispatch(self, jobs: Sequence[JobCandidate]) -> None:
+        """Charge flows for jobs that were actually claimed.
+
+        Args:
+            jobs: Claimed jobs in the order select() returned them
+        """
+        for job in jobs:
+            start = max(self._clock, self._finish.get(job.flow, 0.0))
+            self._clock = start
+            self._finish[job.flow] = start + self._cost(job.job_type)
+
+    def flow_tags(self) -> Dict[FlowKey, float]:
+        """Return a copy of each flow's virtual finish tag (for debugging)."""
+        return dict(self._finish)
@@ -0,0 +1,52 @@
+"""Cooperative cancellation of running jobs.
+
+v0.16.0: DELETE /v1/jobs/{job_id} marks a job CANCELLED in the database and,
+when the job is running, flags it here. The JobWorker checks the flag at
+every progress_callback frame checkpoint and raises JobCancelledError, which
+stops the plugin loop and frees the execution slot within one frame.
+
+The in-process flag covers the common deployment where the API and the
+worker thread share a process. A worker running in a separate process
+falls back to re-reading the job status from the database at most once
+per CANCEL_POLL_SECONDS.
+"""
+
+import threading
+from typing import Set
+
+# Minimum interval between database cancellation checks for one job
+CANCEL_POLL_SECONDS = 1.0
+
+
+class JobCancelledError(Exception):
+    """Raised at a progress checkpoint when the running job was cancelled."""
+
+    def __init__(self, job_id: str) -> None:
+        super().__init__(f"Job {job_id} was cancelled")
+        self.job_id = job_id
+
+
+class JobCancellations:
+    """Thread-safe set of running job IDs that have been cancelled."""
+
+    def __init__(self) -> None:
+        self._cancelled: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def cancel(self, job_id: str) -> None:
+        """Flag a running job for cancellation."""
+        with self._lock:
+            self._cancelled.add(str(job_id))
+
+    def is_cancelled(self, job_id: str) -> bool:
+        """Return True if the job has been flagged."""
+        with self._lock:
+            return str(job_id) in self._cancelled
+
+    def discard(self, job_id: str) -> None:
+        """Forget a job once the worker has stopped running it."""
+        with self._lock:
+            self._cancelled.discard(str(job_id))
+
+
+job_cancellations = JobCancellations()
@@ -0,0 +1,166 @@
+"""Background renewal and reaping of running-job leases.
+
+v0.16.0: The JobWorker runs jobs inline or on slot threads, so its main
+loop can be busy for the whole duration of a video job. JobLeaseKeeper
+renews the leases of the worker's running jobs from a daemon thread every
+third of the lease duration, and reaps expired leases of other (crashed)
+workers on the same schedule.
+
+A job whose renewal fails no longer belongs to this worker (it was reaped
+after a stall, or cancelled). The keeper flags it in job_cancellations so
+the running plugin loop stops at its next progress checkpoint instead of
+overwriting the new owner's result, and reports it via pop_lost().
+"""
+
+import logging
+import threading
+from typing import Callable, List, Optional, Set
+
+from ..services.job_lease_service import JobLease, JobLeaseService, ReapedJobs
+from .job_cancellation import job_cancellations
+
+logger = logging.getLogger(__name__)
+
+
+class JobLeaseKeeper:
+    """Renews this worker's job leases and requeues expired ones."""
+
+    def __init__(
+        self,
+        session_factory,
+        lease: JobLease,
+        max_attempts: int,
+        on_requeued: Optional[Callable[[List[str]], None]] = None,
+        on_failed: Optional[Callable[[List[str]], None]] = None,
+        before_reap: Optional[Callable[[bool], None]] = None,
+    ) -> None:
+        """Initialize the keeper (the thread starts with start()).
+
+        Args:
+            session_factory: Factory returning database sessions
+            lease: Lease the worker takes on the jobs it claims
+            max_attempts: Claims after which an expired job is failed
+            on_requeued: Optional callback receiving requeued job IDs
+                         (e.g. to re-enqueue them in a dispatch queue)
+            on_failed: v0.16.0: Optional callback receiving job IDs failed
+                       after exhausting their attempts (e.g. to delete
+                       their checkpoints)
+            before_reap: v0.16.0: Optional callback run before each reap
+                         with include_unleased, which may adopt expired
+                         jobs that are still running (e.g. detached Ray
+                         executions) so they are not requeued
+        """
+        self.lease = lease
+        self.max_attempts = max_attempts
+        self._session_factory = session_factory
+        self._on_requeued = on_requeued
+        self._on_failed = on_failed
+        self._before_reap = before_reap
+        self._held: Set[str] = set()
+        self._lost: Set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def interval(self) -> float:
+        """Seconds between renewals (a third of the lease)."""
+        return max(self.lease.seconds / 3.0, 0.01)
+
+    def track(self, job_id: str) -> None:
+        """Start renewing the lease of a claimed job."""
+        with self._lock:
+            self._held.add(str(job_id))
+
+    def untrack(self, job_id: str) -> None:
+        """Stop renewing the lease of a finished job."""
+        with self._lock:
+            self._held.discard(str(job_id))
+            self._lost.discard(str(job_id))
+
+    def pop_lost(self) -> List[str]:
+        """Return and forget jobs whose lease was lost since the last call."""
+        with self._lock:
+            lost = list(self._lost)
+            self._lost.clear()
+        return lost
+
+    def renew_once(self) -> List[str]:
+        """Renew all tracked leases once.
+
+        Returns:
+            Job IDs whose lease was lost
+        """
+        with self._lock:
+            held = list(self._held)
+        if not held:
+            return []
+
+        db = self._session_factory()
+        try:
+            renewed = set(JobLeaseService.renew(db, held, self.lease))
+        finally:
+            db.close()
+
+        with self._lock:
+            # Jobs untracked while renewing finished normally
+            lost = [job_id for job_id in held if job_id not in renewed]
+            lost = [job_id for job_id in lost if job_id in self._held]
+            self._held.difference_update(lost)
+            self._lost.update(lost)
+        for job_id in lost:
+            logger.warning(f"Lost lease on job {job_id}, stopping it")
+            job_cancellations.cancel(job_id)
+        return lost
+
+    def reap_once(self, include_unleased: bool = False) -> ReapedJobs:
+        """Requeue or fail RUNNING jobs whose lease expired.
+
+        Args:
+            include_unleased: Also reap RUNNING jobs without a lease
+
+        Returns:
+            ReapedJobs with requeued and failed job IDs
+        """
+        if self._before_reap is not None:
+            try:
+                self._before_reap(include_unleased)
+            except Exception as e:
+                logger.error(f"Error adopting expired jobs: {e}")
+        db = self._session_factory()
+        try:
+            reaped = JobLeaseService.reap_expired(
+                db, self.max_attempts, include_unleased=include_unleased
+            )
+        finally:
+            db.close()
+        if reaped.requeued and self._on_requeued is not None:
+            self._on_requeued(reaped.requeued)
+        if reaped.failed and self._on_failed is not None:
+            self._on_failed(reaped.failed)
+        return reaped
+
+    def start(self) -> None:
+        """Start the renewal thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="job-lease-keeper", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the renewal thread and wait for it to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 5.0)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.renew_once()
+                self.reap_once()
+            except Exception as e:
+                logger.error(f"Job lease keeper error: {e}")
@@ -0,0 +1,39 @@
+"""In-process wake-up channel between submit routes and the JobWorker.
+
+v0.16.0: Submit routes call job_notifier.notify() after committing a new
+job, so the worker thread starts dispatching immediately instead of waiting
+out its idle poll interval. Polling remains as a fallback (e.g. for jobs
+created by another process) and backs off while the system is idle.
+"""
+
+import threading
+
+
+class JobNotifier:
+    """Edge-triggered signal that new work may be available."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def notify(self) -> None:
+        """Signal that a job was submitted or a slot was freed."""
+        self._event.set()
+
+    def wait(self, timeout: float) -> bool:
+        """Block until notified or until timeout elapses.
+
+        Notifications sent while nobody is waiting are not lost: the next
+        wait() returns immediately.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if woken by notify(), False on timeout
+        """
+        notified = self._event.wait(timeout)
+        self._event.clear()
+        return notified
+
+
+job_notifier = JobNotifier()
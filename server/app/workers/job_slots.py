@@ -0,0 +1,119 @@
+"""Execution slot accounting for concurrent job processing.
+
+v0.16.0: JobWorker can run several jobs at once. Each running job holds one
+slot; optional per-job_type quotas stop long video jobs from taking every
+slot so image jobs keep moving while videos are processed.
+
+Slots are thread-backed: the worker runs each claimed job on a thread from
+a ThreadPoolExecutor. Threads (not processes) are used because DuckDB
+requires all connections to live in the same process.
+"""
+
+import threading
+from typing import Dict, Optional
+
+
+def parse_slot_quotas(raw: str) -> Dict[str, int]:
+    """Parse a quota spec like "video=1,video_multi=1" into a dict.
+
+    Args:
+        raw: Comma-separated job_type=count pairs (empty string for none)
+
+    Returns:
+        Dict mapping job_type -> max concurrent jobs of that type
+
+    Raises:
+        ValueError: If an entry is malformed or a count is negative
+    """
+    quotas: Dict[str, int] = {}
+    for entry in raw.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        job_type, sep, count = entry.partition("=")
+        if not sep or not job_type.strip():
+            raise ValueError(f"Invalid slot quota entry: '{entry}'")
+        value = int(count)
+        if value < 0:
+            raise ValueError(f"Slot quota for '{job_type}' must be >= 0")
+        quotas[job_type.strip()] = value
+    return quotas
+
+
+class JobSlots:
+    """Thread-safe counter of busy execution slots, with per-job_type quotas.
+
+    Job types without a quota are bounded only by max_slots.
+    """
+
+    def __init__(self, max_slots: int = 1, quotas: Optional[Dict[str, int]] = None):
+        """Initialize slot accounting.
+
+        Args:
+            max_slots: Total number of jobs that may run at once
+            quotas: Optional max concurrent jobs per job_type
+
+        Raises:
+            ValueError: If max_slots < 1
+        """
+        if max_slots < 1:
+            raise ValueError("max_slots must be >= 1")
+        self.max_slots = max_slots
+        self.quotas: Dict[str, int] = dict(quotas or {})
+        self._in_use: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def busy(self) -> int:
+        """Number of slots currently held."""
+        with self._lock:
+            return sum(self._in_use.values())
+
+    @property
+    def free(self) -> int:
+        """Number of slots currently available."""
+        return self.max_slots - self.busy
+
+    def remaining_quotas(self) -> Dict[str, int]:
+        """Return how many more jobs each quota-limited job type may start."""
+        with self._lock:
+            return {
+                job_type: max(0, limit - self._in_use.get(job_type, 0))
+                for job_type, limit in self.quotas.items()
+            }
+
+    def try_acquire(self, job_type: str) -> bool:
+        """Take a slot for a job of the given type.
+
+        Args:
+            job_type: Job type of the job about to run
+
+        Returns:
+            True if a slot was taken, False if total or quota is exhausted
+        """
+        with self._lock:
+            if sum(self._in_use.values()) >= self.max_slots:
+                return False
+            limit = self.quotas.get(job_type)
+            if limit is not None and self._in_use.get(job_type, 0) >= limit:
+                return False
+            self._in_use[job_type] = self._in_use.get(job_type, 0) + 1
+            return True
+
+    def release(self, job_type: str) -> None:
+        """Return a slot previously taken with try_acquire().
+
+        Args:
+            job_type: Job type passed to try_acquire()
+        """
+        with self._lock:
+            count = self._in_use.get(job_type, 0)
+            if count <= 1:
+                self._in_use.pop(job_type, None)
+            else:
+                self._in_use[job_type] = count - 1
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return a copy of busy slot counts per job_type."""
+        with self._lock:
+            return dict(self._in_use)
@@ -0,0 +1,63 @@
+"""Time-based coalescing of job progress updates.
+
+v0.16.0: Video tools report progress on every frame. Writing whenever the
+percentage was a multiple of 5 still meant one ORM load and commit per
+frame inside that bucket (hundreds per bucket on a 30k-frame video), and
+every frame was broadcast over WebSocket. ProgressThrottle keeps the last
+emitted value per job and lets a new one through only when it changed and
+at least `interval_seconds` passed, so a job produces at most a couple of
+writes and broadcasts per second however fast its frames are. The first
+and final updates of a job always go through.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Tuple
+
+# Minimum interval between two progress writes (or broadcasts) of a job
+PROGRESS_FLUSH_SECONDS = 0.5
+
+
+class ProgressThrottle:
+    """Decides which progress updates of each job are emitted."""
+
+    def __init__(
+        self,
+        interval_seconds: float = PROGRESS_FLUSH_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the throttle.
+
+        Args:
+            interval_seconds: Minimum seconds between emits of one job
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.interval_seconds = interval_seconds
+        self._clock = clock
+        self._last: Dict[str, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def should_emit(self, job_id: str, value: int, final: bool = False) -> bool:
+        """Return True if this update should be written or broadcast.
+
+        Records the value as emitted when returning True.
+
+        Args:
+            job_id: Job UUID string
+            value: Progress value (percent or frame)
+            final: Last update of the job (always emitted)
+        """
+        now = self._clock()
+        with self._lock:
+            last = self._last.get(job_id)
+            if last is not None and not final:
+                last_value, last_time = last
+                if value == last_value or now - last_time < self.interval_seconds:
+                    return False
+            self._last[job_id] = (value, now)
+            return True
+
+    def forget(self, job_id: str) -> None:
+        """Drop a finished job's state."""
+        with self._lock:
+            self._last.pop(job_id, None)
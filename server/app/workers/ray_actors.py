@@ -11,14 +11,14 @@ Architecture:
                                               Plugin executed with
                                               cached model (GPU VRAM or CPU RAM)
 
-The Actor lifecycle is managed by VisionAnalysisService:
-    - Created on first frame (lazy initialization)
-    - Reused for subsequent frames (caching)
-    - Killed on WebSocket disconnect (cleanup)
+The Actor lifecycle is managed by StreamingActorPool (v0.16.0):
+    - Created on first frame of a (plugin, tool), or pre-warmed
+    - Shared by all clients streaming that tool (least-loaded routing)
+    - Killed after an idle timeout or to make room for another tool
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import ray
 
@@ -34,16 +34,16 @@ logger = logging.getLogger(__name__)
 class StreamingToolActor:
     """Ray Actor for holding plugin state in memory across frames.
 
-    This actor is created when a WebSocket client connects and requests
-    a specific tool. The actor loads the plugin once and holds the model
+    This actor is created when a WebSocket client first requests a
+    specific tool and is shared with later clients. The actor loads the plugin once and holds the model
     in memory (GPU VRAM if available, otherwise CPU RAM), enabling
     low-latency processing for subsequent frames.
 
     Lifecycle:
-        1. Created by VisionAnalysisService._get_or_create_actor()
+        1. Created by StreamingActorPool.acquire() or ensure_prewarmed()
         2. Calls plugin.validate() to preload models into memory
-        3. Processes frames via process_frame()
-        4. Killed by VisionAnalysisService.cleanup_client()
+        3. Processes frames via process_frame() for any client
+        4. Killed by StreamingActorPool idle/LRU eviction or shutdown()
 
     Attributes:
         plugin_id: The plugin identifier (e.g., "object-tracker")
@@ -95,6 +95,9 @@ class StreamingToolActor:
                     f"Available: {available}"
                 )
 
+            # v0.16.0: Kept for batched frames (process_frames)
+            self.plugin = plugin
+
             # Run validation to preload models into memory
             if hasattr(plugin, "validate"):
                 plugin.validate()
@@ -135,3 +138,44 @@ class StreamingToolActor:
                 f"{self.plugin_id}.{self.tool_name}: {e}"
             )
             raise RuntimeError(f"Frame processing failed: {e}") from e
+
+    def process_frames(self, args_list: List[Dict[str, Any]]) -> List[Any]:
+        """Process a micro-batch of frames collected across clients.
+
+        v0.16.0: Plugins that override BasePlugin.run_tool_batch() get the
+        whole batch in one call (one batched inference). Otherwise, or if
+        the batch call fails, each frame runs through process_frame() so
+        one bad frame only fails itself.
+
+        Args:
+            args_list: Arguments dicts, one per frame
+
+        Returns:
+            One entry per frame, in order: the tool result, or the
+            RuntimeError raised for that frame
+        """
+        from app.plugins.base import BasePlugin
+
+        batch_fn = getattr(type(self.plugin), "run_tool_batch", None)
+        if batch_fn is not None and batch_fn is not BasePlugin.run_tool_batch:
+            try:
+                batched = self.plugin.run_tool_batch(self.tool_name, args_list)
+                if isinstance(batched, list) and len(batched) == len(args_list):
+                    return batched
+                logger.warning(
+                    f"{self.plugin_id}.{self.tool_name} run_tool_batch returned "
+                    f"a mismatched result; processing frames one by one"
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Batch failed for {self.plugin_id}.{self.tool_name}: {e}; "
+                    f"processing frames one by one"
+                )
+
+        results: List[Any] = []
+        for args in args_list:
+            try:
+                results.append(self.process_frame(args))
+            except RuntimeError as e:
+                results.append(e)
+        return results
@@ -0,0 +1,152 @@
+"""Resource-aware dispatch of batch jobs to the Ray cluster.
+
+v0.16.0: JobWorker used to keep at most two Ray tasks in flight, all with
+the decorator's defaults (1 CPU, no GPU), however large the cluster was.
+Plugins now declare what one task needs in their manifest:
+
+    "resources": {"num_cpus": 2, "num_gpus": 0.5, "memory_mb": 4096}
+
+and the worker sizes each dispatch pass from the cluster's live resources.
+RayCapacity takes the smaller of what Ray reports as available and the
+cluster total minus what this worker's in-flight tasks reserved (tasks
+still queued in Ray do not show up in available_resources() yet), so the
+worker neither over-dispatches on a fresh pass nor ignores other tenants.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Concurrent Ray jobs when cluster resources cannot be read
+RAY_FALLBACK_JOBS = 2
+
+_MB = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class TaskResources:
+    """Resources one execute_pipeline_remote task requests from Ray.
+
+    Attributes:
+        num_cpus: Logical CPUs
+        num_gpus: GPUs (fractions share a GPU between tasks)
+        memory: Heap memory in bytes (0 = not reserved)
+    """
+
+    num_cpus: float = 1.0
+    num_gpus: float = 0.0
+    memory: float = 0.0
+
+    @classmethod
+    def from_manifest(cls, manifest: Any) -> "TaskResources":
+        """Read a plugin manifest's "resources" block.
+
+        Missing or invalid blocks yield the defaults.
+
+        Args:
+            manifest: Plugin manifest dict
+
+        Returns:
+            TaskResources for one task of the plugin
+        """
+        if not isinstance(manifest, dict):
+            return DEFAULT_TASK_RESOURCES
+        declared = manifest.get("resources")
+        if not isinstance(declared, dict):
+            return DEFAULT_TASK_RESOURCES
+        try:
+            resources = cls(
+                num_cpus=float(declared.get("num_cpus", 1.0)),
+                num_gpus=float(declared.get("num_gpus", 0.0)),
+                memory=float(declared.get("memory_mb", 0.0)) * _MB,
+            )
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Ignoring invalid plugin resources {declared}: {e}")
+            return DEFAULT_TASK_RESOURCES
+        if min(resources.num_cpus, resources.num_gpus, resources.memory) < 0:
+            logger.warning(f"Ignoring negative plugin resources {declared}")
+            return DEFAULT_TASK_RESOURCES
+        return resources
+
+    def task_options(self) -> Dict[str, float]:
+        """Return keyword arguments for RemoteFunction.options()."""
+        options = {"num_cpus": self.num_cpus, "num_gpus": self.num_gpus}
+        if self.memory:
+            options["memory"] = self.memory
+        return options
+
+    def as_ray_resources(self) -> Dict[str, float]:
+        """Return the demand keyed like ray.available_resources()."""
+        return {"CPU": self.num_cpus, "GPU": self.num_gpus, "memory": self.memory}
+
+
+DEFAULT_TASK_RESOURCES = TaskResources()
+
+
+class RayCapacity:
+    """Free cluster capacity for one dispatch pass."""
+
+    def __init__(
+        self,
+        available: Dict[str, float],
+        total: Dict[str, float],
+        reserved: Iterable[TaskResources] = (),
+    ) -> None:
+        """Compute free capacity.
+
+        Args:
+            available: ray.available_resources()
+            total: ray.cluster_resources()
+            reserved: Resources of this worker's in-flight tasks
+        """
+        in_flight = {"CPU": 0.0, "GPU": 0.0, "memory": 0.0}
+        for resources in reserved:
+            for key, amount in resources.as_ray_resources().items():
+                in_flight[key] += amount
+        self.free = {
+            key: min(
+                float(available.get(key, 0.0)),
+                float(total.get(key, 0.0)) - in_flight[key],
+            )
+            for key in in_flight
+        }
+
+    @classmethod
+    def from_cluster(
+        cls, ray, reserved: Iterable[TaskResources] = ()
+    ) -> Optional["RayCapacity"]:
+        """Read live capacity from Ray.
+
+        Args:
+            ray: Imported ray module
+            reserved: Resources of this worker's in-flight tasks
+
+        Returns:
+            RayCapacity, or None if the cluster resources cannot be read
+        """
+        try:
+            available = ray.available_resources()
+            total = ray.cluster_resources()
+        except Exception as e:
+            logger.debug(f"Ray resources unavailable: {e}")
+            return None
+        if not isinstance(available, dict) or not isinstance(total, dict):
+            return None
+        return cls(available, total, reserved)
+
+    def max_jobs(self, resources: TaskResources = DEFAULT_TASK_RESOURCES) -> int:
+        """Return how many more tasks of this size fit."""
+        counts = []
+        for key, amount in resources.as_ray_resources().items():
+            if amount <= 0:
+                continue
+            counts.append(int(max(self.free[key], 0.0) // amount))
+        # A task requesting nothing is bounded by CPUs like a default one
+        return min(counts) if counts else self.max_jobs()
+
+    def reserve(self, resources: TaskResources) -> None:
+        """Deduct a dispatched task from the free capacity."""
+        for key, amount in resources.as_ray_resources().items():
+            self.free[key] -= amount
@@ -0,0 +1,159 @@
+"""Detached Ray executions that survive JobWorker restarts.
+
+v0.16.0: Ray tasks are owned by the process that submitted them, so when a
+JobWorker died its tasks and their results died with it, and the string
+persisted in jobs.ray_future_id could not be turned back into a handle.
+Every Ray job is now launched through an ExecutionActor: a detached actor
+named after the job (forgesyte-exec-<job_id>) that submits the task itself
+and holds its result. The name is stored in ray_future_id, so a restarted
+(or another) worker looks the actor up with ray.get_actor() and awaits the
+running or finished task instead of executing the job again.
+
+Lifecycle:
+    worker --launch_execution()--> ExecutionActor --.remote()--> Ray task
+    worker <--actor.result.remote()-- (any worker, after a restart too)
+    worker --kill_execution()--> actor gone once the job is finalized
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+import ray
+
+logger = logging.getLogger(__name__)
+
+# Actor name prefix; the job ID is appended
+EXECUTION_ACTOR_PREFIX = "forgesyte-exec-"
+
+# Detached actors are only found again from the same namespace
+RAY_NAMESPACE = "forgesyte"
+
+# Remote functions an ExecutionActor can run, by kind
+PIPELINE = "pipeline"
+VIDEO_CHUNKED = "video_chunked"
+
+
+def execution_actor_name(job_id: str) -> str:
+    """Return the ExecutionActor name of a job."""
+    return f"{EXECUTION_ACTOR_PREFIX}{job_id}"
+
+
+def is_execution_actor_name(value: Optional[str]) -> bool:
+    """Return True if a ray_future_id names an ExecutionActor."""
+    return bool(value) and str(value).startswith(EXECUTION_ACTOR_PREFIX)
+
+
+@ray.remote(num_cpus=0)
+class ExecutionActor:
+    """Detached owner of one job's Ray task and its result."""
+
+    def __init__(
+        self,
+        job_id: str,
+        kind: str,
+        kwargs: Dict[str, Any],
+        task_options: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """Submit the job's task.
+
+        Args:
+            job_id: Job UUID string
+            kind: PIPELINE or VIDEO_CHUNKED
+            kwargs: Keyword arguments of the remote function
+            task_options: Plugin task resources (RemoteFunction.options())
+        """
+        from ..ray_tasks import (
+            execute_pipeline_remote,
+            execute_video_chunked_remote,
+            input_node_strategy,
+        )
+
+        self.job_id = job_id
+        # v0.16.0: Prefer the node whose storage cache holds the input
+        strategy = input_node_strategy(kwargs["input_path"])
+        if kind == VIDEO_CHUNKED:
+            # The coordinator applies the resources to its range tasks
+            coordinator = execute_video_chunked_remote
+            if strategy is not None:
+                coordinator = coordinator.options(scheduling_strategy=strategy)
+            self._ref = coordinator.remote(**kwargs, task_options=task_options)
+        elif kind == PIPELINE:
+            options: Dict[str, Any] = dict(task_options or {})
+            if strategy is not None:
+                options["scheduling_strategy"] = strategy
+            remote_fn = execute_pipeline_remote
+            if options:
+                remote_fn = remote_fn.options(**options)
+            self._ref = remote_fn.remote(**kwargs)
+        else:
+            raise ValueError(f"Unknown execution kind: {kind}")
+
+    async def result(self) -> Any:
+        """Wait for the task and return its result (or raise its error)."""
+        return await self._ref
+
+    def cancel(self) -> None:
+        """Stop the task."""
+        ray.cancel(self._ref, force=True)
+
+
+def launch_execution(
+    job_id: str,
+    kind: str,
+    kwargs: Dict[str, Any],
+    task_options: Optional[Dict[str, float]] = None,
+) -> Any:
+    """Start a job's task in a detached, named ExecutionActor.
+
+    An actor already running for the job (e.g. the job was requeued while
+    its execution was still alive) is reused.
+
+    Args:
+        job_id: Job UUID string
+        kind: PIPELINE or VIDEO_CHUNKED
+        kwargs: Keyword arguments of the remote function
+        task_options: Plugin task resources (RemoteFunction.options())
+
+    Returns:
+        ExecutionActor handle
+    """
+    return ExecutionActor.options(  # type: ignore[attr-defined]
+        name=execution_actor_name(job_id),
+        namespace=RAY_NAMESPACE,
+        lifetime="detached",
+        get_if_exists=True,
+    ).remote(job_id, kind, kwargs, task_options)
+
+
+def find_execution(ray_module, name: str) -> Any:
+    """Look up a running ExecutionActor by name.
+
+    Args:
+        ray_module: Imported ray module
+        name: Actor name stored in jobs.ray_future_id
+
+    Returns:
+        ExecutionActor handle, or None if the actor no longer exists
+    """
+    try:
+        return ray_module.get_actor(name, namespace=RAY_NAMESPACE)
+    except ValueError:
+        return None
+    except Exception as e:
+        logger.warning(f"Could not look up Ray execution {name}: {e}")
+        return None
+
+
+def kill_execution(ray_module, actor: Any) -> None:
+    """Kill a finished or cancelled ExecutionActor (and its task).
+
+    Args:
+        ray_module: Imported ray module
+        actor: ExecutionActor handle (None is ignored)
+    """
+    if actor is None:
+        return
+    try:
+        ray_module.kill(actor, no_restart=True)
+    except Exception as e:
+        logger.warning(f"Failed to kill Ray execution actor: {e}")
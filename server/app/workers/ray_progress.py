@@ -0,0 +1,149 @@
+"""Progress channel from Ray batch tasks back to the JobWorker.
+
+v0.16.0: Ray-executed video jobs used to run with progress_callback=None,
+so their progress stayed at 0 until the task finished. Each JobWorker now
+owns a named ProgressActor (no CPU reservation). Tasks report through a
+RayProgressReporter, which throttles per-frame callbacks to one
+fire-and-forget actor call per PROGRESS_FLUSH_SECONDS. The actor keeps
+only the latest value per job, and the worker drains it once per loop
+iteration, feeding the same _update_job_progress() path (database write and
+WebSocket broadcast) as synchronous jobs.
+
+Architecture:
+    Ray task --report.remote()--> ProgressActor <--drain.remote()-- JobWorker
+"""
+
+import logging
+import time
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+import ray
+
+from .progress_throttle import PROGRESS_FLUSH_SECONDS, ProgressThrottle
+
+logger = logging.getLogger(__name__)
+
+# Actor name prefix; the worker appends its worker ID
+PROGRESS_ACTOR_PREFIX = "forgesyte-progress-"
+
+
+class ProgressBuffer:
+    """Latest (current, total) progress per job, replaced on each report.
+
+    v0.16.0: A chunked video job reports one value per frame-range task
+    (part); drain() returns the sum over the job's parts.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer."""
+        self._parts: Dict[str, Dict[int, Tuple[int, int]]] = {}
+        self._dirty: Set[str] = set()
+
+    def report(self, job_id: str, current: int, total: int, part: int = 0) -> None:
+        """Record a job's progress, replacing any undrained value.
+
+        Args:
+            job_id: Job UUID string
+            current: Frames processed across all tools
+            total: Frames to process across all tools
+            part: Frame-range task reporting (0 for unchunked jobs)
+        """
+        self._parts.setdefault(job_id, {})[part] = (int(current), int(total))
+        self._dirty.add(job_id)
+
+    def drain(self) -> Dict[str, Tuple[int, int]]:
+        """Return the progress of jobs reported since the last drain."""
+        latest = {}
+        for job_id in self._dirty:
+            parts = self._parts.get(job_id, {}).values()
+            latest[job_id] = (sum(p[0] for p in parts), sum(p[1] for p in parts))
+        self._dirty.clear()
+        return latest
+
+    def forget(self, job_id: str) -> None:
+        """Drop the state of a finished job."""
+        self._parts.pop(job_id, None)
+        self._dirty.discard(job_id)
+
+
+class ProgressActor(ProgressBuffer):
+    """Ray actor holding progress reported by a worker's Ray tasks."""
+
+
+# Remote handle of ProgressActor. ray.remote() returns an ActorClass whose
+# options()/remote() mypy cannot see on the decorated class itself.
+ProgressActorRemote: Any = ray.remote(num_cpus=0)(ProgressActor)
+
+
+class RayProgressReporter:
+    """Task-side progress callbacks that report to a ProgressActor."""
+
+    def __init__(
+        self,
+        actor: Any,
+        job_id: str,
+        interval_seconds: float = PROGRESS_FLUSH_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        part: int = 0,
+    ) -> None:
+        """Initialize the reporter.
+
+        Args:
+            actor: ProgressActor handle
+            job_id: Job UUID string
+            interval_seconds: Minimum seconds between two reports
+            clock: Monotonic time source (injectable for tests)
+            part: v0.16.0: Frame-range task index of a chunked job
+        """
+        self._actor = actor
+        self.job_id = str(job_id)
+        self.part = part
+        self._throttle = ProgressThrottle(interval_seconds, clock)
+
+    def callback(
+        self,
+        tool_index: int,
+        num_tools: int,
+        default_total: int,
+        frame_offset: Optional[int] = None,
+    ) -> Callable[..., None]:
+        """Return a plugin progress_callback for one tool of the job.
+
+        Progress is reported across all tools, like the synchronous worker:
+        tool i of n covers frames [i * total, (i + 1) * total).
+
+        Args:
+            tool_index: Index of the tool in the job (0-based)
+            num_tools: Number of tools in the job
+            default_total: Frame count used when the plugin passes none
+            frame_offset: v0.16.0: First frame of a frame-range task. The
+                          plugin reports absolute frames, so progress is
+                          counted from here against default_total.
+        """
+
+        def cb(current_frame: int, total: Optional[int] = None, **_: Any) -> None:
+            if frame_offset is not None:
+                per_total = default_total
+                done = min(max(current_frame - frame_offset, 0), per_total)
+            else:
+                per_total = total if total and total > 0 else default_total
+                done = current_frame
+            self.report(tool_index * per_total + done, per_total * num_tools)
+
+        return cb
+
+    def report(self, current: int, total: int) -> None:
+        """Send progress to the actor if the throttle allows it.
+
+        Args:
+            current: Frames processed across all tools
+            total: Frames to process across all tools
+        """
+        final = current >= total
+        if not self._throttle.should_emit(self.job_id, current, final):
+            return
+        try:
+            # Fire-and-forget: the task never waits on the actor
+            self._actor.report.remote(self.job_id, current, total, self.part)
+        except Exception as e:
+            logger.debug(f"Progress report failed for job {self.job_id}: {e}")
@@ -12,11 +12,17 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from app.core.database import init_db  # noqa: E402
+from app.core.database import SessionLocal, init_db  # noqa: E402
 from app.plugin_loader import PluginRegistry  # noqa: E402
 from app.services.plugin_management_service import PluginManagementService  # noqa: E402
-from app.services.storage.factory import get_storage_service  # noqa: E402
+from app.services.queue.factory import get_queue_service  # noqa: E402
+from app.services.storage.factory import (  # noqa: E402
+    get_shared_storage_service,
+)
 from app.settings import settings  # noqa: E402
+from app.workers.fair_share import parse_job_type_weights  # noqa: E402
+from app.workers.job_slots import parse_slot_quotas  # noqa: E402
+from app.workers.storage_retention import start_storage_retention  # noqa: E402
 from app.workers.worker import JobWorker  # noqa: E402
 
 logging.basicConfig(
@@ -35,16 +41,25 @@ def run_worker_forever(plugin_manager: PluginRegistry):
     """
     logger.info("Starting JobWorker thread...")
 
-    storage = get_storage_service(settings)
+    storage = get_shared_storage_service(settings)
     plugin_service = PluginManagementService(plugin_manager)
 
     # v0.14.0: Ray disabled - using synchronous execution (Issue #321)
     worker = JobWorker(
         storage=storage,
         plugin_service=plugin_service,
+        max_slots=settings.worker_slots,
+        slot_quotas=parse_slot_quotas(settings.worker_slot_quotas),
+        job_type_weights=parse_job_type_weights(settings.scheduler_weights),
+        queue=get_queue_service(settings),
+        lease_seconds=settings.job_lease_seconds,
+        max_attempts=settings.job_max_attempts,
+        checkpoint_frames=settings.video_checkpoint_frames,
     )
 
     logger.info("JobWorker thread initialized")
+    # v0.16.0: Optional background storage retention
+    start_storage_retention(storage, SessionLocal, settings)
     worker.run_forever()
 
 
@@ -58,16 +73,25 @@ def main():
         plugin_manager = PluginRegistry()
         plugin_manager.load_plugins()
 
-        storage = get_storage_service(settings)
+        storage = get_shared_storage_service(settings)
         plugin_service = PluginManagementService(plugin_manager)
 
         # v0.14.0: Ray disabled - using synchronous execution (Issue #321)
         worker = JobWorker(
             storage=storage,
             plugin_service=plugin_service,
+            max_slots=settings.worker_slots,
+            slot_quotas=parse_slot_quotas(settings.worker_slot_quotas),
+            job_type_weights=parse_job_type_weights(settings.scheduler_weights),
+            queue=get_queue_service(settings),
+            lease_seconds=settings.job_lease_seconds,
+            max_attempts=settings.job_max_attempts,
+            checkpoint_frames=settings.video_checkpoint_frames,
         )
 
         logger.info("JobWorker initialized")
+        # v0.16.0: Optional background storage retention
+        start_storage_retention(storage, SessionLocal, settings)
         worker.run_forever()
 
     except Exception as e:
@@ -0,0 +1,154 @@
+"""Background storage retention passes.
+
+v0.16.0: StorageRetentionKeeper runs StorageRetentionService.run_once()
+from a daemon thread of the JobWorker process every interval seconds.
+Run the module to print a one-off report instead:
+
+    python -m app.workers.storage_retention --dry-run
+"""
+
+import argparse
+import logging
+import threading
+from typing import Optional
+
+from ..services.storage.base import StorageService
+from ..services.storage_retention_service import (
+    RetentionPolicy,
+    RetentionReport,
+    StorageRetentionService,
+    parse_retention_ttls,
+)
+from ..settings import AppSettings
+
+logger = logging.getLogger(__name__)
+
+
+def build_retention_policy(settings: AppSettings) -> RetentionPolicy:
+    """Build the retention policy configured by FORGESYTE_STORAGE_RETENTION_*.
+
+    Args:
+        settings: AppSettings instance with retention configuration
+
+    Returns:
+        RetentionPolicy
+
+    Raises:
+        ValueError: If FORGESYTE_STORAGE_RETENTION_TTLS is malformed
+    """
+    return RetentionPolicy(
+        ttl_seconds=parse_retention_ttls(settings.storage_retention_ttls),
+        max_total_bytes=max(settings.storage_retention_max_mb, 0) * 1024 * 1024,
+        orphan_grace_seconds=settings.storage_retention_orphan_grace_hours * 3600.0,
+    )
+
+
+class StorageRetentionKeeper:
+    """Runs retention passes on a schedule."""
+
+    def __init__(
+        self,
+        service: StorageRetentionService,
+        interval: float,
+        dry_run: bool = False,
+    ) -> None:
+        """Initialize the keeper (the thread starts with start()).
+
+        Args:
+            service: Retention service to run
+            interval: Seconds between passes
+            dry_run: Only log what each pass would delete
+        """
+        self.service = service
+        self.interval = max(interval, 1.0)
+        self.dry_run = dry_run
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self) -> RetentionReport:
+        """Run one retention pass now."""
+        return self.service.run_once(dry_run=self.dry_run)
+
+    def start(self) -> None:
+        """Start the retention thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="storage-retention", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the retention thread and wait for it to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"Storage retention error: {e}")
+
+
+def start_storage_retention(
+    storage: StorageService, session_factory, settings: AppSettings
+) -> Optional[StorageRetentionKeeper]:
+    """Start background retention if FORGESYTE_STORAGE_RETENTION_INTERVAL_SECONDS > 0.
+
+    Args:
+        storage: Storage backend to clean up
+        session_factory: Factory returning database sessions
+        settings: AppSettings instance with retention configuration
+
+    Returns:
+        The running keeper, or None if retention is disabled
+    """
+    if settings.storage_retention_interval_seconds <= 0:
+        return None
+    keeper = StorageRetentionKeeper(
+        StorageRetentionService(
+            storage, session_factory, build_retention_policy(settings)
+        ),
+        interval=settings.storage_retention_interval_seconds,
+        dry_run=settings.storage_retention_dry_run,
+    )
+    keeper.start()
+    logger.info(
+        f"Storage retention every {keeper.interval:.0f}s"
+        f"{' (dry run)' if keeper.dry_run else ''}"
+    )
+    return keeper
+
+
+def main() -> None:
+    """CLI entrypoint: run one retention pass and print the report."""
+    from ..core.database import SessionLocal
+    from ..services.storage.factory import get_storage_service
+    from ..settings import settings
+
+    parser = argparse.ArgumentParser(description="Run one storage retention pass")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report without deleting anything"
+    )
+    args = parser.parse_args()
+
+    service = StorageRetentionService(
+        get_storage_service(settings), SessionLocal, build_retention_policy(settings)
+    )
+    report = service.run_once(dry_run=args.dry_run)
+    for label, paths in (
+        ("expired", report.expired),
+        ("orphaned", report.orphaned),
+        ("evicted", report.evicted),
+    ):
+        for path in paths:
+            print(f"{label}\t{path}")
+    print(report.summary())
+
+
+if __name__ == "__main__":
+    main()
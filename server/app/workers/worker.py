@@ -4,29 +4,71 @@ This worker:
 1. Dequeues job_ids from the queue
 2. Updates job status to RUNNING
 3. Executes pipeline on input file (Commit 6)
-4. Saves results to storage as JSON
+4. Saves results to storage as JSON (gzip-compressed since v0.16.0)
 5. Handles errors with graceful failure
 6. Handles signals (SIGINT/SIGTERM) for graceful shutdown
 """
 
+import contextlib
 import json
 import logging
+import os
 import signal
+import socket
 import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Dict, List, Optional, Protocol, Tuple
 
 from ..core.database import SessionLocal
 from ..models.job import Job, JobStatus
-from ..services.queue.memory_queue import InMemoryQueueService
+from ..services.job_claim_service import ClaimedJob, JobClaimService
+from ..services.job_lease_service import (
+    DEFAULT_LEASE_SECONDS,
+    DEFAULT_MAX_ATTEMPTS,
+    JobLease,
+    JobLeaseService,
+)
+from ..services.job_tools_service import JobToolsService
+from ..services.queue.base import LeaseQueueService, QueueService
+from ..services.storage.base import StorageService
+from ..services.storage.result_codec import encode_result, result_path
 from ..services.tool_router import iter_manifest_tools
+from ..services.video_checkpoint_service import (
+    DEFAULT_SEGMENT_FRAMES,
+    VideoCheckpoint,
+    clear_job_checkpoints,
+)
 from ..services.video_summary_service import derive_video_summary
+from .fair_share import FairShareScheduler
+from .job_cancellation import (
+    CANCEL_POLL_SECONDS,
+    JobCancelledError,
+    job_cancellations,
+)
+from .job_leases import JobLeaseKeeper
+from .job_notifier import job_notifier
+from .job_slots import JobSlots
 from .progress import send_job_completed
+from .progress_throttle import ProgressThrottle
+from .ray_capacity import (
+    DEFAULT_TASK_RESOURCES,
+    RAY_FALLBACK_JOBS,
+    RayCapacity,
+    TaskResources,
+)
 from .worker_state import worker_last_heartbeat
 
 logger = logging.getLogger(__name__)
 
+# v0.16.0: Fallback polling when idle. Submit routes wake the worker through
+# job_notifier, so these only bound latency for jobs created out-of-process.
+# The max stays below the 5s /v1/worker/health heartbeat threshold.
+IDLE_POLL_MIN_SECONDS = 0.5
+IDLE_POLL_MAX_SECONDS = 4.0
+
 
 def _merge_video_frames(
     results: Dict[str, Any], tools_to_run: List[str], job_id: str
@@ -179,18 +221,6 @@ def init_ray() -> bool:
         return False
 
 
-class StorageService(Protocol):
-    """Protocol for storage service (allows dependency injection)."""
-
-    def load_file(self, path: str):
-        """Load file from storage."""
-        ...
-
-    def save_file(self, src, dest_path: str) -> str:
-        """Save file to storage."""
-        ...
-
-
 class PipelineService(Protocol):
     """Protocol for pipeline service (allows dependency injection)."""
 
@@ -215,21 +245,50 @@ class JobWorker:
 
     def __init__(
         self,
-        queue: Optional[InMemoryQueueService] = None,
+        queue: Optional[QueueService] = None,
         session_factory=None,
         storage: Optional[StorageService] = None,
         plugin_service=None,
         use_ray: bool = False,
+        max_slots: int = 1,
+        slot_quotas: Optional[Dict[str, int]] = None,
+        job_type_weights: Optional[Dict[str, float]] = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        checkpoint_frames: int = DEFAULT_SEGMENT_FRAMES,
+        max_ray_jobs: int = 0,
+        video_chunk_frames: int = 0,
+        video_chunk_overlap: int = 0,
     ) -> None:
         """Initialize worker.
 
         Args:
-            queue: Ignored (kept for backward compatibility with tests)
+            queue: v0.16.0: LeaseQueueService to dispatch jobs from instead of
+                   scanning the jobs table. Other queue types are ignored
+                   (kept for backward compatibility with tests).
             session_factory: Session factory (defaults to SessionLocal from database.py)
             storage: StorageService instance for file I/O
             plugin_service: PluginManagementService instance for plugin execution
             use_ray: If True, use Ray for GPU-accelerated execution. If False (default),
                      use synchronous execution for backward compatibility.
+            max_slots: v0.16.0: Number of jobs executed concurrently in sync mode.
+                       1 (default) runs each job inline in run_once().
+            slot_quotas: v0.16.0: Optional max concurrent jobs per job_type,
+                         e.g. {"video": 1, "video_multi": 1}
+            job_type_weights: v0.16.0: Fair-share weights per job_type
+                              (defaults favour image over video jobs)
+            lease_seconds: v0.16.0: Lease held on running jobs; renewed every
+                           third of it while the worker runs
+            max_attempts: v0.16.0: Claims after which a job whose lease
+                          expired is failed instead of requeued
+            checkpoint_frames: v0.16.0: Frames per persisted video checkpoint
+                               segment (0 disables video checkpoints)
+            max_ray_jobs: v0.16.0: Cap on concurrent Ray jobs on top of the
+                          cluster's free resources (0 = no cap)
+            video_chunk_frames: v0.16.0: Frames per parallel Ray task of a
+                                video job whose tools accept frame ranges
+                                (0 = one task per job)
+            video_chunk_overlap: v0.16.0: Warm-up frames before each range
         """
         self._session_factory = session_factory or SessionLocal
         self._storage = storage
@@ -237,10 +296,64 @@ class JobWorker:
         self._running = True
         self._use_ray = use_ray
 
+        # v0.16.0: Execution slots for concurrent sync-mode jobs
+        self._slots = JobSlots(max_slots, slot_quotas)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # v0.16.0: Priority + weighted fair share across (plugin, job_type)
+        self._scheduler = FairShareScheduler(job_type_weights)
+
+        # v0.16.0: Last database cancellation check per running job_id
+        self._cancel_checked_at: Dict[str, float] = {}
+
+        # v0.16.0: Durable dispatch queue (None = scan the jobs table)
+        self._queue = queue if isinstance(queue, LeaseQueueService) else None
+        self._worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        # v0.16.0: Heartbeat leases on running jobs (renewed in run_forever)
+        self._lease = JobLease(owner=self._worker_id, seconds=lease_seconds)
+
+        # v0.16.0: Time of the last queue backfill (repeated every lease period)
+        self._backfilled_at = 0.0
+        if self._queue is not None:
+            self._backfill_queue()
+
+        # v0.16.0: Coalesce per-frame progress into timed writes/broadcasts
+        self._progress_writes = ProgressThrottle()
+        self._progress_broadcasts = ProgressThrottle()
+
+        # v0.16.0: Video checkpoint segment size (0 = no checkpoints)
+        self._checkpoint_frames = checkpoint_frames
+
+        self._lease_keeper = JobLeaseKeeper(
+            self._session_factory,
+            self._lease,
+            max_attempts,
+            on_requeued=self._enqueue_requeued,
+            on_failed=self._clear_checkpoints,
+            before_reap=self._adopt_ray_executions if use_ray else None,
+        )
+
         # v0.12.0: Ray state tracking for async job processing
         self.active_futures: Dict[Any, str] = {}  # { ray_ref: str(job_id) }
         self.job_metadata: Dict[str, Dict[str, Any]] = {}  # { str(job_id): dict }
 
+        # v0.16.0: Executions adopted by the lease keeper thread, handed to
+        # run_once() as (future, job_id, meta)
+        self._reattached: List[Tuple[Any, str, Dict[str, Any]]] = []
+        self._reattached_lock = threading.Lock()
+
+        # v0.16.0: Resource-aware Ray dispatch (per-plugin task resources)
+        self._max_ray_jobs = max_ray_jobs
+        self._task_resources: Dict[str, TaskResources] = {}
+
+        # v0.16.0: Frame-range parallel execution of Ray video jobs
+        self._video_chunk_frames = video_chunk_frames
+        self._video_chunk_overlap = video_chunk_overlap
+
+        # v0.16.0: ProgressActor receiving progress of Ray video jobs
+        self._progress_actor: Any = None
+
         # v0.12.0: Recover orphaned Ray jobs on startup (Issue #270)
         if use_ray:
             self._recover_ray_jobs()
@@ -250,68 +363,179 @@ class JobWorker:
             signal.signal(signal.SIGINT, self._handle_signal)
             signal.signal(signal.SIGTERM, self._handle_signal)
 
+    def _backfill_queue(self) -> None:
+        """Enqueue pending jobs missing from the dispatch queue.
+
+        v0.16.0: Jobs committed just before a crash, or before the queue
+        backend was enabled, would otherwise never be delivered.
+        """
+        if self._queue is None:
+            return
+        self._backfilled_at = time.monotonic()
+        db = self._session_factory()
+        try:
+            count = JobClaimService.enqueue_pending(db, self._queue)
+            if count:
+                logger.debug(f"Backfilled {count} pending job(s) into the queue")
+        except Exception as e:
+            logger.error(f"Queue backfill failed: {e}")
+        finally:
+            db.close()
+
+    def _maybe_backfill_queue(self) -> None:
+        """Backfill the queue again once per lease period.
+
+        v0.16.0: Submit routes only log a failed enqueue, so a pending job
+        missing from the queue is picked up here instead of waiting for the
+        next worker start.
+        """
+        if self._queue is None:
+            return
+        if time.monotonic() - self._backfilled_at >= self._lease.seconds:
+            self._backfill_queue()
+
+    def _enqueue_requeued(self, job_ids: List[str]) -> None:
+        """Put jobs requeued by the lease reaper back into the queue.
+
+        Args:
+            job_ids: Job IDs reset to PENDING
+        """
+        if self._queue is not None:
+            self._backfill_queue()
+
+    def _claim_jobs(self, db, limit: int, **kwargs) -> List[ClaimedJob]:
+        """Claim up to `limit` jobs from the queue or the jobs table.
+
+        v0.16.0: Claimed jobs are leased to this worker and tracked by the
+        lease keeper until they finish.
+
+        Args:
+            db: Database session
+            limit: Maximum number of jobs to claim
+            **kwargs: Extra claim options (e.g. type_limits)
+
+        Returns:
+            Claimed jobs in dispatch order
+        """
+        if self._queue is not None:
+            claimed = JobClaimService.claim_from_queue(
+                db,
+                self._queue,
+                limit=limit,
+                scheduler=self._scheduler,
+                owner=self._worker_id,
+                lease=self._lease,
+                **kwargs,
+            )
+        else:
+            claimed = JobClaimService.claim_pending_jobs(
+                db, limit=limit, scheduler=self._scheduler, lease=self._lease, **kwargs
+            )
+        for item in claimed:
+            self._lease_keeper.track(str(item.job.job_id))
+        return claimed
+
     def _recover_ray_jobs(self) -> None:
         """Recover orphaned Ray jobs on worker startup.
 
         v0.12.0: Called during __init__ when use_ray=True (Issue #270).
 
-        Finds all RUNNING jobs with ray_future_id and attempts to reattach
-        to their Ray futures. If Ray cluster is unavailable or futures are
-        gone, marks jobs as failed.
+        v0.16.0: Orphaned jobs are requeued instead of failed. RUNNING jobs
+        without a lease (claimed before leases existed) or whose lease
+        expired go back to PENDING; jobs out of attempts are failed. Jobs
+        still leased by a live worker are left alone.
+
+        v0.16.0: Jobs running in a detached ExecutionActor that is still
+        alive are reattached instead (see _adopt_ray_executions).
+        """
+        self._recover_running_jobs()
+
+    def _recover_running_jobs(self) -> None:
+        """Requeue RUNNING jobs left behind by a stopped worker.
+
+        v0.16.0: Run once at startup. Later expirations are handled by the
+        lease keeper.
         """
-        db = self._session_factory()
         try:
-            # Find all RUNNING jobs with ray_future_id
-            orphaned_jobs = (
-                db.query(Job)
-                .filter(Job.status == JobStatus.running)
-                .filter(Job.ray_future_id.isnot(None))
-                .all()
-            )
+            reaped = self._lease_keeper.reap_once(include_unleased=True)
+        except Exception as e:
+            logger.error(f"Error recovering running jobs: {e}")
+            return
+        logger.info(
+            f"Recovery complete: {len(reaped.requeued)} job(s) requeued, "
+            f"{len(reaped.failed)} failed after too many attempts"
+        )
 
-            if not orphaned_jobs:
-                logger.info("No orphaned Ray jobs to recover")
-                return
+    def _adopt_ray_executions(self, include_unleased: bool = False) -> None:
+        """Reattach expired Ray jobs whose execution actor is still alive.
 
-            logger.info(
-                f"Found {len(orphaned_jobs)} orphaned Ray jobs, attempting recovery"
-            )
+        v0.16.0: Runs on the lease keeper before each reap (and at startup
+        with include_unleased). Adopted jobs are leased to this worker and
+        handed to run_once(), which awaits their result like a dispatched
+        job. Jobs whose actor is gone are released and requeued by the
+        reap that follows.
 
-            for job in orphaned_jobs:
-                try:
-                    # Try to reconstruct the Ray future reference
-                    # Ray future IDs are strings like "ObjectRef(...)"
-                    future_id = job.ray_future_id
-
-                    # Check if we can still access this future in Ray
-                    # Use ray.objects() or try to get the object
-                    # For now, we'll mark these as failed since the cluster
-                    # state is lost on worker restart
-                    #
-                    # Future enhancement: Could try to reattach if cluster persisted
-                    logger.warning(
-                        f"Job {job.job_id} was running before restart, "
-                        f"marking as failed (Ray future {future_id} lost)"
-                    )
-                    job.status = JobStatus.failed
-                    job.error_message = "Worker restarted - Ray future lost"
-                    job.ray_future_id = None
-                except Exception as e:
-                    logger.error(f"Error recovering job {job.job_id}: {e}")
-                    job.status = JobStatus.failed
-                    job.error_message = f"Recovery failed: {e}"
-                    job.ray_future_id = None
+        Args:
+            include_unleased: Also adopt RUNNING jobs without a lease
+        """
+        import ray
 
-            db.commit()
-            logger.info(
-                f"Recovery complete: {len(orphaned_jobs)} jobs marked as failed"
+        if not ray.is_initialized():
+            return
+        from .ray_executions import EXECUTION_ACTOR_PREFIX, find_execution
+
+        db = self._session_factory()
+        try:
+            adopted = JobLeaseService.adopt_expired(
+                db, self._lease, EXECUTION_ACTOR_PREFIX, include_unleased
+            )
+            if not adopted:
+                return
+            job_ids = [job_id for job_id, _ in adopted]
+            jobs = {
+                str(job.job_id): job
+                for job in db.query(Job).filter(Job.job_id.in_(job_ids)).all()
+            }
+            tools_by_job = JobToolsService.get_tools_for_jobs(
+                db, [uuid.UUID(job_id) for job_id in job_ids]
             )
 
-        except Exception as e:
-            logger.error(f"Error during Ray job recovery: {e}")
+            gone = []
+            for job_id, actor_name in adopted:
+                job = jobs.get(job_id)
+                actor = find_execution(ray, actor_name)
+                if job is None or actor is None:
+                    gone.append(job_id)
+                    continue
+                tools_to_run = tools_by_job.get(job_id, [])
+                meta = {
+                    "plugin_id": job.plugin_id,
+                    "job_type": job.job_type,
+                    "tools_to_run": tools_to_run,
+                    "is_multi": len(tools_to_run) > 1,
+                    "resources": self._plugin_task_resources(job.plugin_id),
+                    "execution": actor,
+                }
+                self._lease_keeper.track(job_id)
+                future = actor.result.remote()
+                with self._reattached_lock:
+                    self._reattached.append((future, job_id, meta))
+                logger.info(f"Job {job_id} reattached to Ray execution {actor_name}")
+
+            if gone:
+                logger.warning(f"Ray executions lost, requeueing jobs: {gone}")
+                JobLeaseService.release(db, gone, self._lease)
         finally:
             db.close()
 
+    def _take_reattached(self) -> None:
+        """Start polling executions adopted by _adopt_ray_executions."""
+        with self._reattached_lock:
+            reattached, self._reattached = self._reattached, []
+        for future, job_id, meta in reattached:
+            self.job_metadata[job_id] = meta
+            self.active_futures[future] = job_id
+
     @staticmethod
     def _get_total_frames(video_path: str) -> int:
         """Get total frame count from video metadata using OpenCV.
@@ -345,7 +569,7 @@ class JobWorker:
         total_tools: int = 1,
         tool_name: str = "",
     ) -> None:
-        """Update job progress in database, throttled to every 5%.
+        """Update job progress in database, coalesced in time.
 
         v0.9.7: Supports unified progress tracking for multi-tool video jobs.
         v0.10.0: Also broadcasts progress via WebSocket for real-time updates.
@@ -357,12 +581,13 @@ class JobWorker:
         - Equal weighting per tool: tool_weight = 100 / total_tools
         - Global progress = (completed_tools * tool_weight) + (frame_progress * tool_weight)
 
-        Throttles DB updates to reduce database write volume:
-        - Updates on first frame (1%)
-        - Updates on every 5% boundary
-        - Always updates on last frame (100%)
-
-        WebSocket broadcasts happen on every call for real-time updates.
+        v0.16.0: DB writes and WebSocket broadcasts are coalesced by
+        ProgressThrottle instead of firing on every frame:
+        - The first update of a job is always written and broadcast
+        - Later ones only when the value changed and PROGRESS_FLUSH_SECONDS
+          passed since the previous write (or broadcast)
+        - The last frame is always written and broadcast
+        Writes are a single-column UPDATE (no ORM load of the job row).
 
         Args:
             job_id: Job UUID string
@@ -399,26 +624,29 @@ class JobWorker:
             percent = int((current_frame / total_frames) * 100)
 
         percent = max(0, min(100, percent))
+        final = current_frame >= total_frames and tool_index + 1 >= total_tools
+
+        # v0.10.0: Broadcast via WebSocket for real-time updates
+        if self._progress_broadcasts.should_emit(job_id, current_frame, final):
+            from .progress import progress_callback
+
+            progress_callback(
+                job_id=job_id,
+                current_frame=current_frame,
+                total_frames=total_frames,
+                current_tool=tool_name if tool_name else None,
+                tools_total=total_tools if total_tools > 1 else None,
+                tools_completed=tool_index if total_tools > 1 else None,
+            )
 
-        # v0.10.0: Always broadcast via WebSocket for real-time updates
-        from .progress import progress_callback
-
-        progress_callback(
-            job_id=job_id,
-            current_frame=current_frame,
-            total_frames=total_frames,
-            current_tool=tool_name if tool_name else None,
-            tools_total=total_tools if total_tools > 1 else None,
-            tools_completed=tool_index if total_tools > 1 else None,
-        )
-
-        # Throttle: only update every 5% to reduce DB writes
-        # Also update on first frame (1) and last frame (total_frames)
-        if current_frame == 1 or current_frame == total_frames or percent % 5 == 0:
-            job = db.query(Job).filter(Job.job_id == job_id).first()
-            if job:
-                job.progress = percent
-                db.commit()
+        if self._progress_writes.should_emit(job_id, percent, final):
+            updated = (
+                db.query(Job)
+                .filter(Job.job_id == job_id)
+                .update({"progress": percent}, synchronize_session=False)
+            )
+            db.commit()
+            if updated:
                 logger.info(
                     "Progress updated: job=%s tool=%s tool_index=%d/%d frame=%d/%d percent=%d",
                     job_id,
@@ -432,6 +660,67 @@ class JobWorker:
             else:
                 logger.warning("Progress update failed: job %s not found in DB", job_id)
 
+    def _raise_if_cancelled(self, job_id: str, force_db_check: bool = False) -> None:
+        """Stop a running job if it was cancelled.
+
+        v0.16.0: Called at every progress_callback frame checkpoint. The
+        in-process flag set by DELETE /v1/jobs/{job_id} is checked on every
+        call; the database (for cancellations made by another process) at
+        most once per CANCEL_POLL_SECONDS unless force_db_check is set.
+
+        Args:
+            job_id: Job UUID string
+            force_db_check: Always re-read the job status from the database
+
+        Raises:
+            JobCancelledError: If the job was cancelled
+        """
+        if job_cancellations.is_cancelled(job_id):
+            raise JobCancelledError(job_id)
+
+        now = time.monotonic()
+        last_check = self._cancel_checked_at.get(job_id)
+        if (
+            not force_db_check
+            and last_check is not None
+            and now - last_check < CANCEL_POLL_SECONDS
+        ):
+            return
+        self._cancel_checked_at[job_id] = now
+
+        # Fresh session: the job's own session may hold an older snapshot
+        db = self._session_factory()
+        try:
+            status = db.query(Job.status).filter(Job.job_id == job_id).scalar()
+        finally:
+            db.close()
+        if status == JobStatus.cancelled:
+            job_cancellations.cancel(job_id)
+            raise JobCancelledError(job_id)
+
+    def _clear_cancel_state(self, job_id: str) -> None:
+        """Forget the cancellation flag and last check of a job (v0.16.0).
+
+        Args:
+            job_id: Job that is no longer run by this worker
+        """
+        job_cancellations.discard(job_id)
+        self._cancel_checked_at.pop(job_id, None)
+
+    def _is_cancelled(self, job_id: str) -> bool:
+        """Return True if the job was cancelled (always checks the database).
+
+        Args:
+            job_id: Job UUID string
+        """
+        try:
+            self._raise_if_cancelled(job_id, force_db_check=True)
+        except JobCancelledError:
+            return True
+        except Exception as e:
+            logger.warning("Job %s: cancellation check failed: %s", job_id, e)
+        return False
+
     def _handle_signal(self, signum: int, frame) -> None:
         """Handle shutdown signals gracefully.
 
@@ -441,6 +730,7 @@ class JobWorker:
         """
         logger.info("Received signal %s, shutting down gracefully", signum)
         self._running = False
+        job_notifier.notify()
 
     def run_once(self) -> bool:
         """Process jobs using Ray for GPU-accelerated execution.
@@ -465,6 +755,17 @@ class JobWorker:
 
         processed_something = False
 
+        # v0.16.0: Await executions adopted from a previous worker
+        self._take_reattached()
+
+        # v0.16.0: Stop Ray tasks whose jobs were cancelled
+        if self.active_futures:
+            self._cancel_ray_futures(ray)
+
+        # v0.16.0: Apply progress reported by running Ray tasks
+        if self.active_futures:
+            self._drain_ray_progress(ray)
+
         # 1. Poll active Ray futures (non-blocking)
         if self.active_futures:
             ready_refs, _ = ray.wait(
@@ -483,82 +784,355 @@ class JobWorker:
                         f"Ray task failed for job {job_id}: {e}", exc_info=True
                     )
                     self._fail_job(job_id, str(e))
+                self._forget_progress(job_id)
+                self._end_execution(ray, meta)
                 processed_something = True
 
-        # 2. Dispatch new jobs (Limit concurrency to avoid OOM)
-        if len(self.active_futures) < 2:
-            db = self._session_factory()
+        # 2. Dispatch new jobs into the cluster's free capacity
+        if self._dispatch_ray_jobs(ray, execute_pipeline_remote):
+            processed_something = True
+
+        return processed_something
+
+    def _plugin_task_resources(self, plugin_id: str) -> TaskResources:
+        """Return the Ray resources one task of a plugin requests.
+
+        v0.16.0: Read once per plugin from its manifest "resources" block.
+        """
+        if plugin_id not in self._task_resources:
+            manifest = None
             try:
-                job = (
-                    db.query(Job)
-                    .filter(Job.status == JobStatus.pending)
-                    .order_by(Job.created_at.asc())
-                    .first()
-                )
-                if job:
-                    # Atomic claim: only update if still pending
-                    rows_updated = (
-                        db.query(Job)
-                        .filter(Job.job_id == job.job_id)
-                        .filter(Job.status == JobStatus.pending)
-                        .update({"status": JobStatus.running})
-                    )
-                    db.commit()
+                if self._plugin_service is not None:
+                    manifest = self._plugin_service.get_plugin_manifest(plugin_id)
+            except Exception as e:
+                logger.warning(f"Could not read manifest of {plugin_id}: {e}")
+            self._task_resources[plugin_id] = TaskResources.from_manifest(manifest)
+        return self._task_resources[plugin_id]
 
-                    if rows_updated == 0:
-                        # Already claimed by another worker
-                        logger.debug(
-                            f"Job {job.job_id} already claimed by another worker"
-                        )
-                        return processed_something
+    def _use_video_chunks(self, job: Job, tools_to_run: List[str]) -> bool:
+        """Return True if a Ray video job runs as parallel frame ranges.
+
+        v0.16.0: Requires video_chunk_frames > 0 and every tool listing
+        start_frame and end_frame in its manifest input_types.
+        """
+        if self._video_chunk_frames <= 0:
+            return False
+        if job.job_type not in ("video", "video_multi"):
+            return False
+        from ..ray_tasks import tools_support_frame_ranges
+
+        try:
+            manifest = self._plugin_service.get_plugin_manifest(job.plugin_id)
+        except Exception as e:
+            logger.warning(f"Could not read manifest of {job.plugin_id}: {e}")
+            return False
+        return tools_support_frame_ranges(manifest, tools_to_run)
+
+    def _largest_task_resources(self) -> TaskResources:
+        """Return the per-resource maximum of all known plugin demands."""
+        known = [DEFAULT_TASK_RESOURCES, *self._task_resources.values()]
+        return TaskResources(
+            num_cpus=max(r.num_cpus for r in known),
+            num_gpus=max(r.num_gpus for r in known),
+            memory=max(r.memory for r in known),
+        )
+
+    def _ray_free_slots(self, capacity: Optional[RayCapacity]) -> int:
+        """Return how many more jobs to claim for Ray in this pass.
+
+        v0.16.0: Sized by the cluster's free resources in tasks of the
+        largest known plugin demand, so a claimed job always fits (a
+        plugin's first job is sized as a default task), capped by
+        max_ray_jobs. Falls back to RAY_FALLBACK_JOBS
+        concurrent jobs when the resources cannot be read.
+        """
+        in_flight = len(self.active_futures)
+        if capacity is None:
+            free = RAY_FALLBACK_JOBS - in_flight
+        else:
+            free = capacity.max_jobs(self._largest_task_resources())
+        if self._max_ray_jobs > 0:
+            free = min(free, self._max_ray_jobs - in_flight)
+        return max(free, 0)
 
-                    db.refresh(job)
+    def _dispatch_ray_jobs(self, ray, execute_pipeline_remote) -> bool:
+        """Claim jobs and dispatch them to Ray until the cluster is full.
 
-                    # Query tools from job_tools table via service
-                    from app.services.job_tools_service import JobToolsService
+        v0.16.0: Each task requests its plugin's manifest resources, which
+        are deducted from the free capacity before the next claim. Claims
+        repeat until the cluster is full or no job is pending, so one pass
+        fills all free CPUs/GPUs instead of a fixed two jobs.
 
-                    tools_to_run = JobToolsService.get_tools_for_job(db, job.job_id)
+        Args:
+            ray: Imported ray module
+            execute_pipeline_remote: Ray remote function running a pipeline
+
+        Returns:
+            True if any job was dispatched
+        """
+        reserved = [
+            self.job_metadata.get(job_id, {}).get("resources", DEFAULT_TASK_RESOURCES)
+            for job_id in self.active_futures.values()
+        ]
+        capacity = RayCapacity.from_cluster(ray, reserved)
+
+        dispatched = False
+        free_slots = self._ray_free_slots(capacity)
+        while free_slots > 0 and self._running:
+            db = self._session_factory()
+            try:
+                # v0.16.0: Claim every free Ray slot with one UPDATE ... RETURNING
+                claimed = self._claim_jobs(db, limit=free_slots)
+                for item in claimed:
+                    job = item.job
+                    tools_to_run = item.tools
                     is_multi = len(tools_to_run) > 1
+                    resources = self._plugin_task_resources(job.plugin_id)
                     meta = {
                         "plugin_id": job.plugin_id,
                         "job_type": job.job_type,
                         "tools_to_run": tools_to_run,
                         "is_multi": is_multi,
+                        "resources": resources,
                     }
 
                     # Dispatch to Ray Cluster (with failure handling)
                     try:
-                        future = execute_pipeline_remote.remote(
-                            plugin_id=job.plugin_id,
-                            tools_to_run=tools_to_run,
-                            input_path=job.input_path,
-                            job_type=job.job_type,
+                        task_options = None
+                        if resources != DEFAULT_TASK_RESOURCES:
+                            task_options = resources.task_options()
+                        kwargs = {
+                            "plugin_id": job.plugin_id,
+                            "tools_to_run": tools_to_run,
+                            "input_path": job.input_path,
+                            "job_type": job.job_type,
+                            "job_id": str(job.job_id),
+                            "progress_actor": self._get_progress_actor(ray),
+                        }
+                        if self._use_video_chunks(job, tools_to_run):
+                            from ..ray_tasks import execute_video_chunked_remote
+
+                            kind = "video_chunked"
+                            remote_fn = execute_video_chunked_remote
+                            kwargs["chunk_frames"] = self._video_chunk_frames
+                            kwargs["overlap_frames"] = self._video_chunk_overlap
+                        else:
+                            kind = "pipeline"
+                            remote_fn = execute_pipeline_remote
+                        future, ray_future_id, execution = self._launch_ray_task(
+                            ray, str(job.job_id), kind, remote_fn, kwargs, task_options
                         )
+                        meta["execution"] = execution
                     except Exception as dispatch_exc:
                         # Dispatch failed - mark job as failed
+                        self._lease_keeper.untrack(str(job.job_id))
+                        self._clear_cancel_state(str(job.job_id))
                         logger.error(
                             f"Ray dispatch failed for job {job.job_id}: {dispatch_exc}"
                         )
-                        job.status = JobStatus.failed
-                        job.error_message = f"Ray dispatch failed: {dispatch_exc}"
-                        db.commit()
-                        raise
+                        # v0.16.0: Never overwrite a cancellation made since
+                        # the claim
+                        db.query(Job).filter(
+                            Job.job_id == job.job_id,
+                            Job.status != JobStatus.cancelled,
+                        ).update(
+                            {
+                                "status": JobStatus.failed,
+                                "error_message": f"Ray dispatch failed: {dispatch_exc}",
+                            }
+                        )
+                        continue
 
                     self.job_metadata[str(job.job_id)] = meta
                     self.active_futures[future] = str(job.job_id)
+                    if capacity is not None:
+                        capacity.reserve(resources)
 
                     # v0.12.0: Persist ray_future_id for recovery (Issue #270)
-                    job.ray_future_id = str(future)
-                    db.commit()
+                    # v0.16.0: The execution actor name when one is used
+                    db.query(Job).filter(Job.job_id == job.job_id).update(
+                        {"ray_future_id": ray_future_id}
+                    )
 
                     logger.info(f"Job {job.job_id} dispatched to Ray cluster")
-                    processed_something = True
+                    dispatched = True
+                db.commit()
             except Exception as e:
                 logger.error(f"Error dispatching job: {e}")
+                break
             finally:
                 db.close()
 
-        return processed_something
+            # Fewer jobs than requested: nothing else is pending
+            if len(claimed) < free_slots:
+                break
+            free_slots = self._ray_free_slots(capacity)
+
+        return dispatched
+
+    def _launch_ray_task(
+        self,
+        ray,
+        job_id: str,
+        kind: str,
+        remote_fn,
+        kwargs: Dict[str, Any],
+        task_options: Optional[Dict[str, float]],
+    ) -> Tuple[Any, str, Any]:
+        """Start a job's Ray task, in a detached execution actor if possible.
+
+        v0.16.0: With Ray initialized, the task is owned by a named
+        ExecutionActor (see ray_executions.py) so that it survives this
+        worker. Otherwise the task is submitted directly and cannot be
+        reattached after a restart.
+
+        Args:
+            ray: Imported ray module
+            job_id: Job UUID string
+            kind: "pipeline" or "video_chunked"
+            remote_fn: Remote function used for direct submission
+            kwargs: Keyword arguments of the remote function
+            task_options: Plugin task resources, or None for the defaults
+
+        Returns:
+            (future, ray_future_id to persist, ExecutionActor or None)
+        """
+        if ray.is_initialized():
+            from .ray_executions import execution_actor_name, launch_execution
+
+            execution = launch_execution(job_id, kind, kwargs, task_options)
+            return execution.result.remote(), execution_actor_name(job_id), execution
+
+        if kind == "video_chunked":
+            future = remote_fn.remote(**kwargs, task_options=task_options)
+        else:
+            if task_options:
+                remote_fn = remote_fn.options(**task_options)
+            future = remote_fn.remote(**kwargs)
+        return future, str(future), None
+
+    def _end_execution(self, ray, meta: Dict[str, Any]) -> None:
+        """Kill the execution actor of a finished or cancelled job.
+
+        Args:
+            ray: Imported ray module
+            meta: Job metadata (jobs without an actor are ignored)
+        """
+        execution = meta.get("execution")
+        if execution is not None:
+            from .ray_executions import kill_execution
+
+            kill_execution(ray, execution)
+
+    def _get_progress_actor(self, ray) -> Any:
+        """Return this worker's ProgressActor, creating it on first use.
+
+        v0.16.0: Returns None (Ray jobs run without progress) if Ray is
+        not initialized or the actor cannot be created.
+
+        Args:
+            ray: Imported ray module
+        """
+        if self._progress_actor is None:
+            try:
+                if not ray.is_initialized():
+                    return None
+                from .ray_progress import PROGRESS_ACTOR_PREFIX, ProgressActorRemote
+
+                self._progress_actor = ProgressActorRemote.options(
+                    name=f"{PROGRESS_ACTOR_PREFIX}{self._worker_id}",
+                    get_if_exists=True,
+                ).remote()
+            except Exception as e:
+                logger.warning(f"Ray progress actor unavailable: {e}")
+                return None
+        return self._progress_actor
+
+    def _drain_ray_progress(self, ray) -> None:
+        """Write and broadcast progress reported by running Ray tasks.
+
+        v0.16.0: One actor call per loop iteration fetches the latest
+        progress of every job; updates go through _update_job_progress()
+        like synchronous jobs. Jobs no longer in flight are ignored.
+
+        Args:
+            ray: Imported ray module
+        """
+        if self._progress_actor is None:
+            return
+        try:
+            updates = ray.get(self._progress_actor.drain.remote(), timeout=5.0)
+        except Exception as e:
+            logger.warning(f"Failed to read Ray job progress: {e}")
+            return
+
+        running = set(self.active_futures.values())
+        updates = {k: v for k, v in updates.items() if k in running}
+        if not updates:
+            return
+        db = self._session_factory()
+        try:
+            for job_id, (current, total) in updates.items():
+                self._update_job_progress(job_id, current, total, db)
+        except Exception as e:
+            logger.error(f"Error updating Ray job progress: {e}")
+        finally:
+            db.close()
+
+    def _forget_progress(self, job_id: str) -> None:
+        """Drop a finished job's progress throttle (and actor) state."""
+        self._progress_writes.forget(job_id)
+        self._progress_broadcasts.forget(job_id)
+        if self._progress_actor is not None:
+            try:
+                self._progress_actor.forget.remote(job_id)
+            except Exception as e:
+                logger.debug(f"Progress actor forget failed for {job_id}: {e}")
+
+    def _cancel_ray_futures(self, ray) -> None:
+        """Cancel Ray tasks of jobs cancelled via DELETE /v1/jobs/{job_id}.
+
+        v0.16.0: One status query covers all active futures. Jobs whose
+        lease was lost (requeued or adopted elsewhere) are dropped as well,
+        leaving their execution actor to the new owner.
+
+        Args:
+            ray: Imported ray module
+        """
+        db = self._session_factory()
+        try:
+            cancelled = {
+                str(row[0])
+                for row in db.query(Job.job_id)
+                .filter(Job.job_id.in_(list(self.active_futures.values())))
+                .filter(Job.status == JobStatus.cancelled)
+                .all()
+            }
+        except Exception as e:
+            logger.error(f"Error checking Ray jobs for cancellation: {e}")
+            return
+        finally:
+            db.close()
+        lost = set(self._lease_keeper.pop_lost())
+
+        for ref, job_id in list(self.active_futures.items()):
+            if job_id not in cancelled and job_id not in lost:
+                continue
+            meta = self.job_metadata.pop(job_id, None) or {}
+            try:
+                # Actor tasks (execution results) cannot be force-cancelled
+                ray.cancel(ref, force=meta.get("execution") is None)
+            except Exception as e:
+                logger.warning(f"Ray cancel failed for job {job_id}: {e}")
+            # v0.16.0: A lost job's execution may have been adopted by
+            # another worker; only a user cancellation stops it
+            if job_id in cancelled:
+                self._end_execution(ray, meta)
+            del self.active_futures[ref]
+            self._clear_cancel_state(job_id)
+            self._lease_keeper.untrack(job_id)
+            self._forget_progress(job_id)
+            logger.info(f"Job {job_id} cancelled, Ray task stopped")
 
     def _run_once_sync(self) -> bool:
         """Process one job synchronously (backward compatibility mode).
@@ -566,40 +1140,98 @@ class JobWorker:
         This is the original run_once implementation before Ray integration.
         Used for unit tests and when Ray is not available.
 
+        v0.16.0: With max_slots > 1, claimed jobs are handed to execution
+        slots instead of running inline (see _dispatch_to_slots).
+
         Returns:
             True if a job was processed, False if no pending jobs
         """
+        if self._slots.max_slots > 1:
+            return self._dispatch_to_slots()
+
         db = self._session_factory()
         try:
-            job = (
-                db.query(Job)
-                .filter(Job.status == JobStatus.pending)
-                .order_by(Job.created_at.asc())
-                .first()
+            claimed = self._claim_jobs(db, limit=1)
+            if not claimed:
+                return False
+
+            job = claimed[0].job
+            logger.info("Job %s marked RUNNING", job.job_id)
+
+            # Execute pipeline on input file
+            return self._execute_pipeline(job, db, tools_to_run=claimed[0].tools)
+        finally:
+            db.close()
+
+    def _dispatch_to_slots(self) -> bool:
+        """Claim pending jobs into free execution slots.
+
+        v0.16.0: Fills every free slot with one batch claim, capped per
+        job_type by the remaining slot quotas so one job type cannot starve
+        the others. Jobs are chosen by priority and weighted fair share.
+
+        Returns:
+            True if at least one job was dispatched, False otherwise
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._slots.max_slots,
+                thread_name_prefix="job-slot",
             )
 
-            if job is None:
-                return False
+        if self._slots.free <= 0:
+            return False
 
-            rows_updated = (
-                db.query(Job)
-                .filter(Job.job_id == job.job_id)
-                .filter(Job.status == JobStatus.pending)
-                .update({"status": JobStatus.running})
+        db = self._session_factory()
+        try:
+            claimed = self._claim_jobs(
+                db,
+                limit=self._slots.free,
+                type_limits=self._slots.remaining_quotas(),
             )
-            db.commit()
+        finally:
+            db.close()
 
-            if rows_updated == 0:
-                return False
+        for item in claimed:
+            job_id = str(item.job.job_id)
+            job_type = item.job.job_type
+            if not self._slots.try_acquire(job_type):
+                # Only this thread acquires slots, so this should not happen
+                logger.error("Job %s claimed without a free slot", job_id)
+                self._fail_job(job_id, "Worker had no free execution slot")
+                continue
 
-            db.refresh(job)
+            self._executor.submit(self._run_in_slot, item.job, item.tools)
+            logger.info(
+                "Job %s dispatched to execution slot (%d/%d busy)",
+                job_id,
+                self._slots.busy,
+                self._slots.max_slots,
+            )
 
-            logger.info("Job %s marked RUNNING", job.job_id)
+        return bool(claimed)
 
-            # Execute pipeline on input file
-            return self._execute_pipeline(job, db)
+    def _run_in_slot(self, job: Job, tools_to_run: List[str]) -> None:
+        """Execute a claimed job on a slot thread and release the slot.
+
+        Args:
+            job: Claimed Job (detached from the claiming session)
+            tools_to_run: Tools fetched with the claim
+        """
+        job_id = str(job.job_id)
+        job_type = job.job_type
+        db = self._session_factory()
+        try:
+            # Attach the claimed row without re-reading it
+            job = db.merge(job, load=False)
+            self._execute_pipeline(job, db, tools_to_run=tools_to_run)
+        except Exception as e:
+            logger.error("Job %s: slot execution crashed: %s", job_id, e)
+            self._fail_job(job_id, str(e))
         finally:
             db.close()
+            self._slots.release(job_type)
+            job_notifier.notify()
 
     def _finalize_job(self, job_id: str, meta: dict, results: dict) -> None:
         """Finalize a completed Ray job.
@@ -609,12 +1241,16 @@ class JobWorker:
             meta: Job metadata dict
             results: Results from Ray task
         """
+        self._lease_keeper.untrack(job_id)
         db = self._session_factory()
         try:
             job = db.query(Job).filter(Job.job_id == job_id).first()
             if not job:
                 logger.warning(f"Job {job_id} not found in database")
                 return
+            if job.status == JobStatus.cancelled:
+                logger.info(f"Job {job_id} was cancelled, discarding Ray results")
+                return
 
             tools_to_run = meta.get("tools_to_run", [])
             output_data: Dict[str, Any]
@@ -659,7 +1295,6 @@ class JobWorker:
                     "results": results.get(tools_to_run[0]),
                 }
 
-            output_json = json.dumps(output_data, indent=2)
             if not self._storage:
                 logger.error(f"No storage service for job {job_id}")
                 self._fail_job(
@@ -667,8 +1302,8 @@ class JobWorker:
                 )
                 return
             output_path = self._storage.save_file(
-                BytesIO(output_json.encode()),
-                f"{job.job_type}/output/{job.job_id}.json",
+                BytesIO(encode_result(output_data)),
+                result_path(job.job_type, str(job.job_id)),
             )
             job.status = JobStatus.completed
             job.output_path = output_path
@@ -684,6 +1319,36 @@ class JobWorker:
         finally:
             db.close()
 
+    @staticmethod
+    def _flush_checkpoint(checkpoint: VideoCheckpoint) -> None:
+        """Persist buffered frames of a failed tool, logging write errors.
+
+        Args:
+            checkpoint: Checkpoint of the tool that failed
+        """
+        try:
+            checkpoint.flush()
+        except Exception as e:
+            logger.warning(
+                "Job %s: failed to flush checkpoint: %s", checkpoint.job_id, e
+            )
+
+    def _clear_checkpoints(self, job_ids: List[str]) -> None:
+        """Delete the video checkpoints of jobs that ended for good.
+
+        v0.16.0: Called when a job fails terminally or is cancelled; jobs
+        requeued for another attempt keep their checkpoints.
+
+        Args:
+            job_ids: Job UUID strings
+        """
+        if not self._storage or not self._checkpoint_frames:
+            return
+        for job_id in job_ids:
+            deleted = clear_job_checkpoints(self._storage, str(job_id))
+            if deleted:
+                logger.info("Job %s: deleted %d checkpoint object(s)", job_id, deleted)
+
     def _fail_job(self, job_id: str, error_msg: str) -> None:
         """Mark a job as failed.
 
@@ -691,10 +1356,12 @@ class JobWorker:
             job_id: Job UUID string
             error_msg: Error message
         """
+        self._lease_keeper.untrack(job_id)
         db = self._session_factory()
         try:
             job = db.query(Job).filter(Job.job_id == job_id).first()
-            if job:
+            # v0.16.0: Never overwrite a user cancellation
+            if job and job.status != JobStatus.cancelled:
                 job.status = JobStatus.failed
                 job.error_message = error_msg
                 job.ray_future_id = None  # v0.12.0: Clear on failure (Issue #270)
@@ -702,7 +1369,9 @@ class JobWorker:
         finally:
             db.close()
 
-    def _execute_pipeline(self, job: Job, db) -> bool:
+    def _execute_pipeline(
+        self, job: Job, db, tools_to_run: Optional[List[str]] = None
+    ) -> bool:
         """Execute pipeline on job input file.
 
         v0.9.4: Supports multi-tool execution for image_multi job type.
@@ -714,10 +1383,16 @@ class JobWorker:
         Args:
             job: Job model instance
             db: Database session
+            tools_to_run: v0.16.0: Tools prefetched by JobClaimService
+                          (queried from job_tools when None)
 
         Returns:
             True if pipeline executed successfully, False on error
         """
+        job_id = str(job.job_id)
+        is_video = job.job_type in ("video", "video_multi")
+        # v0.16.0: Local copies of the input, pinned until the job ends
+        inputs = contextlib.ExitStack()
         try:
             # Verify storage and plugin_service are available
             if not self._storage:
@@ -747,9 +1422,10 @@ class JobWorker:
 
             # v0.9.4: Determine tools to execute from job_tools table
             # v0.15.1: Query from job_tools via JobToolsService
-            from app.services.job_tools_service import JobToolsService
+            if tools_to_run is None:
+                from app.services.job_tools_service import JobToolsService
 
-            tools_to_run = JobToolsService.get_tools_for_job(db, job.job_id)
+                tools_to_run = JobToolsService.get_tools_for_job(db, job.job_id)
 
             if not tools_to_run:
                 job.status = JobStatus.failed
@@ -761,6 +1437,8 @@ class JobWorker:
 
             # Validate all tools exist and support the job type
             manifest_tools = iter_manifest_tools(manifest)
+            # v0.16.0: Video tools that can resume from a start_frame
+            resumable_tools = set()
 
             for tool_name in tools_to_run:
                 tool_def = None
@@ -807,15 +1485,17 @@ class JobWorker:
                         )
                         db.commit()
                         return False
+                    if "start_frame" in input_types:
+                        resumable_tools.add(tool_name)
 
             # Branch by job_type to prepare arguments
             args: Dict[str, Any] = {}
 
             if job.job_type in ("image", "image_multi"):
                 # Load image file from storage
-                image_path = self._storage.load_file(job.input_path)
-                with open(image_path, "rb") as f:
-                    image_bytes = f.read()
+                with self._storage.open_local(job.input_path) as image_path:
+                    with open(image_path, "rb") as f:
+                        image_bytes = f.read()
 
                 # Determine parameter name from first tool's manifest
                 first_tool_def = None
@@ -849,7 +1529,10 @@ class JobWorker:
 
             elif job.job_type in ("video", "video_multi"):
                 # Load video file from storage
-                video_path = self._storage.load_file(job.input_path)
+                # v0.16.0: Kept open (pinned in the storage cache) while tools run
+                video_path = inputs.enter_context(
+                    self._storage.open_local(job.input_path)
+                )
 
                 # v0.9.6: Get total frames for progress tracking
                 # v0.9.7: For multi-tool, we need progress per tool
@@ -874,16 +1557,48 @@ class JobWorker:
             # v0.9.7: Updated to use unified progress for multi-tool video jobs
             results: Dict[str, Any] = {}
             num_tools = len(tools_to_run)
+            checkpoints: List[VideoCheckpoint] = []
 
             for idx, tool_name in enumerate(tools_to_run):
+                # v0.16.0: Resume from what a previous run of this job saved
+                checkpoint = None
+                if job.job_type in ("video", "video_multi") and self._checkpoint_frames:
+                    checkpoint = VideoCheckpoint(
+                        self._storage, job_id, tool_name, self._checkpoint_frames
+                    )
+                    checkpoint.load()
+                    checkpoints.append(checkpoint)
+                    saved = checkpoint.completed_result()
+                    if saved is not None:
+                        logger.info(
+                            "Job %s: tool '%s' restored from checkpoint",
+                            job.job_id,
+                            tool_name,
+                        )
+                        results[tool_name] = saved
+                        continue
+                    if tool_name not in resumable_tools:
+                        checkpoint = None
+
                 logger.info("Job %s: executing tool '%s'", job.job_id, tool_name)
 
                 # v0.9.8: Create per-tool progress callback for video jobs
                 progress_callback = None
                 if job.job_type in ("video", "video_multi"):
 
-                    def make_progress_cb(tool_index: int):
-                        def cb(current_frame: int, total: int = total_frames) -> None:
+                    def make_progress_cb(
+                        tool_index: int, checkpoint: Optional[VideoCheckpoint]
+                    ):
+                        def cb(
+                            current_frame: int,
+                            total: int = total_frames,
+                            frame_results: Optional[List[Any]] = None,
+                        ) -> None:
+                            # v0.16.0: Cancellation checkpoint (once per frame)
+                            self._raise_if_cancelled(str(job.job_id))
+                            # v0.16.0: Persist frame results in segments
+                            if checkpoint is not None:
+                                checkpoint.record(current_frame, frame_results)
                             per_total = total if total and total > 0 else total_frames
                             overall_total = per_total * num_tools
                             overall_current = (tool_index * per_total) + current_frame
@@ -893,17 +1608,32 @@ class JobWorker:
 
                         return cb
 
-                    progress_callback = make_progress_cb(idx)
+                    progress_callback = make_progress_cb(idx, checkpoint)
 
                 tool_args = args.copy() if args else {}
+                if checkpoint is not None:
+                    tool_args["start_frame"] = checkpoint.resume_frame
+                    if checkpoint.resume_frame:
+                        logger.info(
+                            "Job %s: resuming tool '%s' at frame %d",
+                            job.job_id,
+                            tool_name,
+                            checkpoint.resume_frame,
+                        )
 
                 # Execute tool via plugin_service (includes sandbox and error handling)
-                result = plugin_service.run_plugin_tool(
-                    job.plugin_id,
-                    tool_name,
-                    tool_args,
-                    progress_callback=progress_callback,
-                )
+                try:
+                    result = plugin_service.run_plugin_tool(
+                        job.plugin_id,
+                        tool_name,
+                        tool_args,
+                        progress_callback=progress_callback,
+                    )
+                except Exception:
+                    # v0.16.0: Keep the frames processed before the failure
+                    if checkpoint is not None:
+                        self._flush_checkpoint(checkpoint)
+                    raise
 
                 # Handle Pydantic models
                 if hasattr(result, "model_dump"):
@@ -911,6 +1641,12 @@ class JobWorker:
                 elif hasattr(result, "dict"):
                     result = result.dict()
 
+                if checkpoint is not None:
+                    result = checkpoint.merge(result)
+                # v0.16.0: Later tools may fail; don't rerun this one then
+                if checkpoints and idx < num_tools - 1:
+                    checkpoints[-1].save_result(result)
+
                 results[tool_name] = result
                 logger.info(
                     "Job %s: tool '%s' executed successfully", job.job_id, tool_name
@@ -969,13 +1705,16 @@ class JobWorker:
                     "results": results[tools_to_run[0]],
                 }
 
-            output_json = json.dumps(output_data, indent=2)
-            output_bytes = BytesIO(output_json.encode())
+            # v0.16.0: Don't overwrite a cancellation made while tools ran
+            self._raise_if_cancelled(str(job.job_id), force_db_check=True)
+
+            # v0.16.0: Compact, gzip-compressed JSON (see result_codec)
+            output_bytes = BytesIO(encode_result(output_data))
 
             # Save results to storage with job_type subdirectory
             output_path = self._storage.save_file(
                 output_bytes,
-                f"{job.job_type}/output/{job.job_id}.json",
+                result_path(job.job_type, str(job.job_id)),
             )
             logger.info("Job %s: saved results to %s", job.job_id, output_path)
 
@@ -991,6 +1730,10 @@ class JobWorker:
             job.summary = json.dumps(summary_dict)
             db.commit()
 
+            # v0.16.0: The output is saved; checkpoints are no longer needed
+            for checkpoint in checkpoints:
+                checkpoint.clear()
+
             # Notify WebSocket subscribers
             send_job_completed(str(job.job_id))
 
@@ -998,21 +1741,69 @@ class JobWorker:
             return True
 
         except Exception as e:
+            # v0.16.0: A cancelled job keeps its CANCELLED status. The plugin
+            # sandbox wraps JobCancelledError, so re-check the job as well.
+            if isinstance(e, JobCancelledError) or self._is_cancelled(job_id):
+                db.rollback()
+                logger.info("Job %s cancelled, execution stopped", job.job_id)
+                # A lost lease stops the run too; only a user cancellation
+                # (status reloaded after the rollback) ends the job for good
+                if job.status == JobStatus.cancelled and is_video:
+                    self._clear_checkpoints([job_id])
+                return False
+
             # Mark job as failed with error message
             logger.error("Job %s: pipeline execution failed: %s", job.job_id, str(e))
             job.status = JobStatus.failed
             job.error_message = str(e)
             db.commit()
+            if is_video:
+                self._clear_checkpoints([job_id])
             return False
 
+        finally:
+            inputs.close()
+            self._clear_cancel_state(job_id)
+            self._lease_keeper.untrack(job_id)
+            self._forget_progress(job_id)
+
     def run_forever(self) -> None:
-        """Run the worker loop until shutdown signal is received."""
+        """Run the worker loop until shutdown signal is received.
+
+        v0.16.0: When idle, waits on job_notifier instead of sleeping, so
+        submitted jobs are picked up immediately. Without notifications the
+        poll interval doubles from IDLE_POLL_MIN_SECONDS up to
+        IDLE_POLL_MAX_SECONDS; active Ray futures keep it at the minimum.
+
+        v0.16.0: Requeues jobs orphaned by a previous worker process, then
+        renews this worker's job leases from a background thread. With a
+        dispatch queue, pending jobs are backfilled into it every lease
+        period.
+        """
         logger.info("Worker started")
+        if not self._use_ray:
+            # Ray mode already recovered in __init__
+            self._recover_running_jobs()
+        self._lease_keeper.start()
+        idle_wait = IDLE_POLL_MIN_SECONDS
         while self._running:
             # Send heartbeat to indicate worker is alive
             worker_last_heartbeat.beat()
+            self._maybe_backfill_queue()
 
             processed = self.run_once()
-            if not processed:
-                time.sleep(0.5)
+            if processed:
+                idle_wait = IDLE_POLL_MIN_SECONDS
+                continue
+
+            if job_notifier.wait(idle_wait) or self.active_futures:
+                idle_wait = IDLE_POLL_MIN_SECONDS
+            else:
+                idle_wait = min(idle_wait * 2, IDLE_POLL_MAX_SECONDS)
+
+        # v0.16.0: Let in-flight slot jobs finish before returning
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._lease_keeper.stop()
         logger.info("Worker stopped")
@@ -16,10 +16,7 @@ from fastapi.testclient import TestClient
 from app.core.database import get_db
 from app.main import app
 from app.models.job import Job, JobStatus
-from app.services.storage.local_storage import BASE_DIR, LocalStorageService
-
-# Video storage directory (relative to server/data/jobs/)
-VIDEO_INPUT_DIR = BASE_DIR / "video" / "input"
+from app.services.storage.local_storage import LocalStorageService
 
 
 @pytest.fixture
@@ -43,21 +40,18 @@ def storage():
     return LocalStorageService()
 
 
-@pytest.fixture(autouse=True)
-def setup_video_dir():
-    """Ensure video/input directory exists before tests and cleanup after."""
-    # Create the directory
-    VIDEO_INPUT_DIR.mkdir(parents=True, exist_ok=True)
-    yield
-    # Cleanup test files (but keep directory structure)
-    for f in VIDEO_INPUT_DIR.glob("*.mp4"):
-        f.unlink()
+@pytest.fixture
+def video_input_dir(local_storage_dir):
+    """Video input directory of the per-test local storage."""
+    video_input_dir = local_storage_dir / "video" / "input"
+    video_input_dir.mkdir(parents=True)
+    return video_input_dir
 
 
 class TestGetJobVideo:
     """Tests for GET /v1/jobs/{job_id}/video endpoint."""
 
-    def test_get_job_video_success(self, client, session):
+    def test_get_job_video_success(self, client, session, video_input_dir):
         """Test GET /v1/jobs/{job_id}/video returns video file."""
         job_id = uuid4()
 
@@ -74,7 +68,7 @@ class TestGetJobVideo:
         session.commit()
 
         # Create a fake MP4 file
-        video_path = VIDEO_INPUT_DIR / f"{job_id}.mp4"
+        video_path = video_input_dir / f"{job_id}.mp4"
         video_path.write_bytes(b"\x00\x00\x00\x18ftypmp42")  # Minimal MP4 header
 
         response = client.get(f"/v1/jobs/{job_id}/video")
@@ -113,7 +107,7 @@ class TestGetJobVideo:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    def test_get_job_video_pending_job(self, client, session):
+    def test_get_job_video_pending_job(self, client, session, video_input_dir):
         """Test GET /v1/jobs/{job_id}/video for pending job still returns video."""
         job_id = uuid4()
 
@@ -129,7 +123,7 @@ class TestGetJobVideo:
         session.commit()
 
         # Create the video file
-        video_path = VIDEO_INPUT_DIR / f"{job_id}.mp4"
+        video_path = video_input_dir / f"{job_id}.mp4"
         video_path.write_bytes(b"\x00\x00\x00\x18ftypmp42")
 
         response = client.get(f"/v1/jobs/{job_id}/video")
@@ -137,3 +131,56 @@ class TestGetJobVideo:
         # Video should be accessible even for pending jobs (for preview)
         assert response.status_code == 200
         assert response.headers["content-type"] == "video/mp4"
+
+    def test_get_job_video_range_request(self, client, session, video_input_dir):
+        """v0.16.0: A Range request returns only the requested bytes (206)."""
+        job_id = uuid4()
+        job = Job(
+            job_id=job_id,
+            status=JobStatus.completed,
+            plugin_id="yolo",
+            input_path=f"video/input/{job_id}.mp4",
+            job_type="video",
+        )
+        session.add(job)
+        session.commit()
+        (video_input_dir / f"{job_id}.mp4").write_bytes(b"0123456789")
+
+        response = client.get(
+            f"/v1/jobs/{job_id}/video", headers={"Range": "bytes=2-5"}
+        )
+
+        assert response.status_code == 206
+        assert response.content == b"2345"
+        assert response.headers["content-range"] == "bytes 2-5/10"
+        assert response.headers["accept-ranges"] == "bytes"
+
+        response = client.get(
+            f"/v1/jobs/{job_id}/video", headers={"Range": "bytes=10-"}
+        )
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */10"
+
+    def test_get_job_video_redirects_when_enabled(self, client, session, monkeypatch):
+        """v0.16.0: Backends with presigned URLs redirect when enabled."""
+        from app.api_routes.routes import jobs
+
+        job_id = uuid4()
+        job = Job(
+            job_id=job_id,
+            status=JobStatus.completed,
+            plugin_id="yolo",
+            input_path=f"video/input/{job_id}.mp4",
+            job_type="video",
+        )
+        session.add(job)
+        session.commit()
+        monkeypatch.setattr(jobs.settings, "storage_redirect_downloads", True)
+        monkeypatch.setattr(
+            jobs.storage, "get_redirect_url", lambda path: f"https://s3/{path}"
+        )
+
+        response = client.get(f"/v1/jobs/{job_id}/video", follow_redirects=False)
+
+        assert response.status_code == 307
+        assert response.headers["location"] == f"https://s3/video/input/{job_id}.mp4"
@@ -0,0 +1,106 @@
+"""Tests for DELETE /v1/jobs/{job_id} job cancellation (v0.16.0)."""
+
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.database import get_db
+from app.main import app
+from app.models.job import Job, JobStatus
+from app.workers.job_cancellation import job_cancellations
+
+
+@pytest.fixture
+def client(session):
+    """Create a test client with dependency overrides for database session."""
+
+    def override_get_db():
+        try:
+            yield session
+        finally:
+            pass
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _add_job(session, status):
+    job = Job(
+        job_id=uuid4(),
+        status=status,
+        plugin_id="yolo",
+        input_path="video/input/test.mp4",
+        job_type="video",
+    )
+    session.add(job)
+    session.commit()
+    return str(job.job_id)
+
+
+@pytest.mark.unit
+class TestCancelJob:
+    """Tests for DELETE /v1/jobs/{job_id}."""
+
+    def test_cancel_pending_job(self, client, session):
+        """A pending job is cancelled and never flagged for a worker."""
+        job_id = _add_job(session, JobStatus.pending)
+
+        response = client.delete(f"/v1/jobs/{job_id}")
+
+        assert response.status_code == 200
+        assert response.json() == {"job_id": job_id, "status": "cancelled"}
+        session.expire_all()
+        job = session.query(Job).filter(Job.job_id == job_id).first()
+        assert job.status == JobStatus.cancelled
+        assert job.error_message == "Cancelled by user"
+        assert not job_cancellations.is_cancelled(job_id)
+
+    def test_cancel_running_job_flags_worker(self, client, session):
+        """A running job is flagged so the worker stops at the next frame."""
+        job_id = _add_job(session, JobStatus.running)
+
+        try:
+            response = client.delete(f"/v1/jobs/{job_id}")
+
+            assert response.status_code == 200
+            assert job_cancellations.is_cancelled(job_id)
+        finally:
+            job_cancellations.discard(job_id)
+
+    def test_cancel_is_idempotent(self, client, session):
+        """Cancelling a cancelled job succeeds again."""
+        job_id = _add_job(session, JobStatus.cancelled)
+
+        response = client.delete(f"/v1/jobs/{job_id}")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "cancelled"
+
+    @pytest.mark.parametrize("status", [JobStatus.completed, JobStatus.failed])
+    def test_cancel_finished_job_conflicts(self, client, session, status):
+        """Finished jobs cannot be cancelled."""
+        job_id = _add_job(session, status)
+
+        response = client.delete(f"/v1/jobs/{job_id}")
+
+        assert response.status_code == 409
+        session.expire_all()
+        assert session.query(Job).filter(Job.job_id == job_id).first().status == status
+
+    def test_cancel_unknown_job(self, client):
+        """Unknown job IDs return 404."""
+        response = client.delete(f"/v1/jobs/{uuid4()}")
+
+        assert response.status_code == 404
+
+    def test_cancelled_job_reported_in_get(self, client, session):
+        """GET /v1/jobs/{job_id} reports the cancelled status."""
+        job_id = _add_job(session, JobStatus.pending)
+        client.delete(f"/v1/jobs/{job_id}")
+
+        response = client.get(f"/v1/jobs/{job_id}")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "cancelled"
@@ -449,3 +449,36 @@ def test_list_jobs_summary_fallback_for_old_jobs(client, session, storage):
     # Or return None if no fallback implemented
     # (This test documents expected behavior)
     assert video_job["summary"] is None or video_job["summary"]["frame_count"] == 5
+
+
+def test_list_jobs_signs_result_urls_without_storage_probes(
+    client, session, monkeypatch
+):
+    """v0.16.0: Result URLs are presigned without probes and cached per job."""
+    from unittest.mock import MagicMock
+
+    from app.api_routes.routes import jobs
+
+    session.query(Job).delete()
+    session.commit()
+    completed = [
+        create_job(session, JobStatus.completed, with_result=True) for _ in range(3)
+    ]
+    mock_storage = MagicMock()
+    mock_storage.get_redirect_url.side_effect = (
+        lambda path, expires_in: f"https://s3/{path}"
+    )
+    monkeypatch.setattr(jobs, "storage", mock_storage)
+    jobs.result_urls.clear()
+
+    for _ in range(2):
+        response = client.get("/v1/jobs?limit=10&skip=0")
+        assert response.status_code == 200
+
+    urls = {j["job_id"]: j["result_url"] for j in response.json()["jobs"]}
+    for job in completed:
+        assert urls[str(job.job_id)] == f"https://s3/{job.output_path}"
+    # One signature per job across both requests, and no existence checks
+    assert mock_storage.get_redirect_url.call_count == 3
+    mock_storage.get_signed_url.assert_not_called()
+    mock_storage.file_exists.assert_not_called()
@@ -24,6 +24,7 @@ from app.core.database import get_db
 from app.main import app
 from app.models.job import Job, JobStatus
 from app.services.storage.local_storage import LocalStorageService
+from app.services.storage.result_codec import encode_result, result_path
 
 
 @pytest.fixture
@@ -441,6 +442,47 @@ def test_get_job_result_returns_json_file(client, session, storage):
     assert "frames" in data
 
 
+def test_get_job_result_serves_compressed_result(client, session, storage):
+    """v0.16.0: Compressed results are sent as stored when gzip is accepted."""
+    job_id = uuid4()
+    output_path = result_path("video", str(job_id))
+    session.add(
+        Job(
+            job_id=job_id,
+            status=JobStatus.completed,
+            plugin_id="test-plugin",
+            input_path="video/input/test.mp4",
+            output_path=output_path,
+            job_type="video",
+        )
+    )
+    session.commit()
+    results_data = {"frames": [{"detections": [{"class": "player"}]}]}
+    storage.save_file(BytesIO(encode_result(results_data)), output_path)
+
+    response = client.get(
+        f"/v1/jobs/{job_id}/result", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.json() == results_data
+
+    response = client.get(
+        f"/v1/jobs/{job_id}/result", headers={"Accept-Encoding": "identity"}
+    )
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.json() == results_data
+
+    # GET /v1/jobs/{id} derives its summary from the compressed result too
+    response = client.get(f"/v1/jobs/{job_id}")
+    assert response.status_code == 200
+    assert response.json()["summary"] is not None
+
+
 def test_get_job_result_not_found(client, session):
     """Test GET /v1/jobs/{job_id}/result returns 404 for non-existent job."""
     fake_job_id = uuid4()
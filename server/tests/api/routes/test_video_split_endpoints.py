@@ -146,6 +146,42 @@ class TestVideoUploadEndpoint:
 
         assert response.status_code == 400
 
+    @pytest.mark.unit
+    def test_video_upload_streams_file_to_storage(
+        self, mock_plugin_registry, mock_plugin_service
+    ):
+        """v0.16.0: The upload is passed to storage as a stream, not bytes."""
+        from io import BytesIO
+        from unittest.mock import patch
+
+        app.dependency_overrides[get_plugin_manager] = lambda: mock_plugin_registry
+        app.dependency_overrides[get_plugin_service] = lambda: mock_plugin_service
+        saved = {}
+
+        def save_file(src, dest_path):
+            saved["stream"] = not isinstance(src, BytesIO)
+            saved["data"] = src.read()
+            return dest_path
+
+        storage = MagicMock()
+        storage.save_file.side_effect = save_file
+        mp4_data = b"\x00\x00\x00\x18ftypmp42" + b"\x01" * 4096
+
+        try:
+            with patch(
+                "app.api_routes.routes.video_submit.get_storage", return_value=storage
+            ):
+                response = TestClient(app).post(
+                    "/v1/video/upload",
+                    files={"file": ("test.mp4", mp4_data)},
+                    params={"plugin_id": "yolo-tracker"},
+                )
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        assert saved == {"stream": True, "data": mp4_data}
+
     @pytest.mark.unit
     def test_video_upload_validates_plugin(self, mock_plugin_service):
         """POST /v1/video/upload should reject invalid plugin_id."""
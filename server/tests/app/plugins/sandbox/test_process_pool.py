@@ -0,0 +1,144 @@
+"""Tests for process_pool.py - warm plugin worker processes (v0.16.0)."""
+
+import os
+import signal
+import time
+from typing import Any, Dict
+
+import pytest
+
+from app.plugins.sandbox.process_pool import PluginProcessPool
+
+
+class _PoolTestPlugin:
+    """Plugin stub loaded inside pool workers."""
+
+    def run_tool(self, tool_name: str, args: Dict[str, Any]) -> Any:
+        if tool_name == "echo":
+            return {"pid": os.getpid(), **args}
+        if tool_name == "progress":
+            callback = args["progress_callback"]
+            for frame in range(1, 4):
+                callback(frame, 3)
+            return {"frames": 3}
+        if tool_name == "fail":
+            raise ValueError("bad frame")
+        if tool_name == "sleep":
+            time.sleep(args["seconds"])
+            return {"slept": args["seconds"]}
+        if tool_name == "segfault":
+            os.kill(os.getpid(), signal.SIGKILL)
+        raise ValueError(f"Unknown tool: {tool_name}")
+
+
+def _load_test_plugins() -> Dict[str, Any]:
+    return {"stub": _PoolTestPlugin()}
+
+
+@pytest.fixture
+def pool():
+    pool = PluginProcessPool(
+        size=1,
+        plugin_loader=_load_test_plugins,
+        max_calls_per_worker=3,
+        mp_context="fork",
+    )
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.unit
+class TestPluginProcessPool:
+    """Tests for PluginProcessPool."""
+
+    def test_runs_tool_in_worker_process(self, pool) -> None:
+        """Tools run in a separate, reused worker process."""
+        first = pool.run("stub", "echo", {"value": 1})
+        second = pool.run("stub", "echo", {"value": 2})
+
+        assert first.ok is True
+        assert first.result["value"] == 1
+        assert first.execution_time_ms is not None
+        assert first.result["pid"] != os.getpid()
+        assert second.result["pid"] == first.result["pid"]
+
+    def test_plugin_error_keeps_worker(self, pool) -> None:
+        """Plugin exceptions map like run_plugin_sandboxed and keep the worker."""
+        pid = pool.run("stub", "echo", {}).result["pid"]
+
+        result = pool.run("stub", "fail", {})
+
+        assert result.ok is False
+        assert result.error_type == "ValueError"
+        assert "bad frame" in result.error
+        assert pool.run("stub", "echo", {}).result["pid"] == pid
+
+    def test_progress_relayed_to_caller(self, pool) -> None:
+        """Progress callbacks fire in the calling process."""
+        calls = []
+
+        result = pool.run(
+            "stub",
+            "progress",
+            {},
+            progress_callback=lambda current, total: calls.append((current, total)),
+        )
+
+        assert result.ok is True
+        assert calls == [(1, 3), (2, 3), (3, 3)]
+
+    def test_hard_timeout_kills_worker(self, pool) -> None:
+        """A call over its timeout kills the worker; the next call gets a new one."""
+        pid = pool.run("stub", "echo", {}).result["pid"]
+
+        result = pool.run("stub", "sleep", {"seconds": 30}, timeout_seconds=0.5)
+
+        assert result.ok is False
+        assert result.error_type == "TimeoutError"
+        assert pool.run("stub", "echo", {}).result["pid"] != pid
+
+    def test_crashed_worker_is_replaced(self, pool) -> None:
+        """A worker dying mid-call is reported and replaced."""
+        result = pool.run("stub", "segfault", {})
+
+        assert result.ok is False
+        assert result.error_type == "WorkerCrashed"
+        assert pool.run("stub", "echo", {}).ok is True
+
+    def test_worker_recycled_after_max_calls(self, pool) -> None:
+        """Workers retire after max_calls_per_worker calls."""
+        pids = [pool.run("stub", "echo", {}).result["pid"] for _ in range(4)]
+
+        assert pids[0] == pids[1] == pids[2]
+        assert pids[3] != pids[0]
+        assert pool.recycled == 1
+
+    def test_unknown_plugin_returns_error(self, pool) -> None:
+        """Plugins not loaded in the worker return a ValueError result."""
+        result = pool.run("missing", "echo", {})
+
+        assert result.ok is False
+        assert result.error_type == "ValueError"
+
+    def test_run_after_shutdown_raises(self) -> None:
+        """A shut-down pool refuses new calls."""
+        pool = PluginProcessPool(
+            size=1, plugin_loader=_load_test_plugins, mp_context="fork"
+        )
+        pool.shutdown()
+
+        with pytest.raises(RuntimeError):
+            pool.run("stub", "echo", {})
+
+    def test_raising_progress_callback_aborts_call(self, pool) -> None:
+        """A raising progress callback aborts the call and replaces the worker."""
+        pid = pool.run("stub", "echo", {}).result["pid"]
+
+        def cancel(current, total):
+            raise RuntimeError("cancelled")
+
+        result = pool.run("stub", "progress", {}, progress_callback=cancel)
+
+        assert result.ok is False
+        assert result.error_type == "RuntimeError"
+        assert pool.run("stub", "echo", {}).result["pid"] != pid
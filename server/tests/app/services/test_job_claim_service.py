@@ -0,0 +1,202 @@
+"""Tests for JobClaimService batch claims (v0.16.0)."""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.models.job import Job, JobStatus
+from app.models.job_tool import JobTool
+from app.services.job_claim_service import JobClaimService
+from app.services.job_tools_service import JobToolsService
+
+BASE_TIME = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _add_job(session, job_type="image", tools=("detect",), age=0, status=None):
+    job_id = uuid4()
+    session.add(
+        Job(
+            job_id=job_id,
+            status=status or JobStatus.pending,
+            plugin_id="yolo",
+            input_path=f"{job_type}/input/{job_id}",
+            job_type=job_type,
+            created_at=BASE_TIME + timedelta(seconds=age),
+        )
+    )
+    session.flush()
+    for order, tool in enumerate(tools):
+        session.add(JobTool(job_id=job_id, tool_id=tool, tool_order=order))
+    session.commit()
+    return str(job_id)
+
+
+def _status(session, job_id):
+    session.rollback()
+    return session.query(Job).filter(Job.job_id == job_id).first().status
+
+
+@pytest.mark.unit
+def test_claims_oldest_jobs_with_tools(session):
+    """Up to `limit` oldest pending jobs are claimed with their tools."""
+    newest = _add_job(session, age=30)
+    oldest = _add_job(session, tools=("detect", "track"), age=10)
+    middle = _add_job(session, age=20)
+    _add_job(session, age=0, status=JobStatus.completed)
+
+    claimed = JobClaimService.claim_pending_jobs(session, limit=2)
+
+    assert [str(c.job.job_id) for c in claimed] == [oldest, middle]
+    assert claimed[0].tools == ["detect", "track"]
+    assert claimed[1].tools == ["detect"]
+    assert all(c.job.status == JobStatus.running for c in claimed)
+    assert _status(session, oldest) == JobStatus.running
+    assert _status(session, newest) == JobStatus.pending
+
+
+@pytest.mark.unit
+def test_claimed_jobs_are_not_claimed_twice(session):
+    """A second claim only sees jobs that are still pending."""
+    first = _add_job(session, age=0)
+    second = _add_job(session, age=1)
+
+    batch_one = JobClaimService.claim_pending_jobs(session, limit=1)
+    batch_two = JobClaimService.claim_pending_jobs(session, limit=5)
+
+    assert [str(c.job.job_id) for c in batch_one] == [first]
+    assert [str(c.job.job_id) for c in batch_two] == [second]
+    assert JobClaimService.claim_pending_jobs(session, limit=5) == []
+
+
+@pytest.mark.unit
+def test_type_limits_cap_job_types(session):
+    """type_limits caps per-type claims; unlisted types fill the rest."""
+    video_a = _add_job(session, job_type="video", age=0)
+    video_b = _add_job(session, job_type="video", age=1)
+    image = _add_job(session, job_type="image", age=2)
+    _add_job(session, job_type="video_multi", age=3)
+
+    claimed = JobClaimService.claim_pending_jobs(
+        session, limit=5, type_limits={"video": 1, "video_multi": 0}
+    )
+
+    assert [str(c.job.job_id) for c in claimed] == [video_a, image]
+    assert _status(session, video_b) == JobStatus.pending
+
+
+@pytest.mark.unit
+def test_zero_limit_claims_nothing(session):
+    """limit <= 0 never touches the database."""
+    job_id = _add_job(session)
+
+    assert JobClaimService.claim_pending_jobs(session, limit=0) == []
+    assert _status(session, job_id) == JobStatus.pending
+
+
+@pytest.mark.unit
+def test_get_tools_for_jobs_batches_lookup(session):
+    """get_tools_for_jobs returns ordered tools keyed by job_id."""
+    job_a = _add_job(session, tools=("b_tool", "a_tool"))
+    job_b = _add_job(session, tools=("ocr",))
+
+    tools = JobToolsService.get_tools_for_jobs(session, [job_a, job_b])
+
+    assert tools == {job_a: ["b_tool", "a_tool"], job_b: ["ocr"]}
+    assert JobToolsService.get_tools_for_jobs(session, []) == {}
+
+
+@pytest.mark.unit
+def test_higher_priority_claimed_first(session):
+    """Without a scheduler, priority wins over age."""
+    old = _add_job(session, age=0)
+    urgent = _add_job(session, age=10)
+    session.query(Job).filter(Job.job_id == urgent).update({"priority": 5})
+    session.commit()
+
+    claimed = JobClaimService.claim_pending_jobs(session, limit=1)
+
+    assert [str(c.job.job_id) for c in claimed] == [urgent]
+    assert _status(session, old) == JobStatus.pending
+
+
+@pytest.mark.unit
+def test_scheduler_picks_across_flows(session):
+    """With a scheduler, a newer image job is claimed next to old videos."""
+    from app.workers.fair_share import FairShareScheduler
+
+    videos = [_add_job(session, job_type="video", age=i) for i in range(5)]
+    image = _add_job(session, job_type="image", age=100)
+    scheduler = FairShareScheduler()
+
+    claimed = JobClaimService.claim_pending_jobs(session, limit=2, scheduler=scheduler)
+
+    assert [str(c.job.job_id) for c in claimed] == [videos[0], image]
+    assert claimed[1].tools == ["detect"]
+    assert set(scheduler.flow_tags()) == {("yolo", "video"), ("yolo", "image")}
+
+
+@pytest.fixture
+def lease_queue(tmp_path):
+    from app.services.queue.sqlite_queue import SqliteQueueService
+
+    queue = SqliteQueueService(str(tmp_path / "queue.sqlite3"), max_deliveries=2)
+    yield queue
+    queue.close()
+
+
+@pytest.mark.unit
+def test_claim_from_queue_claims_and_acks(session, lease_queue):
+    """Queued jobs are claimed by job_id and removed from the queue."""
+    first = _add_job(session, age=0)
+    second = _add_job(session, tools=("detect", "track"), age=10)
+    unqueued = _add_job(session, age=5)
+    lease_queue.enqueue(first, plugin_id="yolo", job_type="image")
+    lease_queue.enqueue(second, plugin_id="yolo", job_type="image", priority=1)
+
+    claimed = JobClaimService.claim_from_queue(session, lease_queue, limit=5)
+
+    assert [str(c.job.job_id) for c in claimed] == [second, first]
+    assert claimed[0].tools == ["detect", "track"]
+    assert lease_queue.size() == 0
+    assert _status(session, unqueued) == JobStatus.pending
+
+
+@pytest.mark.unit
+def test_claim_from_queue_drops_jobs_no_longer_pending(session, lease_queue):
+    """Entries of cancelled jobs are acked without being claimed."""
+    job_id = _add_job(session, status=JobStatus.cancelled)
+    lease_queue.enqueue(job_id, plugin_id="yolo", job_type="image")
+
+    assert JobClaimService.claim_from_queue(session, lease_queue, limit=1) == []
+    assert lease_queue.size() == 0
+    assert _status(session, job_id) == JobStatus.cancelled
+
+
+@pytest.mark.unit
+def test_claim_from_queue_dead_letters_unclaimable_job(
+    session, lease_queue, monkeypatch
+):
+    """A pending job whose claim keeps failing is dead-lettered and failed."""
+    job_id = _add_job(session)
+    lease_queue.enqueue(job_id, plugin_id="yolo", job_type="image")
+    monkeypatch.setattr(JobClaimService, "claim_jobs", lambda db, ids, lease=None: [])
+    monkeypatch.setattr("app.services.job_claim_service.QUEUE_RETRY_DELAY_SECONDS", 0.0)
+
+    JobClaimService.claim_from_queue(session, lease_queue, limit=1)
+    assert _status(session, job_id) == JobStatus.pending
+    JobClaimService.claim_from_queue(session, lease_queue, limit=1)
+
+    assert _status(session, job_id) == JobStatus.failed
+    assert [e.job_id for e in lease_queue.dead_letters()] == [job_id]
+
+
+@pytest.mark.unit
+def test_enqueue_pending_backfills_queue(session, lease_queue):
+    """enqueue_pending() queues every pending job once."""
+    pending = _add_job(session)
+    _add_job(session, status=JobStatus.completed)
+
+    assert JobClaimService.enqueue_pending(session, lease_queue) == 1
+    assert JobClaimService.enqueue_pending(session, lease_queue) == 1
+    assert [e.job_id for e in lease_queue.peek_ready(per_flow_limit=5)] == [pending]
@@ -0,0 +1,162 @@
+"""Tests for JobLeaseService - running-job leases (v0.16.0)."""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.models.job import Job, JobStatus
+from app.services.job_claim_service import JobClaimService
+from app.services.job_lease_service import JobLease, JobLeaseService
+
+LEASE = JobLease(owner="host:1", seconds=60.0)
+
+
+def _add_job(session, status=JobStatus.pending, **fields):
+    job_id = uuid4()
+    session.add(
+        Job(
+            job_id=job_id,
+            status=status,
+            plugin_id="yolo",
+            input_path=f"video/input/{job_id}",
+            job_type="video",
+            **fields,
+        )
+    )
+    session.commit()
+    return str(job_id)
+
+
+def _job(session, job_id):
+    session.rollback()
+    return session.query(Job).filter(Job.job_id == job_id).first()
+
+
+@pytest.mark.unit
+def test_claim_takes_lease_and_counts_attempts(session):
+    """Claiming with a lease records owner, deadline and attempts."""
+    job_id = _add_job(session)
+    before = datetime.utcnow()
+
+    JobClaimService.claim_pending_jobs(session, limit=1, lease=LEASE)
+
+    job = _job(session, job_id)
+    assert job.lease_owner == "host:1"
+    assert job.lease_expires_at >= before + timedelta(seconds=59)
+    assert job.attempts == 1
+
+
+@pytest.mark.unit
+def test_renew_only_extends_own_running_jobs(session):
+    """Leases held by other workers or on finished jobs are not renewed."""
+    past = datetime.utcnow() - timedelta(seconds=5)
+    mine = _add_job(
+        session, JobStatus.running, lease_owner="host:1", lease_expires_at=past
+    )
+    theirs = _add_job(
+        session, JobStatus.running, lease_owner="host:2", lease_expires_at=past
+    )
+    done = _add_job(
+        session, JobStatus.completed, lease_owner="host:1", lease_expires_at=past
+    )
+
+    renewed = JobLeaseService.renew(session, [mine, theirs, done], LEASE)
+
+    assert renewed == [mine]
+    assert _job(session, mine).lease_expires_at > datetime.utcnow()
+    assert _job(session, theirs).lease_expires_at == past
+
+
+@pytest.mark.unit
+def test_reap_requeues_expired_and_fails_exhausted(session):
+    """Expired leases are requeued, or failed once attempts are used up."""
+    past = datetime.utcnow() - timedelta(seconds=5)
+    future = datetime.utcnow() + timedelta(seconds=60)
+    retry = _add_job(
+        session,
+        JobStatus.running,
+        lease_owner="host:2",
+        lease_expires_at=past,
+        attempts=1,
+        ray_future_id="ObjectRef(1)",
+    )
+    exhausted = _add_job(
+        session,
+        JobStatus.running,
+        lease_owner="host:2",
+        lease_expires_at=past,
+        attempts=3,
+    )
+    alive = _add_job(
+        session, JobStatus.running, lease_owner="host:3", lease_expires_at=future
+    )
+    unleased = _add_job(session, JobStatus.running)
+
+    reaped = JobLeaseService.reap_expired(session, max_attempts=3)
+
+    assert reaped.requeued == [retry]
+    assert reaped.failed == [exhausted]
+    job = _job(session, retry)
+    assert job.status == JobStatus.pending
+    assert (job.lease_owner, job.lease_expires_at, job.ray_future_id) == (
+        None,
+        None,
+        None,
+    )
+    failed = _job(session, exhausted)
+    assert failed.status == JobStatus.failed
+    assert failed.error_message == "Lease expired after 3 attempt(s)"
+    assert _job(session, alive).status == JobStatus.running
+    assert _job(session, unleased).status == JobStatus.running
+
+
+@pytest.mark.unit
+def test_reap_at_startup_includes_unleased_jobs(session):
+    """include_unleased requeues RUNNING jobs claimed without a lease."""
+    unleased = _add_job(session, JobStatus.running)
+
+    reaped = JobLeaseService.reap_expired(session, include_unleased=True)
+
+    assert reaped.requeued == [unleased]
+    assert _job(session, unleased).status == JobStatus.pending
+
+
+@pytest.mark.unit
+def test_adopt_expired_takes_over_detached_executions(session):
+    """Expired jobs running in an execution actor are leased, not reaped."""
+    past = datetime.utcnow() - timedelta(seconds=5)
+    detached = _add_job(
+        session,
+        JobStatus.running,
+        lease_owner="host:2",
+        lease_expires_at=past,
+        ray_future_id="forgesyte-exec-1",
+        attempts=1,
+    )
+    plain = _add_job(
+        session,
+        JobStatus.running,
+        lease_owner="host:2",
+        lease_expires_at=past,
+        ray_future_id="ObjectRef(1)",
+    )
+    live = _add_job(
+        session,
+        JobStatus.running,
+        lease_owner="host:2",
+        lease_expires_at=datetime.utcnow() + timedelta(seconds=60),
+        ray_future_id="forgesyte-exec-2",
+    )
+
+    adopted = JobLeaseService.adopt_expired(session, LEASE, "forgesyte-exec-")
+
+    assert adopted == [(detached, "forgesyte-exec-1")]
+    job = _job(session, detached)
+    assert (job.lease_owner, job.attempts) == ("host:1", 1)
+    assert _job(session, plain).lease_owner == "host:2"
+    assert _job(session, live).lease_owner == "host:2"
+
+    JobLeaseService.release(session, [detached], LEASE)
+    reaped = JobLeaseService.reap_expired(session, max_attempts=3)
+    assert sorted(reaped.requeued) == sorted([detached, plain])
@@ -0,0 +1,155 @@
+"""Tests for SqliteQueueService - durable lease queue (v0.16.0)."""
+
+import time
+from uuid import uuid4
+
+import pytest
+
+from app.services.queue.base import QueueEntry
+from app.services.queue.sqlite_queue import SqliteQueueService
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = SqliteQueueService(
+        str(tmp_path / "queue.sqlite3"), visibility_timeout=30.0, max_deliveries=2
+    )
+    yield queue
+    queue.close()
+
+
+@pytest.mark.unit
+class TestSqliteQueueService:
+    """Tests for SqliteQueueService."""
+
+    def test_enqueue_is_idempotent(self, queue) -> None:
+        """Enqueueing the same job twice keeps one entry."""
+        job_id = str(uuid4())
+
+        queue.enqueue(job_id, plugin_id="yolo", job_type="image")
+        queue.enqueue(job_id, plugin_id="yolo", job_type="image")
+
+        assert queue.size() == 1
+
+    def test_enqueue_rejects_invalid_job_id(self, queue) -> None:
+        """Job IDs must be UUIDs."""
+        with pytest.raises(ValueError):
+            queue.enqueue("not-a-uuid")
+
+    def test_dequeue_by_priority_then_age(self, queue) -> None:
+        """dequeue() returns the highest priority, then oldest, entry."""
+        low, high = str(uuid4()), str(uuid4())
+        queue.enqueue(low, plugin_id="a", priority=0)
+        queue.enqueue(high, plugin_id="b", priority=5)
+
+        assert queue.dequeue() == high
+        assert queue.dequeue() == low
+        assert queue.dequeue() is None
+
+    def test_peek_ready_limits_per_flow(self, queue) -> None:
+        """peek_ready() returns at most per_flow_limit entries per flow."""
+        queue.enqueue_many(
+            [QueueEntry(str(uuid4()), "yolo", "image") for _ in range(3)]
+            + [QueueEntry(str(uuid4()), "yolo", "video")]
+        )
+
+        ready = queue.peek_ready(per_flow_limit=2)
+
+        assert sorted(e.job_type for e in ready) == ["image", "image", "video"]
+
+    def test_leased_entries_are_hidden_until_timeout(self, queue) -> None:
+        """Leased entries are invisible and are redelivered after expiry."""
+        job_id = str(uuid4())
+        queue.enqueue(job_id)
+
+        assert [e.job_id for e in queue.lease([job_id], "w1", 0.05)] == [job_id]
+        assert queue.lease([job_id], "w2") == []
+        assert queue.peek_ready(per_flow_limit=10) == []
+
+        time.sleep(0.1)
+        redelivered = queue.lease([job_id], "w2")
+        assert redelivered[0].deliveries == 2
+
+    def test_ack_removes_entry(self, queue) -> None:
+        """Acked entries leave the queue."""
+        job_id = str(uuid4())
+        queue.enqueue(job_id)
+        queue.lease([job_id], "w1")
+
+        queue.ack([job_id])
+
+        assert queue.size() == 0
+
+    def test_nack_requeues_then_dead_letters(self, queue) -> None:
+        """nack() requeues until max_deliveries, then dead-letters."""
+        job_id = str(uuid4())
+        queue.enqueue(job_id)
+
+        queue.lease([job_id], "w1")
+        assert queue.nack(job_id, "conflict") is False
+        queue.lease([job_id], "w1")
+        assert queue.nack(job_id, "conflict again") is True
+
+        assert queue.size() == 0
+        dead = queue.dead_letters()
+        assert [e.job_id for e in dead] == [job_id]
+        assert dead[0].last_error == "conflict again"
+
+        assert queue.requeue_dead_letter(job_id) is True
+        assert queue.dequeue() == job_id
+
+    def test_entries_survive_reopen(self, queue, tmp_path) -> None:
+        """Entries are persisted to disk."""
+        job_id = str(uuid4())
+        queue.enqueue(job_id, plugin_id="yolo", job_type="video", priority=3)
+
+        reopened = SqliteQueueService(str(tmp_path / "queue.sqlite3"))
+        try:
+            entry = reopened.peek_ready(per_flow_limit=1)[0]
+        finally:
+            reopened.close()
+
+        assert (entry.job_id, entry.plugin_id, entry.priority) == (job_id, "yolo", 3)
+
+
+@pytest.mark.unit
+class TestQueueFactory:
+    """Tests for the queue backend selection."""
+
+    def test_sqlite_is_the_default_backend(self, tmp_path, monkeypatch) -> None:
+        """Without FORGESYTE_QUEUE_BACKEND, submitted jobs go to the queue."""
+        from app.services.queue.factory import (
+            enqueue_submitted_job,
+            get_queue_service,
+            reset_queue_factory_state,
+        )
+        from app.settings import AppSettings
+
+        monkeypatch.delenv("FORGESYTE_QUEUE_BACKEND", raising=False)
+        settings = AppSettings(FORGESYTE_QUEUE_PATH=str(tmp_path / "q.sqlite3"))
+        job_id = str(uuid4())
+        try:
+            enqueue_submitted_job(settings, job_id, "yolo", "image", priority=2)
+            queue = get_queue_service(settings)
+            assert isinstance(queue, SqliteQueueService)
+            assert queue.peek_ready(per_flow_limit=1)[0].priority == 2
+        finally:
+            reset_queue_factory_state()
+
+    def test_relative_queue_path_resolves_against_server_dir(self) -> None:
+        """A relative queue path does not depend on the working directory."""
+        from app.services.queue.factory import SERVER_DIR, resolve_queue_path
+
+        assert resolve_queue_path("data/queue.sqlite3") == str(
+            SERVER_DIR / "data" / "queue.sqlite3"
+        )
+        assert (SERVER_DIR / "app").is_dir()
+
+    def test_database_backend_disables_queue(self, monkeypatch) -> None:
+        """FORGESYTE_QUEUE_BACKEND=database keeps table scanning."""
+        from app.services.queue.factory import get_queue_service
+        from app.settings import AppSettings
+
+        monkeypatch.setenv("FORGESYTE_QUEUE_BACKEND", "database")
+
+        assert get_queue_service(AppSettings()) is None
@@ -4,7 +4,8 @@ from io import BytesIO
 
 import pytest
 
-from app.services.storage.local_storage import BASE_DIR, LocalStorageService
+from app.services.storage import local_storage
+from app.services.storage.local_storage import LocalStorageService
 
 
 @pytest.mark.unit
@@ -18,7 +19,7 @@ def test_local_storage_save_file():
 
     assert result is not None
     assert "video1.mp4" in result
-    full_path = BASE_DIR / result
+    full_path = local_storage.BASE_DIR / result
     assert full_path.exists()
     assert full_path.read_bytes() == contents
 
@@ -56,7 +57,7 @@ def test_local_storage_delete_file():
 
     storage.delete_file("test_videos/video3.mp4")
 
-    full_path = BASE_DIR / saved_path
+    full_path = local_storage.BASE_DIR / saved_path
     assert not full_path.exists()
 
 
@@ -78,6 +79,34 @@ def test_local_storage_creates_directories():
 
     result = storage.save_file(src, "deeply/nested/path/video.mp4")
 
-    full_path = BASE_DIR / result
+    full_path = local_storage.BASE_DIR / result
     assert full_path.exists()
     assert full_path.parent.exists()
+
+
+@pytest.mark.unit
+def test_local_storage_save_file_copies_in_chunks():
+    """v0.16.0: Large sources are copied in bounded chunks, atomically."""
+    from app.services.storage.local_storage import COPY_CHUNK_BYTES
+
+    contents = b"x" * (COPY_CHUNK_BYTES * 2 + 10)
+    src = BytesIO(contents)
+    read_sizes = []
+    original_read = src.read
+
+    def read(size=-1):
+        read_sizes.append(size)
+        return original_read(size)
+
+    src.read = read
+    storage = LocalStorageService()
+
+    result = storage.save_file(src, "test_videos/chunked.mp4")
+
+    full_path = local_storage.BASE_DIR / result
+    try:
+        assert full_path.read_bytes() == contents
+        assert read_sizes and all(0 < size <= COPY_CHUNK_BYTES for size in read_sizes)
+        assert not list(full_path.parent.glob(".chunked.mp4.*.part"))
+    finally:
+        full_path.unlink(missing_ok=True)
@@ -0,0 +1,96 @@
+"""Tests for DiskCache - node-local cache of remote files (v0.16.0)."""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from app.services.storage.disk_cache import DiskCache
+
+
+def _writer(content: bytes, calls: list):
+    def fill(dest: Path) -> None:
+        calls.append(dest)
+        dest.write_bytes(content)
+
+    return fill
+
+
+@pytest.mark.unit
+def test_miss_fills_once_then_hits(tmp_path):
+    """The first open fills the entry; later opens reuse it."""
+    cache = DiskCache(tmp_path / "cache", max_bytes=1024)
+    calls: list = []
+
+    with cache.open("video/input/a.mp4", _writer(b"abc", calls), ".mp4") as path:
+        assert path.read_bytes() == b"abc"
+        assert path.suffix == ".mp4"
+    with cache.open("video/input/a.mp4", _writer(b"xyz", calls), ".mp4") as again:
+        assert again == path
+        assert again.read_bytes() == b"abc"
+
+    assert len(calls) == 1
+
+
+@pytest.mark.unit
+def test_failed_fill_leaves_no_entry(tmp_path):
+    """A fill that raises leaves neither the entry nor its temp file."""
+    cache = DiskCache(tmp_path / "cache", max_bytes=1024)
+
+    def broken(dest: Path) -> None:
+        dest.write_bytes(b"partial")
+        raise OSError("connection reset")
+
+    with pytest.raises(OSError):
+        with cache.open("key", broken):
+            pass
+
+    assert cache.size_bytes == 0
+    assert not [
+        p for p in (tmp_path / "cache").iterdir() if not p.name.endswith(".lock")
+    ]
+
+
+@pytest.mark.unit
+def test_concurrent_opens_download_once(tmp_path):
+    """Callers racing on a missing entry wait for a single fill."""
+    cache = DiskCache(tmp_path / "cache", max_bytes=1024)
+    calls: list = []
+
+    def slow_fill(dest: Path) -> None:
+        calls.append(dest)
+        time.sleep(0.05)
+        dest.write_bytes(b"video")
+
+    def read(results: list) -> None:
+        with cache.open("key", slow_fill) as path:
+            results.append(path.read_bytes())
+
+    results: list = []
+    threads = [threading.Thread(target=read, args=(results,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [b"video"] * 4
+    assert len(calls) == 1
+
+
+@pytest.mark.unit
+def test_evicts_least_recently_used_unpinned(tmp_path):
+    """Over budget, the oldest entry not in use is deleted."""
+    cache = DiskCache(tmp_path / "cache", max_bytes=10)
+    with cache.open("old", _writer(b"1234", [])) as old:
+        pass
+    os.utime(old, (1, 1))
+    with cache.open("pinned", _writer(b"1234", [])) as pinned:
+        os.utime(pinned, (0, 0))
+        with cache.open("new", _writer(b"1234", [])) as new:
+            assert new.exists()
+        assert pinned.exists()
+
+    assert not old.exists()
+    assert cache.size_bytes == 8
@@ -119,3 +119,55 @@ class TestResetStorageFactoryState:
         reset_storage_factory_state()
         reset_storage_factory_state()
         assert len(_logged_backends) == 0
+
+
+class TestSharedStorageService:
+    """v0.16.0: One storage service per configuration and process."""
+
+    def setup_method(self):
+        from app.services.storage.factory import reset_storage_factory_state
+
+        reset_storage_factory_state()
+
+    def test_same_configuration_returns_same_instance(self):
+        """Repeated calls reuse the instance (and its client)."""
+        from app.services.storage.factory import get_shared_storage_service
+
+        settings = AppSettings(storage_backend="local")
+
+        assert get_shared_storage_service(settings) is get_shared_storage_service(
+            AppSettings(storage_backend="LOCAL")
+        )
+
+    def test_different_configuration_gets_own_instance(self):
+        """Changing the storage settings builds a new instance."""
+        from app.services.storage.factory import get_shared_storage_service
+
+        with patch("app.services.storage.factory.S3StorageService") as mock_s3_class:
+            mock_s3_class.side_effect = lambda **kwargs: object()
+            first = get_shared_storage_service(
+                AppSettings(storage_backend="s3", s3_bucket_name="a")
+            )
+            second = get_shared_storage_service(
+                AppSettings(storage_backend="s3", s3_bucket_name="b")
+            )
+            again = get_shared_storage_service(
+                AppSettings(storage_backend="s3", s3_bucket_name="a")
+            )
+
+        assert first is not second
+        assert again is first
+        assert mock_s3_class.call_count == 2
+
+    def test_reset_drops_shared_instances(self):
+        """reset_storage_factory_state() forces a rebuild."""
+        from app.services.storage.factory import (
+            get_shared_storage_service,
+            reset_storage_factory_state,
+        )
+
+        settings = AppSettings(storage_backend="local")
+        first = get_shared_storage_service(settings)
+        reset_storage_factory_state()
+
+        assert get_shared_storage_service(settings) is not first
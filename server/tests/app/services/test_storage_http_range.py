@@ -0,0 +1,60 @@
+"""Tests for HTTP Range header parsing (v0.16.0)."""
+
+import pytest
+
+from app.services.storage.http_range import (
+    RangeNotSatisfiableError,
+    accepts_encoding,
+    parse_range_header,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        ("bytes=0-99", (0, 99)),
+        ("bytes=100-", (100, 999)),
+        ("bytes=-100", (900, 999)),
+        ("bytes=900-5000", (900, 999)),
+        ("bytes=-5000", (0, 999)),
+    ],
+)
+def test_single_ranges(header, expected):
+    """Single ranges are clamped to the file size."""
+    assert parse_range_header(header, 1000) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "header", [None, "", "items=0-1", "bytes=0-1,5-6", "bytes=abc", "bytes=5-1"]
+)
+def test_ignored_headers_serve_whole_file(header):
+    """Absent, multi-range and malformed headers are ignored."""
+    assert parse_range_header(header, 1000) is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("header,size", [("bytes=1000-", 1000), ("bytes=-0", 1000)])
+def test_unsatisfiable_ranges(header, size):
+    """Ranges starting past the end raise with the file size."""
+    with pytest.raises(RangeNotSatisfiableError) as exc_info:
+        parse_range_header(header, size)
+    assert exc_info.value.size == size
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        ("gzip, deflate, br", True),
+        ("GZIP;q=0.5", True),
+        ("*", True),
+        ("gzip;q=0", False),
+        ("identity", False),
+        (None, False),
+    ],
+)
+def test_accepts_encoding(header, expected):
+    """v0.16.0: Codings listed with a non-zero q value are accepted."""
+    assert accepts_encoding(header, "gzip") is expected
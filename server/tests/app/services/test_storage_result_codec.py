@@ -0,0 +1,66 @@
+"""Tests for compressed result artifacts (v0.16.0)."""
+
+import gzip
+import json
+from io import BytesIO
+
+import pytest
+
+from app.services.storage.local_storage import LocalStorageService
+from app.services.storage.result_codec import (
+    decode_result,
+    encode_result,
+    iter_decoded,
+    load_result,
+    result_content_encoding,
+    result_path,
+)
+
+RESULT = {"job_id": "abc", "frames": [{"frame_idx": i} for i in range(50)]}
+
+
+@pytest.mark.unit
+class TestResultCodec:
+    """Results are stored as compact gzip JSON and decoded by path."""
+
+    def test_round_trip(self):
+        """Encoded results decode to the same data."""
+        path = result_path("video", "abc")
+
+        assert path == "video/output/abc.json.gz"
+        assert result_content_encoding(path) == "gzip"
+        assert decode_result(encode_result(RESULT), path) == RESULT
+
+    def test_encoded_json_is_compact(self):
+        """No indentation or separator whitespace is stored."""
+        raw = gzip.decompress(encode_result(RESULT))
+
+        assert b" " not in raw
+        assert len(encode_result(RESULT)) < len(json.dumps(RESULT, indent=2))
+
+    def test_plain_json_paths_still_decode(self):
+        """Results written before v0.16.0 are read as plain JSON."""
+        assert result_content_encoding("video/output/abc.json") is None
+        assert decode_result(b'{"a": 1}', "video/output/abc.json") == {"a": 1}
+
+    def test_corrupt_compressed_result_raises_value_error(self):
+        """Bad gzip data surfaces as ValueError, like bad JSON."""
+        with pytest.raises(ValueError):
+            decode_result(b"not gzip", "video/output/abc.json.gz")
+
+    def test_iter_decoded_streams_chunks(self):
+        """Compressed bytes split at any point decompress to the JSON."""
+        encoded = encode_result(RESULT)
+        chunks = [encoded[i : i + 7] for i in range(0, len(encoded), 7)]
+
+        assert json.loads(b"".join(iter_decoded(chunks))) == RESULT
+
+    def test_load_result_from_storage(self):
+        """load_result() reads and decodes a stored artifact."""
+        storage = LocalStorageService()
+        path = result_path("image", "codec-test")
+        storage.save_file(BytesIO(encode_result(RESULT)), path)
+        try:
+            assert load_result(storage, path) == RESULT
+        finally:
+            storage.delete_file(path)
@@ -0,0 +1,171 @@
+"""Tests for StorageRetentionService - storage garbage collection (v0.16.0)."""
+
+import os
+from io import BytesIO
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models.job import Job, JobStatus
+from app.services.storage.local_storage import LocalStorageService
+from app.services.storage_retention_service import (
+    RetentionPolicy,
+    StorageRetentionService,
+    parse_retention_ttls,
+)
+
+NOW = 1_000_000_000.0
+HOUR = 3600.0
+
+
+@pytest.fixture
+def storage(local_storage_dir):
+    return LocalStorageService()
+
+
+def _put(storage, path, age_hours, size=10):
+    storage.save_file(BytesIO(b"x" * size), path)
+    mtime = NOW - age_hours * HOUR
+    os.utime(storage.load_file(path), (mtime, mtime))
+    return path
+
+
+def _add_job(session, status, with_output=True):
+    job_id = str(uuid4())
+    session.add(
+        Job(
+            job_id=job_id,
+            status=status,
+            plugin_id="yolo",
+            input_path=f"video/input/{job_id}.mp4",
+            output_path=f"video/output/{job_id}.json.gz" if with_output else None,
+            job_type="video",
+        )
+    )
+    session.commit()
+    return job_id
+
+
+def _service(test_engine, storage, **policy):
+    return StorageRetentionService(
+        storage, sessionmaker(bind=test_engine), RetentionPolicy(**policy)
+    )
+
+
+@pytest.mark.unit
+def test_parse_retention_ttls():
+    """Prefixes get a trailing slash and hours become seconds."""
+    assert parse_retention_ttls(" video/input=1, image/output/=0.5 ,") == {
+        "video/input/": HOUR,
+        "image/output/": HOUR / 2,
+    }
+    with pytest.raises(ValueError):
+        parse_retention_ttls("video/input")
+    with pytest.raises(ValueError):
+        parse_retention_ttls("video/input=-1")
+
+
+@pytest.mark.unit
+def test_expires_finished_job_files_by_prefix_ttl(test_engine, session, storage):
+    """Old files of finished jobs go; active jobs' files stay at any age."""
+    done = _add_job(session, JobStatus.completed)
+    running = _add_job(session, JobStatus.running)
+    _put(storage, f"video/input/{done}.mp4", age_hours=48)
+    _put(storage, f"video/output/{done}.json.gz", age_hours=2)
+    _put(storage, f"video/input/{running}.mp4", age_hours=48)
+
+    report = _service(
+        test_engine, storage, ttl_seconds={"video/input/": 24 * HOUR}
+    ).run_once(now=NOW)
+
+    assert report.expired == [f"video/input/{done}.mp4"]
+    assert not storage.file_exists(f"video/input/{done}.mp4")
+    assert storage.file_exists(f"video/output/{done}.json.gz")
+    assert storage.file_exists(f"video/input/{running}.mp4")
+
+
+@pytest.mark.unit
+def test_orphans_deleted_after_grace(test_engine, session, storage):
+    """Uploads without a job are deleted only once older than the grace."""
+    old = _put(storage, "video/input/abandoned.mp4", age_hours=30)
+    fresh = _put(storage, "video/input/just-uploaded.mp4", age_hours=1)
+
+    report = _service(test_engine, storage, orphan_grace_seconds=24 * HOUR).run_once(
+        now=NOW
+    )
+
+    assert report.orphaned == [old]
+    assert not storage.file_exists(old)
+    assert storage.file_exists(fresh)
+
+
+@pytest.mark.unit
+def test_checkpoints_follow_their_job(test_engine, session, storage):
+    """Checkpoints of running jobs are kept; those of no job are orphans."""
+    running = _add_job(session, JobStatus.running, with_output=False)
+    kept = _put(storage, f"video/checkpoints/{running}/track/index.json", 48)
+    stale = _put(storage, f"video/checkpoints/{uuid4()}/track/index.json", 48)
+
+    report = _service(test_engine, storage).run_once(now=NOW)
+
+    assert report.orphaned == [stale]
+    assert storage.file_exists(kept)
+
+
+@pytest.mark.unit
+def test_size_budget_evicts_oldest_and_clears_output_path(
+    test_engine, session, storage
+):
+    """Over budget, the oldest finished-job files go and the DB follows."""
+    old = _add_job(session, JobStatus.completed)
+    new = _add_job(session, JobStatus.completed)
+    _put(storage, f"video/output/{old}.json.gz", age_hours=10, size=100)
+    _put(storage, f"video/output/{new}.json.gz", age_hours=1, size=100)
+
+    report = _service(test_engine, storage, max_total_bytes=150).run_once(now=NOW)
+
+    assert report.evicted == [f"video/output/{old}.json.gz"]
+    assert report.freed_bytes == 100
+    assert report.cleared_outputs == [old]
+    session.rollback()
+    jobs = {str(j.job_id): j for j in session.query(Job).all()}
+    assert jobs[old].output_path is None
+    assert jobs[new].output_path == f"video/output/{new}.json.gz"
+
+
+@pytest.mark.unit
+def test_dry_run_reports_without_deleting(test_engine, session, storage):
+    """A dry run reports the same paths but leaves storage and DB alone."""
+    done = _add_job(session, JobStatus.completed)
+    output = _put(storage, f"video/output/{done}.json.gz", age_hours=48)
+
+    report = _service(
+        test_engine, storage, ttl_seconds={"video/output/": HOUR}
+    ).run_once(dry_run=True, now=NOW)
+
+    assert report.dry_run
+    assert report.expired == [output]
+    assert report.cleared_outputs == [done]
+    assert storage.file_exists(output)
+    session.rollback()
+    assert session.query(Job).first().output_path == output
+
+
+@pytest.mark.unit
+def test_deletes_in_batches(test_engine, session, storage, monkeypatch):
+    """Deletes go to delete_files() in batch_size chunks."""
+    for i in range(5):
+        _put(storage, f"image/input/orphan-{i}.png", age_hours=48)
+    calls = []
+    original = storage.delete_files
+    monkeypatch.setattr(
+        storage,
+        "delete_files",
+        lambda paths: (calls.append(len(paths)), original(paths)),
+    )
+
+    _service(test_engine, storage, batch_size=2).run_once(now=NOW)
+
+    assert calls == [2, 2, 1]
+    assert list(storage.list_files("image/")) == []
@@ -89,6 +89,31 @@ class TestS3StorageService:
         assert result == dest_path
         assert s3_storage.file_exists(dest_path)
 
+    def test_save_file_stores_content_encoding(self, s3_storage):
+        """v0.16.0: Compressed results carry Content-Type and -Encoding."""
+        s3_storage.save_file(BytesIO(b"\x1f\x8b"), "video/output/a.json.gz")
+
+        head = s3_storage.client.head_object(
+            Bucket="test-bucket", Key="video/output/a.json.gz"
+        )
+        assert head["ContentType"] == "application/json"
+        assert head["ContentEncoding"] == "gzip"
+
+    def test_list_and_delete_files(self, s3_storage):
+        """v0.16.0: Objects are listed by prefix and deleted in batches."""
+        for name in ("a", "b", "c"):
+            s3_storage.save_file(BytesIO(b"data"), f"image/input/{name}.png")
+        s3_storage.save_file(BytesIO(b"data"), "video/input/v.mp4")
+
+        listed = sorted(f.path for f in s3_storage.list_files("image/"))
+        assert listed == ["image/input/a.png", "image/input/b.png", "image/input/c.png"]
+        assert all(f.size == 4 for f in s3_storage.list_files("image/"))
+
+        with patch("app.services.storage.s3_storage._DELETE_BATCH_SIZE", 2):
+            s3_storage.delete_files(listed + ["image/input/missing.png"])
+
+        assert [f.path for f in s3_storage.list_files()] == ["video/input/v.mp4"]
+
     def test_load_file(self, s3_storage):
         """Test loading a file from S3."""
         contents = b"test video data"
@@ -181,6 +206,19 @@ class TestStorageFactory:
         assert isinstance(storage, S3StorageService)
         assert storage.bucket == "test-bucket"
 
+    @mock_aws
+    def test_s3_client_pool_and_transfer_config(self, s3_env):
+        """v0.16.0: The factory applies pool and multipart settings."""
+        s3_env.s3_max_pool_connections = 64
+        s3_env.s3_transfer_concurrency = 4
+        s3_env.s3_multipart_chunk_mb = 32
+
+        storage = get_storage_service(s3_env)
+
+        assert storage.client.meta.config.max_pool_connections == 64
+        assert storage.transfer_config.max_concurrency == 4
+        assert storage.transfer_config.multipart_chunksize == 32 * 1024 * 1024
+
 
 class TestS3TempFileCleanup:
     """Tests for temp file cleanup on failed downloads (Issue #246)."""
@@ -370,3 +408,140 @@ class TestFileExistsErrorHandling:
         ):
             with pytest.raises(ClientError):
                 s3_storage.file_exists("any.txt")
+
+
+class TestS3DiskCache:
+    """v0.16.0: Read-through disk cache validated by ETag."""
+
+    @pytest.fixture
+    def cached_storage(self, tmp_path):
+        from app.services.storage.disk_cache import DiskCache
+
+        with mock_aws():
+            s3 = boto3.client("s3", region_name="us-east-1")
+            s3.create_bucket(Bucket="test-bucket")
+            storage = S3StorageService(
+                bucket_name="test-bucket",
+                endpoint_url=None,
+                access_key="testing",
+                secret_key="testing",
+                cache=DiskCache(tmp_path / "cache", max_bytes=1024 * 1024),
+            )
+            yield storage
+
+    def test_repeated_opens_download_once(self, cached_storage):
+        """A cached object is served locally after one download."""
+        cached_storage.save_file(BytesIO(b"video"), "video/input/a.mp4")
+
+        with patch.object(
+            cached_storage.client,
+            "get_object",
+            wraps=cached_storage.client.get_object,
+        ) as download:
+            with cached_storage.open_local("video/input/a.mp4") as first:
+                assert first.read_bytes() == b"video"
+            with cached_storage.open_local("video/input/a.mp4") as second:
+                assert second == first
+
+        assert first.suffix == ".mp4"
+        assert first.parent == cached_storage.cache.root
+        assert download.call_count == 1
+
+    def test_repeated_loads_download_once(self, cached_storage):
+        """load_file() reads through the cache and returns private copies."""
+        cached_storage.save_file(BytesIO(b"result"), "video/output/a.json")
+
+        with patch.object(
+            cached_storage.client,
+            "get_object",
+            wraps=cached_storage.client.get_object,
+        ) as download:
+            first = cached_storage.load_file("video/output/a.json")
+            second = cached_storage.load_file("video/output/a.json")
+
+        try:
+            assert download.call_count == 1
+            assert first != second
+            assert first.suffix == ".json"
+            assert first.parent != cached_storage.cache.root
+            # Evicting the cache entry leaves the caller's copy intact
+            cached_storage.cache.max_bytes = 0
+            assert cached_storage.cache.evict() == 1
+            assert first.read_bytes() == second.read_bytes() == b"result"
+        finally:
+            first.unlink(missing_ok=True)
+            second.unlink(missing_ok=True)
+
+    def test_changed_object_is_refetched(self, cached_storage):
+        """A new ETag invalidates the cached copy."""
+        cached_storage.save_file(BytesIO(b"v1"), "video/input/a.mp4")
+        with cached_storage.open_local("video/input/a.mp4") as old:
+            assert old.read_bytes() == b"v1"
+
+        cached_storage.save_file(BytesIO(b"v2"), "video/input/a.mp4")
+        with cached_storage.open_local("video/input/a.mp4") as new:
+            assert new.read_bytes() == b"v2"
+        assert new != old
+
+    def test_missing_key_raises_file_not_found(self, cached_storage):
+        """Missing objects raise FileNotFoundError, as without a cache."""
+        with pytest.raises(FileNotFoundError):
+            with cached_storage.open_local("video/input/missing.mp4"):
+                pass
+        with pytest.raises(FileNotFoundError):
+            cached_storage.load_file("video/input/missing.mp4")
+
+    @mock_aws
+    def test_uncached_open_local_deletes_temp_copy(self, s3_env):
+        """Without a cache, the temp copy is deleted when the context exits."""
+        s3_env.storage_cache_mb = 0
+        storage = get_storage_service(s3_env)
+        storage.save_file(BytesIO(b"video"), "video/input/a.mp4")
+
+        with storage.open_local("video/input/a.mp4") as local_path:
+            assert local_path.read_bytes() == b"video"
+
+        assert storage.cache is None
+        assert not local_path.exists()
+
+    @mock_aws
+    def test_factory_enables_cache(self, s3_env, tmp_path):
+        """The factory attaches the configured disk cache."""
+        s3_env.storage_cache_dir = str(tmp_path / "factory-cache")
+
+        storage = get_storage_service(s3_env)
+
+        assert storage.cache is not None
+        assert storage.cache.root == tmp_path / "factory-cache"
+
+
+class TestS3Streaming:
+    """v0.16.0: Ranged streaming and presigned redirects."""
+
+    def test_iter_bytes_streams_range(self, s3_storage):
+        """iter_bytes fetches only the requested bytes with a ranged GET."""
+        s3_storage.save_file(BytesIO(b"0123456789"), "video/input/a.mp4")
+
+        with patch.object(
+            s3_storage.client, "get_object", wraps=s3_storage.client.get_object
+        ) as get_object:
+            data = b"".join(s3_storage.iter_bytes("video/input/a.mp4", 2, 5))
+
+        assert data == b"23456"
+        assert get_object.call_args.kwargs["Range"] == "bytes=2-6"
+        assert s3_storage.get_size("video/input/a.mp4") == 10
+
+    def test_missing_key_raises_before_streaming(self, s3_storage):
+        """A missing object raises FileNotFoundError, not mid-stream."""
+        with pytest.raises(FileNotFoundError):
+            s3_storage.iter_bytes("video/input/missing.mp4")
+        with pytest.raises(FileNotFoundError):
+            s3_storage.get_size("video/input/missing.mp4")
+
+    def test_redirect_url_makes_no_request(self, s3_storage):
+        """Presigning a redirect URL does not probe the object."""
+        with patch.object(s3_storage.client, "head_object") as head_object:
+            url = s3_storage.get_redirect_url("video/output/a.json", expires_in=60)
+
+        assert "video/output/a.json" in url
+        head_object.assert_not_called()
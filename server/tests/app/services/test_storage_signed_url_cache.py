@@ -0,0 +1,56 @@
+"""Tests for the signed URL cache (v0.16.0)."""
+
+import pytest
+
+from app.services.storage.signed_url_cache import SignedUrlCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestSignedUrlCache:
+    """URLs are reused until their TTL passes."""
+
+    def test_reuses_url_until_ttl(self):
+        """A URL is signed once per TTL window."""
+        clock = FakeClock()
+        cache = SignedUrlCache(ttl_seconds=100, clock=clock)
+        signed = []
+
+        def sign():
+            signed.append(clock.now)
+            return f"url-{len(signed)}"
+
+        assert cache.get("a", sign) == "url-1"
+        clock.now = 99
+        assert cache.get("a", sign) == "url-1"
+        clock.now = 100
+        assert cache.get("a", sign) == "url-2"
+        assert signed == [0.0, 100]
+
+    def test_bounded_to_max_entries(self):
+        """The least recently used URL is dropped first."""
+        cache = SignedUrlCache(ttl_seconds=100, max_entries=2, clock=FakeClock())
+        cache.get("a", lambda: "a1")
+        cache.get("b", lambda: "b1")
+        cache.get("a", lambda: "a2")
+        cache.get("c", lambda: "c1")
+
+        assert cache.get("a", lambda: "a3") == "a1"
+        assert cache.get("b", lambda: "b2") == "b2"
+
+    def test_invalidate(self):
+        """An invalidated path is signed again."""
+        cache = SignedUrlCache(ttl_seconds=100, clock=FakeClock())
+        cache.get("a", lambda: "a1")
+        cache.invalidate("a")
+
+        assert cache.get("a", lambda: "a2") == "a2"
@@ -0,0 +1,81 @@
+"""Tests for VideoCheckpoint - resumable video tools (v0.16.0)."""
+
+import pytest
+
+from app.services.storage.local_storage import LocalStorageService
+from app.services.video_checkpoint_service import VideoCheckpoint
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    monkeypatch.setattr("app.services.storage.local_storage.BASE_DIR", tmp_path)
+    return LocalStorageService()
+
+
+def _frames(start, end):
+    return [{"frame_idx": i, "boxes": [i]} for i in range(start, end)]
+
+
+@pytest.mark.unit
+class TestVideoCheckpoint:
+    """Tests for VideoCheckpoint."""
+
+    def test_segments_flushed_by_frame_range(self, storage) -> None:
+        """Frames are written once a segment's frame range is full."""
+        checkpoint = VideoCheckpoint(storage, "job-1", "track", segment_frames=10)
+        checkpoint.load()
+
+        checkpoint.record(5, _frames(0, 5))
+        assert checkpoint.resume_frame == 0
+        checkpoint.record(12, _frames(5, 12))
+
+        assert checkpoint.resume_frame == 12
+        assert storage.file_exists(
+            "video/checkpoints/job-1/track/frames_00000000_00000012.json"
+        )
+
+    def test_reload_resumes_and_merges(self, storage) -> None:
+        """A re-run resumes after persisted frames and merges them back."""
+        first = VideoCheckpoint(storage, "job-1", "track", segment_frames=10)
+        first.load()
+        first.record(10, _frames(0, 10))
+        first.record(13, _frames(10, 13))
+        first.flush()
+
+        second = VideoCheckpoint(storage, "job-1", "track", segment_frames=10)
+        second.load()
+        assert second.resume_frame == 13
+        second.record(18, _frames(13, 18))
+        merged = second.merge({"total_frames": 20, "frames": _frames(12, 20)})
+
+        assert [f["frame_idx"] for f in merged["frames"]] == list(range(20))
+        assert merged["total_frames"] == 20
+
+    def test_completed_result_and_clear(self, storage) -> None:
+        """Saved tool results are restored, and clear() removes everything."""
+        checkpoint = VideoCheckpoint(storage, "job-1", "track", segment_frames=2)
+        checkpoint.load()
+        checkpoint.record(2, _frames(0, 2))
+        checkpoint.save_result({"frames": _frames(0, 4)})
+
+        reloaded = VideoCheckpoint(storage, "job-1", "track")
+        reloaded.load()
+        assert reloaded.completed_result() == {"frames": _frames(0, 4)}
+
+        reloaded.clear()
+        assert not storage.file_exists(reloaded.index_path)
+        assert not storage.file_exists(
+            "video/checkpoints/job-1/track/frames_00000000_00000002.json"
+        )
+
+    def test_corrupt_index_starts_over(self, storage) -> None:
+        """An unreadable index is ignored."""
+        from io import BytesIO
+
+        storage.save_file(BytesIO(b"{not json"), "video/checkpoints/j/t/index.json")
+        checkpoint = VideoCheckpoint(storage, "j", "t")
+
+        checkpoint.load()
+
+        assert checkpoint.resume_frame == 0
+        assert checkpoint.completed_result() is None
@@ -0,0 +1,129 @@
+"""Tests for priority and weighted fair-share scheduling (v0.16.0)."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.workers.fair_share import (
+    FairShareScheduler,
+    JobCandidate,
+    parse_job_type_weights,
+)
+
+BASE_TIME = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _candidate(job_id, job_type="video", plugin_id="yolo", priority=0, age=0):
+    return JobCandidate(
+        job_id=job_id,
+        plugin_id=plugin_id,
+        job_type=job_type,
+        priority=priority,
+        created_at=BASE_TIME + timedelta(seconds=age),
+    )
+
+
+@pytest.mark.unit
+def test_parse_job_type_weights():
+    """Weight spec parses into floats and rejects non-positive weights."""
+    assert parse_job_type_weights("image=4, video=0.5") == {
+        "image": 4.0,
+        "video": 0.5,
+    }
+    assert parse_job_type_weights("") == {}
+    with pytest.raises(ValueError):
+        parse_job_type_weights("video=0")
+    with pytest.raises(ValueError):
+        parse_job_type_weights("video")
+
+
+@pytest.mark.unit
+def test_single_flow_is_fifo():
+    """Within one flow and priority, jobs are dispatched oldest first."""
+    scheduler = FairShareScheduler()
+    candidates = [_candidate(f"v{i}", age=10 - i) for i in range(3)]
+
+    chosen = scheduler.select(candidates, limit=3)
+
+    assert [c.job_id for c in chosen] == ["v2", "v1", "v0"]
+
+
+@pytest.mark.unit
+def test_image_job_is_not_starved_by_video_burst():
+    """A newer image job is served after at most one video job."""
+    scheduler = FairShareScheduler()
+    videos = [_candidate(f"v{i}", age=i) for i in range(200)]
+    image = _candidate("img", job_type="image", age=500)
+
+    chosen = scheduler.select(videos + [image], limit=2)
+
+    assert [c.job_id for c in chosen] == ["v0", "img"]
+
+
+@pytest.mark.unit
+def test_weights_set_dispatch_share():
+    """A weight-4 flow gets four dispatches per weight-1 dispatch."""
+    scheduler = FairShareScheduler({"image": 4.0, "video": 1.0})
+    videos = [_candidate(f"v{i}", age=i) for i in range(10)]
+    images = [_candidate(f"i{i}", job_type="image", age=i) for i in range(10)]
+
+    chosen = scheduler.select(videos + images, limit=10)
+    types = [c.job_type for c in chosen]
+
+    assert types.count("image") == 8
+    assert types.count("video") == 2
+
+
+@pytest.mark.unit
+def test_priority_beats_fair_share():
+    """Higher priority jobs go first regardless of flow share."""
+    scheduler = FairShareScheduler()
+    candidates = [
+        _candidate("img", job_type="image", age=0),
+        _candidate("urgent", job_type="video", priority=5, age=10),
+    ]
+
+    chosen = scheduler.select(candidates, limit=2)
+
+    assert [c.job_id for c in chosen] == ["urgent", "img"]
+
+
+@pytest.mark.unit
+def test_flows_are_keyed_by_plugin():
+    """Two plugins with the same job type share the worker fairly."""
+    scheduler = FairShareScheduler()
+    busy = [_candidate(f"a{i}", plugin_id="a", age=i) for i in range(5)]
+    quiet = [_candidate("b0", plugin_id="b", age=100)]
+
+    chosen = scheduler.select(busy + quiet, limit=2)
+
+    assert [c.job_id for c in chosen] == ["a0", "b0"]
+
+
+@pytest.mark.unit
+def test_type_limits_respected():
+    """type_limits caps how many jobs of a type are selected."""
+    scheduler = FairShareScheduler()
+    candidates = [_candidate(f"v{i}", age=i) for i in range(3)]
+
+    assert scheduler.select(candidates, limit=3, type_limits={"video": 1}) == [
+        candidates[0]
+    ]
+    assert scheduler.select(candidates, limit=3, type_limits={"video": 0}) == []
+
+
+@pytest.mark.unit
+def test_record_dispatch_carries_share_across_batches():
+    """Charges persist between select() calls; idle flows don't bank credit."""
+    scheduler = FairShareScheduler()
+    video_a = _candidate("v0", age=0)
+    video_b = _candidate("v1", age=1)
+    image = _candidate("img", job_type="image", age=2)
+
+    first = scheduler.select([video_a, video_b, image], limit=1)
+    assert [c.job_id for c in first] == ["v0"]
+    scheduler.record_dispatch(first)
+
+    # Video flow was charged, so the image job goes next
+    second = scheduler.select([video_b, image], limit=1)
+    assert [c.job_id for c in second] == ["img"]
@@ -0,0 +1,158 @@
+"""Tests for cooperative job cancellation in JobWorker (v0.16.0)."""
+
+from contextlib import nullcontext
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models.job import Job, JobStatus
+from app.models.job_tool import JobTool
+from app.workers.job_cancellation import JobCancelledError, job_cancellations
+from app.workers.worker import JobWorker
+
+VIDEO_MANIFEST = {"tools": [{"id": "track", "input_types": ["video"]}]}
+IMAGE_MANIFEST = {"tools": [{"id": "detect", "input_types": ["image_bytes"]}]}
+
+
+def _add_job(session, job_type, tool):
+    job_id = str(uuid4())
+    session.add(
+        Job(
+            job_id=job_id,
+            status=JobStatus.pending,
+            plugin_id="yolo",
+            input_path=f"{job_type}/input/{job_id}",
+            job_type=job_type,
+        )
+    )
+    session.flush()
+    session.add(JobTool(job_id=job_id, tool_id=tool, tool_order=0))
+    session.commit()
+    return job_id
+
+
+def _cancel_in_db(test_engine, job_id):
+    db = sessionmaker(bind=test_engine)()
+    try:
+        db.query(Job).filter(Job.job_id == job_id).update(
+            {"status": JobStatus.cancelled}, synchronize_session=False
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _worker(test_engine, manifest, run_tool, tmp_path):
+    media = tmp_path / "input.bin"
+    media.write_bytes(b"data")
+    storage = MagicMock()
+    storage.open_local.return_value = nullcontext(str(media))
+    plugin_service = MagicMock()
+    plugin_service.get_plugin_manifest.return_value = manifest
+    plugin_service.run_plugin_tool.side_effect = run_tool
+    worker = JobWorker(
+        session_factory=sessionmaker(bind=test_engine),
+        storage=storage,
+        plugin_service=plugin_service,
+    )
+    return worker, storage
+
+
+def _status(session, job_id):
+    session.rollback()
+    return session.query(Job).filter(Job.job_id == job_id).first().status
+
+
+@pytest.mark.unit
+class TestJobCancellation:
+    """Worker behaviour when a running job is cancelled."""
+
+    def test_video_job_stops_within_one_frame(self, test_engine, session, tmp_path):
+        """An in-process cancel stops the plugin loop at the next frame."""
+        job_id = _add_job(session, "video", "track")
+        frames_seen = []
+
+        def run_tool(plugin_id, tool_name, args, progress_callback=None):
+            for frame in range(1, 101):
+                frames_seen.append(frame)
+                if frame == 3:
+                    _cancel_in_db(test_engine, job_id)
+                    job_cancellations.cancel(job_id)
+                progress_callback(frame, 100)
+            return {"frames": []}
+
+        worker, storage = _worker(test_engine, VIDEO_MANIFEST, run_tool, tmp_path)
+
+        assert worker.run_once() is False
+        assert frames_seen == [1, 2, 3]
+        assert _status(session, job_id) == JobStatus.cancelled
+        storage.save_file.assert_not_called()
+        assert not job_cancellations.is_cancelled(job_id)
+
+    def test_cancel_from_other_process_detected_via_db(
+        self, test_engine, session, tmp_path
+    ):
+        """Without the in-process flag, the DB status is picked up."""
+        job_id = _add_job(session, "video", "track")
+
+        def run_tool(plugin_id, tool_name, args, progress_callback=None):
+            _cancel_in_db(test_engine, job_id)
+            progress_callback(1, 100)
+            return {"frames": []}
+
+        worker, storage = _worker(test_engine, VIDEO_MANIFEST, run_tool, tmp_path)
+
+        assert worker.run_once() is False
+        assert _status(session, job_id) == JobStatus.cancelled
+        storage.save_file.assert_not_called()
+
+    def test_wrapped_cancellation_keeps_cancelled_status(
+        self, test_engine, session, tmp_path
+    ):
+        """JobCancelledError wrapped by the plugin sandbox is still a cancel."""
+        job_id = _add_job(session, "video", "track")
+
+        def run_tool(plugin_id, tool_name, args, progress_callback=None):
+            _cancel_in_db(test_engine, job_id)
+            try:
+                progress_callback(1, 100)
+            except JobCancelledError as e:
+                raise Exception(f"Tool execution error: {e}") from None
+            return {"frames": []}
+
+        worker, _ = _worker(test_engine, VIDEO_MANIFEST, run_tool, tmp_path)
+
+        worker.run_once()
+
+        session.rollback()
+        job = session.query(Job).filter(Job.job_id == job_id).first()
+        assert job.status == JobStatus.cancelled
+        assert job.error_message is None
+
+    def test_image_job_cancelled_mid_run_not_completed(
+        self, test_engine, session, tmp_path
+    ):
+        """A job cancelled while its tool ran is not marked completed."""
+        job_id = _add_job(session, "image", "detect")
+
+        def run_tool(plugin_id, tool_name, args, progress_callback=None):
+            _cancel_in_db(test_engine, job_id)
+            return {"boxes": []}
+
+        worker, storage = _worker(test_engine, IMAGE_MANIFEST, run_tool, tmp_path)
+
+        assert worker.run_once() is False
+        assert _status(session, job_id) == JobStatus.cancelled
+        storage.save_file.assert_not_called()
+
+    def test_fail_job_does_not_overwrite_cancel(self, test_engine, session):
+        """_fail_job leaves cancelled jobs alone."""
+        job_id = _add_job(session, "video", "track")
+        _cancel_in_db(test_engine, job_id)
+        worker = JobWorker(session_factory=sessionmaker(bind=test_engine))
+
+        worker._fail_job(job_id, "late Ray failure")
+
+        assert _status(session, job_id) == JobStatus.cancelled
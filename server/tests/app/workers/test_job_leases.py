@@ -0,0 +1,222 @@
+"""Tests for JobLeaseKeeper and lease recovery in JobWorker (v0.16.0)."""
+
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models.job import Job, JobStatus
+from app.models.job_tool import JobTool
+from app.services.job_lease_service import JobLease
+from app.workers.job_cancellation import job_cancellations
+from app.workers.job_leases import JobLeaseKeeper
+from app.workers.worker import JobWorker
+
+
+def _add_job(session, status, **fields):
+    job_id = str(uuid4())
+    session.add(
+        Job(
+            job_id=job_id,
+            status=status,
+            plugin_id="yolo",
+            input_path=f"image/input/{job_id}",
+            job_type="image",
+            **fields,
+        )
+    )
+    session.flush()
+    session.add(JobTool(job_id=job_id, tool_id="detect", tool_order=0))
+    session.commit()
+    return job_id
+
+
+def _job(session, job_id):
+    session.rollback()
+    return session.query(Job).filter(Job.job_id == job_id).first()
+
+
+@pytest.mark.unit
+class TestJobLeaseKeeper:
+    """Tests for JobLeaseKeeper."""
+
+    def test_renews_tracked_jobs(self, test_engine, session):
+        """Tracked jobs get their lease extended."""
+        past = datetime.utcnow() - timedelta(seconds=1)
+        job_id = _add_job(
+            session, JobStatus.running, lease_owner="w1", lease_expires_at=past
+        )
+        keeper = JobLeaseKeeper(
+            sessionmaker(bind=test_engine), JobLease("w1", 60.0), max_attempts=3
+        )
+        keeper.track(job_id)
+
+        assert keeper.renew_once() == []
+        assert _job(session, job_id).lease_expires_at > datetime.utcnow()
+
+    def test_lost_lease_stops_job(self, test_engine, session):
+        """A job requeued elsewhere is flagged so the worker stops it."""
+        job_id = _add_job(session, JobStatus.pending)
+        keeper = JobLeaseKeeper(
+            sessionmaker(bind=test_engine), JobLease("w1", 60.0), max_attempts=3
+        )
+        keeper.track(job_id)
+
+        try:
+            assert keeper.renew_once() == [job_id]
+            assert job_cancellations.is_cancelled(job_id)
+            assert keeper.pop_lost() == [job_id]
+            assert keeper.renew_once() == []
+        finally:
+            job_cancellations.discard(job_id)
+
+    def test_reap_reports_requeued_and_failed_jobs(self, test_engine, session):
+        """Reaped jobs are passed to on_requeued and on_failed."""
+        past = datetime.utcnow() - timedelta(seconds=5)
+        retry = _add_job(
+            session,
+            JobStatus.running,
+            lease_owner="w2",
+            lease_expires_at=past,
+            attempts=1,
+        )
+        exhausted = _add_job(
+            session,
+            JobStatus.running,
+            lease_owner="w2",
+            lease_expires_at=past,
+            attempts=3,
+        )
+        on_requeued, on_failed = MagicMock(), MagicMock()
+        keeper = JobLeaseKeeper(
+            sessionmaker(bind=test_engine),
+            JobLease("w1", 60.0),
+            max_attempts=3,
+            on_requeued=on_requeued,
+            on_failed=on_failed,
+        )
+
+        keeper.reap_once()
+
+        on_requeued.assert_called_once_with([retry])
+        on_failed.assert_called_once_with([exhausted])
+
+    def test_background_thread_renews(self, test_engine, session):
+        """start() renews leases periodically until stop()."""
+        job_id = _add_job(
+            session,
+            JobStatus.running,
+            lease_owner="w1",
+            lease_expires_at=datetime.utcnow(),
+        )
+        keeper = JobLeaseKeeper(
+            sessionmaker(bind=test_engine), JobLease("w1", 0.3), max_attempts=3
+        )
+        keeper.track(job_id)
+
+        keeper.start()
+        try:
+            deadline = datetime.utcnow() + timedelta(seconds=5)
+            while datetime.utcnow() < deadline:
+                expires = _job(session, job_id).lease_expires_at
+                if expires > datetime.utcnow() + timedelta(seconds=0.1):
+                    break
+        finally:
+            keeper.stop()
+
+        assert _job(session, job_id).status == JobStatus.running
+        assert expires > datetime.utcnow()
+
+
+@pytest.mark.unit
+class TestWorkerLeaseRecovery:
+    """JobWorker requeues orphaned RUNNING jobs instead of losing them."""
+
+    def test_restart_requeues_orphaned_ray_job(self, test_engine, session):
+        """A Ray job running before restart is requeued, not failed."""
+        job_id = _add_job(session, JobStatus.running, ray_future_id="ObjectRef(1)")
+
+        JobWorker(session_factory=sessionmaker(bind=test_engine), use_ray=True)
+
+        job = _job(session, job_id)
+        assert job.status == JobStatus.pending
+        assert job.ray_future_id is None
+
+    def test_restart_reattaches_live_ray_execution(self, test_engine, session):
+        """A job whose execution actor survived is awaited, not re-executed."""
+        job_id = _add_job(session, JobStatus.running, attempts=1)
+        name = f"forgesyte-exec-{job_id}"
+        session.query(Job).filter(Job.job_id == job_id).update({"ray_future_id": name})
+        session.commit()
+        actor = MagicMock()
+        actor.result.remote.return_value = "result-ref"
+
+        with (
+            patch("ray.is_initialized", return_value=True),
+            patch("ray.get_actor", return_value=actor) as get_actor,
+        ):
+            worker = JobWorker(
+                session_factory=sessionmaker(bind=test_engine), use_ray=True
+            )
+
+        get_actor.assert_called_once_with(name, namespace="forgesyte")
+        job = _job(session, job_id)
+        assert (job.status, job.attempts) == (JobStatus.running, 1)
+        assert (job.lease_owner, job.ray_future_id) == (worker._lease.owner, name)
+        assert job_id in worker._lease_keeper._held
+
+        worker._take_reattached()
+        assert worker.active_futures == {"result-ref": job_id}
+        meta = worker.job_metadata[job_id]
+        assert (meta["tools_to_run"], meta["execution"]) == (["detect"], actor)
+
+    def test_restart_requeues_job_with_lost_execution(self, test_engine, session):
+        """A job whose execution actor is gone is requeued."""
+        job_id = _add_job(session, JobStatus.running)
+        session.query(Job).filter(Job.job_id == job_id).update(
+            {"ray_future_id": f"forgesyte-exec-{job_id}"}
+        )
+        session.commit()
+
+        with (
+            patch("ray.is_initialized", return_value=True),
+            patch("ray.get_actor", side_effect=ValueError("not found")),
+        ):
+            worker = JobWorker(
+                session_factory=sessionmaker(bind=test_engine), use_ray=True
+            )
+
+        job = _job(session, job_id)
+        assert (job.status, job.ray_future_id) == (JobStatus.pending, None)
+        assert worker._reattached == []
+
+    def test_claimed_job_is_leased_while_running(self, test_engine, session):
+        """Sync jobs are leased to the worker while they run."""
+        job_id = _add_job(session, JobStatus.pending)
+        plugin_service = MagicMock()
+        plugin_service.get_plugin_manifest.return_value = {
+            "tools": [{"id": "detect", "input_types": ["image_bytes"]}]
+        }
+        worker = JobWorker(
+            session_factory=sessionmaker(bind=test_engine),
+            storage=MagicMock(),
+            plugin_service=plugin_service,
+        )
+        seen = {}
+
+        def run_tool(plugin_id, tool_name, args, progress_callback=None):
+            seen["owner"] = _job(session, job_id).lease_owner
+            seen["tracked"] = job_id in worker._lease_keeper._held
+            return {"boxes": []}
+
+        plugin_service.run_plugin_tool.side_effect = run_tool
+        worker._storage.open_local.return_value = nullcontext(__file__)
+        worker._storage.save_file.return_value = f"image/output/{job_id}.json"
+
+        assert worker.run_once() is True
+        assert seen == {"owner": worker._lease.owner, "tracked": True}
+        assert job_id not in worker._lease_keeper._held
+        assert _job(session, job_id).attempts == 1
@@ -0,0 +1,96 @@
+"""Tests for event-driven job dispatch (v0.16.0)."""
+
+import threading
+import time
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models.job import Job, JobStatus
+from app.services.queue.sqlite_queue import SqliteQueueService
+from app.workers import worker as worker_module
+from app.workers.job_notifier import JobNotifier
+from app.workers.worker import JobWorker
+
+
+@pytest.mark.unit
+def test_notify_before_wait_is_not_lost():
+    """A notification sent while nobody waits wakes the next wait()."""
+    notifier = JobNotifier()
+    notifier.notify()
+
+    assert notifier.wait(timeout=0.01) is True
+    # Event is consumed
+    assert notifier.wait(timeout=0.01) is False
+
+
+@pytest.mark.unit
+def test_notify_wakes_waiting_thread():
+    """notify() from another thread ends wait() early."""
+    notifier = JobNotifier()
+    threading.Timer(0.05, notifier.notify).start()
+
+    start = time.monotonic()
+    assert notifier.wait(timeout=5) is True
+    assert time.monotonic() - start < 2
+
+
+@pytest.mark.unit
+def test_run_forever_backs_off_when_idle(test_engine):
+    """Idle waits double up to IDLE_POLL_MAX_SECONDS and reset on notify."""
+    worker = JobWorker(session_factory=sessionmaker(bind=test_engine))
+    waits = []
+    notified = iter([False, False, False, False, True, False])
+
+    def fake_wait(timeout):
+        waits.append(timeout)
+        if len(waits) == 6:
+            worker._running = False
+        return next(notified)
+
+    with patch.object(worker_module.job_notifier, "wait", side_effect=fake_wait):
+        with patch.object(worker, "run_once", return_value=False):
+            worker.run_forever()
+
+    assert waits == [0.5, 1.0, 2.0, 4.0, 4.0, 0.5]
+
+
+@pytest.mark.unit
+def test_run_forever_backfills_queue_periodically(test_engine, session, tmp_path):
+    """A pending job missing from the queue is enqueued without a restart."""
+    queue = SqliteQueueService(str(tmp_path / "queue.sqlite3"))
+    worker = JobWorker(
+        queue=queue, session_factory=sessionmaker(bind=test_engine), lease_seconds=1
+    )
+    # Committed after the startup backfill, as if its enqueue had failed
+    job_id = str(uuid4())
+    session.add(
+        Job(
+            job_id=job_id,
+            status=JobStatus.pending,
+            plugin_id="yolo",
+            input_path="image/input/a.png",
+            job_type="image",
+        )
+    )
+    session.commit()
+    assert queue.size() == 0
+    waits = []
+
+    def fake_wait(timeout):
+        waits.append(timeout)
+        worker._backfilled_at -= 1
+        if len(waits) == 2:
+            worker._running = False
+        return False
+
+    try:
+        with patch.object(worker_module.job_notifier, "wait", side_effect=fake_wait):
+            with patch.object(worker, "run_once", return_value=False):
+                worker.run_forever()
+
+        assert [e.job_id for e in queue.peek_ready(per_flow_limit=5)] == [job_id]
+    finally:
+        queue.close()
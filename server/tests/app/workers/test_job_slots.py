@@ -0,0 +1,147 @@
+"""Tests for JobWorker execution slots (v0.16.0)."""
+
+import threading
+from contextlib import nullcontext
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models.job import Job, JobStatus
+from app.models.job_tool import JobTool
+from app.workers.job_slots import JobSlots, parse_slot_quotas
+from app.workers.worker import JobWorker
+
+
+@pytest.mark.unit
+def test_parse_slot_quotas():
+    """Quota spec parses into a job_type -> count dict."""
+    assert parse_slot_quotas("") == {}
+    assert parse_slot_quotas("video=1, video_multi=2") == {
+        "video": 1,
+        "video_multi": 2,
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("raw", ["video", "=1", "video=-1", "video=x"])
+def test_parse_slot_quotas_rejects_malformed(raw):
+    """Malformed quota entries raise ValueError."""
+    with pytest.raises(ValueError):
+        parse_slot_quotas(raw)
+
+
+@pytest.mark.unit
+def test_job_slots_total_limit():
+    """try_acquire fails once all slots are busy."""
+    slots = JobSlots(max_slots=2)
+
+    assert slots.try_acquire("image") is True
+    assert slots.try_acquire("video") is True
+    assert slots.try_acquire("image") is False
+    assert slots.free == 0
+
+    slots.release("image")
+    assert slots.free == 1
+    assert slots.snapshot() == {"video": 1}
+
+
+@pytest.mark.unit
+def test_job_slots_quota_limits_job_type():
+    """A quota caps one job type while others still get slots."""
+    slots = JobSlots(max_slots=3, quotas={"video": 1})
+
+    assert slots.try_acquire("video") is True
+    assert slots.try_acquire("video") is False
+    assert slots.remaining_quotas() == {"video": 0}
+    assert slots.try_acquire("image") is True
+
+    slots.release("video")
+    assert slots.remaining_quotas() == {"video": 1}
+
+
+@pytest.mark.unit
+def test_job_slots_rejects_zero_slots():
+    """max_slots must be at least 1."""
+    with pytest.raises(ValueError):
+        JobSlots(max_slots=0)
+
+
+def _add_job(session, job_type: str) -> str:
+    job_id = str(uuid4())
+    session.add(
+        Job(
+            job_id=job_id,
+            status=JobStatus.pending,
+            plugin_id="test_plugin",
+            input_path=f"{job_type}/input/test.bin",
+            job_type=job_type,
+        )
+    )
+    session.flush()
+    session.add(JobTool(job_id=job_id, tool_id="test_tool", tool_order=0))
+    session.commit()
+    return job_id
+
+
+@pytest.mark.unit
+def test_worker_runs_jobs_in_parallel_slots(test_engine, session):
+    """With max_slots=2, a blocked video job does not hold up an image job."""
+    Session = sessionmaker(bind=test_engine)
+    video_started = threading.Event()
+    release_video = threading.Event()
+
+    def run_tool(plugin_id, tool_name, args, progress_callback=None):
+        if "video_path" in args:
+            video_started.set()
+            release_video.wait(timeout=10)
+            return {"frames": [], "total_frames": 0}
+        return {"ok": True}
+
+    mock_storage = MagicMock()
+    mock_storage.open_local.side_effect = lambda path: nullcontext(__file__)
+    mock_storage.save_file.side_effect = lambda src, dest_path: dest_path
+    mock_plugin_service = MagicMock()
+    mock_plugin_service.get_plugin_manifest.return_value = {
+        "tools": [{"id": "test_tool", "input_types": ["video", "image_bytes"]}]
+    }
+    mock_plugin_service.run_plugin_tool.side_effect = run_tool
+
+    worker = JobWorker(
+        session_factory=Session,
+        storage=mock_storage,
+        plugin_service=mock_plugin_service,
+        max_slots=2,
+        slot_quotas={"video": 1},
+    )
+
+    video_id = _add_job(session, "video")
+    second_video_id = _add_job(session, "video")
+    image_id = _add_job(session, "image")
+
+    try:
+        assert worker.run_once() is True
+        assert video_started.wait(timeout=10)
+
+        # Video quota is exhausted: the image job is claimed, the 2nd video is not
+        for _ in range(100):
+            session.rollback()
+            image_job = session.query(Job).filter(Job.job_id == image_id).first()
+            if image_job.status == JobStatus.completed:
+                break
+            threading.Event().wait(0.05)
+
+        assert image_job.status == JobStatus.completed
+        session.rollback()
+        second = session.query(Job).filter(Job.job_id == second_video_id).first()
+        assert second.status == JobStatus.pending
+    finally:
+        release_video.set()
+        if worker._executor is not None:
+            worker._executor.shutdown(wait=True)
+
+    session.rollback()
+    video_job = session.query(Job).filter(Job.job_id == video_id).first()
+    assert video_job.status == JobStatus.completed
+    assert worker._slots.busy == 0
@@ -0,0 +1,70 @@
+"""Tests for resource-aware Ray dispatch (v0.16.0)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.workers.ray_capacity import (
+    DEFAULT_TASK_RESOURCES,
+    RayCapacity,
+    TaskResources,
+)
+
+GB = 1024**3
+
+
+@pytest.mark.unit
+def test_task_resources_from_manifest():
+    """The manifest "resources" block sets CPU, GPU and memory."""
+    resources = TaskResources.from_manifest(
+        {"resources": {"num_cpus": 2, "num_gpus": 0.5, "memory_mb": 1024}}
+    )
+
+    assert resources == TaskResources(num_cpus=2.0, num_gpus=0.5, memory=float(GB))
+    assert resources.task_options() == {
+        "num_cpus": 2.0,
+        "num_gpus": 0.5,
+        "memory": float(GB),
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "manifest",
+    [
+        None,
+        {},
+        {"resources": "gpu"},
+        {"resources": {"num_gpus": "x"}},
+        {"resources": {"num_cpus": -1}},
+    ],
+)
+def test_task_resources_defaults(manifest):
+    """Missing or invalid resource blocks fall back to the defaults."""
+    assert TaskResources.from_manifest(manifest) == DEFAULT_TASK_RESOURCES
+
+
+@pytest.mark.unit
+def test_capacity_counts_in_flight_tasks():
+    """Free capacity excludes this worker's tasks not yet visible to Ray."""
+    capacity = RayCapacity(
+        available={"CPU": 8.0, "GPU": 2.0, "memory": 16 * GB},
+        total={"CPU": 8.0, "GPU": 2.0, "memory": 16 * GB},
+        reserved=[TaskResources(num_cpus=1.0, num_gpus=1.0)],
+    )
+
+    assert capacity.max_jobs() == 7
+    gpu_task = TaskResources(num_cpus=1.0, num_gpus=0.5)
+    assert capacity.max_jobs(gpu_task) == 2
+
+    capacity.reserve(gpu_task)
+    assert capacity.max_jobs(gpu_task) == 1
+
+
+@pytest.mark.unit
+def test_capacity_from_cluster_unavailable():
+    """Unreadable cluster resources yield None (fixed fallback concurrency)."""
+    ray = MagicMock()
+    ray.available_resources.side_effect = RuntimeError("not initialized")
+
+    assert RayCapacity.from_cluster(ray) is None
@@ -0,0 +1,93 @@
+"""Tests for progress reporting from Ray tasks (v0.16.0)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.workers.ray_progress import ProgressBuffer, RayProgressReporter
+from app.workers.worker import JobWorker
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+def test_progress_buffer_keeps_latest_and_drains():
+    """Only the latest report per job is kept until drained."""
+    buffer = ProgressBuffer()
+    buffer.report("a", 1, 10)
+    buffer.report("a", 5, 10)
+    buffer.report("b", 2, 4)
+
+    assert buffer.drain() == {"a": (5, 10), "b": (2, 4)}
+    assert buffer.drain() == {}
+
+
+@pytest.mark.unit
+def test_reporter_throttles_frames():
+    """Per-frame callbacks become one actor call per interval (plus final)."""
+    actor = MagicMock()
+    clock = FakeClock()
+    reporter = RayProgressReporter(actor, "job-1", interval_seconds=1.0, clock=clock)
+    cb = reporter.callback(tool_index=0, num_tools=1, default_total=100)
+
+    for frame in range(1, 101):
+        clock.now = frame * 0.1
+        cb(frame)
+
+    sent = [c.args for c in actor.report.remote.call_args_list]
+    assert sent[0] == ("job-1", 1, 100, 0)
+    assert sent[-1] == ("job-1", 100, 100, 0)
+    assert len(sent) <= 12
+
+
+@pytest.mark.unit
+def test_worker_drains_progress_into_update_path():
+    """Drained progress of in-flight jobs goes through _update_job_progress."""
+    worker = JobWorker(storage=MagicMock(), plugin_service=MagicMock())
+    worker._session_factory = lambda: MagicMock()
+    worker._progress_actor = MagicMock()
+    worker.active_futures = {"ref": "running-job"}
+    worker._update_job_progress = MagicMock()
+
+    ray = MagicMock()
+    ray.get.return_value = {"running-job": (50, 200), "finished-job": (10, 10)}
+
+    worker._drain_ray_progress(ray)
+
+    worker._update_job_progress.assert_called_once()
+    assert worker._update_job_progress.call_args.args[:3] == ("running-job", 50, 200)
+
+
+@pytest.mark.unit
+def test_progress_buffer_sums_frame_range_parts():
+    """Chunked jobs report per range; drain returns the job total."""
+    buffer = ProgressBuffer()
+    buffer.report("a", 5, 10, part=0)
+    buffer.report("a", 2, 10, part=1)
+    assert buffer.drain() == {"a": (7, 20)}
+
+    buffer.report("a", 10, 10, part=1)
+    assert buffer.drain() == {"a": (15, 20)}
+
+    buffer.forget("a")
+    assert buffer.drain() == {}
+
+
+@pytest.mark.unit
+def test_range_callback_counts_from_offset():
+    """Range tasks report absolute frames; progress counts from the offset."""
+    actor = MagicMock()
+    reporter = RayProgressReporter(actor, "job-1", part=2)
+    cb = reporter.callback(0, 1, default_total=10, frame_offset=100)
+
+    cb(105, total=5000)
+
+    actor.report.remote.assert_called_once_with("job-1", 5, 10, 2)
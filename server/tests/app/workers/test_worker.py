@@ -1,6 +1,8 @@
 """Tests for JobWorker."""
 
+import gzip
 import json
+from contextlib import nullcontext
 from unittest.mock import ANY, MagicMock
 from uuid import uuid4
 
@@ -64,7 +66,9 @@ def test_worker_run_once_marks_job_running(test_engine, session):
     session.commit()
 
     # Setup mock behaviors
-    mock_storage.load_file.return_value = "/data/jobs/video/input/test.mp4"
+    mock_storage.open_local.return_value = nullcontext(
+        "/data/jobs/video/input/test.mp4"
+    )
     mock_storage.save_file.return_value = "video/output/test.json"
     mock_plugin_service.get_plugin_manifest.return_value = {
         "tools": [{"id": "test_tool", "input_types": ["video"]}]
@@ -141,7 +145,9 @@ def test_worker_multiple_run_once_calls(test_engine, session):
     session.commit()
 
     # Setup mock behaviors
-    mock_storage.load_file.return_value = "/data/jobs/video/input/test.mp4"
+    mock_storage.open_local.return_value = nullcontext(
+        "/data/jobs/video/input/test.mp4"
+    )
     mock_storage.save_file.return_value = "video/output/test.json"
     mock_plugin_service.get_plugin_manifest.return_value = {
         "tools": [{"id": "test_tool", "input_types": ["video"]}]
@@ -195,7 +201,9 @@ def test_worker_run_once_executes_pipeline(test_engine, session):
     session.add(job_tool)
     session.commit()
     # Setup mock behaviors
-    mock_storage.load_file.return_value = "/data/jobs/video/input/test.mp4"
+    mock_storage.open_local.return_value = nullcontext(
+        "/data/jobs/video/input/test.mp4"
+    )
     mock_storage.save_file.return_value = "video/output/test.json"
     mock_plugin_service.get_plugin_manifest.return_value = {
         "tools": [{"id": "test_tool", "input_types": ["video"]}]
@@ -251,7 +259,9 @@ def test_worker_run_once_saves_results_to_storage(test_engine, session):
     test_results = [
         {"frame_index": 0, "result": {"detections": [{"id": 1}]}},
     ]
-    mock_storage.load_file.return_value = "/data/jobs/video/input/test.mp4"
+    mock_storage.open_local.return_value = nullcontext(
+        "/data/jobs/video/input/test.mp4"
+    )
     mock_storage.save_file.return_value = "video/output/test.json"
     mock_plugin_service.get_plugin_manifest.return_value = {
         "tools": [{"id": "test_tool", "input_types": ["video"]}]
@@ -269,7 +279,7 @@ def test_worker_run_once_saves_results_to_storage(test_engine, session):
         call_args[0][0].read() if hasattr(call_args[0][0], "read") else call_args[0][0]
     )
     if isinstance(saved_content, bytes):
-        saved_json = json.loads(saved_content.decode())
+        saved_json = json.loads(gzip.decompress(saved_content))
     else:
         saved_json = json.loads(saved_content)
     # v0.10.0: Flattened video output format for VideoResultsViewer
@@ -312,7 +322,9 @@ def test_worker_run_once_updates_job_completed(test_engine, session):
     session.add(job_tool)
     session.commit()
     # Setup mock behaviors
-    mock_storage.load_file.return_value = "/data/jobs/video/input/test.mp4"
+    mock_storage.open_local.return_value = nullcontext(
+        "/data/jobs/video/input/test.mp4"
+    )
     mock_storage.save_file.return_value = "video/output/test.json"
     mock_plugin_service.get_plugin_manifest.return_value = {
         "tools": [{"id": "test_tool", "input_types": ["video"]}]
@@ -362,7 +374,9 @@ def test_worker_run_once_handles_pipeline_error(test_engine, session):
     session.add(job_tool)
     session.commit()
     # Setup mock to raise error
-    mock_storage.load_file.return_value = "/data/jobs/video/input/test.mp4"
+    mock_storage.open_local.return_value = nullcontext(
+        "/data/jobs/video/input/test.mp4"
+    )
     mock_plugin_service.get_plugin_manifest.return_value = {
         "tools": [{"id": "test_tool", "input_types": ["video"]}]
     }
@@ -408,7 +422,7 @@ def test_worker_run_once_handles_storage_error(test_engine, session):
     session.add(job_tool)
     session.commit()
     # Setup mock to raise file not found
-    mock_storage.load_file.side_effect = FileNotFoundError("File not found")
+    mock_storage.open_local.side_effect = FileNotFoundError("File not found")
     mock_plugin_service.get_plugin_manifest.return_value = {
         "tools": [{"id": "test_tool", "input_types": ["video"]}]
     }
@@ -457,7 +471,9 @@ def test_worker_flattens_video_results_for_ui(test_engine, session):
     session.add(job_tool)
     session.commit()
     # Mock returns dict with frames and total_frames (like YOLO plugin)
-    mock_storage.load_file.return_value = "/data/jobs/video/input/test.mp4"
+    mock_storage.open_local.return_value = nullcontext(
+        "/data/jobs/video/input/test.mp4"
+    )
     mock_storage.save_file.return_value = "video/output/test.json"
     mock_plugin_service.get_plugin_manifest.return_value = {
         "tools": [{"id": "video_player_tracking", "input_types": ["video"]}]
@@ -480,7 +496,7 @@ def test_worker_flattens_video_results_for_ui(test_engine, session):
     # saved_content is a BytesIO object
     if hasattr(saved_content, "read"):
         saved_content.seek(0)
-        saved_json = json.loads(saved_content.read().decode())
+        saved_json = json.loads(gzip.decompress(saved_content.read()))
     elif isinstance(saved_content, bytes):
         saved_json = json.loads(saved_content.decode())
     else:
@@ -561,7 +577,7 @@ def test_worker_sync_mode_loads_plugins(test_engine, session):
     session.add(job_tool)
     session.commit()
     # Setup storage mock to return real temp file
-    mock_storage.load_file.return_value = test_image_path
+    mock_storage.open_local.return_value = nullcontext(test_image_path)
     mock_storage.save_file.return_value = "image/output/test.json"
 
     # Execute - this will fail if load_plugins() is missing
@@ -624,7 +640,9 @@ def test_worker_stores_summary_on_completion(test_engine, session):
     session.commit()
 
     # Setup mock behaviors
-    mock_storage.load_file.return_value = "/data/jobs/video/input/test.mp4"
+    mock_storage.open_local.return_value = nullcontext(
+        "/data/jobs/video/input/test.mp4"
+    )
     mock_storage.save_file.return_value = "video/output/test.json"
     mock_plugin_service.get_plugin_manifest.return_value = {
         "tools": [{"id": "detect", "input_types": ["video"]}]
@@ -0,0 +1,171 @@
+"""Tests for video checkpoint/resume in JobWorker (v0.16.0)."""
+
+from io import BytesIO
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models.job import Job, JobStatus
+from app.models.job_tool import JobTool
+from app.services.storage.local_storage import LocalStorageService
+from app.services.storage.result_codec import load_result
+from app.workers.job_cancellation import JobCancelledError
+from app.workers.worker import JobWorker
+
+MANIFEST = {
+    "tools": [
+        {"id": "track", "input_types": ["video", "start_frame"]},
+        {"id": "count", "input_types": ["video"]},
+    ]
+}
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    monkeypatch.setattr("app.services.storage.local_storage.BASE_DIR", tmp_path)
+    storage = LocalStorageService()
+    storage.save_file(BytesIO(b"not really a video"), "video/input/clip.mp4")
+    return storage
+
+
+def _add_job(session, tools):
+    job_id = str(uuid4())
+    session.add(
+        Job(
+            job_id=job_id,
+            status=JobStatus.pending,
+            plugin_id="yolo",
+            input_path="video/input/clip.mp4",
+            job_type="video_multi" if len(tools) > 1 else "video",
+        )
+    )
+    session.flush()
+    for order, tool in enumerate(tools):
+        session.add(JobTool(job_id=job_id, tool_id=tool, tool_order=order))
+    session.commit()
+    return job_id
+
+
+def _requeue(session, job_id):
+    session.rollback()
+    session.query(Job).filter(Job.job_id == job_id).update(
+        {"status": JobStatus.pending}, synchronize_session=False
+    )
+    session.commit()
+
+
+def _worker(test_engine, storage, run_tool):
+    plugin_service = MagicMock()
+    plugin_service.get_plugin_manifest.return_value = MANIFEST
+    plugin_service.run_plugin_tool.side_effect = run_tool
+    return JobWorker(
+        session_factory=sessionmaker(bind=test_engine),
+        storage=storage,
+        plugin_service=plugin_service,
+        checkpoint_frames=5,
+    )
+
+
+def _tracker(calls, fail_at=None, error=RuntimeError):
+    """Fake tools; at fail_at, raise error (JobCancelledError = lost lease)."""
+
+    def run_tool(plugin_id, tool_name, args, progress_callback=None):
+        if tool_name == "count":
+            calls.append(("count", None))
+            if fail_at == "count":
+                raise error("count crashed")
+            return {"frames": [], "total_frames": 20}
+        start = args["start_frame"]
+        calls.append(("track", start))
+        for frame in range(start, 20):
+            if frame == fail_at:
+                raise error(f"crash at frame {frame}")
+            progress_callback(
+                frame + 1, 20, frame_results=[{"frame_idx": frame, "id": frame}]
+            )
+        frames = [{"frame_idx": frame, "id": frame} for frame in range(start, 20)]
+        return {"frames": frames, "total_frames": 20}
+
+    return run_tool
+
+
+@pytest.mark.unit
+class TestWorkerVideoCheckpoint:
+    """Worker resumes video jobs from persisted checkpoints."""
+
+    def test_rerun_skips_persisted_frames(self, test_engine, session, storage):
+        """After a requeue, only frames after the last checkpoint are redone."""
+        job_id = _add_job(session, ["track"])
+        calls = []
+
+        run_tool = _tracker(calls, fail_at=12, error=JobCancelledError)
+        _worker(test_engine, storage, run_tool).run_once()
+        _requeue(session, job_id)
+        _worker(test_engine, storage, _tracker(calls)).run_once()
+
+        assert calls == [("track", 0), ("track", 12)]
+        job = session.query(Job).filter(Job.job_id == job_id).first()
+        assert job.status == JobStatus.completed
+        output = load_result(storage, job.output_path)
+        assert [frame["frame_idx"] for frame in output["frames"]] == list(range(20))
+        assert not storage.file_exists(f"video/checkpoints/{job_id}/track/index.json")
+
+    def test_finished_tools_not_rerun(self, test_engine, session, storage):
+        """In multi-tool jobs, tools that completed are restored, not rerun."""
+        job_id = _add_job(session, ["track", "count"])
+        calls = []
+
+        run_tool = _tracker(calls, fail_at="count", error=JobCancelledError)
+        _worker(test_engine, storage, run_tool).run_once()
+        _requeue(session, job_id)
+        _worker(test_engine, storage, _tracker(calls)).run_once()
+
+        assert calls == [("track", 0), ("count", None), ("count", None)]
+        job = session.query(Job).filter(Job.job_id == job_id).first()
+        assert job.status == JobStatus.completed
+
+    def test_failed_job_deletes_checkpoints(self, test_engine, session, storage):
+        """A job that fails for good leaves no checkpoint objects behind."""
+        job_id = _add_job(session, ["track", "count"])
+
+        _worker(test_engine, storage, _tracker([], fail_at="count")).run_once()
+
+        job = session.query(Job).filter(Job.job_id == job_id).first()
+        assert job.status == JobStatus.failed
+        assert list(storage.list_files(f"video/checkpoints/{job_id}/")) == []
+
+    def test_cancelled_job_deletes_checkpoints(self, test_engine, session, storage):
+        """A user cancellation deletes the job's checkpoints."""
+        job_id = _add_job(session, ["track"])
+        track = _tracker([])
+
+        def cancel_at_frame_12(plugin_id, tool_name, args, progress_callback=None):
+            def cb(current, total, frame_results=None):
+                if current == 12:
+                    session.query(Job).filter(Job.job_id == job_id).update(
+                        {"status": JobStatus.cancelled}, synchronize_session=False
+                    )
+                    session.commit()
+                    raise JobCancelledError(job_id)
+                progress_callback(current, total, frame_results=frame_results)
+
+            return track(plugin_id, tool_name, args, progress_callback=cb)
+
+        _worker(test_engine, storage, cancel_at_frame_12).run_once()
+
+        session.rollback()
+        job = session.query(Job).filter(Job.job_id == job_id).first()
+        assert job.status == JobStatus.cancelled
+        assert list(storage.list_files(f"video/checkpoints/{job_id}/")) == []
+
+    def test_requeued_job_keeps_checkpoints(self, test_engine, session, storage):
+        """A run stopped by a lost lease keeps its checkpoints for the retry."""
+        job_id = _add_job(session, ["track"])
+
+        run_tool = _tracker([], fail_at=12, error=JobCancelledError)
+        _worker(test_engine, storage, run_tool).run_once()
+
+        paths = {f.path for f in storage.list_files(f"video/checkpoints/{job_id}/")}
+        assert f"video/checkpoints/{job_id}/track/index.json" in paths
@@ -10,7 +10,9 @@ Tests verify:
 7. v0.9.8: video_multi job type support with canonical JSON output
 """
 
+import gzip
 import json
+from contextlib import nullcontext
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
@@ -89,7 +91,7 @@ class TestMultiToolWorkerExecution:
         session.commit()
 
         # Setup mocks
-        mock_storage.load_file.return_value = "/data/test.png"
+        mock_storage.open_local.return_value = nullcontext("/data/test.png")
         mock_storage.save_file.return_value = "image_multi/output/test.json"
 
         # Mock manifest with tools
@@ -157,7 +159,7 @@ class TestMultiToolWorkerExecution:
         session.commit()
 
         # Setup mocks
-        mock_storage.load_file.return_value = "/data/test.png"
+        mock_storage.open_local.return_value = nullcontext("/data/test.png")
         mock_storage.save_file.return_value = "image_multi/output/test.json"
         mock_plugin_service.get_plugin_manifest.return_value = {
             "tools": [
@@ -223,7 +225,7 @@ class TestMultiToolWorkerExecution:
         session.commit()
 
         # Setup mocks
-        mock_storage.load_file.return_value = "/data/test.png"
+        mock_storage.open_local.return_value = nullcontext("/data/test.png")
         mock_storage.save_file.return_value = "image_multi/output/test.json"
         mock_plugin_service.get_plugin_manifest.return_value = {
             "tools": [
@@ -255,7 +257,7 @@ class TestMultiToolWorkerExecution:
 
         # Verify output format
         assert saved_output is not None
-        output_data = json.loads(saved_output)
+        output_data = json.loads(gzip.decompress(saved_output))
 
         # Multi-tool format: {"plugin_id": ..., "tools": {...}}
         assert "plugin_id" in output_data
@@ -302,7 +304,7 @@ class TestMultiToolWorkerExecution:
         session.commit()
 
         # Setup mocks
-        mock_storage.load_file.return_value = "/data/test.png"
+        mock_storage.open_local.return_value = nullcontext("/data/test.png")
         mock_storage.save_file.return_value = "image/output/test.json"
         mock_plugin_service.get_plugin_manifest.return_value = {
             "tools": [{"id": "analyze", "input_types": ["image_bytes"]}]
@@ -328,7 +330,7 @@ class TestMultiToolWorkerExecution:
 
         # Verify output format - single tool uses old format
         assert saved_output is not None
-        output_data = json.loads(saved_output)
+        output_data = json.loads(gzip.decompress(saved_output))
         assert "results" in output_data
         assert output_data["results"]["text"] == "extracted text"
 
@@ -369,7 +371,7 @@ class TestMultiToolWorkerExecution:
         session.commit()
 
         # Setup mocks
-        mock_storage.load_file.return_value = "/data/test.png"
+        mock_storage.open_local.return_value = nullcontext("/data/test.png")
         mock_plugin_service.get_plugin_manifest.return_value = {
             "tools": [
                 {"id": "t1", "input_types": ["image_bytes"]},
@@ -456,7 +458,7 @@ class TestVideoMultiWorkerExecution:
         session.commit()
 
         # Setup mocks
-        mock_storage.load_file.return_value = "/data/test.mp4"
+        mock_storage.open_local.return_value = nullcontext("/data/test.mp4")
         mock_storage.save_file.return_value = "video_multi/output/test.json"
 
         # Mock manifest with tools
@@ -528,7 +530,7 @@ class TestVideoMultiWorkerExecution:
         session.commit()
 
         # Setup mocks
-        mock_storage.load_file.return_value = "/data/test.mp4"
+        mock_storage.open_local.return_value = nullcontext("/data/test.mp4")
         mock_plugin_service.get_plugin_manifest.return_value = {
             "tools": [
                 {
@@ -577,7 +579,7 @@ class TestVideoMultiWorkerExecution:
 
         # Verify canonical output format
         assert saved_output is not None
-        output_data = json.loads(saved_output)
+        output_data = json.loads(gzip.decompress(saved_output))
 
         # v0.12.0: video_multi merges frames from all tools by frame_idx:
         # {"job_id": "...", "status": "completed", "frames": [{"frame_idx": 0, "tool1": {...}, "tool2": {...}}, ...]}
@@ -645,7 +647,7 @@ class TestVideoMultiWorkerExecution:
         session.commit()
 
         # Setup mocks
-        mock_storage.load_file.return_value = "/data/test.mp4"
+        mock_storage.open_local.return_value = nullcontext("/data/test.mp4")
         mock_plugin_service.get_plugin_manifest.return_value = {
             "tools": [
                 {
@@ -678,7 +680,7 @@ class TestVideoMultiWorkerExecution:
 
         # Verify canonical output format for single video
         assert saved_output is not None
-        output_data = json.loads(saved_output)
+        output_data = json.loads(gzip.decompress(saved_output))
 
         # v0.10.0: Canonical video format (flattened for VideoResultsViewer):
         # {"job_id": "...", "status": "completed", "frames": [...], "total_frames": N}
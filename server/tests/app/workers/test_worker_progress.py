@@ -1,5 +1,6 @@
 """TDD tests for worker progress tracking."""
 
+from contextlib import nullcontext
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
@@ -8,6 +9,7 @@ from sqlalchemy.orm import sessionmaker
 
 from app.models.job import Job, JobStatus
 from app.models.job_tool import JobTool
+from app.workers.progress_throttle import ProgressThrottle
 from app.workers.worker import JobWorker
 
 
@@ -54,9 +56,11 @@ def test_worker_get_total_frames_zero_frames_fallback(test_engine):
 
 @pytest.mark.unit
 def test_worker_update_progress_throttled(test_engine, session):
-    """RED: Verify progress updates are throttled to every 5%."""
+    """Verify progress writes are coalesced in time (v0.16.0)."""
     Session = sessionmaker(bind=test_engine)
     worker = JobWorker(session_factory=Session)
+    now = [0.0]
+    worker._progress_writes = ProgressThrottle(0.5, clock=lambda: now[0])
 
     job_id = str(uuid4())
     job = Job(
@@ -71,25 +75,21 @@ def test_worker_update_progress_throttled(test_engine, session):
     job_tool = JobTool(job_id=job_id, tool_id="detect", tool_order=0)
     session.add(job_tool)
     session.commit()
-    # Update at 1% (should update - first frame)
+    # First update is always written
     worker._update_job_progress(job_id, 1, 100, session)
     session.expire_all()
     assert job.progress == 1
 
-    # Update at 2% (should NOT update - not 5% boundary)
-    worker._update_job_progress(job_id, 2, 100, session)
-    session.expire_all()
-    assert job.progress == 1  # Still 1, not updated
-
-    # Update at 5% (should update - 5% boundary)
+    # Within the flush interval (even on a 5% boundary): not written
     worker._update_job_progress(job_id, 5, 100, session)
     session.expire_all()
-    assert job.progress == 5
+    assert job.progress == 1
 
-    # Update at 10% (should update - 5% boundary)
-    worker._update_job_progress(job_id, 10, 100, session)
+    # Interval elapsed: latest value is written
+    now[0] = 0.6
+    worker._update_job_progress(job_id, 7, 100, session)
     session.expire_all()
-    assert job.progress == 10
+    assert job.progress == 7
 
 
 @pytest.mark.unit
@@ -148,7 +148,7 @@ def test_worker_sets_100_percent_on_completion(test_engine, session):
     session.add(job_tool)
     session.commit()
     # Setup mock behaviors
-    mock_storage.load_file.return_value = "/tmp/test.mp4"
+    mock_storage.open_local.return_value = nullcontext("/tmp/test.mp4")
     mock_storage.save_file.return_value = "video/output/test.json"
     mock_plugin_service.get_plugin_manifest.return_value = {
         "tools": [{"id": "detect", "input_types": ["video"]}]
@@ -4,7 +4,9 @@ The worker's json.dumps() crashes when run_plugin_tool returns a Pydantic model
 instead of a plain dict. This test verifies the fix handles both cases.
 """
 
+import gzip
 import json
+from contextlib import nullcontext
 from unittest.mock import MagicMock
 from uuid import uuid4
 
@@ -56,7 +58,9 @@ class TestWorkerPydanticSerialization:
         session.add(job_tool)
         session.commit()
         # Setup mock behaviors
-        mock_storage.load_file.return_value = "/data/jobs/image/input/test.png"
+        mock_storage.open_local.return_value = nullcontext(
+            "/data/jobs/image/input/test.png"
+        )
 
         # Create a temp file for image loading
         import tempfile
@@ -64,7 +68,7 @@ class TestWorkerPydanticSerialization:
         with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
             f.write(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
             temp_path = f.name
-        mock_storage.load_file.return_value = temp_path
+        mock_storage.open_local.return_value = nullcontext(temp_path)
 
         mock_storage.save_file.return_value = "image/output/test.json"
 
@@ -91,7 +95,7 @@ class TestWorkerPydanticSerialization:
         if hasattr(saved_content, "read"):
             saved_bytes = saved_content.read()
             if isinstance(saved_bytes, bytes):
-                saved_json = json.loads(saved_bytes.decode())
+                saved_json = json.loads(gzip.decompress(saved_bytes))
             else:
                 saved_json = json.loads(saved_bytes)
         else:
@@ -136,14 +140,16 @@ class TestWorkerPydanticSerialization:
         session.add(job_tool)
         session.commit()
         # Setup mock behaviors
-        mock_storage.load_file.return_value = "/data/jobs/image/input/test.png"
+        mock_storage.open_local.return_value = nullcontext(
+            "/data/jobs/image/input/test.png"
+        )
 
         import tempfile
 
         with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
             f.write(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
             temp_path = f.name
-        mock_storage.load_file.return_value = temp_path
+        mock_storage.open_local.return_value = nullcontext(temp_path)
 
         mock_storage.save_file.return_value = "image/output/test.json"
 
@@ -205,7 +211,7 @@ class TestWorkerPydanticSerialization:
         with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
             f.write(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
             temp_path = f.name
-        mock_storage.load_file.return_value = temp_path
+        mock_storage.open_local.return_value = nullcontext(temp_path)
         mock_storage.save_file.return_value = "image/output/test.json"
 
         # Create a nested Pydantic model
@@ -244,7 +250,7 @@ class TestWorkerPydanticSerialization:
         if hasattr(saved_content, "read"):
             saved_bytes = saved_content.read()
             if isinstance(saved_bytes, bytes):
-                saved_json = json.loads(saved_bytes.decode())
+                saved_json = json.loads(gzip.decompress(saved_bytes))
             else:
                 saved_json = json.loads(saved_bytes)
         else:
@@ -55,6 +55,9 @@ os.environ["FORGESYTE_DATABASE_URL"] = "duckdb:///:memory:"
 # Use local storage for tests to avoid S3 dependencies
 os.environ["FORGESYTE_STORAGE_BACKEND"] = "local"
 
+# Scan the jobs table instead of writing a queue file under data/
+os.environ["FORGESYTE_QUEUE_BACKEND"] = "database"
+
 # Configure authentication BEFORE importing app or pytest
 # This ensures that when app.main initializes during TestClient creation,
 # it will have API keys configured and enforce authentication
@@ -85,6 +88,14 @@ def pytest_configure(config):
     config.option.asyncio_mode = "auto"
 
 
+@pytest.fixture(autouse=True)
+def local_storage_dir(tmp_path, monkeypatch):
+    """Point LocalStorageService at a per-test data/jobs instead of the repo's."""
+    base_dir = tmp_path / "data" / "jobs"
+    monkeypatch.setattr("app.services.storage.local_storage.BASE_DIR", base_dir)
+    return base_dir
+
+
 @pytest.fixture(scope="session", autouse=True)
 def install_plugins():
     """Install plugins once per test session for integration tests."""
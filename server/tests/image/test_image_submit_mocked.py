@@ -110,6 +110,22 @@ class TestImageSubmitSuccess:
         assert mock_deps["db"].add.call_count == 2
         mock_deps["db"].commit.assert_called()
 
+    def test_priority_stored_on_job(self, client, mock_deps):
+        response = client.post(
+            "/v1/image/submit?plugin_id=ocr&tool=analyze&priority=5",
+            files={"file": ("test.png", BytesIO(FAKE_PNG), "image/png")},
+        )
+        assert response.status_code == 200
+        job = mock_deps["db"].add.call_args_list[0].args[0]
+        assert job.priority == 5
+
+    def test_priority_out_of_range_returns_422(self, client, mock_deps):
+        response = client.post(
+            "/v1/image/submit?plugin_id=ocr&tool=analyze&priority=99",
+            files={"file": ("test.png", BytesIO(FAKE_PNG), "image/png")},
+        )
+        assert response.status_code == 422
+
 
 class TestImageSubmitValidation:
     """Validation / rejection tests."""
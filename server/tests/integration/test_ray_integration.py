@@ -78,6 +78,8 @@ class TestRayJobDispatch:
         mock_ray = MagicMock()
         mock_ref = MockRayObjectRef("test-job-id")
         mock_ray.wait.return_value = ([], [])
+        # No cluster connection: tasks are submitted directly
+        mock_ray.is_initialized.return_value = False
 
         mock_execute = MagicMock()
         mock_execute.remote.return_value = mock_ref
@@ -91,15 +93,18 @@ class TestRayJobDispatch:
         mock_job.input_path = "image/input/test.jpg"
 
         mock_db = MagicMock()
-        mock_db.query.return_value.filter.return_value.order_by.return_value.first.return_value = (
-            mock_job
-        )
 
         worker._session_factory = lambda: mock_db
 
+        from app.services.job_claim_service import ClaimedJob
+
         with patch.dict("sys.modules", {"ray": mock_ray}):
             with patch("app.ray_tasks.execute_pipeline_remote", mock_execute):
-                worker.run_once()
+                with patch(
+                    "app.workers.worker.JobClaimService.claim_pending_jobs",
+                    return_value=[ClaimedJob(job=mock_job, tools=["test_tool"])],
+                ):
+                    worker.run_once()
 
         # Verify dispatch happened
         mock_execute.remote.assert_called_once()
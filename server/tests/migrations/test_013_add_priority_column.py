@@ -0,0 +1,32 @@
+"""Tests for v0.16.0 priority column migration."""
+
+from sqlalchemy import text
+
+
+def test_priority_column_exists(test_engine):
+    """Verify priority column exists as an integer column."""
+    with test_engine.connect() as conn:
+        row = conn.execute(
+            text(
+                "SELECT is_nullable, data_type FROM information_schema.columns "
+                "WHERE table_name = 'jobs' AND column_name = 'priority'"
+            )
+        ).fetchone()
+    assert row is not None, "priority column missing from jobs table"
+    # Nullable: DuckDB cannot ADD COLUMN with NOT NULL
+    assert row[0] == "YES"
+    assert "int" in row[1].lower()
+
+
+def test_priority_defaults_to_zero(test_engine):
+    """Rows inserted without a priority get 0 (server default)."""
+    with test_engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO jobs (job_id, status, plugin_id, input_path, job_type, "
+                "created_at, updated_at) VALUES (gen_random_uuid(), 'pending', 'p', "
+                "'in', 'image', now(), now())"
+            )
+        )
+        priority = conn.execute(text("SELECT priority FROM jobs")).scalar_one()
+    assert priority == 0
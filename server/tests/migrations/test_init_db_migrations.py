@@ -31,6 +31,8 @@ def test_jobs_table_has_all_expected_columns(test_engine):
     """
     # v0.15.1: tool and tool_list columns removed, stored in job_tools table
     # v0.15.x: summary added for pre-computed video summary (Discussion #354)
+    # v0.16.0: priority added for job scheduling
+    # v0.16.0: lease_owner, lease_expires_at, attempts added for job leases
     expected_columns = [
         "job_id",
         "status",
@@ -44,6 +46,10 @@ def test_jobs_table_has_all_expected_columns(test_engine):
         "progress",  # Added in migration 006
         "ray_future_id",  # Added in migration 007
         "summary",  # Added in migration 012 (Discussion #354)
+        "priority",  # Added in migration 013
+        "lease_owner",  # Added in migration 015
+        "lease_expires_at",  # Added in migration 015
+        "attempts",  # Added in migration 015
     ]
 
     with test_engine.connect() as conn:
@@ -89,10 +95,10 @@ def test_jobs_table_column_count(test_engine):
         )
         count = result.fetchone()[0]
 
-    # v0.15.x: Expected 12 columns (summary added in migration 012)
+    # v0.16.0: Expected 16 columns (priority in 013, lease columns in 015)
     # See test_jobs_table_has_all_expected_columns for list
-    assert count == 12, (
-        f"Expected 12 columns in jobs table, got {count}. "
+    assert count == 16, (
+        f"Expected 16 columns in jobs table, got {count}. "
         f"This may indicate missing migrations (Issue #293)."
     )
 
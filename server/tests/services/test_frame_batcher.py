@@ -0,0 +1,192 @@
+"""Tests for cross-client micro-batching of streamed frames (v0.16.0)."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.frame_batcher import FrameBatcher
+
+
+class RecordingDispatch:
+    """Batch dispatch that records batches and echoes frame ids."""
+
+    def __init__(self) -> None:
+        self.batches = []
+
+    async def __call__(self, key, args_list):
+        self.batches.append((key, [a["id"] for a in args_list]))
+        return [
+            ValueError("bad frame") if a["id"] == "bad" else {"frame": a["id"]}
+            for a in args_list
+        ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_frames_share_a_batch():
+    """Frames of one tool within the window run as one batch, in order."""
+    dispatch = RecordingDispatch()
+    batcher = FrameBatcher(dispatch, window_ms=20, max_batch_size=8)
+
+    results = await asyncio.gather(
+        batcher.submit("yolo", "player", {"id": "a"}),
+        batcher.submit("yolo", "player", {"id": "b"}),
+        batcher.submit("yolo", "ball", {"id": "c"}),
+    )
+
+    assert results == [{"frame": "a"}, {"frame": "b"}, {"frame": "c"}]
+    assert sorted(dispatch.batches) == [
+        (("yolo", "ball"), ["c"]),
+        (("yolo", "player"), ["a", "b"]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_without_waiting():
+    """Reaching max_batch_size dispatches before the window elapses."""
+    dispatch = RecordingDispatch()
+    batcher = FrameBatcher(dispatch, window_ms=60_000, max_batch_size=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            batcher.submit("p", "t", {"id": "a"}),
+            batcher.submit("p", "t", {"id": "b"}),
+        ),
+        timeout=1.0,
+    )
+
+    assert results == [{"frame": "a"}, {"frame": "b"}]
+
+
+@pytest.mark.asyncio
+async def test_running_batch_is_referenced_until_done():
+    """The batcher holds its batch tasks so they cannot be garbage-collected."""
+    release = asyncio.Event()
+
+    async def dispatch(key, args_list):
+        await release.wait()
+        return [{"frame": a["id"]} for a in args_list]
+
+    batcher = FrameBatcher(dispatch, window_ms=60_000, max_batch_size=1)
+    pending = asyncio.ensure_future(batcher.submit("p", "t", {"id": "a"}))
+    await asyncio.sleep(0)
+
+    assert len(batcher._tasks) == 1
+    release.set()
+    assert await pending == {"frame": "a"}
+    await asyncio.sleep(0)
+    assert batcher._tasks == set()
+
+
+@pytest.mark.asyncio
+async def test_frame_error_only_fails_that_frame():
+    """An Exception entry fails its own caller; batch errors fail all."""
+    batcher = FrameBatcher(RecordingDispatch(), window_ms=5)
+
+    good, bad = await asyncio.gather(
+        batcher.submit("p", "t", {"id": "a"}),
+        batcher.submit("p", "t", {"id": "bad"}),
+        return_exceptions=True,
+    )
+    assert good == {"frame": "a"}
+    assert isinstance(bad, ValueError)
+
+    failing = FrameBatcher(AsyncMock(side_effect=RuntimeError("actor died")))
+    with pytest.raises(RuntimeError, match="actor died"):
+        await failing.submit("p", "t", {"id": "a"})
+
+
+class _Awaitable:
+    def __init__(self, value):
+        self._value = value
+
+    def __await__(self):
+        async def _get():
+            return self._value
+
+        return _get().__await__()
+
+
+@pytest.mark.asyncio
+async def test_service_batches_frames_across_clients():
+    """Two clients' frames reach one process_frames call."""
+    from app.services.vision_analysis import VisionAnalysisService
+
+    handle = MagicMock()
+    handle.process_frames.remote.side_effect = lambda args_list: _Awaitable(
+        [{"n": i} for i in range(len(args_list))]
+    )
+    actor_cls = MagicMock()
+    actor_cls.remote.return_value = handle
+    ws_manager = AsyncMock()
+    service = VisionAnalysisService(MagicMock(), ws_manager, batch_window_ms=20)
+    frame = {"data": "YmFzZTY0", "tools": ["test_tool"]}
+
+    with patch("ray.is_initialized", return_value=True):
+        with patch("app.workers.ray_actors.StreamingToolActor", actor_cls):
+            await asyncio.gather(
+                service.handle_frame("client-1", "p", {**frame, "frame_id": "f1"}),
+                service.handle_frame("client-2", "p", {**frame, "frame_id": "f2"}),
+            )
+
+    handle.process_frames.remote.assert_called_once()
+    assert len(handle.process_frames.remote.call_args.args[0]) == 2
+    sent = {
+        c.args[0]: (c.args[1], c.args[3])
+        for c in ws_manager.send_frame_result.call_args_list
+    }
+    assert sent["client-1"][0] == "f1"
+    assert sent["client-2"][0] == "f2"
+    assert {
+        sent["client-1"][1]["tools"]["test_tool"]["n"],
+        sent["client-2"][1]["tools"]["test_tool"]["n"],
+    } == {0, 1}
+
+
+def _bare_actor(plugin):
+    """StreamingToolActor instance without Ray or plugin loading."""
+    from app.workers.ray_actors import StreamingToolActor
+
+    cls = StreamingToolActor.__ray_metadata__.modified_class
+    actor = cls.__new__(cls)
+    actor.plugin_id, actor.tool_name, actor.plugin = "p", "t", plugin
+    actor.plugin_service = MagicMock()
+    return actor
+
+
+@pytest.mark.unit
+def test_actor_uses_plugin_batch_hook():
+    """Plugins overriding run_tool_batch get the whole batch in one call."""
+    from app.plugins.base import BasePlugin
+
+    class BatchPlugin(BasePlugin):
+        name = "p"
+        tools = {}
+
+        def __init__(self):
+            self.calls = []
+
+        def run_tool(self, tool_name, args):
+            raise AssertionError("per-frame path used")
+
+        def run_tool_batch(self, tool_name, args_list):
+            self.calls.append(len(args_list))
+            return [args["id"] for args in args_list]
+
+    plugin = BatchPlugin()
+    actor = _bare_actor(plugin)
+
+    assert actor.process_frames([{"id": 1}, {"id": 2}]) == [1, 2]
+    assert plugin.calls == [2]
+
+
+@pytest.mark.unit
+def test_actor_falls_back_to_per_frame():
+    """Without a batch hook, frames run one by one; errors stay per frame."""
+    actor = _bare_actor(MagicMock(spec=[]))
+    actor.plugin_service.run_plugin_tool.side_effect = [{"ok": 1}, ValueError("x")]
+
+    results = actor.process_frames([{"id": 1}, {"id": 2}])
+
+    assert results[0] == {"ok": 1}
+    assert isinstance(results[1], RuntimeError)
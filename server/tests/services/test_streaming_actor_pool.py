@@ -0,0 +1,133 @@
+"""Tests for the shared StreamingToolActor pool (v0.16.0)."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.streaming_actor_pool import (
+    StreamingActorPool,
+    create_streaming_actor_pool,
+    parse_prewarm_tools,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def actor_cls():
+    """Patch StreamingToolActor with a mock returning a new handle per spawn."""
+    cls = MagicMock()
+    cls.remote.side_effect = lambda plugin_id, tool_name: MagicMock(
+        name=f"{plugin_id}.{tool_name}"
+    )
+    with patch("app.workers.ray_actors.StreamingToolActor", cls):
+        with patch("ray.is_initialized", return_value=True):
+            with patch("ray.kill") as kill:
+                cls.kill = kill
+                yield cls
+
+
+@pytest.mark.unit
+def test_parse_prewarm_tools():
+    """Pre-warm spec parses into (plugin, tool) keys."""
+    assert parse_prewarm_tools("") == []
+    assert parse_prewarm_tools("yolo:player, ocr:analyze") == [
+        ("yolo", "player"),
+        ("ocr", "analyze"),
+    ]
+    with pytest.raises(ValueError):
+        parse_prewarm_tools("yolo")
+
+
+@pytest.mark.unit
+def test_least_loaded_routing_up_to_max_replicas(actor_cls):
+    """A second replica is spawned only while all replicas are busy."""
+    pool = StreamingActorPool(max_replicas=2)
+
+    first = pool.acquire("yolo", "player")
+    pool.release(first)
+    assert pool.acquire("yolo", "player") is first  # idle replica reused
+
+    second = pool.acquire("yolo", "player")  # first is busy
+    assert second is not first
+    third = pool.acquire("yolo", "player")  # at max_replicas: least loaded
+    assert third in (first, second)
+    assert actor_cls.remote.call_count == 2
+
+
+@pytest.mark.unit
+def test_full_pool_evicts_lru_idle_replica(actor_cls):
+    """At max_actors, the least recently used idle replica makes room."""
+    clock = FakeClock()
+    pool = StreamingActorPool(max_actors=2, clock=clock)
+
+    a = pool.acquire("p", "a")
+    clock.now = 1
+    pool.release(a)
+    b = pool.acquire("p", "b")
+    clock.now = 2
+    pool.release(b)
+
+    pool.acquire("p", "c")
+
+    assert pool.replicas("p", "a") == []
+    assert pool.size == 2
+    actor_cls.kill.assert_called_once_with(a.handle)
+
+    # Every replica busy and no replica for the tool: refuse
+    pool.acquire("p", "b")
+    with pytest.raises(RuntimeError, match="pool is full"):
+        pool.acquire("p", "d")
+
+
+@pytest.mark.unit
+def test_idle_eviction_keeps_prewarmed(actor_cls):
+    """Idle replicas are killed after idle_seconds, pre-warmed ones kept."""
+    clock = FakeClock()
+    pool = StreamingActorPool(idle_seconds=10, prewarm=[("p", "warm")], clock=clock)
+    pool.ensure_prewarmed()
+    pool.release(pool.acquire("p", "cold"))
+
+    clock.now = 11
+    assert pool.evict_idle() == 1
+    assert len(pool.replicas("p", "warm")) == 1
+    assert pool.replicas("p", "cold") == []
+
+
+@pytest.mark.unit
+def test_sweeper_evicts_without_further_acquire(actor_cls):
+    """The sweeper kills idle replicas after the last frame, with no acquire."""
+    clock = FakeClock()
+    pool = StreamingActorPool(idle_seconds=10, clock=clock, sweep_seconds=0.01)
+    replica = pool.acquire("p", "t")
+    pool.release(replica)
+    try:
+        clock.now = 11
+        deadline = time.monotonic() + 5
+        while pool.size and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        pool.shutdown()
+
+    actor_cls.kill.assert_called_once_with(replica.handle)
+    assert pool.replicas("p", "t") == []
+
+
+@pytest.mark.unit
+def test_create_pool_defaults_to_app_settings():
+    """Without a settings object, the pool is sized from app settings."""
+    from app.settings import settings
+
+    pool = create_streaming_actor_pool()
+
+    assert pool.max_actors == max(1, settings.streaming_actor_pool_size)
+    assert pool.idle_seconds == settings.streaming_actor_idle_seconds
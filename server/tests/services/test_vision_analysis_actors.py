@@ -2,11 +2,13 @@
 
 v0.13.0 (Phase C): Real-time Ray Actors for WebSocket streaming.
 v0.13.1: Fixed actor cache key to include plugin_name.
+v0.16.0: Actors are pooled and shared across clients; disconnecting a
+client no longer kills them (the pool evicts idle replicas).
 
 These tests verify the Actor Lifecycle Contract:
 1. CREATE actor on first frame
 2. REUSE actor on subsequent frames (caching)
-3. KILL actor on client disconnect
+3. KEEP shared actors on client disconnect (v0.16.0)
 4. Plugin switching creates new actors (v0.13.1)
 
 Acceptance Criteria covered:
@@ -87,7 +89,8 @@ async def test_actor_lifecycle_caching_and_cleanup():
     This test verifies:
     - First frame creates a new actor (AC 2)
     - Second frame reuses the same actor (AC 2)
-    - cleanup_client kills the actor and removes from tracking (AC 3)
+    - cleanup_client removes the client from tracking but keeps the
+      shared actor for other clients (v0.16.0)
     """
     from app.services.vision_analysis import VisionAnalysisService
 
@@ -124,10 +127,11 @@ async def test_actor_lifecycle_caching_and_cleanup():
                 # Verify only one actor was created (caching works)
                 assert len(MockStreamingToolActor._instances) == 1
 
-                # 4. Cleanup: Should KILL the actor and remove from tracking dict
+                # 4. Cleanup: Removes tracking; the pooled actor stays warm
                 await service.cleanup_client("client-123")
-                mock_kill.assert_called_once()
+                mock_kill.assert_not_called()
                 assert "client-123" not in service.active_actors
+                assert len(service.actor_pool.replicas("test-plugin", "test_tool")) == 1
 
 
 @pytest.mark.asyncio
@@ -204,18 +208,19 @@ async def test_multi_tool_streaming_support():
                 # Two actors should have been created
                 assert len(MockStreamingToolActor._instances) == 2
 
-                # Cleanup should kill both actors
+                # Cleanup keeps both pooled actors
                 await service.cleanup_client("client-123")
-                assert mock_kill.call_count == 2  # Both actors killed
+                mock_kill.assert_not_called()
                 assert "client-123" not in service.active_actors
+                assert service.actor_pool.size == 2
 
 
 @pytest.mark.asyncio
-async def test_actor_isolation_between_clients():
-    """Test that actors are isolated between different clients.
+async def test_actors_shared_between_clients():
+    """v0.16.0: Clients streaming the same tool share one pooled actor.
 
-    Each client should have its own set of actors, and cleanup
-    of one client should not affect another.
+    Cleanup of one client does not affect the other client's tracking or
+    the shared actor.
     """
     from app.services.vision_analysis import VisionAnalysisService
 
@@ -240,20 +245,19 @@ async def test_actor_isolation_between_clients():
                 await service.handle_frame("client-1", "test-plugin", frame_data)
                 await service.handle_frame("client-2", "test-plugin", frame_data)
 
-                # Both clients should have their own actors
+                # Both clients are tracked, but only one model was loaded
                 assert "client-1" in service.active_actors
                 assert "client-2" in service.active_actors
+                assert len(MockStreamingToolActor._instances) == 1
 
                 # Cleanup client-1 should not affect client-2
                 await service.cleanup_client("client-1")
-                assert mock_kill.call_count == 1
                 assert "client-1" not in service.active_actors
                 assert "client-2" in service.active_actors  # Still there!
 
-                # Cleanup client-2
                 await service.cleanup_client("client-2")
-                assert mock_kill.call_count == 2
                 assert "client-2" not in service.active_actors
+                mock_kill.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -303,6 +307,7 @@ async def test_plugin_switching_creates_new_actor():
                 assert ("plugin-a", "analyze") in service.active_actors["client-1"]
                 assert ("plugin-b", "analyze") in service.active_actors["client-1"]
 
-                # Cleanup kills both
+                # Cleanup keeps both pooled actors
                 await service.cleanup_client("client-1")
-                assert mock_kill.call_count == 2
+                mock_kill.assert_not_called()
+                assert service.actor_pool.size == 2
@@ -247,6 +247,39 @@ class TestExecutePipelineRemote:
         assert "Available plugins" in error_msg
         assert "ocr" in error_msg or "yolo" in error_msg
 
+    def test_video_progress_reported(
+        self, mock_plugin_service, mock_storage, monkeypatch
+    ):
+        """v0.16.0: Video tools get a callback reporting to the progress actor."""
+        from app.ray_tasks import _execute_pipeline_impl
+        from app.workers.ray_progress import RayProgressReporter
+        from app.workers.worker import JobWorker
+
+        monkeypatch.setattr(JobWorker, "_get_total_frames", staticmethod(lambda p: 10))
+        actor = MagicMock()
+
+        def run_tool(plugin_id, tool_name, args, progress_callback=None):
+            progress_callback(10, total=10)
+            return {"frames": []}
+
+        mock_plugin_service.run_plugin_tool.side_effect = run_tool
+
+        _execute_pipeline_impl(
+            plugin_id="test_plugin",
+            tools_to_run=["a", "b"],
+            input_path="video/test.mp4",
+            job_type="video_multi",
+            get_plugin_service_fn=lambda: mock_plugin_service,
+            get_storage_service_fn=lambda: mock_storage,
+            progress_reporter=RayProgressReporter(actor, "job-1"),
+        )
+
+        # Progress spans both tools: 10/20 after the first, 20/20 at the end
+        assert [c.args for c in actor.report.remote.call_args_list] == [
+            ("job-1", 10, 20, 0),
+            ("job-1", 20, 20, 0),
+        ]
+
 
 class TestRayTaskDecorator:
     """Tests for the Ray remote decorator configuration."""
@@ -352,6 +385,15 @@ class TestPluginServiceInitialization:
     remains empty and plugin lookups fail.
     """
 
+    @pytest.fixture(autouse=True)
+    def _fresh_services(self):
+        """Each test builds its own memoized services."""
+        from app.ray_tasks import _reset_worker_services
+
+        _reset_worker_services()
+        yield
+        _reset_worker_services()
+
     def test_get_plugin_service_loads_plugins(self, monkeypatch):
         """Test that _get_plugin_service() loads plugins from entry points.
 
@@ -455,3 +497,184 @@ class TestPluginServiceInitialization:
         # Should log the error with specific prefix
         assert "Ray Worker Plugin Load Errors" in caplog.text
         assert "broken_plugin" in caplog.text
+
+    def test_services_memoized_per_process(self, monkeypatch):
+        """Warm workers reuse the loaded registry and storage client."""
+        from app import ray_tasks
+
+        loads = []
+
+        def fake_entry_points(group=None):
+            loads.append(group)
+            return []
+
+        storage_calls = []
+        monkeypatch.setattr("app.plugin_loader.entry_points", fake_entry_points)
+        monkeypatch.setattr(
+            "app.services.storage.factory.get_storage_service",
+            lambda settings: storage_calls.append(settings) or MagicMock(),
+        )
+
+        service = ray_tasks._get_plugin_service()
+        storage = ray_tasks._get_storage_service()
+
+        assert ray_tasks._get_plugin_service() is service
+        assert ray_tasks._get_storage_service() is storage
+        assert loads.count("forgesyte.plugins") == 1
+        assert len(storage_calls) == 1
+
+        ray_tasks._reset_worker_services()
+        assert ray_tasks._get_plugin_service() is not service
+        assert loads.count("forgesyte.plugins") == 2
+
+
+class TestFrameRangeVideo:
+    """v0.16.0: Frame-range parallel execution of video jobs."""
+
+    def test_split_frame_ranges(self):
+        """Ranges cover the video; a short tail folds into the last range."""
+        from app.ray_tasks import split_frame_ranges
+
+        assert split_frame_ranges(900, 1000) == [(0, None)]
+        assert split_frame_ranges(3000, 1000) == [(0, 1000), (1000, 2000), (2000, None)]
+        assert split_frame_ranges(2100, 1000) == [(0, 1000), (1000, None)]
+        assert split_frame_ranges(5000, 0) == [(0, None)]
+
+    def test_tools_support_frame_ranges(self):
+        """All tools must accept start_frame and end_frame."""
+        from app.ray_tasks import tools_support_frame_ranges
+
+        manifest = {
+            "tools": [
+                {"id": "a", "input_types": ["video_path", "start_frame", "end_frame"]},
+                {"id": "b", "input_types": ["video_path", "start_frame"]},
+            ]
+        }
+        assert tools_support_frame_ranges(manifest, ["a"])
+        assert not tools_support_frame_ranges(manifest, ["a", "b"])
+        assert not tools_support_frame_ranges(None, ["a"])
+
+    def test_range_task_warms_up_and_clips(self, mock_plugin_service, mock_storage):
+        """A range task starts overlap frames early and drops them."""
+        from app.ray_tasks import _execute_pipeline_impl
+
+        def run_tool(plugin_id, tool_name, args, progress_callback=None):
+            frames = range(args["start_frame"], args["end_frame"] + 2)
+            return {"frames": [{"frame_idx": i} for i in frames], "total_frames": 50}
+
+        mock_plugin_service.run_plugin_tool.side_effect = run_tool
+
+        result = _execute_pipeline_impl(
+            plugin_id="test_plugin",
+            tools_to_run=["track"],
+            input_path="video/test.mp4",
+            job_type="video",
+            get_plugin_service_fn=lambda: mock_plugin_service,
+            get_storage_service_fn=lambda: mock_storage,
+            frame_range=(10, 20),
+            overlap_frames=3,
+        )
+
+        args = mock_plugin_service.run_plugin_tool.call_args.args[2]
+        assert (args["start_frame"], args["end_frame"]) == (7, 20)
+        assert [f["frame_idx"] for f in result["track"]["frames"]] == list(
+            range(10, 20)
+        )
+
+    def test_coordinator_merges_ranges(self, monkeypatch):
+        """Range results are concatenated in frame order per tool."""
+        from app import ray_tasks
+
+        storage = MagicMock()
+        storage.load_file.return_value = Path("/nonexistent/video.mp4")
+        monkeypatch.setattr(ray_tasks, "_get_storage_service", lambda: storage)
+        monkeypatch.setattr(ray_tasks, "_probe_frame_count", lambda path: 24)
+
+        calls = []
+
+        def fake_remote(**kwargs):
+            calls.append(kwargs)
+            start, end = kwargs["frame_range"]
+            end = 24 if end is None else end
+            return {"track": {"frames": [{"frame_idx": i} for i in range(start, end)]}}
+
+        fake_task = MagicMock()
+        fake_task.remote.side_effect = fake_remote
+        monkeypatch.setattr(ray_tasks, "execute_pipeline_remote", fake_task)
+        monkeypatch.setattr(ray_tasks.ray, "get", lambda refs: refs)
+
+        result = ray_tasks.execute_video_chunked_remote._function(
+            "p", ["track"], "video/in.mp4", "video", chunk_frames=10, overlap_frames=2
+        )
+
+        assert [c["frame_range"] for c in calls] == [(0, 10), (10, None)]
+        assert [c["part"] for c in calls] == [0, 1]
+        assert [f["frame_idx"] for f in result["track"]["frames"]] == list(range(24))
+        assert result["track"]["total_frames"] == 24
+
+
+class TestNodeInputCache:
+    """v0.16.0: Inputs are read through the storage's pinned local copy."""
+
+    def test_storage_service_input_pinned_for_task(self):
+        """open_local() is held for the whole task; nothing is deleted."""
+        import contextlib
+
+        from app import ray_tasks
+        from app.services.storage.base import StorageService
+
+        events = []
+
+        class CachingStorage(StorageService):
+            @contextlib.contextmanager
+            def open_local(self, path):
+                events.append(("open", path))
+                yield Path(tempfile.gettempdir()) / "cached.mp4"
+                events.append(("close", path))
+
+            load_file = save_file = delete_file = MagicMock()
+            file_exists = get_signed_url = MagicMock()
+
+        with ray_tasks._local_input(CachingStorage(), "video/in.mp4") as path:
+            assert events == [("open", "video/in.mp4")]
+            assert path.name == "cached.mp4"
+
+        assert events[-1] == ("close", "video/in.mp4")
+
+
+class TestInputNodeAffinity:
+    """v0.16.0: Tasks of one input prefer the same node."""
+
+    def test_input_prefers_one_node_per_path(self, monkeypatch):
+        """All tasks of an input get a soft affinity to the same node."""
+        from app import ray_tasks
+
+        nodes = [{"NodeID": f"{i:02x}" * 28, "Alive": True} for i in range(4)]
+        monkeypatch.setattr(ray_tasks.ray, "is_initialized", lambda: True)
+        monkeypatch.setattr(ray_tasks.ray, "nodes", lambda: nodes)
+
+        first = ray_tasks.input_node_strategy("video/input/a.mp4")
+        again = ray_tasks.input_node_strategy("video/input/a.mp4")
+
+        assert first.node_id == again.node_id
+        assert first.soft is True
+        # Removing another node keeps the preferred one
+        nodes[:] = [n for n in nodes if n["NodeID"] == first.node_id] + [
+            n for n in nodes if n["NodeID"] != first.node_id
+        ][:1]
+        assert ray_tasks.input_node_strategy("video/input/a.mp4").node_id == (
+            first.node_id
+        )
+
+    def test_single_node_gets_no_input_affinity(self, monkeypatch):
+        """With one node (or outside Ray) tasks are scheduled as before."""
+        from app import ray_tasks
+
+        monkeypatch.setattr(ray_tasks.ray, "is_initialized", lambda: True)
+        monkeypatch.setattr(
+            ray_tasks.ray, "nodes", lambda: [{"NodeID": "aa" * 28, "Alive": True}]
+        )
+        assert ray_tasks.input_node_strategy("video/input/a.mp4") is None
+
+        monkeypatch.setattr(ray_tasks.ray, "is_initialized", lambda: False)
+        assert ray_tasks.input_node_strategy("video/input/a.mp4") is None
@@ -60,24 +60,44 @@ class TestWorkerProgressBroadcast:
         # DB update should be throttled (not committed)
         # But WebSocket broadcast should still happen
 
-    def test_progress_updates_at_5_percent_boundaries(self, mock_db) -> None:
-        """Test progress updates happen at 5%, 10%, 15%, etc."""
+    def test_progress_writes_coalesced_in_time(self, mock_db) -> None:
+        """Test progress writes wait for the flush interval (v0.16.0)."""
+        from app.workers.progress_throttle import ProgressThrottle
         from app.workers.worker import JobWorker
 
         worker = JobWorker()
+        now = [0.0]
+        worker._progress_writes = ProgressThrottle(0.5, clock=lambda: now[0])
 
-        # Reset mock
-        mock_db.reset_mock()
-
-        # Update at 5%
         worker._update_job_progress("job-1", 5, 100, mock_db)
-        assert mock_db.commit.call_count >= 1
+        assert mock_db.commit.call_count == 1
 
         mock_db.reset_mock()
 
-        # Update at 10%
+        # Within the interval: coalesced
         worker._update_job_progress("job-1", 10, 100, mock_db)
-        assert mock_db.commit.call_count >= 1
+        mock_db.commit.assert_not_called()
+
+        # After the interval: written as one column UPDATE
+        now[0] = 1.0
+        worker._update_job_progress("job-1", 11, 100, mock_db)
+        mock_db.query.return_value.filter.return_value.update.assert_called_once_with(
+            {"progress": 11}, synchronize_session=False
+        )
+        assert mock_db.commit.call_count == 1
+
+    def test_broadcasts_throttled(self, mock_db) -> None:
+        """Test WebSocket broadcasts are coalesced like DB writes (v0.16.0)."""
+        from app.workers.worker import JobWorker
+
+        with patch("app.workers.progress.progress_callback") as mock_progress:
+            worker = JobWorker()
+            for frame in range(1, 101):
+                worker._update_job_progress("job-1", frame, 100, mock_db)
+
+        # First frame and last frame; the rest fell within the interval
+        frames = [c[1]["current_frame"] for c in mock_progress.call_args_list]
+        assert frames == [1, 100]
 
     def test_progress_always_updates_on_last_frame(self, mock_db) -> None:
         """Test progress always updates on the last frame."""
@@ -111,5 +131,6 @@ class TestWorkerProgressBroadcast:
         )
 
         # Should update DB at 25%
-        job = mock_db.query.return_value.filter.return_value.first.return_value
-        assert job.progress == 25
+        mock_db.query.return_value.filter.return_value.update.assert_called_once_with(
+            {"progress": 25}, synchronize_session=False
+        )
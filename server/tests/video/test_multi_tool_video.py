@@ -8,8 +8,10 @@ Tests for v0.9.7 multi-tool video processing feature:
 - Backward compatibility
 """
 
+import gzip
 import json
 import uuid
+from contextlib import nullcontext
 from typing import Optional
 from unittest.mock import MagicMock, patch
 
@@ -164,7 +166,7 @@ class TestMultiToolVideoExecution:
         # Load saved results
         saved_output = mock_storage.save_file.call_args[0][0]
         saved_output.seek(0)
-        output_json = saved_output.read().decode("utf-8")
+        output_json = gzip.decompress(saved_output.read()).decode("utf-8")
         output = json.loads(output_json)
 
         # v0.12.0: Verify video_multi merged format
@@ -268,7 +270,7 @@ class TestBackwardCompatibility:
         # Load saved results
         saved_output = mock_storage.save_file.call_args[0][0]
         saved_output.seek(0)
-        output_json = saved_output.read().decode("utf-8")
+        output_json = gzip.decompress(saved_output.read()).decode("utf-8")
         output = json.loads(output_json)
 
         # v0.10.0: Single-tool video uses flattened format for VideoResultsViewer
@@ -401,7 +403,7 @@ class TestMultiToolStatusEndpoint:
 def mock_storage():
     """Create a mock storage service."""
     storage = MagicMock()
-    storage.load_file.return_value = "/tmp/test.mp4"
+    storage.open_local.return_value = nullcontext("/tmp/test.mp4")
     storage.save_file.return_value = "video/output/test.json"
     return storage
 
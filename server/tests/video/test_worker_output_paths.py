@@ -4,6 +4,7 @@ Ensures worker stores relative paths only, not absolute paths.
 This test prevents regression of the double-prefix bug.
 """
 
+from contextlib import nullcontext
 from unittest.mock import MagicMock
 from uuid import uuid4
 
@@ -28,7 +29,9 @@ def test_worker_stores_relative_output_path_only(test_engine, session):
 
     # Mock storage that returns relative path (as LocalStorageService now does)
     mock_storage = MagicMock()
-    mock_storage.load_file.return_value = "/data/video_jobs/input/test.mp4"
+    mock_storage.open_local.return_value = nullcontext(
+        "/data/video_jobs/input/test.mp4"
+    )
     mock_storage.save_file.side_effect = lambda src, dest: dest  # Return relative path
 
     # Mock plugin_service (JobWorker uses plugin_service, not pipeline_service)
@@ -88,9 +91,10 @@ def test_worker_stores_relative_output_path_only(test_engine, session):
     assert output_path.startswith(
         "video/output/"
     ), f"Expected video/output/ prefix, got: {output_path}"
+    # v0.16.0: Results are stored gzip-compressed
     assert output_path.endswith(
-        ".json"
-    ), f"Expected .json extension, got: {output_path}"
+        ".json.gz"
+    ), f"Expected .json.gz extension, got: {output_path}"
 
 
 @pytest.mark.unit
@@ -108,7 +112,9 @@ def test_worker_does_not_store_absolute_path(test_engine, session):
 
     # Mock storage that incorrectly returns absolute path (simulating a bug)
     mock_storage = MagicMock()
-    mock_storage.load_file.return_value = "/data/video_jobs/input/test.mp4"
+    mock_storage.open_local.return_value = nullcontext(
+        "/data/video_jobs/input/test.mp4"
+    )
     mock_storage.save_file.return_value = (
         "/data/video_jobs/output/test.json"  # BUG: absolute path!
     )
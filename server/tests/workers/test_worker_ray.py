@@ -82,13 +82,10 @@ class TestJobWorkerRayDispatch:
             use_ray=True,  # Enable Ray mode
         )
 
+        from app.services.job_claim_service import ClaimedJob
+
         # Mock database
         mock_db = MagicMock()
-        mock_db.query.return_value.filter.return_value.order_by.return_value.first.return_value = (
-            mock_job
-        )
-        mock_db.query.return_value.filter.return_value.update.return_value = 1
-
         worker._session_factory = lambda: mock_db
 
         # Mock Ray
@@ -96,17 +93,30 @@ class TestJobWorkerRayDispatch:
 
         with patch("ray.wait", return_value=([], [])):
             with patch("ray.ObjectRef", MockRayObjectRef):
-                # Patch execute_pipeline_remote at the module level
-                with patch("app.ray_tasks.execute_pipeline_remote") as mock_execute:
-                    mock_execute.remote.return_value = mock_ref
-
-                    # Run once
-                    worker.run_once()
+                with patch(
+                    "app.workers.worker.JobClaimService.claim_pending_jobs",
+                    return_value=[ClaimedJob(job=mock_job, tools=["test_tool"])],
+                ) as mock_claim:
+                    # Patch execute_pipeline_remote at the module level
+                    with patch("app.ray_tasks.execute_pipeline_remote") as mock_execute:
+                        mock_execute.remote.return_value = mock_ref
+
+                        # Run once
+                        worker.run_once()
+
+        # Verify both free Ray slots were requested in one claim
+        mock_claim.assert_called_once_with(
+            mock_db, limit=2, scheduler=worker._scheduler, lease=worker._lease
+        )
 
         # Verify job was dispatched
         mock_execute.remote.assert_called_once()
         assert len(worker.active_futures) == 1
         assert str(mock_job.job_id) in worker.job_metadata
+        assert worker.job_metadata[str(mock_job.job_id)]["tools_to_run"] == [
+            "test_tool"
+        ]
+        mock_db.commit.assert_called_once()
 
     def test_polls_ray_futures(self, mock_job, mock_storage):
         """Test that worker polls active Ray futures."""
@@ -266,17 +276,18 @@ class TestJobWorkerRayDispatch:
             worker.active_futures[ref] = f"job_{i}"
 
         mock_db = MagicMock()
-        mock_db.query.return_value.filter.return_value.order_by.return_value.first.return_value = (
-            mock_job
-        )
         worker._session_factory = lambda: mock_db
 
         with patch("ray.wait", return_value=([], [])):
-            with patch("app.ray_tasks.execute_pipeline_remote") as mock_execute:
-                # Run once
-                worker.run_once()
+            with patch(
+                "app.workers.worker.JobClaimService.claim_pending_jobs"
+            ) as mock_claim:
+                with patch("app.ray_tasks.execute_pipeline_remote") as mock_execute:
+                    # Run once
+                    worker.run_once()
 
-        # Should NOT dispatch new job since at limit
+        # Should NOT claim or dispatch a new job since at limit
+        mock_claim.assert_not_called()
         mock_execute.remote.assert_not_called()
 
     def test_handles_ray_task_exception(self, mock_job, mock_storage):
@@ -349,3 +360,193 @@ class TestJobWorkerBackwardCompatibility:
 
         # Check the private attribute
         assert worker._plugin_service == mock_plugin
+
+
+class TestJobWorkerRayCapacity:
+    """v0.16.0: Ray dispatch sized by cluster resources."""
+
+    def test_fills_free_gpus_with_manifest_resources(self):
+        """One pass claims until the cluster's free GPUs are used."""
+        import uuid
+
+        from app.services.job_claim_service import ClaimedJob
+        from app.workers.worker import JobWorker
+
+        plugin_service = MagicMock()
+        plugin_service.get_plugin_manifest.return_value = {
+            "resources": {"num_cpus": 1, "num_gpus": 0.5}
+        }
+        worker = JobWorker(
+            storage=MagicMock(), plugin_service=plugin_service, use_ray=True
+        )
+        worker._session_factory = lambda: MagicMock()
+        worker._progress_actor = MagicMock()
+        # Resources learned from an earlier job of the plugin
+        worker._plugin_task_resources("yolo")
+
+        def make_job():
+            job = MagicMock()
+            job.job_id = uuid.uuid4()
+            job.plugin_id = "yolo"
+            job.job_type = "video"
+            job.input_path = "video/in.mp4"
+            return ClaimedJob(job=job, tools=["detect"])
+
+        limits = []
+
+        def claim(db, limit, **kwargs):
+            limits.append(limit)
+            return [make_job() for _ in range(limit)]
+
+        ray = MagicMock()
+        ray.is_initialized.return_value = False  # Direct task submission
+        ray.available_resources.return_value = {"CPU": 16.0, "GPU": 1.0}
+        ray.cluster_resources.return_value = {"CPU": 16.0, "GPU": 1.0}
+        execute = MagicMock()
+        execute.options.return_value.remote.side_effect = lambda **kw: object()
+
+        with patch(
+            "app.workers.worker.JobClaimService.claim_pending_jobs", side_effect=claim
+        ):
+            worker._dispatch_ray_jobs(ray, execute)
+
+        # One free GPU fits two half-GPU tasks, then the cluster is full
+        assert limits == [2]
+        assert len(worker.active_futures) == 2
+        execute.options.assert_called_with(num_cpus=1.0, num_gpus=0.5)
+
+
+class TestJobWorkerRayExecutions:
+    """v0.16.0: Ray jobs run in detached, reattachable execution actors."""
+
+    def test_dispatch_launches_named_execution(self):
+        """The execution actor's name is persisted as ray_future_id."""
+        import uuid
+
+        from app.services.job_claim_service import ClaimedJob
+        from app.workers.worker import JobWorker
+
+        worker = JobWorker(storage=MagicMock(), plugin_service=MagicMock())
+        worker._use_ray = True
+        worker._progress_actor = MagicMock()
+        db = MagicMock()
+        worker._session_factory = lambda: db
+
+        job = MagicMock()
+        job.job_id = uuid.uuid4()
+        job.plugin_id = "yolo"
+        job.job_type = "image"
+        job.input_path = "image/in.png"
+        ray = MagicMock()
+        ray.is_initialized.return_value = True
+        ray.available_resources.return_value = {"CPU": 1.0}
+        ray.cluster_resources.return_value = {"CPU": 1.0}
+        actor = MagicMock()
+        actor.result.remote.return_value = "result-ref"
+        execute = MagicMock()
+
+        with (
+            patch(
+                "app.workers.worker.JobClaimService.claim_pending_jobs",
+                return_value=[ClaimedJob(job=job, tools=["detect"])],
+            ),
+            patch(
+                "app.workers.ray_executions.launch_execution", return_value=actor
+            ) as launch,
+        ):
+            worker._dispatch_ray_jobs(ray, execute)
+
+        job_id = str(job.job_id)
+        execute.remote.assert_not_called()
+        assert launch.call_args.args[:2] == (job_id, "pipeline")
+        assert launch.call_args.args[2]["tools_to_run"] == ["detect"]
+        assert worker.active_futures == {"result-ref": job_id}
+        db.query.return_value.filter.return_value.update.assert_called_with(
+            {"ray_future_id": f"forgesyte-exec-{job_id}"}
+        )
+
+    def test_dispatch_failure_keeps_cancellation(self, test_engine, session):
+        """A job cancelled before its dispatch failed stays cancelled."""
+        import uuid
+
+        from sqlalchemy.orm import sessionmaker
+
+        from app.models.job import Job, JobStatus
+        from app.services.job_claim_service import ClaimedJob
+        from app.workers.job_cancellation import job_cancellations
+        from app.workers.worker import JobWorker
+
+        worker = JobWorker(
+            session_factory=sessionmaker(bind=test_engine),
+            storage=MagicMock(),
+            plugin_service=MagicMock(),
+        )
+        worker._use_ray = True
+        job_id = uuid.uuid4()
+        session.add(
+            Job(
+                job_id=job_id,
+                status=JobStatus.cancelled,
+                plugin_id="yolo",
+                input_path="image/in.png",
+                job_type="image",
+            )
+        )
+        session.commit()
+        # DELETE /v1/jobs/{id} flagged the job after the claim
+        job_cancellations.cancel(str(job_id))
+        claimed = MagicMock(
+            job_id=job_id, plugin_id="yolo", job_type="image", input_path="x"
+        )
+        ray = MagicMock()
+        ray.available_resources.return_value = {"CPU": 1.0}
+        ray.cluster_resources.return_value = {"CPU": 1.0}
+
+        with (
+            patch(
+                "app.workers.worker.JobClaimService.claim_pending_jobs",
+                side_effect=[[ClaimedJob(job=claimed, tools=["detect"])], []],
+            ),
+            patch.object(
+                worker, "_launch_ray_task", side_effect=RuntimeError("no cluster")
+            ),
+        ):
+            worker._dispatch_ray_jobs(ray, MagicMock())
+
+        session.expire_all()
+        job = session.query(Job).filter(Job.job_id == job_id).first()
+        assert job.status == JobStatus.cancelled
+        assert job.error_message is None
+        assert not job_cancellations.is_cancelled(str(job_id))
+        assert worker.active_futures == {}
+
+    def test_finished_execution_is_killed(self):
+        """The actor is killed once its job has been finalized."""
+        from app.workers.worker import JobWorker
+
+        worker = JobWorker(storage=MagicMock(), plugin_service=MagicMock())
+        worker._use_ray = True
+        worker._session_factory = lambda: MagicMock()
+        worker._finalize_job = MagicMock()
+        actor = MagicMock()
+        worker.active_futures["result-ref"] = "job-1"
+        worker.job_metadata["job-1"] = {"tools_to_run": ["detect"], "execution": actor}
+
+        mock_ray = MagicMock()
+        mock_ray.wait.return_value = (["result-ref"], [])
+        mock_ray.get.return_value = {"detect": {}}
+        mock_ray.available_resources.return_value = {}
+        mock_ray.cluster_resources.return_value = {}
+
+        with (
+            patch.dict("sys.modules", {"ray": mock_ray}),
+            patch(
+                "app.workers.worker.JobClaimService.claim_pending_jobs",
+                return_value=[],
+            ),
+        ):
+            worker.run_once()
+
+        worker._finalize_job.assert_called_once()
+        mock_ray.kill.assert_called_once_with(actor, no_restart=True)
+        assert worker.active_futures == {}